@@ -0,0 +1,211 @@
+import inspect
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from dataLoader import DataLoader
+from analyzer import Analyzer, ANALYSIS_METHODS
+from outputWriter import OutputWriter
+
+# Most recent (analysis, parameters) results kept per dataset version; callers choose
+# top_n and offset freely, so the cache must not grow with every distinct query
+RESULT_CACHE_SIZE = 128
+
+class AnalysisServer:
+    def __init__(self, file_path="Dataset_Books.csv", host='127.0.0.1', port=8000,
+                 data_loader=None, analyzer=None, reload_interval=2.0):
+        """Initialize AnalysisServer; the dataset is loaded once and kept in memory"""
+        self.file_path = file_path
+        self.host = host
+        self.port = port
+        self.data_loader = data_loader or DataLoader()
+        self.analyzer = analyzer or Analyzer()
+        self.reload_interval = reload_interval
+        self.serializer = OutputWriter('json')
+        
+        self.dataset = None
+        self.mtime = None
+        # Modification time of a version that failed to load, retried only once the file changes again
+        self.failed_mtime = None
+        self.version = 0
+        self.loaded_at = None
+        self.results = OrderedDict()
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.httpd = None
+    
+    def load(self):
+        """Load the CSV and atomically swap it in; returns True when a dataset is available"""
+        try:
+            mtime = os.path.getmtime(self.file_path)
+        except OSError:
+            mtime = None
+        
+        dataset = self.data_loader.load(self.file_path)
+        if dataset is None:
+            self.failed_mtime = mtime
+            return self.dataset is not None
+        
+        with self.lock:
+            self.dataset = dataset
+            self.mtime = mtime
+            self.version += 1
+            self.loaded_at = time.time()
+            # Cached results belong to the previous version of the file
+            self.results = OrderedDict()
+        return True
+    
+    def check_reload(self):
+        """Reload the dataset when the CSV's modification time changed"""
+        try:
+            mtime = os.path.getmtime(self.file_path)
+        except OSError:
+            return False
+        
+        if mtime != self.mtime and mtime != self.failed_mtime:
+            print(f"Dataset '{self.file_path}' changed, reloading...")
+            return self.load()
+        return False
+    
+    def watch(self):
+        """Background loop polling the CSV for changes"""
+        while not self.stop_event.wait(self.reload_interval):
+            self.check_reload()
+    
+    def parse_params(self, method, query):
+        """Convert query-string values to the integer parameters the analyze_* method accepts"""
+        accepted = inspect.signature(method).parameters
+        params = {}
+        for name, values in query.items():
+            if name not in accepted or name == 'df':
+                raise ValueError(f"Unknown parameter '{name}' for this analysis")
+            try:
+                params[name] = int(values[-1])
+            except ValueError:
+                raise ValueError(f"Parameter '{name}' must be an integer")
+            # offset may be 0 (the first page); counts like top_n must be positive
+            if params[name] < (0 if name == 'offset' else 1):
+                raise ValueError(f"Parameter '{name}' must be {'non-negative' if name == 'offset' else 'positive'}")
+        return params
+    
+    def run_query(self, analysis_type, query=None):
+        """Run one analysis against the in-memory dataset; returns (HTTP status, JSON payload)"""
+        if analysis_type not in ANALYSIS_METHODS:
+            return 404, {'error': f"Unknown analysis '{analysis_type}'", 'analyses': list(ANALYSIS_METHODS)}
+        
+        method = getattr(self.analyzer, ANALYSIS_METHODS[analysis_type])
+        try:
+            params = self.parse_params(method, query or {})
+        except ValueError as e:
+            return 400, {'error': str(e)}
+        
+        with self.lock:
+            dataset, version = self.dataset, self.version
+        if dataset is None:
+            return 503, {'error': 'Dataset not loaded'}
+        
+        key = (analysis_type, tuple(sorted(params.items())), version)
+        with self.lock:
+            payload = self.results.get(key)
+            if payload is not None:
+                self.results.move_to_end(key)
+                return payload
+        
+        analysis_data, error = method(dataset, **params)
+        if error:
+            payload = (422, {'analysis': analysis_type, 'error': error})
+        else:
+            payload = (200, {'analysis': analysis_type, 'version': version,
+                             'data': self.serializer.to_serializable(analysis_data)})
+        
+        with self.lock:
+            if version == self.version:
+                self.results[key] = payload
+                if len(self.results) > RESULT_CACHE_SIZE:
+                    self.results.popitem(last=False)
+        return payload
+    
+    def health(self):
+        """Server status for monitoring"""
+        with self.lock:
+            return 200, {
+                'status': 'ok' if self.dataset is not None else 'no dataset',
+                'file': self.file_path,
+                'rows': 0 if self.dataset is None else len(self.dataset),
+                'version': self.version,
+                'loaded_at': self.loaded_at
+            }
+    
+    def route(self, path):
+        """Map a request path to a (status, payload) response"""
+        parsed = urlparse(path)
+        parts = [part for part in parsed.path.split('/') if part]
+        query = parse_qs(parsed.query)
+        
+        if parts in ([], ['analyses']):
+            return 200, {'analyses': list(ANALYSIS_METHODS)}
+        if parts == ['health']:
+            return self.health()
+        if len(parts) == 2 and parts[0] == 'analyze':
+            return self.run_query(parts[1], query)
+        return 404, {'error': f"Unknown path '{parsed.path}'"}
+    
+    def make_handler(self):
+        """Request handler class bound to this server"""
+        server = self
+        
+        class AnalysisRequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                status, payload = server.route(self.path)
+                body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        return AnalysisRequestHandler
+    
+    def start(self):
+        """Load the dataset and start serving on background threads; returns False if loading failed"""
+        if not self.load():
+            return False
+        
+        self.httpd = ThreadingHTTPServer((self.host, self.port), self.make_handler())
+        self.httpd.daemon_threads = True
+        self.port = self.httpd.server_address[1]
+        
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        threading.Thread(target=self.watch, daemon=True).start()
+        return True
+    
+    def serve_forever(self):
+        """Start the server and block until interrupted"""
+        if not self.start():
+            print(f"Error: Failed to load dataset from '{self.file_path}'")
+            return False
+        
+        print(f"Serving {len(self.dataset)} records from '{self.file_path}' on http://{self.host}:{self.port}")
+        print(f"Endpoints: /health, /analyses, /analyze/<{'|'.join(ANALYSIS_METHODS)}>?top_n=N&offset=M")
+        try:
+            while not self.stop_event.wait(1):
+                pass
+        except KeyboardInterrupt:
+            print("\nShutting down server...")
+        finally:
+            self.shutdown()
+        return True
+    
+    def shutdown(self):
+        """Stop the HTTP server and the reload watcher"""
+        self.stop_event.set()
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
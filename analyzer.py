@@ -1,9 +1,54 @@
+import importlib
 import pandas as pd
+from catalogQuery import Catalog, Column
+
+# Analyzer method behind each analysis type, in menu order
+ANALYSIS_METHODS = {
+    'trends': 'analyze_publication_trends',
+    'authors': 'analyze_top_authors',
+    'languages': 'analyze_language_distribution',
+    'publishers': 'analyze_books_by_publisher',
+    'isbn': 'analyze_missing_isbn',
+    'year-language': 'analyze_books_per_year_by_language'
+}
+
+# Visualizer (and TerminalRenderer) method and title of each analysis type's chart; printed
+# headings, report sections and PDF pages all take their titles from here
+ANALYSIS_CHARTS = {
+    'trends': ('visualize_publication_trends', 'Publication Trends Over Time'),
+    'authors': ('visualize_top_authors', 'Top 5 Most Prolific Authors'),
+    'languages': ('visualize_language_distribution', 'Language Distribution'),
+    'publishers': ('visualize_books_by_publisher', 'Books by Publisher'),
+    'isbn': ('visualize_missing_isbn', 'Missing ISBN Analysis'),
+    'year-language': ('visualize_books_per_year_by_language', 'Books per Year by Language (First 1000 Records)')
+}
+
+# Accepted column names for each field, in order of preference
+DATE_COLUMNS = ['publication_date', 'publication date', 'date', 'year']
+AUTHOR_COLUMNS = ['authors', 'author', 'writer', 'book_author']
+LANGUAGE_COLUMNS = ['language_code', 'language', 'lang', 'book_language']
+PUBLISHER_COLUMNS = ['publisher', 'book publisher', 'book_publisher', 'publishing_house']
+
+# analyze_books_per_year_by_language only looks at the first rows of the dataset
+YEAR_LANGUAGE_LIMIT = 1000
+
+# Alternative backends for --engine: (module, class) of an Analyzer subclass that reads the file itself
+ENGINE_CLASSES = {
+    'polars': ('polarsEngine', 'PolarsAnalyzer'),
+    'duckdb': ('duckdbEngine', 'DuckDbAnalyzer')
+}
+ENGINE_NAMES = ['pandas'] + list(ENGINE_CLASSES)
+
+def create_engine(engine, file_path):
+    """Analyzer for a non-pandas engine over file_path; the backend module is imported only when chosen"""
+    module_name, class_name = ENGINE_CLASSES[engine]
+    return getattr(importlib.import_module(module_name), class_name)(file_path)
 
 class Analyzer:
     def __init__(self):
         """Initialize Analyzer class"""
-        pass
+        # Each analysis is a lazy query plan over the DataFrame it is given
+        self.catalog = Catalog()
     
     def limit_dataset(self, df, n=None):
         """Limit dataset to first n records for analysis. If n is None, use all records."""
@@ -11,16 +56,42 @@ class Analyzer:
             return df
         return df.head(n)
     
+    def extract_years(self, column):
+        """Publication years from a numeric year column or a column of date strings"""
+        # Check if the column is already numeric (years)
+        if column.dtype in ['int64', 'float64']:
+            return column
+        
+        # Try to extract years from date strings
+        try:
+            return pd.to_datetime(column, errors='coerce').dt.year
+        except:
+            # Try to extract 4-digit years from strings
+            year_pattern = column.astype(str).str.extract(r'(\d{4})')
+            return pd.to_numeric(year_pattern[0], errors='coerce')
+    
+    def valid_year_bounds(self):
+        """First and last realistic publication year: 1800 and five years from now"""
+        return 1800, pd.Timestamp.now().year + 5
+    
+    def valid_year_mask(self, years):
+        """Years between 1800 and five years from now"""
+        first_year, last_year = self.valid_year_bounds()
+        return (years >= first_year) & (years <= last_year)
+    
+    def valid_year_filter(self, column):
+        """Query predicate version of valid_year_mask"""
+        return Column(column).between(*self.valid_year_bounds())
+    
     def analyze_publication_trends(self, df):
         """Analyze publication trends over time"""
         # Use all records for analysis
         df = self.limit_dataset(df, n=None)
         
         # Check for different possible column names for publication date
-        date_columns = ['publication_date', 'publication date', 'date', 'year']
         date_col = None
         
-        for col in date_columns:
+        for col in DATE_COLUMNS:
             if col in df.columns:
                 date_col = col
                 break
@@ -28,29 +99,12 @@ class Analyzer:
         if date_col is None:
             return None, f"Publication date column not found in dataset! Available columns: {list(df.columns)}"
         
-        # Handle different data types for dates
-        years = None
-        
-        # Check if the column is already numeric (years)
-        if df[date_col].dtype in ['int64', 'float64']:
-            years = df[date_col]
-        else:
-            # Try to extract years from date strings
-            try:
-                years = pd.to_datetime(df[date_col], errors='coerce').dt.year
-            except:
-                # Try to extract 4-digit years from strings
-                year_pattern = df[date_col].astype(str).str.extract(r'(\d{4})')
-                years = pd.to_numeric(year_pattern[0], errors='coerce')
-        
-        if years is None:
-            return None, f"Could not extract years from {date_col} column"
-        
-        # Filter out unrealistic years (e.g., before 1800 or after current year + 5)
-        current_year = pd.Timestamp.now().year
-        valid_years = years[(years >= 1800) & (years <= current_year + 5)]
-        
-        year_counts = valid_years.value_counts().sort_index()
+        # Extract years, filter out unrealistic ones (e.g., before 1800 or after current year + 5) and count
+        year_counts = (self.catalog.frame(df)
+                       .with_years(date_col, self.extract_years)
+                       .filter(self.valid_year_filter(date_col))
+                       .group_by(date_col).count().sort_index()
+                       .collect())
         
         # Remove NaN years
         year_counts = year_counts.dropna()
@@ -69,16 +123,15 @@ class Analyzer:
         
         return analysis_data, None
     
-    def analyze_top_authors(self, df, top_n=5):
-        """Analyze top most prolific authors"""
+    def analyze_top_authors(self, df, top_n=5, offset=0):
+        """Analyze top most prolific authors (offset skips the most prolific ones, for paging)"""
         # Use all records for analysis
         df = self.limit_dataset(df, n=None)
         
         # Check for different possible column names for authors
-        author_columns = ['authors', 'author', 'writer', 'book_author']
         author_col = None
         
-        for col in author_columns:
+        for col in AUTHOR_COLUMNS:
             if col in df.columns:
                 author_col = col
                 break
@@ -86,11 +139,12 @@ class Analyzer:
         if author_col is None:
             return None, f"Authors column not found in dataset! Available columns: {list(df.columns)}"
         
-        author_counts = df[author_col].value_counts().head(top_n)
+        author_counts = self.catalog.frame(df).group_by(author_col).count().top(top_n, offset).collect()
         
         analysis_data = {
             'author_counts': author_counts,
-            'top_n': top_n
+            'top_n': top_n,
+            'offset': offset
         }
         
         return analysis_data, None
@@ -101,10 +155,9 @@ class Analyzer:
         df = self.limit_dataset(df, n=None)
         
         # Check for different possible column names for language
-        language_columns = ['language_code', 'language', 'lang', 'book_language']
         lang_col = None
         
-        for col in language_columns:
+        for col in LANGUAGE_COLUMNS:
             if col in df.columns:
                 lang_col = col
                 break
@@ -112,8 +165,8 @@ class Analyzer:
         if lang_col is None:
             return None, f"Language column not found in dataset! Available columns: {list(df.columns)}"
         
-        lang_counts = df[lang_col].value_counts()
-        total_books = len(df)
+        lang_counts = self.catalog.frame(df).group_by(lang_col).count().collect()
+        total_books = self.catalog.frame(df).count().collect()
         
         # Calculate percentages
         lang_percentages = (lang_counts / total_books * 100).round(1)
@@ -126,16 +179,15 @@ class Analyzer:
         
         return analysis_data, None
     
-    def analyze_books_by_publisher(self, df, top_n=20):
-        """Analyze number of books by publisher"""
+    def analyze_books_by_publisher(self, df, top_n=20, offset=0):
+        """Analyze number of books by publisher (offset skips the largest publishers, for paging)"""
         # Use all records for analysis
         df = self.limit_dataset(df, n=None)
         
         # Check for different possible column names for publisher
-        publisher_columns = ['publisher', 'book publisher', 'book_publisher', 'publishing_house']
         publisher_col = None
         
-        for col in publisher_columns:
+        for col in PUBLISHER_COLUMNS:
             if col in df.columns:
                 publisher_col = col
                 break
@@ -143,13 +195,16 @@ class Analyzer:
         if publisher_col is None:
             return None, f"Publisher column not found in dataset! Available columns: {list(df.columns)}"
         
-        publisher_counts = df[publisher_col].value_counts().head(top_n)
-        total_publishers = df[publisher_col].nunique()
+        # Only the requested page of publishers is ranked; the rest are just counted
+        publishers = self.catalog.frame(df).group_by(publisher_col)
+        publisher_counts = publishers.count().top(top_n, offset).collect()
+        total_publishers = publishers.distinct().collect()
         
         analysis_data = {
             'publisher_counts': publisher_counts,
             'total_publishers': total_publishers,
-            'top_n': top_n
+            'top_n': top_n,
+            'offset': offset
         }
         
         return analysis_data, None
@@ -164,12 +219,12 @@ class Analyzer:
         if not isbn_columns:
             return None, "No ISBN columns found in dataset!"
         
-        total_records = len(df)
+        total_records = self.catalog.frame(df).count().collect()
         isbn_analysis = {}
         
         for isbn_col in isbn_columns:
             # Count both null values and empty strings as missing
-            missing_count = df[isbn_col].isnull().sum() + (df[isbn_col] == '').sum()
+            missing_count = self.catalog.frame(df).filter(Column(isbn_col).is_missing()).count().collect()
             missing_percentage = (missing_count / total_records) * 100
             present_count = total_records - missing_count
             
@@ -189,21 +244,16 @@ class Analyzer:
     
     def analyze_books_per_year_by_language(self, df):
         """Analyze books published per year categorized by language"""
-        # Use only the first 1000 records for analysis
-        df = self.limit_dataset(df, n=1000)
-        
         # Check for publication date column
-        date_columns = ['publication_date', 'publication date', 'date', 'year']
         date_col = None
-        for col in date_columns:
+        for col in DATE_COLUMNS:
             if col in df.columns:
                 date_col = col
                 break
         
         # Check for language column
-        language_columns = ['language_code', 'language', 'lang', 'book_language']
         lang_col = None
-        for col in language_columns:
+        for col in LANGUAGE_COLUMNS:
             if col in df.columns:
                 lang_col = col
                 break
@@ -216,42 +266,20 @@ class Analyzer:
                 missing_cols.append("language")
             return None, f"{' and '.join(missing_cols)} column(s) not found in dataset! Available columns: {list(df.columns)}"
         
-        # Handle different data types for dates (same logic as publication trends)
-        years = None
-        
-        # Check if the column is already numeric (years)
-        if df[date_col].dtype in ['int64', 'float64']:
-            years = df[date_col]
-        else:
-            # Try to extract years from date strings
-            try:
-                years = pd.to_datetime(df[date_col], errors='coerce').dt.year
-            except:
-                # Try to extract 4-digit years from strings
-                year_pattern = df[date_col].astype(str).str.extract(r'(\d{4})')
-                years = pd.to_numeric(year_pattern[0], errors='coerce')
-        
-        if years is None:
-            return None, f"Could not extract years from {date_col} column"
-        
-        # Filter out unrealistic years
-        current_year = pd.Timestamp.now().year
-        valid_mask = (years >= 1800) & (years <= current_year + 5)
-        
-        # Create a temporary dataframe with year and language
-        temp_df = pd.DataFrame({
-            'year': years,
-            'language': df[lang_col]
-        })
-        
-        # Filter by valid years and remove NaN
-        temp_df = temp_df[valid_mask].dropna()
-        
-        if temp_df.empty:
+        # Use only the first 1000 records, with years extracted as for publication trends, keep
+        # valid years with a language and count each (year, language) pair
+        pair_counts = (self.catalog.frame(df)
+                       .head(YEAR_LANGUAGE_LIMIT)
+                       .with_years(date_col, self.extract_years)
+                       .select({'year': date_col, 'language': lang_col})
+                       .filter(self.valid_year_filter('year') & Column('language').not_null())
+                       .group_by('year', 'language').count()
+                       .collect())
+        
+        if pair_counts.empty:
             return None, "No valid year-language data found"
         
-        # Group by year and language
-        year_lang_counts = temp_df.groupby(['year', 'language']).size().unstack(fill_value=0)
+        year_lang_counts = pair_counts.unstack(fill_value=0)
         
         analysis_data = {
             'year_lang_counts': year_lang_counts,
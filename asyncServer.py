@@ -0,0 +1,250 @@
+import asyncio
+import json
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from urllib.parse import urlparse, parse_qs
+from analyzer import ANALYSIS_METHODS
+from analysisServer import AnalysisServer
+from sharedDataset import publish, attached
+
+# Latency windows kept at most; requests beyond them are counted under 'other'
+MAX_LATENCY_ROUTES = 32
+
+# Per-process server used by process-pool workers: shared block name -> AnalysisServer
+_worker_servers = {}
+
+def run_in_worker(handle, version, analysis_type, query):
+    """Process-pool task: answer a query from the dataset the front end shared, attached once per worker process"""
+    server = _worker_servers.get(handle['name'])
+    if server is None:
+        # Drop the previous version's frame first so its block is unmapped when attached() closes it
+        _worker_servers.clear()
+        server = AnalysisServer(None)
+        server.dataset = attached(handle).frame()
+        server.version = version
+        _worker_servers[handle['name']] = server
+    return server.run_query(analysis_type, query)
+
+class AsyncAnalysisServer:
+    def __init__(self, server, executor='thread', workers=4, max_pending=64, latency_window=10000):
+        """Initialize the asyncio front end over an AnalysisServer"""
+        self.server = server
+        self.executor_kind = executor
+        self.workers = workers
+        self.max_pending = max_pending
+        self.executor = None
+        # Process workers read the dataset from shared memory; the previous version stays mapped
+        # until the next reload so that queued tasks can still attach to it
+        self.shared = None
+        self.retired = None
+        self.publishing = asyncio.Lock()
+        self.in_flight = {}
+        self.latencies = {}
+        self.latency_window = latency_window
+        self.counters = {'requests': 0, 'computed': 0, 'coalesced': 0, 'rejected': 0, 'errors': 0}
+        self.tcp_server = None
+    
+    def create_executor(self):
+        """Thread pool shares the in-memory dataset; process pool attaches it from shared memory"""
+        if self.executor_kind == 'process':
+            return ProcessPoolExecutor(max_workers=self.workers)
+        return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='analysis')
+    
+    def request_key(self, analysis_type, query):
+        """Identity of a request for single-flight coalescing"""
+        params = tuple(sorted((name, tuple(values)) for name, values in (query or {}).items()))
+        return analysis_type, params, self.server.version
+    
+    async def shared_handle(self):
+        """(handle, version) of the current dataset in shared memory, published again after a reload"""
+        # Copying the dataset into the block runs off the event loop, so other connections are still
+        # answered; the lock makes concurrent requests after a reload wait for one copy
+        async with self.publishing:
+            with self.server.lock:
+                dataset, version = self.server.dataset, self.server.version
+            if self.shared is None or self.shared[1] != version:
+                shared = await asyncio.get_running_loop().run_in_executor(None, publish, dataset)
+                if self.retired is not None:
+                    self.retired[0].close()
+                self.retired, self.shared = self.shared, (shared, version)
+            return self.shared[0].handle, self.shared[1]
+    
+    def release_shared(self):
+        """Free the shared copies of the dataset"""
+        for shared in (self.shared, self.retired):
+            if shared is not None:
+                shared[0].close()
+        self.shared = self.retired = None
+    
+    async def compute(self, analysis_type, query):
+        """Run one analysis on the executor"""
+        loop = asyncio.get_running_loop()
+        if self.executor_kind == 'process':
+            handle, version = await self.shared_handle()
+            return await loop.run_in_executor(self.executor, run_in_worker, handle, version, analysis_type, query)
+        return await loop.run_in_executor(self.executor, self.server.run_query, analysis_type, query)
+    
+    async def submit(self, analysis_type, query=None):
+        """Run an analysis, coalescing identical in-flight requests and shedding load past max_pending"""
+        self.counters['requests'] += 1
+        key = self.request_key(analysis_type, query)
+        
+        future = self.in_flight.get(key)
+        if future is not None:
+            self.counters['coalesced'] += 1
+            return await asyncio.shield(future)
+        
+        if len(self.in_flight) >= self.max_pending:
+            self.counters['rejected'] += 1
+            return 503, {'error': 'Server busy, retry later', 'pending': len(self.in_flight)}
+        
+        future = asyncio.ensure_future(self.compute(analysis_type, query))
+        self.in_flight[key] = future
+        self.counters['computed'] += 1
+        try:
+            return await asyncio.shield(future)
+        finally:
+            if self.in_flight.get(key) is future:
+                del self.in_flight[key]
+    
+    def route_name(self, path):
+        """Endpoint a request path is timed under: a known route, or 'other' for any path a client makes up"""
+        parts = [part for part in urlparse(path).path.split('/') if part]
+        if parts in ([], ['analyses'], ['health'], ['metrics']) or (
+                len(parts) == 2 and parts[0] == 'analyze' and parts[1] in ANALYSIS_METHODS):
+            return '/' + '/'.join(parts)
+        return 'other'
+    
+    def record_latency(self, name, seconds):
+        """Keep a bounded window of request latencies per endpoint, for a bounded number of endpoints"""
+        if name not in self.latencies and len(self.latencies) >= MAX_LATENCY_ROUTES:
+            name = 'other'
+        window = self.latencies.get(name)
+        if window is None:
+            window = self.latencies[name] = deque(maxlen=self.latency_window)
+        window.append(seconds)
+    
+    def percentiles(self, values, points=(50, 90, 99)):
+        """Nearest-rank percentiles in milliseconds"""
+        ordered = sorted(values)
+        if not ordered:
+            return {}
+        return {f"p{point}": round(ordered[min(int(len(ordered) * point / 100), len(ordered) - 1)] * 1000, 3)
+                for point in points}
+    
+    def metrics(self):
+        """Request counters and latency percentiles per endpoint"""
+        return 200, {
+            'counters': dict(self.counters),
+            'pending': len(self.in_flight),
+            'max_pending': self.max_pending,
+            'executor': self.executor_kind,
+            'workers': self.workers,
+            'latency_ms': {
+                name: dict(self.percentiles(window), count=len(window))
+                for name, window in self.latencies.items()
+            }
+        }
+    
+    async def route(self, path):
+        """Map a request path to a (status, payload) response"""
+        parsed = urlparse(path)
+        parts = [part for part in parsed.path.split('/') if part]
+        
+        if parts == ['metrics']:
+            return self.metrics()
+        if len(parts) == 2 and parts[0] == 'analyze':
+            return await self.submit(parts[1], parse_qs(parsed.query))
+        return self.server.route(path)
+    
+    async def handle_connection(self, reader, writer):
+        """Minimal HTTP/1.1 GET handler (one request per connection)"""
+        start = time.perf_counter()
+        try:
+            request_line = (await reader.readline()).decode('latin-1').split()
+            while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                pass
+            
+            if len(request_line) < 2 or request_line[0] != 'GET':
+                status, payload = 405, {'error': 'Only GET is supported'}
+                name = 'invalid'
+            else:
+                name = self.route_name(request_line[1])
+                try:
+                    status, payload = await self.route(request_line[1])
+                except Exception as e:
+                    # A failed analysis or worker still gets an answer instead of a dropped connection
+                    self.counters['errors'] += 1
+                    status, payload = 500, {'error': f"Internal server error: {e}"}
+            
+            body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+            headers = [
+                f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}",
+                "Content-Type: application/json; charset=utf-8",
+                f"Content-Length: {len(body)}",
+                "Connection: close"
+            ]
+            if status == 503:
+                headers.append("Retry-After: 1")
+            writer.write(("\r\n".join(headers) + "\r\n\r\n").encode('latin-1') + body)
+            await writer.drain()
+            self.record_latency(name, time.perf_counter() - start)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+    
+    async def start(self):
+        """Load the dataset, start the executor and listen; returns False if loading failed"""
+        if not self.server.load():
+            return False
+        
+        self.executor = self.create_executor()
+        self.tcp_server = await asyncio.start_server(self.handle_connection, self.server.host, self.server.port)
+        self.server.port = self.tcp_server.sockets[0].getsockname()[1]
+        return True
+    
+    async def watch(self):
+        """Poll the CSV for changes without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.server.reload_interval)
+            await loop.run_in_executor(None, self.server.check_reload)
+    
+    async def serve(self):
+        """Serve until cancelled"""
+        if not await self.start():
+            print(f"Error: Failed to load dataset from '{self.server.file_path}'")
+            return False
+        
+        print(f"Serving {len(self.server.dataset)} records from '{self.server.file_path}' on "
+              f"http://{self.server.host}:{self.server.port} (asyncio, {self.workers} {self.executor_kind} workers, "
+              f"max {self.max_pending} pending)")
+        print(f"Endpoints: /health, /metrics, /analyses, /analyze/<{'|'.join(ANALYSIS_METHODS)}>?top_n=N&offset=M")
+        watcher = asyncio.ensure_future(self.watch())
+        try:
+            async with self.tcp_server:
+                await self.tcp_server.serve_forever()
+        finally:
+            watcher.cancel()
+            await self.stop()
+        return True
+    
+    async def stop(self):
+        """Close the listener and the executor"""
+        if self.tcp_server is not None:
+            self.tcp_server.close()
+            self.tcp_server = None
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+        self.release_shared()
+    
+    def serve_forever(self):
+        """Blocking entry point used by the CLI"""
+        try:
+            return asyncio.run(self.serve())
+        except KeyboardInterrupt:
+            print("\nShutting down server...")
+            return True
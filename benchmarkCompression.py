@@ -0,0 +1,111 @@
+import argparse
+import bz2
+import gzip
+import json
+import lzma
+import os
+import shutil
+import tempfile
+import time
+from dataLoader import DataLoader
+from compression import open_decompressed, zstandard
+
+# Writer for each codec: (file suffix, function compressing bytes)
+CODECS = {
+    'gzip': ('.csv.gz', lambda data: gzip.compress(data, compresslevel=6)),
+    'bz2': ('.csv.bz2', lambda data: bz2.compress(data, compresslevel=9)),
+    'xz': ('.csv.xz', lambda data: lzma.compress(data, preset=6))
+}
+if zstandard is not None:
+    CODECS['zstd'] = ('.csv.zst', lambda data: zstandard.ZstdCompressor(level=3).compress(data))
+    # Independent 1 MiB frames, as written by pzstd or zstd --block-size, can be decoded in parallel
+    CODECS['zstd-frames'] = ('.csv.zst', lambda data: b''.join(
+        zstandard.ZstdCompressor(level=3).compress(data[start:start + (1 << 20)])
+        for start in range(0, len(data), 1 << 20)))
+
+class CompressionBenchmark:
+    def __init__(self, work_dir, repeat=3):
+        """Initialize CompressionBenchmark; each measurement is the best of `repeat` runs"""
+        self.work_dir = work_dir
+        self.repeat = repeat
+    
+    def build_input(self, file_path, copies):
+        """Plain CSV made of `copies` copies of the source rows (one header)"""
+        with open(file_path, 'rb') as f:
+            header, _, body = f.read().partition(b'\n')
+        if not body.endswith(b'\n'):
+            body += b'\n'
+        return header + b'\n' + body * copies
+    
+    def best_time(self, task):
+        """Fastest wall-clock time of task() over the repeats"""
+        timings = []
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            task()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+    
+    def decompress_then_parse(self, compressed_path):
+        """The old workflow: decompress to a temporary file on disk, then parse it"""
+        plain_path = os.path.join(self.work_dir, 'decompressed.csv')
+        with open_decompressed(compressed_path) as stream, open(plain_path, 'wb') as out:
+            shutil.copyfileobj(stream, out, 1 << 20)
+        df = DataLoader().load(plain_path)
+        os.remove(plain_path)
+        return df
+    
+    def run(self, file_path, copies=50):
+        """Time plain, streamed and decompress-then-parse loading for every codec"""
+        data = self.build_input(file_path, copies)
+        plain_path = os.path.join(self.work_dir, 'plain.csv')
+        with open(plain_path, 'wb') as f:
+            f.write(data)
+        
+        loader = DataLoader()
+        results = {'input_bytes': len(data), 'rows': len(loader.load(plain_path)), 'codecs': {}}
+        results['plain_seconds'] = self.best_time(lambda: loader.load(plain_path))
+        
+        for name, (suffix, compress) in CODECS.items():
+            compressed_path = os.path.join(self.work_dir, f"{name}{suffix}")
+            with open(compressed_path, 'wb') as f:
+                f.write(compress(data))
+            results['codecs'][name] = {
+                'compressed_bytes': os.path.getsize(compressed_path),
+                'streamed_seconds': self.best_time(lambda: loader.load(compressed_path)),
+                'decompress_then_parse_seconds': self.best_time(lambda: self.decompress_then_parse(compressed_path)),
+                # Bytes the old workflow wrote to disk and read back
+                'temporary_bytes': len(data)
+            }
+        return results
+    
+    def print_results(self, results):
+        """Table of timings, with the speed-up of streaming over decompress-then-parse"""
+        print(f"Input: {results['rows']:,} rows, {results['input_bytes'] / 1024 / 1024:.1f} MiB; "
+              f"plain CSV parse {results['plain_seconds'] * 1000:.0f}ms")
+        print(f"{'Codec':<12} {'Size':>9} {'Streamed':>10} {'Decompress+parse':>17} {'Speed-up':>9}")
+        print("-" * 61)
+        for name, codec in results['codecs'].items():
+            speedup = codec['decompress_then_parse_seconds'] / codec['streamed_seconds']
+            print(f"{name:<12} {codec['compressed_bytes'] / 1024:>7.0f}KB {codec['streamed_seconds'] * 1000:>8.0f}ms "
+                  f"{codec['decompress_then_parse_seconds'] * 1000:>15.0f}ms {speedup:>8.2f}x")
+
+def main():
+    """Entry point for the compressed-input benchmark"""
+    parser = argparse.ArgumentParser(description='Benchmark streamed compressed input against decompress-then-parse')
+    parser.add_argument('--file', '-f', default='Dataset_Books.csv', help='Source CSV (default: Dataset_Books.csv)')
+    parser.add_argument('--copies', type=int, default=50, help='Times the source rows are repeated (default: 50)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement, best kept (default: 3)')
+    parser.add_argument('--json', metavar='JSON_FILE', help='Also write the results as JSON')
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as work_dir:
+        benchmark = CompressionBenchmark(work_dir, repeat=args.repeat)
+        results = benchmark.run(args.file, copies=args.copies)
+    benchmark.print_results(results)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import redirect_stdout
+import numpy as np
+import pandas as pd
+from dataLoader import DataLoader
+from analyzer import Analyzer, ANALYSIS_METHODS, ANALYSIS_CHARTS, ENGINE_NAMES, create_engine
+from profiler import Profiler
+from syntheticCatalog import CatalogGenerator
+
+# Dataset sizes measured by default (rows)
+DEFAULT_TIERS = [10000, 100000, 1000000]
+
+# Bump when the generator changes so cached datasets are regenerated
+GENERATOR_VERSION = 1
+
+# Profiler stage for each benchmark stage prefix
+PROFILER_STAGES = {'load': 'load', 'analyze': 'analyze', 'render': 'visualize'}
+
+class BenchmarkSuite:
+    def __init__(self, tiers=None, seed=0, repeat=3, data_dir='.bench_data', trace_memory=True, render=False,
+                 engines=None):
+        """Initialize BenchmarkSuite over synthetic catalogs of the given sizes; render adds headless chart stages"""
+        self.tiers = tiers or DEFAULT_TIERS
+        self.engines = engines or ['pandas']
+        self.render = render
+        self.seed = seed
+        self.repeat = repeat
+        self.data_dir = data_dir
+        self.trace_memory = trace_memory
+    
+    def dataset_path(self, rows):
+        """Cached synthetic catalog for one tier, generated on first use"""
+        os.makedirs(self.data_dir, exist_ok=True)
+        path = os.path.join(self.data_dir, f"catalog-v{GENERATOR_VERSION}-seed{self.seed}-{rows}.csv")
+        if not os.path.exists(path):
+            print(f"Generating {rows:,} synthetic rows into '{path}'...", file=sys.stderr)
+            CatalogGenerator(seed=self.seed).write(path, rows)
+        return path
+    
+    def engine_stages(self, engine, file_path, state):
+        """(stage name, callable) pairs loading file_path with one engine, then running every analysis"""
+        prefix = '' if engine == 'pandas' else f"{engine}/"
+        if engine == 'pandas':
+            loader = DataLoader()
+            analyzer = Analyzer()
+            
+            def load():
+                state['analyzer'], state['df'] = analyzer, loader.load(file_path)
+        else:
+            def load():
+                # Other engines read the file themselves; their analyses take no DataFrame
+                state['analyzer'], state['df'] = create_engine(engine, file_path), None
+        
+        def analyze(analysis_type, method_name):
+            state['results'][analysis_type] = getattr(state['analyzer'], method_name)(state['df'])
+        
+        stages = [(f"{prefix}load", load)]
+        for analysis_type, method_name in ANALYSIS_METHODS.items():
+            stages.append((f"{prefix}analyze:{analysis_type}",
+                           lambda analysis_type=analysis_type, method_name=method_name: analyze(analysis_type, method_name)))
+        return stages
+    
+    def stages(self, file_path):
+        """(stage name, callable) pairs of every engine; charts are drawn from the first engine's results"""
+        states = [{'results': {}} for _ in self.engines]
+        stages = []
+        for engine, state in zip(self.engines, states):
+            stages += self.engine_stages(engine, file_path, state)
+        
+        if self.render:
+            # Imported here so benchmarks without charts never load matplotlib; charts are drawn off-screen
+            import matplotlib
+            matplotlib.use('Agg')
+            from visualizer import Visualizer
+            visualizer = Visualizer(interactive=False)
+            for analysis_type in ANALYSIS_METHODS:
+                method = getattr(visualizer, ANALYSIS_CHARTS[analysis_type][0])
+                stages.append((f"render:{analysis_type}",
+                               lambda analysis_type=analysis_type, method=method:
+                               self.render_chart(method, *states[0]['results'][analysis_type])))
+        return stages
+    
+    def stage_kind(self, name):
+        """Profiler stage of a benchmark stage name ('polars/analyze:trends' -> 'analyze')"""
+        return PROFILER_STAGES[name.split('/')[-1].split(':')[0]]
+    
+    def render_chart(self, method, analysis_data, error):
+        """Draw one chart off-screen and discard it (printed summaries are suppressed)"""
+        if error:
+            return
+        import matplotlib.pyplot as plt
+        with redirect_stdout(io.StringIO()):
+            figure = method(analysis_data)
+        if figure is not None:
+            figure.canvas.draw()
+            plt.close(figure)
+    
+    def measure_memory(self, stages):
+        """Peak traced memory of each stage (one pass under tracemalloc, kept apart from timing)"""
+        profiler = Profiler(trace_memory=True)
+        with profiler:
+            for name, stage in stages:
+                with profiler.measure(self.stage_kind(name), name):
+                    stage()
+        return {name: record['peak_memory'] for name, record in profiler.records.items()}
+    
+    def measure_time(self, stages):
+        """Wall-clock samples of each stage over `repeat` untraced passes"""
+        samples = {name: [] for name, _ in stages}
+        for _ in range(self.repeat):
+            for name, stage in stages:
+                start = time.perf_counter()
+                stage()
+                samples[name].append(time.perf_counter() - start)
+        return samples
+    
+    def run_tier(self, rows):
+        """Time and peak memory of every stage on one dataset size"""
+        file_path = self.dataset_path(rows)
+        stages = self.stages(file_path)
+        peaks = self.measure_memory(stages) if self.trace_memory else {}
+        samples = self.measure_time(stages)
+        
+        results = {}
+        for name, seconds in samples.items():
+            results[name] = {
+                'min_seconds': min(seconds),
+                'median_seconds': statistics.median(seconds),
+                'samples': seconds,
+                'peak_memory': peaks.get(name)
+            }
+        return {'rows': rows, 'file_bytes': os.path.getsize(file_path), 'stages': results}
+    
+    def environment(self):
+        """Commit and library versions, so results from different runs can be told apart"""
+        try:
+            commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                    cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10).stdout.strip() or None
+        except (OSError, subprocess.SubprocessError):
+            commit = None
+        return {
+            'commit': commit,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'seed': self.seed,
+            'repeat': self.repeat,
+            'generator_version': GENERATOR_VERSION,
+            'render': self.render,
+            'engines': self.engines
+        }
+    
+    def run(self):
+        """Benchmark every tier; returns the JSON-ready results"""
+        return {
+            'environment': self.environment(),
+            'tiers': {str(rows): self.run_tier(rows) for rows in self.tiers}
+        }
+    
+    def print_results(self, results, baseline=None):
+        """Table per tier; with a baseline, the change of each median against it"""
+        for tier, tier_results in results['tiers'].items():
+            base_stages = (baseline or {}).get('tiers', {}).get(tier, {}).get('stages', {})
+            print(f"\n{int(tier):,} rows ({tier_results['file_bytes'] / 1024 / 1024:.1f} MiB)")
+            print(f"{'Stage':<30} {'Median':>10} {'Min':>10} {'Peak mem':>10} {'vs base':>9}")
+            print("-" * 73)
+            for name, stage in tier_results['stages'].items():
+                peak = f"{stage['peak_memory'] / 1024 / 1024:.1f}MiB" if stage['peak_memory'] is not None else '-'
+                change = '-'
+                if name in base_stages:
+                    change = f"{(stage['median_seconds'] / base_stages[name]['median_seconds'] - 1) * 100:+.1f}%"
+                print(f"{name:<30} {stage['median_seconds'] * 1000:>8.1f}ms {stage['min_seconds'] * 1000:>8.1f}ms "
+                      f"{peak:>10} {change:>9}")
+            if len(self.engines) > 1:
+                print(self.engine_totals(tier_results['stages']))
+    
+    def engine_totals(self, stages):
+        """One line comparing the summed load and analysis medians of each engine"""
+        totals = {}
+        for engine in self.engines:
+            prefix = '' if engine == 'pandas' else f"{engine}/"
+            totals[engine] = sum(stage['median_seconds'] for name, stage in stages.items()
+                                 if name.startswith(prefix) and self.stage_kind(name) != 'visualize'
+                                 and (prefix or '/' not in name))
+        first = self.engines[0]
+        parts = [f"{engine} {seconds * 1000:.1f}ms" + (f" ({totals[first] / seconds:.2f}x {first})"
+                                                      if engine != first and seconds else '')
+                 for engine, seconds in totals.items()]
+        return "Load + analyses: " + ', '.join(parts)
+
+def main():
+    """Entry point for the scaling benchmark"""
+    parser = argparse.ArgumentParser(description='Time and peak memory of loading and each analysis across dataset sizes')
+    parser.add_argument('--tiers', type=int, nargs='+', default=DEFAULT_TIERS,
+                        help='Dataset sizes in rows (default: 10000 100000 1000000)')
+    parser.add_argument('--seed', type=int, default=0, help='Synthetic catalog seed (default: 0)')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed passes per stage (default: 3)')
+    parser.add_argument('--data-dir', default='.bench_data', help='Where generated catalogs are cached')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the tracemalloc pass')
+    parser.add_argument('--render', action='store_true', help='Also time a headless (Agg) render of each chart')
+    parser.add_argument('--engines', nargs='+', choices=ENGINE_NAMES, default=['pandas'],
+                        help='Analysis engines to time side by side (default: pandas)')
+    parser.add_argument('--output', '-o', metavar='JSON_FILE', help='Write the results as JSON')
+    parser.add_argument('--baseline', metavar='JSON_FILE', help='Show changes against an earlier results file')
+    args = parser.parse_args()
+    
+    suite = BenchmarkSuite(tiers=args.tiers, seed=args.seed, repeat=args.repeat, data_dir=args.data_dir,
+                           trace_memory=not args.no_memory, render=args.render, engines=args.engines)
+    results = suite.run()
+    
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    suite.print_results(results, baseline)
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to '{args.output}'")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,350 @@
+import os
+import numpy as np
+import pandas as pd
+from dataLoader import DataLoader
+
+# Rows parsed at a time when a scan applies pushed-down filters while reading
+SCAN_CHUNK_ROWS = 100000
+
+def as_text(value):
+    """How a number parsed from one chunk is spelled in the file (1984.0 -> '1984')"""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+class Predicate:
+    def __init__(self, column, op, value=None):
+        """Row condition on a column; conditions joined with & must all hold"""
+        self.terms = [(column, op, value)]
+    
+    def __and__(self, other):
+        combined = Predicate(None, None)
+        combined.terms = self.terms + other.terms
+        return combined
+    
+    def __repr__(self):
+        return ' & '.join(f"{column} {op}" + ('' if value is None else f" {value!r}")
+                          for column, op, value in self.terms)
+    
+    def columns(self):
+        """Columns the condition reads"""
+        return [column for column, _, _ in self.terms]
+    
+    def between(self, values, low, high):
+        """Boolean Series of values in [low, high]"""
+        if not isinstance(values.dtype, pd.CategoricalDtype):
+            return (values >= low) & (values <= high)
+        # Interned columns have no order to compare by: test each distinct value once and look
+        # the answer up by code (code -1, a missing value, takes the trailing False)
+        categories = values.cat.categories
+        inside = np.append(np.asarray((categories >= low) & (categories <= high), dtype=bool), False)
+        return pd.Series(inside[values.cat.codes.to_numpy()], index=values.index)
+    
+    def mask(self, frame):
+        """Boolean Series of the rows of frame meeting every term"""
+        mask = None
+        for column, op, value in self.terms:
+            values = frame[column]
+            if op == 'between':
+                term = self.between(values, *value)
+            elif op == '==':
+                term = values == value
+            elif op == 'isin':
+                term = values.isin(value)
+            elif op == 'not_null':
+                term = values.notna()
+            else:
+                # Both null values and empty strings count as missing
+                term = values.isnull() | (values == '')
+            mask = term if mask is None else mask & term
+        return mask
+
+class Column:
+    def __init__(self, name):
+        """Column reference that builds predicates: col('year').between(2015, 2020)"""
+        self.name = name
+    
+    def __eq__(self, value):
+        return Predicate(self.name, '==', value)
+    
+    def between(self, low, high):
+        """Values in [low, high]"""
+        return Predicate(self.name, 'between', (low, high))
+    
+    def isin(self, values):
+        """Values equal to one of values"""
+        return Predicate(self.name, 'isin', list(values))
+    
+    def not_null(self):
+        """Values that are present"""
+        return Predicate(self.name, 'not_null')
+    
+    def is_missing(self):
+        """Null values or empty strings"""
+        return Predicate(self.name, 'missing')
+
+def col(name):
+    """Column reference for Query.filter"""
+    return Column(name)
+
+class Query:
+    def __init__(self, source, steps=None, data_loader=None):
+        """Lazy plan over a CSV path or a DataFrame; nothing is read until collect()"""
+        self.source = source
+        self.steps = steps or []
+        self.data_loader = data_loader or DataLoader()
+    
+    def then(self, *step):
+        """New query with one more step (queries are immutable, so plans can share a prefix)"""
+        return Query(self.source, self.steps + [step], self.data_loader)
+    
+    def filter(self, predicate):
+        """Keep the rows meeting predicate"""
+        return self.then('filter', predicate)
+    
+    def head(self, n):
+        """Keep the first n rows"""
+        return self.then('head', n)
+    
+    def with_years(self, date_col, extract, name=None):
+        """Add (or replace date_col with) publication years computed by extract (e.g. Analyzer.extract_years)"""
+        return self.then('years', date_col, name or date_col, extract)
+    
+    def select(self, columns):
+        """Keep only columns: a list of names, or a dict of {new name: column}"""
+        if not isinstance(columns, dict):
+            columns = {name: name for name in columns}
+        return self.then('select', columns)
+    
+    def group_by(self, *keys):
+        """Group rows by keys; follow with count()"""
+        return self.then('group_by', list(keys))
+    
+    def count(self):
+        """Number of rows, or rows per group (largest first, ties in first-seen order) after group_by"""
+        return self.then('count')
+    
+    def top(self, n, offset=0):
+        """The n largest group counts after skipping the offset largest (for paging)"""
+        return self.then('top', n, offset)
+    
+    def distinct(self):
+        """Number of groups after group_by"""
+        return self.then('distinct')
+    
+    def sort_index(self):
+        """Group counts ordered by key"""
+        return self.then('sort_index')
+    
+    def optimize(self):
+        """(pushed, rest): the work the loader does while reading, and the steps left for memory"""
+        # Fusion: adjacent filters become one predicate, evaluated in a single pass
+        steps = []
+        for step in self.steps:
+            if step[0] == 'filter' and steps and steps[-1][0] == 'filter':
+                steps[-1] = ('filter', steps[-1][1] & step[1])
+            elif (step[0] == 'top' and len(steps) >= 2 and steps[-1] == ('count',) and steps[-2][0] == 'group_by'
+                  and len(steps[-2][1]) == 1):
+                # Partial sort: only the n + offset largest counts of a single key are ranked
+                steps[-1] = ('top_count',) + step[1:]
+            else:
+                steps.append(step)
+        
+        # Predicate pushdown: a leading head becomes the parser's row limit, and a filter right
+        # after it (still on file columns) is applied to each chunk as it is read
+        pushed = {'nrows': None, 'predicate': None, 'columns': self.source_columns(steps)}
+        if steps and steps[0][0] == 'head':
+            pushed['nrows'] = steps.pop(0)[1]
+        if steps and steps[0][0] == 'filter':
+            pushed['predicate'] = steps.pop(0)[1]
+        return pushed, steps
+    
+    def source_columns(self, steps):
+        """Projection pushdown: the file columns a plan reads, or None when it returns whole rows"""
+        needed = []
+        derived = set()
+        for step in steps:
+            if step[0] == 'filter':
+                referenced = step[1].columns()
+            elif step[0] == 'years':
+                referenced = [step[1]]
+            elif step[0] in ('select', 'group_by'):
+                referenced = list(step[1].values()) if step[0] == 'select' else step[1]
+            else:
+                referenced = []
+            needed += [name for name in referenced if name not in derived and name not in needed]
+            if step[0] == 'years':
+                derived.add(step[2])
+            elif step[0] == 'select':
+                # Only the selected columns flow on, under their new names
+                return needed
+        if any(step[0] in ('group_by', 'count', 'top_count', 'distinct') for step in steps):
+            return needed
+        return None
+    
+    def explain(self):
+        """Optimized plan as text, one line per operator"""
+        pushed, rest = self.optimize()
+        if isinstance(self.source, pd.DataFrame):
+            lines = [f"Frame rows={len(self.source)}"]
+        else:
+            lines = [f"Scan {os.path.basename(self.source)}"]
+        lines[0] += f" columns={'*' if pushed['columns'] is None else pushed['columns']}"
+        if pushed['nrows'] is not None:
+            lines[0] += f" nrows={pushed['nrows']}"
+        if pushed['predicate'] is not None:
+            lines[0] += f" filter=({pushed['predicate']})"
+        for step in rest:
+            lines.append('  ' + ' '.join(str(part) for part in step if part is not None and not callable(part)))
+        return '\n'.join(lines)
+    
+    def read(self, pushed):
+        """Source rows after the pushed-down row limit, projection and filter"""
+        if isinstance(self.source, pd.DataFrame):
+            frame = self.source if pushed['nrows'] is None else self.source.head(pushed['nrows'])
+            self.check_columns(list(frame.columns), pushed)
+            if pushed['columns'] is not None:
+                frame = frame[pushed['columns']]
+            return frame if pushed['predicate'] is None else frame[pushed['predicate'].mask(frame)]
+        
+        if not os.path.exists(self.source):
+            raise FileNotFoundError(f"File '{self.source}' not found.")
+        with self.data_loader.source(self.source) as source:
+            header = list(pd.read_csv(source, nrows=0).columns)
+        self.check_columns(header, pushed)
+        # A plain row count still has to parse one column to find the records
+        usecols = pushed['columns'] if pushed['columns'] != [] else header[:1]
+        
+        with self.data_loader.source(self.source) as source:
+            if pushed['predicate'] is None:
+                frame = pd.read_csv(source, usecols=usecols, nrows=pushed['nrows'])
+            else:
+                # Only matching rows of each chunk are kept, so memory follows the result, not the file
+                pieces = [chunk[pushed['predicate'].mask(chunk)]
+                          for chunk in pd.read_csv(source, usecols=usecols, nrows=pushed['nrows'],
+                                                   chunksize=SCAN_CHUNK_ROWS)]
+                frame = self.unify_types(pd.concat(pieces)) if pieces else pd.DataFrame(columns=usecols)
+        return frame if pushed['columns'] != [] else frame.iloc[:, :0]
+    
+    def check_columns(self, available, pushed):
+        """Raise for projected columns the source does not have"""
+        missing = [name for name in pushed['columns'] or [] if name not in available]
+        if missing:
+            raise ValueError(f"Column(s) {missing} not found in dataset! Available columns: {available}")
+    
+    def unify_types(self, frame):
+        """Columns read chunk by chunk, typed as a single read would type them"""
+        # Each chunk infers its own dtypes, so '1984' is an int where a chunk holds only numbers and
+        # text elsewhere; read whole, such a column is text throughout
+        for name in frame.columns:
+            values = frame[name]
+            if values.dtype != object:
+                continue
+            present = values.dropna()
+            is_text = present.map(lambda value: isinstance(value, str))
+            if is_text.any() and not is_text.all():
+                frame[name] = values.map(lambda value: value if isinstance(value, str) or pd.isna(value)
+                                         else as_text(value))
+        return frame
+    
+    def group_counts(self, values):
+        """(distinct values, their counts, their first-seen ranks) of a column, unsorted"""
+        if not isinstance(values.dtype, pd.CategoricalDtype):
+            # Without sorting, value_counts() lists values in first-seen order
+            counts = values.value_counts(sort=False)
+            return counts.index, counts.to_numpy(), np.arange(len(counts))
+        # Interned columns are counted with np.bincount over the codes
+        codes = values.cat.codes.to_numpy()
+        codes = codes[codes >= 0]
+        counts = np.bincount(codes, minlength=len(values.cat.categories))
+        present = np.flatnonzero(counts)
+        # Ties go to the value seen first in these rows, which after a filter need not be category order
+        first = np.full(len(counts), len(codes))
+        np.minimum.at(first, codes, np.arange(len(codes)))
+        return values.cat.categories[present], counts[present], first[present]
+    
+    def leading(self, counts, first, k):
+        """Positions of the k largest counts (ties to the first seen), in no particular order"""
+        if k >= len(counts):
+            return np.arange(len(counts))
+        if k <= 0:
+            return np.arange(0)
+        # np.argpartition finds the k-th largest count in O(groups), without sorting them all
+        kth = counts[np.argpartition(-counts, k - 1)[k - 1]]
+        larger = np.flatnonzero(counts > kth)
+        tied = np.flatnonzero(counts == kth)
+        needed = k - len(larger)
+        if needed < len(tied):
+            tied = tied[np.argpartition(first[tied], needed - 1)[:needed]]
+        return np.concatenate([larger, tied])
+    
+    def value_counts(self, values, n=None, offset=0):
+        """values.value_counts(), or its rows offset:offset + n ranked by partial selection"""
+        if n is None and not isinstance(values.dtype, pd.CategoricalDtype):
+            return values.value_counts()
+        labels, counts, first = self.group_counts(values)
+        keep = np.arange(len(counts)) if n is None else self.leading(counts, first, offset + n)
+        order = keep[np.lexsort((first[keep], -counts[keep]))]
+        if n is not None:
+            order = order[offset:offset + n]
+        return pd.Series(counts[order], index=pd.Index(labels[order], name=values.name), name='count')
+    
+    def decoded(self, frame, keys):
+        """frame with interned key columns turned back into their values"""
+        # Grouping on categoricals would sort by category (first-seen) order instead of by value
+        return frame.assign(**{key: frame[key].astype(frame[key].cat.categories.dtype) for key in keys
+                               if isinstance(frame[key].dtype, pd.CategoricalDtype)})
+    
+    def collect(self):
+        """Execute the plan once: a DataFrame of rows, a Series of counts, or a row count"""
+        pushed, rest = self.optimize()
+        if isinstance(self.source, pd.DataFrame) and pushed['predicate'] is not None and rest == [('count',)]:
+            # Counting matching rows needs only the mask, not a filtered copy of the frame
+            frame = self.source if pushed['nrows'] is None else self.source.head(pushed['nrows'])
+            self.check_columns(list(frame.columns), pushed)
+            return int(pushed['predicate'].mask(frame).sum())
+        result = self.read(pushed)
+        keys = []
+        for step in rest:
+            kind = step[0]
+            if kind == 'head':
+                result = result.head(step[1])
+            elif kind == 'filter':
+                result = result[step[1].mask(result)]
+            elif kind == 'years':
+                _, date_col, name, extract = step
+                result = result.assign(**{name: extract(result[date_col])})
+            elif kind == 'select':
+                result = pd.DataFrame({name: result[column] for name, column in step[1].items()})
+            elif kind == 'group_by':
+                keys = step[1]
+            elif kind == 'count':
+                if not keys:
+                    result = len(result)
+                elif len(keys) == 1:
+                    result = self.value_counts(result[keys[0]])
+                else:
+                    result = self.decoded(result, keys).groupby(keys).size()
+            elif kind == 'top_count':
+                result = self.value_counts(result[keys[0]], step[1], step[2])
+            elif kind == 'distinct':
+                result = (len(self.group_counts(result[keys[0]])[1]) if len(keys) == 1
+                          else len(self.decoded(result, keys).groupby(keys).size()))
+            elif kind == 'top':
+                result = result.sort_values(ascending=False, kind='stable').iloc[step[2]:step[2] + step[1]]
+            elif kind == 'sort_index':
+                result = result.sort_index()
+        return result
+
+class Catalog:
+    def __init__(self, data_loader=None):
+        """Entry point of the lazy query API: Catalog().scan(path).filter(...).group_by(...).count()"""
+        self.data_loader = data_loader or DataLoader()
+    
+    def scan(self, file_path):
+        """Query over a CSV file (plain or compressed), read only when collected"""
+        return Query(file_path, data_loader=self.data_loader)
+    
+    def frame(self, df):
+        """Query over an already loaded DataFrame"""
+        return Query(df, data_loader=self.data_loader)
@@ -0,0 +1,264 @@
+import json
+import os
+import sqlite3
+import pandas as pd
+from dataLoader import DataLoader
+from analyzer import (Analyzer, DATE_COLUMNS, AUTHOR_COLUMNS, LANGUAGE_COLUMNS, PUBLISHER_COLUMNS,
+                      YEAR_LANGUAGE_LIMIT)
+
+# Accepted column names for book titles (indexed for full-text search)
+TITLE_COLUMNS = ['title', 'book', 'book_title', 'name']
+
+# Indexed columns of the books table
+INDEXED_COLUMNS = ['year', 'language', 'publisher', 'author']
+
+class CatalogStore:
+    def __init__(self, db_path):
+        """Initialize CatalogStore backed by a local SQLite file"""
+        self.db_path = db_path
+        # Autocommit mode: ingest manages its own transaction so a failed load keeps the previous catalog
+        self.connection = sqlite3.connect(db_path, isolation_level=None)
+        self.analyzer = Analyzer()
+    
+    def close(self):
+        """Close the database connection"""
+        self.connection.close()
+    
+    def find_column(self, columns, candidates):
+        """First accepted column name present in the header"""
+        for col in candidates:
+            if col in columns:
+                return col
+        return None
+    
+    def meta(self):
+        """Ingest metadata (source file, columns), or {} for an empty database"""
+        try:
+            rows = self.connection.execute("SELECT key, value FROM meta").fetchall()
+        except sqlite3.OperationalError:
+            return {}
+        return {key: json.loads(value) for key, value in rows}
+    
+    def source_stamp(self, file_path):
+        """Path, size and modification time identifying one version of the source file"""
+        stat = os.stat(file_path)
+        return {'path': os.path.abspath(file_path), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    
+    def is_current(self, file_path):
+        """True when the database holds the current version of file_path"""
+        source = self.meta().get('source')
+        return source is not None and os.path.exists(file_path) and source == self.source_stamp(file_path)
+    
+    def is_stale(self, file_path):
+        """True when file_path is the ingested source and has changed since"""
+        source = self.meta().get('source')
+        return (source is not None and os.path.exists(file_path)
+                and source['path'] == os.path.abspath(file_path) and not self.is_current(file_path))
+    
+    def other_source(self, file_path):
+        """Path of the ingested source when it is a file other than file_path, else None"""
+        source = self.meta().get('source')
+        if source is None or source['path'] == os.path.abspath(file_path):
+            return None
+        return source['path']
+    
+    def create_schema(self, isbn_count):
+        """Drop any previous catalog and create the tables"""
+        isbn_columns = ''.join(f", isbn_{number} TEXT" for number in range(isbn_count))
+        for table in ('books_fts', 'books', 'meta'):
+            self.connection.execute(f"DROP TABLE IF EXISTS {table}")
+        self.connection.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self.connection.execute("CREATE TABLE books (id INTEGER PRIMARY KEY, title TEXT, author TEXT, year INTEGER, "
+                                f"language TEXT, publisher TEXT{isbn_columns})")
+    
+    def column_values(self, chunk, col):
+        """Column values as Python objects with None for missing (None when the column is absent)"""
+        if col is None:
+            return [None] * len(chunk)
+        values = chunk[col].astype(object)
+        return values.where(values.notna(), None).tolist()
+    
+    def text_values(self, chunk, col):
+        """Column values as text, numbers spelled as in the CSV (a chunk with gaps parses 1984 as 1984.0)"""
+        return [None if value is None else
+                str(int(value)) if isinstance(value, float) and value.is_integer() else str(value)
+                for value in self.column_values(chunk, col)]
+    
+    def ingest(self, file_path, chunk_rows=100000):
+        """Load a CSV chunk by chunk through DataLoader into the database; returns the row count or None"""
+        fields = None
+        total_rows = 0
+        self.connection.execute("BEGIN")
+        try:
+            for chunk in DataLoader().load_chunks(file_path, chunk_rows):
+                if fields is None:
+                    columns = list(chunk.columns)
+                    fields = {
+                        'title': self.find_column(columns, TITLE_COLUMNS),
+                        'author': self.find_column(columns, AUTHOR_COLUMNS),
+                        'date': self.find_column(columns, DATE_COLUMNS),
+                        'language': self.find_column(columns, LANGUAGE_COLUMNS),
+                        'publisher': self.find_column(columns, PUBLISHER_COLUMNS),
+                        'isbn': [col for col in columns if 'isbn' in col.lower()]
+                    }
+                    self.create_schema(len(fields['isbn']))
+                    placeholders = ', '.join('?' * (5 + len(fields['isbn'])))
+                    insert = f"INSERT INTO books VALUES (NULL, {placeholders})"
+                
+                # Years are extracted once at ingest; the validity window is applied at query time
+                if fields['date'] is not None:
+                    years = self.analyzer.extract_years(chunk[fields['date']])
+                    years = [None if pd.isna(year) else int(year) for year in years]
+                else:
+                    years = [None] * len(chunk)
+                
+                # Stored as text even where a chunk parsed the column as numbers, so '1984' counts as one value
+                isbn_values = [self.text_values(chunk, col) for col in fields['isbn']]
+                rows = zip(self.text_values(chunk, fields['title']), self.text_values(chunk, fields['author']),
+                           years, self.text_values(chunk, fields['language']),
+                           self.text_values(chunk, fields['publisher']), *isbn_values)
+                self.connection.executemany(insert, rows)
+                total_rows += len(chunk)
+            
+            if fields is None:
+                self.connection.execute("ROLLBACK")
+                return None
+            
+            for col in INDEXED_COLUMNS:
+                self.connection.execute(f"CREATE INDEX idx_books_{col} ON books ({col})")
+            self.connection.execute("CREATE VIRTUAL TABLE books_fts USING fts5(title, content='books', content_rowid='id')")
+            self.connection.execute("INSERT INTO books_fts (books_fts) VALUES ('rebuild')")
+            
+            meta = {'source': self.source_stamp(file_path), 'columns': columns, 'fields': fields, 'rows': total_rows}
+            self.connection.executemany("INSERT INTO meta VALUES (?, ?)",
+                                        [(key, json.dumps(value)) for key, value in meta.items()])
+            self.connection.execute("COMMIT")
+        except Exception:
+            if self.connection.in_transaction:
+                self.connection.execute("ROLLBACK")
+            raise
+        self.connection.execute("ANALYZE")
+        return total_rows
+    
+    def query(self, sql, params=()):
+        """Rows of a read-only query"""
+        return self.connection.execute(sql, params).fetchall()
+    
+    def search(self, text, limit=20):
+        """Books whose title matches an FTS5 query, best matches first"""
+        return pd.DataFrame(self.query(
+            "SELECT b.title, b.author, b.year, b.language, b.publisher FROM books_fts "
+            "JOIN books b ON b.id = books_fts.rowid WHERE books_fts MATCH ? ORDER BY rank LIMIT ?",
+            (text, limit)), columns=['title', 'author', 'year', 'language', 'publisher'])
+
+class SqlAnalyzer(Analyzer):
+    def __init__(self, store):
+        """Analyzer answering every analysis with an aggregate query; the df argument is ignored"""
+        super().__init__()
+        self.store = store
+        meta = store.meta()
+        self.columns = meta.get('columns', [])
+        self.fields = meta.get('fields', {})
+        self.total_rows = meta.get('rows', 0)
+    
+    def missing_column_error(self, name):
+        """Same message the Analyzer gives for a missing column"""
+        return f"{name} column not found in dataset! Available columns: {self.columns}"
+    
+    def counts(self, column, limit=None, offset=0):
+        """Value counts of a column, ties in first-seen order like value_counts()"""
+        sql = (f"SELECT {column}, COUNT(*) FROM books WHERE {column} IS NOT NULL "
+               f"GROUP BY {column} ORDER BY COUNT(*) DESC, MIN(id)")
+        # SQLite needs a LIMIT before an OFFSET; -1 means no limit
+        rows = self.store.query(sql + " LIMIT ? OFFSET ?", (-1 if limit is None else limit, offset))
+        return pd.Series([count for _, count in rows], index=[value for value, _ in rows], dtype='int64')
+    
+    def analyze_publication_trends(self, df=None):
+        """Publication trends from a GROUP BY on the indexed year column"""
+        if self.fields.get('date') is None:
+            return None, self.missing_column_error("Publication date")
+        rows = self.store.query("SELECT year, COUNT(*) FROM books WHERE year BETWEEN ? AND ? "
+                                "GROUP BY year ORDER BY year", self.valid_year_bounds())
+        if not rows:
+            return None, "No valid publication years found in the data"
+        
+        year_counts = pd.Series(dict(rows), dtype='int64')
+        return {
+            'year_counts': year_counts,
+            'total_years': len(year_counts),
+            'most_productive_year': year_counts.idxmax(),
+            'most_productive_count': year_counts.max(),
+            'least_productive_year': year_counts.idxmin(),
+            'least_productive_count': year_counts.min()
+        }, None
+    
+    def analyze_top_authors(self, df=None, top_n=5, offset=0):
+        """Top authors from the author index"""
+        if self.fields.get('author') is None:
+            return None, self.missing_column_error("Authors")
+        return {'author_counts': self.counts('author', top_n, offset), 'top_n': top_n, 'offset': offset}, None
+    
+    def analyze_language_distribution(self, df=None):
+        """Language counts and shares of all records"""
+        if self.fields.get('language') is None:
+            return None, self.missing_column_error("Language")
+        lang_counts = self.counts('language')
+        return {
+            'lang_counts': lang_counts,
+            'lang_percentages': (lang_counts / self.total_rows * 100).round(1),
+            'total_books': self.total_rows
+        }, None
+    
+    def analyze_books_by_publisher(self, df=None, top_n=20, offset=0):
+        """Top publishers and the number of distinct publishers"""
+        if self.fields.get('publisher') is None:
+            return None, self.missing_column_error("Publisher")
+        total_publishers = self.store.query("SELECT COUNT(DISTINCT publisher) FROM books")[0][0]
+        return {
+            'publisher_counts': self.counts('publisher', top_n, offset),
+            'total_publishers': total_publishers,
+            'top_n': top_n,
+            'offset': offset
+        }, None
+    
+    def analyze_missing_isbn(self, df=None):
+        """Missing (NULL or empty) values of every ISBN column in one scan"""
+        isbn_cols = self.fields.get('isbn', [])
+        if not isbn_cols:
+            return None, "No ISBN columns found in dataset!"
+        
+        sums = ', '.join(f"SUM(isbn_{number} IS NULL OR isbn_{number} = '')" for number in range(len(isbn_cols)))
+        missing = self.store.query(f"SELECT {sums} FROM books")[0]
+        isbn_analysis = {}
+        for isbn_col, missing_count in zip(isbn_cols, missing):
+            missing_count = missing_count or 0
+            isbn_analysis[isbn_col] = {
+                'total_records': self.total_rows,
+                'present_count': self.total_rows - missing_count,
+                'missing_count': missing_count,
+                'missing_percentage': missing_count / self.total_rows * 100 if self.total_rows else 0.0
+            }
+        return {'isbn_analysis': isbn_analysis, 'total_records': self.total_rows}, None
+    
+    def analyze_books_per_year_by_language(self, df=None):
+        """Year by language counts over the first YEAR_LANGUAGE_LIMIT records"""
+        if self.fields.get('date') is None or self.fields.get('language') is None:
+            missing_cols = [name for name, field in (("publication date", 'date'), ("language", 'language'))
+                            if self.fields.get(field) is None]
+            return None, f"{' and '.join(missing_cols)} column(s) not found in dataset! Available columns: {self.columns}"
+        
+        rows = self.store.query(
+            "SELECT year, language, COUNT(*) FROM (SELECT year, language FROM books ORDER BY id LIMIT ?) "
+            "WHERE year BETWEEN ? AND ? AND language IS NOT NULL GROUP BY year, language",
+            (YEAR_LANGUAGE_LIMIT, *self.valid_year_bounds()))
+        if not rows:
+            return None, "No valid year-language data found"
+        
+        year_lang_counts = pd.Series({(year, language): count for year, language, count in rows})
+        year_lang_counts = year_lang_counts.unstack(fill_value=0).sort_index()
+        year_lang_counts = year_lang_counts[sorted(year_lang_counts.columns)]
+        return {
+            'year_lang_counts': year_lang_counts,
+            'years': sorted(year_lang_counts.index),
+            'languages': list(year_lang_counts.columns)
+        }, None
@@ -1,12 +1,38 @@
 import argparse
+import os
 import sys
+import time
 from main import Main
+from analyzer import ANALYSIS_METHODS, ANALYSIS_CHARTS, ENGINE_NAMES, create_engine
+from terminalRenderer import TerminalRenderer
+from outputWriter import OutputWriter, OUTPUT_FORMATS
+from reportGenerator import ReportGenerator
+from analysisServer import AnalysisServer
+from asyncServer import AsyncAnalysisServer
+from csvWatcher import CsvWatcher
+from profiler import Profiler
+from metricsExporter import MetricsExporter
+from sampler import Sampler, SampledAnalyzer
+from comparison import DatasetComparison, COMPARE_TYPES
+from partitions import PartitionedDataset, is_partitioned
+from compression import detect_compression
+from catalogStore import CatalogStore, SqlAnalyzer
+from datasetIndex import DatasetIndex, parse_year_range, parse_names
+
+# All analyses in the order they appear in the menu
+ANALYSIS_TYPES = list(ANALYSIS_METHODS)
 
 class CLI:
     def __init__(self):
         """Initialize CLI class"""
         self.main_app = Main()
-        
+        self.terminal = False
+        self.writer = None
+        self.profiler = None
+        self.report_stats = None
+        # Extra keyword arguments of the analyze_* methods, set from --top / --offset
+        self.analysis_params = {}
+    
     def create_parser(self):
         """Create and configure argument parser"""
         parser = argparse.ArgumentParser(
@@ -22,6 +48,26 @@ Examples:
   python cli.py --isbn                          # Show ISBN analysis
   python cli.py --year-language                 # Show books per year by language
   python cli.py --file custom_dataset.csv       # Use custom dataset file
+  python cli.py --all --terminal                # All analyses as text charts (no matplotlib)
+  python cli.py --all --output json             # Machine-readable results on stdout
+  python cli.py --report weekly.html            # Self-contained HTML/SVG report
+  python cli.py --pdf report.pdf                # All charts in one multi-page PDF
+  python cli.py --serve --port 8080             # JSON analysis server, dataset kept in memory
+  python cli.py --serve --async --workers 8     # asyncio front end with a bounded worker pool
+  python cli.py --watch --interval 5            # Follow appended rows, redraw changed results
+  python cli.py --all -T --profile              # Per-stage timings and peak memory
+  python cli.py --all -T --profile-output run.prof  # ...plus a cProfile dump for pstats
+  python cli.py --all -o json --metrics-file /var/lib/node_exporter/bookshop.prom  # OpenMetrics for cron runs
+  python cli.py --languages --sample 0.05       # Approximate answer from a 5% sample, with CIs
+  python cli.py --all -T --sample-rows 10000 --seed 7  # Fixed-size reservoir sample
+  python cli.py --compare last_month.csv this_month.csv  # Side-by-side deltas, files loaded in parallel
+  python cli.py --all -T --file 'exports/*.csv'  # Analyze partitioned exports as one dataset
+  python cli.py --all -T --db catalog.sqlite    # Answer from an indexed SQLite catalog (built on first use)
+  python cli.py --db catalog.sqlite --search 'love NOT war'  # Full-text title search
+  python cli.py --all -T --engine polars        # Analyze with the Polars backend
+  python cli.py --sql 'SELECT COUNT(*) FROM books'  # Ad-hoc SQL over the CSV with DuckDB
+  python cli.py --all -T --years 2010-2020 --language German,French  # Analyze one slice of the catalog
+  python cli.py --publishers -T --top 50 --offset 100  # Publishers ranked 101-150
             '''
         )
         
@@ -30,7 +76,7 @@ Examples:
             '--file', '-f',
             type=str,
             default='Dataset_Books.csv',
-            help='Path to the dataset CSV file (default: Dataset_Books.csv)'
+            help='Path to the dataset CSV file, or a directory / glob of CSV partitions (default: Dataset_Books.csv)'
         )
         
         # Analysis options
@@ -76,7 +122,228 @@ Examples:
             help='Show books per year categorized by language (first 1000 records only)'
         )
         
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Run all six analyses in sequence'
+        )
+        
+        # Filter options
+        parser.add_argument(
+            '--years',
+            type=str,
+            metavar='FIRST-LAST',
+            help='Only analyze books published in this year range (e.g. 2010-2020, or a single year)'
+        )
+        
+        parser.add_argument(
+            '--language',
+            type=str,
+            metavar='NAMES',
+            help='Only analyze books in these languages, comma-separated (e.g. German,French)'
+        )
+        
+        parser.add_argument(
+            '--publisher',
+            action='append',
+            metavar='NAME',
+            help='Only analyze books from this publisher (repeat for several)'
+        )
+        
+        # Ranking options
+        parser.add_argument(
+            '--top',
+            type=int,
+            metavar='N',
+            help='Number of authors / publishers to list (default: 5 authors, 20 publishers)'
+        )
+        
+        parser.add_argument(
+            '--offset',
+            type=int,
+            default=0,
+            metavar='N',
+            help='Skip the N highest-ranked authors / publishers, to page through the long tail'
+        )
+        
         # Output options
+        parser.add_argument(
+            '--terminal', '-T',
+            action='store_true',
+            help='Draw Unicode bar charts, sparklines and heatmaps in the terminal instead of matplotlib windows'
+        )
+        
+        parser.add_argument(
+            '--output', '-o',
+            choices=OUTPUT_FORMATS,
+            default='table',
+            help='Result format: table (charts and text, default), json, csv or ndjson'
+        )
+        
+        parser.add_argument(
+            '--report',
+            type=str,
+            metavar='HTML_FILE',
+            help='Write all analyses to a self-contained HTML report with inline SVG charts'
+        )
+        
+        parser.add_argument(
+            '--pdf',
+            type=str,
+            metavar='PDF_FILE',
+            help='Render every chart into one multi-page PDF (Agg backend, background writer)'
+        )
+        
+        # Server options
+        parser.add_argument(
+            '--serve',
+            action='store_true',
+            help='Run a JSON analysis server that keeps the dataset in memory and reloads it when the file changes'
+        )
+        
+        parser.add_argument(
+            '--port',
+            type=int,
+            default=8000,
+            help='Port for --serve (default: 8000)'
+        )
+        
+        parser.add_argument(
+            '--host',
+            type=str,
+            default='127.0.0.1',
+            help='Interface for --serve (default: 127.0.0.1)'
+        )
+        
+        parser.add_argument(
+            '--async',
+            dest='use_async',
+            action='store_true',
+            help='Serve through the asyncio front end (bounded executor, request coalescing, /metrics)'
+        )
+        
+        parser.add_argument(
+            '--executor',
+            choices=['thread', 'process'],
+            default='thread',
+            help='Worker pool for --async analyses (default: thread)'
+        )
+        
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=4,
+            help='Number of --async workers, or of --compare / partition loader processes (default: 4)'
+        )
+        
+        parser.add_argument(
+            '--max-pending',
+            type=int,
+            default=64,
+            help='Distinct in-flight --async analyses before requests are rejected with 503 (default: 64)'
+        )
+        
+        # Watch options
+        parser.add_argument(
+            '--watch',
+            action='store_true',
+            help='Tail the CSV and update the analyses incrementally as rows are appended (text charts)'
+        )
+        
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=2.0,
+            help='Seconds between --watch polls (default: 2)'
+        )
+        
+        # Profiling options
+        parser.add_argument(
+            '--profile',
+            action='store_true',
+            help='Time loading, each analysis and each chart, and report peak memory (tracemalloc)'
+        )
+        
+        parser.add_argument(
+            '--profile-output',
+            type=str,
+            metavar='PSTATS_FILE',
+            help='With --profile (implied), also write cProfile statistics for python -m pstats'
+        )
+        
+        parser.add_argument(
+            '--metrics-file',
+            type=str,
+            metavar='PROM_FILE',
+            help='Write run metrics (durations, rows, bytes, peak memory, cache hits) in OpenMetrics text format'
+        )
+        
+        parser.add_argument(
+            '--compare',
+            nargs='+',
+            metavar='FILE',
+            help='Load two or more CSV files in parallel processes and show side-by-side deltas'
+        )
+        
+        # Sampling options
+        sampling = parser.add_mutually_exclusive_group()
+        sampling.add_argument(
+            '--sample',
+            type=float,
+            metavar='FRACTION',
+            help='Analyze a random fraction of the rows (e.g. 0.05); counts are scaled up with confidence intervals'
+        )
+        
+        sampling.add_argument(
+            '--sample-rows',
+            type=int,
+            metavar='N',
+            help='Analyze a uniform reservoir sample of N rows; counts are scaled up with confidence intervals'
+        )
+        
+        parser.add_argument(
+            '--seed',
+            type=int,
+            help='Random seed for --sample / --sample-rows (repeatable samples)'
+        )
+        
+        parser.add_argument(
+            '--engine',
+            choices=ENGINE_NAMES,
+            default='pandas',
+            help='Analysis backend for a single CSV file: pandas (default), polars (multithreaded scan and group-bys) '
+                 'or duckdb (SQL over a cached Parquet copy, spilling to disk when memory runs out)'
+        )
+        
+        # Catalog store options
+        parser.add_argument(
+            '--db',
+            type=str,
+            metavar='SQLITE_FILE',
+            help='Run analyses as SQL queries on an indexed SQLite catalog, ingesting --file when it is empty or stale'
+        )
+        
+        parser.add_argument(
+            '--ingest',
+            action='store_true',
+            help='With --db, replace the catalog with --file even if it was built from another file'
+        )
+        
+        parser.add_argument(
+            '--search',
+            type=str,
+            metavar='QUERY',
+            help='With --db, list books whose title matches an FTS5 query (e.g. "love NOT war", "garden*")'
+        )
+        
+        parser.add_argument(
+            '--sql',
+            type=str,
+            metavar='QUERY',
+            help='Run a SQL query with DuckDB over --file, which is exposed as the view "books" '
+                 '(columns typed as pandas reads them)'
+        )
+        
         parser.add_argument(
             '--no-graph', '-ng',
             action='store_true',
@@ -106,69 +373,297 @@ Examples:
             print(f"Error loading dataset: {e}")
             return None
     
+    def load_sample(self, file_path, fraction, rows, seed):
+        """Load a random sample and switch to an Analyzer that scales results back to the full file"""
+        sampler = Sampler(seed=seed)
+        if self.profiler is not None:
+            self.profiler.instrument(sampler, 'load')
+        try:
+            dataset, total_rows = sampler.load(file_path, fraction=fraction, rows=rows)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return None
+        if dataset is None:
+            return None
+        
+        analyzer = SampledAnalyzer(len(dataset), total_rows)
+        if self.profiler is not None:
+            self.profiler.instrument(analyzer, 'analyze')
+        self.main_app.analyzer = analyzer
+        if self.writer is None:
+            print(f"Sampled {len(dataset):,} of {total_rows:,} rows ({len(dataset) / total_rows * 100:.1f}%) "
+                  f"from '{file_path}'; results are estimates")
+        return dataset
+    
+    def print_estimates(self, analysis_data):
+        """Confidence intervals for analyses run on a sample"""
+        if analysis_data and isinstance(self.main_app.analyzer, SampledAnalyzer):
+            lines = self.main_app.analyzer.describe_estimates(analysis_data)
+            if lines:
+                print("\n" + "\n".join(lines))
+    
+    def compare_files(self, file_paths, analysis_types, workers):
+        """Analyze several files concurrently and print (or write) comparison tables"""
+        if len(file_paths) < 2:
+            print("Error: --compare needs at least two files")
+            return False
+        
+        comparison = DatasetComparison(workers=min(workers, len(file_paths)))
+        results = comparison.run(file_paths, analysis_types)
+        if self.writer is None:
+            print("\n" + "="*66)
+            print("   DATASET COMPARISON")
+            print("="*66)
+            comparison.print_summary(results)
+        
+        for analysis_type in analysis_types:
+            if analysis_type not in COMPARE_TYPES:
+                if self.writer is None:
+                    print(f"\n(No comparison view for '{analysis_type}')")
+                continue
+            
+            table, error = comparison.compare(results, analysis_type)
+            if self.writer is not None:
+                self.writer.write(f"compare-{analysis_type}", {'comparison': table}, error)
+                continue
+            
+            print("\n" + "="*66)
+            print(f"   {ANALYSIS_CHARTS[analysis_type][1].upper()}")
+            print("="*66)
+            if error:
+                print(f"Error: {error}")
+            else:
+                print(table.astype(object).where(table.notna(), '-').to_string())
+        
+        if self.writer is not None:
+            self.writer.flush()
+        return all('error' not in result for result in results)
+    
+    def analyze_partitions(self, pattern, analysis_types, workers):
+        """Aggregate each partition in its own process and show the merged results"""
+        partitioned = PartitionedDataset(pattern, workers=workers)
+        aggregates = partitioned.aggregate()
+        if aggregates is None:
+            print(f"Error: No loadable CSV partitions match '{pattern}'")
+            return False
+        
+        if self.writer is None:
+            partitioned.print_summary()
+        for analysis_type in analysis_types:
+            analysis_data, error = aggregates.analysis_data(analysis_type)
+            if self.writer is not None:
+                self.writer.write(analysis_type, analysis_data, error)
+            else:
+                self.show_analysis(analysis_type, analysis_data, error)
+        
+        if self.writer is not None:
+            self.writer.flush()
+        return True
+    
+    def open_catalog(self, db_path, file_path, force_ingest=False):
+        """Open the SQLite catalog, (re)ingesting file_path when needed; returns a SqlAnalyzer or None"""
+        try:
+            store = CatalogStore(db_path)
+            meta = store.meta()
+            # Answering --file from a catalog of another CSV would report the wrong dataset
+            other = store.other_source(file_path)
+            if other is not None and os.path.exists(file_path) and not force_ingest:
+                print(f"Error: Catalog '{db_path}' holds '{other}', not '{file_path}'; "
+                      f"pass --ingest to replace it or --file '{other}'")
+                return None
+            if force_ingest or not meta or store.is_stale(file_path):
+                if not os.path.exists(file_path):
+                    print(f"Error: Catalog '{db_path}' needs data but file '{file_path}' not found.")
+                    return None
+                start = time.perf_counter()
+                rows = store.ingest(file_path)
+                if rows is None:
+                    print(f"Error: Failed to ingest '{file_path}' into '{db_path}'")
+                    return None
+                if self.writer is None:
+                    print(f"Ingested {rows:,} records from '{file_path}' into '{db_path}' "
+                          f"in {time.perf_counter() - start:.2f}s")
+        except Exception as e:
+            print(f"Error opening catalog '{db_path}': {e}")
+            return None
+        
+        analyzer = SqlAnalyzer(store)
+        if self.profiler is not None:
+            self.profiler.instrument(analyzer, 'analyze')
+        return analyzer
+    
+    def open_engine(self, engine, file_path):
+        """Scan file_path with an alternative analysis engine; returns its Analyzer or None"""
+        try:
+            start = time.perf_counter()
+            analyzer = create_engine(engine, file_path)
+        except Exception as e:
+            print(f"Error: Failed to load '{file_path}' with the {engine} engine: {e}")
+            return None
+        if self.verbose:
+            print(f"Loaded {analyzer.total_rows:,} records from '{file_path}' with the {engine} engine "
+                  f"in {time.perf_counter() - start:.2f}s")
+        if self.profiler is not None:
+            self.profiler.instrument(analyzer, 'analyze')
+        return analyzer
+    
+    def search_catalog(self, analyzer, query):
+        """Print (or write) the books whose titles match a full-text query"""
+        try:
+            matches = analyzer.store.search(query)
+        except Exception as e:
+            print(f"Error: Invalid search '{query}': {e}")
+            return False
+        
+        if self.writer is not None:
+            self.writer.write('search', {'query': query, 'matches': matches})
+            self.writer.flush()
+        elif matches.empty:
+            print(f"No titles match '{query}'")
+        else:
+            print(matches.to_string(index=False))
+        return True
+    
+    def run_sql(self, file_path, query):
+        """Print (or write) the result of an ad-hoc DuckDB query over the dataset"""
+        analyzer = self.open_engine('duckdb', file_path)
+        if analyzer is None:
+            return False
+        try:
+            rows = analyzer.query(query)
+        except Exception as e:
+            print(f"Error: Invalid SQL query '{query}': {e}")
+            return False
+        
+        if self.writer is not None:
+            self.writer.write('sql', {'query': query, 'rows': rows})
+            self.writer.flush()
+        elif rows.empty:
+            print("Query returned no rows")
+        else:
+            print(rows.to_string(index=False))
+        return True
+    
+    def filter_dataset(self, dataset, years, languages, publishers):
+        """Rows of dataset in the year range, languages and publishers given, or None on a bad filter"""
+        try:
+            years = parse_year_range(years) if years else None
+            languages = parse_names(languages) if languages else None
+            filtered = DatasetIndex(dataset, self.main_app.analyzer).select(years, languages, publishers)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return None
+        if self.writer is None:
+            print(f"Filtered to {len(filtered):,} of {len(dataset):,} records")
+        return filtered
+    
+    def write_analysis(self, analysis_type, dataset):
+        """Run an analysis and hand its analysis_data to the output writer"""
+        method = getattr(self.main_app.analyzer, ANALYSIS_METHODS[analysis_type])
+        analysis_data, error = method(dataset, **self.analysis_params.get(analysis_type, {}))
+        self.writer.write(analysis_type, analysis_data, error)
+    
+    def write_report(self, dataset, report_path, source_name):
+        """Generate the HTML report, reusing cached sections whose data did not change"""
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(report_path)), '.report_cache')
+        generator = ReportGenerator(cache_dir=cache_dir, analyzer=self.main_app.analyzer)
+        stats = generator.generate(dataset, report_path, source_name=source_name)
+        self.report_stats = stats
+        print(f"Report written to '{report_path}'")
+        print(f"   Sections rendered: {len(stats['rendered'])} {stats['rendered']}")
+        print(f"   Sections from cache: {len(stats['cached'])} {stats['cached']}")
+    
+    def write_pdf(self, dataset, pdf_path, analysis_types):
+        """Render the selected analyses into a multi-page PDF and report per-page timings"""
+        # Imported here so non-PDF runs (e.g. --terminal) never load matplotlib
+        from pdfReport import PdfReport
+        
+        report = PdfReport(pdf_path, analyzer=self.main_app.analyzer)
+        report.generate(dataset, analysis_types)
+        report.print_timings()
+    
+    def render_changes(self, changed, total_rows):
+        """Redraw only the analyses whose results changed since the last poll"""
+        if self.writer is not None:
+            for analysis_type, analysis_data, error in changed:
+                self.writer.write(analysis_type, analysis_data, error)
+            self.writer.flush()
+            return
+        
+        print(f"\n[{time.strftime('%H:%M:%S')}] {total_rows:,} records - updated: "
+              f"{', '.join(analysis_type for analysis_type, _, _ in changed)}")
+        renderer = TerminalRenderer()
+        for analysis_type, analysis_data, error in changed:
+            print("\n" + "="*50)
+            print(f"   {ANALYSIS_CHARTS[analysis_type][1].upper()}")
+            print("="*50)
+            if error:
+                print(f"Error: {error}")
+            else:
+                getattr(renderer, ANALYSIS_CHARTS[analysis_type][0])(analysis_data)
+    
+    def watch_file(self, file_path, analysis_types, interval, max_polls=None):
+        """Follow the CSV by byte offset and re-render results as rows are appended"""
+        if not os.path.exists(file_path):
+            print(f"Error: File '{file_path}' not found.")
+            return False
+        if detect_compression(file_path) is not None:
+            print(f"Error: --watch follows appended bytes and cannot tail compressed file '{file_path}'")
+            return False
+        
+        watcher = CsvWatcher(file_path, analysis_types, analyzer=self.main_app.analyzer, poll_interval=interval)
+        if self.writer is None:
+            print(f"Watching '{file_path}' every {interval:g}s (Ctrl+C to stop)...")
+        try:
+            watcher.watch(lambda changed: self.render_changes(changed, watcher.aggregates.total_rows),
+                          max_polls=max_polls)
+        except KeyboardInterrupt:
+            print("\nStopped watching.")
+        return True
+    
+    def write_metrics(self, metrics_path, file_path, succeeded):
+        """Export this run's profile as an OpenMetrics textfile"""
+        exporter = MetricsExporter()
+        exporter.collect_run(file_path, profiler=self.profiler, dataset=self.main_app.dataset,
+                             report_stats=self.report_stats, succeeded=succeeded)
+        try:
+            exporter.write(metrics_path)
+        except OSError as e:
+            print(f"Error writing metrics to '{metrics_path}': {e}", file=sys.stderr)
+    
+    def show_analysis(self, analysis_type, analysis_data, error):
+        """Print the heading and draw the chart (or error) for one analysis result"""
+        print("\n" + "="*50)
+        print(f"   {self.heading(analysis_type, analysis_data)}")
+        print("="*50)
+        if error:
+            print(f"Error: {error}")
+        elif analysis_type == 'isbn' and not self.terminal:
+            self.main_app.display_missing_isbn_data(analysis_data)
+            self.print_estimates(analysis_data)
+        else:
+            getattr(self.main_app.visualizer, ANALYSIS_CHARTS[analysis_type][0])(analysis_data)
+            self.print_estimates(analysis_data)
+    
+    def heading(self, analysis_type, analysis_data):
+        """Heading printed above an analysis; the authors heading names the ranks listed"""
+        if analysis_type != 'authors' or analysis_data is None or 'offset' not in analysis_data:
+            return ANALYSIS_CHARTS[analysis_type][1].upper()
+        if analysis_data['offset']:
+            first = analysis_data['offset'] + 1
+            return f"MOST PROLIFIC AUTHORS, RANKS {first}-{first + analysis_data['top_n'] - 1}"
+        return f"TOP {analysis_data['top_n']} MOST PROLIFIC AUTHORS"
+    
     def run_analysis(self, analysis_type, dataset):
         """Run specific analysis based on type"""
         try:
-            if analysis_type == 'trends':
-                print("\n" + "="*50)
-                print("   PUBLICATION TRENDS OVER TIME")
-                print("="*50)
-                analysis_data, error = self.main_app.analyzer.analyze_publication_trends(dataset)
-                if error:
-                    print(f"Error: {error}")
-                else:
-                    self.main_app.visualizer.visualize_publication_trends(analysis_data)
-                    
-            elif analysis_type == 'authors':
-                print("\n" + "="*50)
-                print("   TOP 5 MOST PROLIFIC AUTHORS")
-                print("="*50)
-                analysis_data, error = self.main_app.analyzer.analyze_top_authors(dataset)
-                if error:
-                    print(f"Error: {error}")
-                else:
-                    self.main_app.visualizer.visualize_top_authors(analysis_data)
-                    
-            elif analysis_type == 'languages':
-                print("\n" + "="*50)
-                print("   LANGUAGE DISTRIBUTION")
-                print("="*50)
-                analysis_data, error = self.main_app.analyzer.analyze_language_distribution(dataset)
-                if error:
-                    print(f"Error: {error}")
-                else:
-                    self.main_app.visualizer.visualize_language_distribution(analysis_data)
-                    
-            elif analysis_type == 'publishers':
-                print("\n" + "="*50)
-                print("   BOOKS BY PUBLISHER")
-                print("="*50)
-                analysis_data, error = self.main_app.analyzer.analyze_books_by_publisher(dataset)
-                if error:
-                    print(f"Error: {error}")
-                else:
-                    self.main_app.visualizer.visualize_books_by_publisher(analysis_data)
-                    
-            elif analysis_type == 'isbn':
-                print("\n" + "="*50)
-                print("   MISSING ISBN ANALYSIS")
-                print("="*50)
-                analysis_data, error = self.main_app.analyzer.analyze_missing_isbn(dataset)
-                if error:
-                    print(f"Error: {error}")
-                else:
-                    self.main_app.display_missing_isbn_data(analysis_data)
-                    
-            elif analysis_type == 'year-language':
-                print("\n" + "="*50)
-                print("   BOOKS PER YEAR BY LANGUAGE (FIRST 1000 RECORDS)")
-                print("="*50)
-                analysis_data, error = self.main_app.analyzer.analyze_books_per_year_by_language(dataset)
-                if error:
-                    print(f"Error: {error}")
-                else:
-                    self.main_app.visualizer.visualize_books_per_year_by_language(analysis_data)
-                    
+            if self.writer is not None:
+                self.write_analysis(analysis_type, dataset)
+            elif analysis_type in ANALYSIS_METHODS:
+                method = getattr(self.main_app.analyzer, ANALYSIS_METHODS[analysis_type])
+                analysis_data, error = method(dataset, **self.analysis_params.get(analysis_type, {}))
+                self.show_analysis(analysis_type, analysis_data, error)
+        
         except KeyboardInterrupt:
             print("\n\nAnalysis interrupted by user (Ctrl+C)")
         except Exception as e:
@@ -182,12 +677,34 @@ Examples:
         # Store verbose flag
         self.verbose = args.verbose
         
-        # Load dataset
-        dataset = self.load_dataset(args.file)
-        if dataset is None:
-            sys.exit(1)
+        if not (args.profile or args.profile_output or args.metrics_file):
+            self.execute(args)
+            return
         
-        self.main_app.dataset = dataset
+        self.profiler = Profiler(cprofile_path=args.profile_output)
+        self.main_app.enable_profiling(self.profiler)
+        self.profiler.start()
+        succeeded = False
+        try:
+            self.execute(args)
+            succeeded = True
+        finally:
+            self.profiler.stop()
+            if args.profile or args.profile_output:
+                self.profiler.print_report(sys.stderr if self.writer is not None else None)
+            if args.metrics_file:
+                self.write_metrics(args.metrics_file, args.file, succeeded)
+    
+    def execute(self, args):
+        """Run whatever the parsed arguments ask for"""
+        # Terminal charts replace the matplotlib Visualizer before it is ever imported
+        self.terminal = args.terminal
+        if self.terminal:
+            self.main_app.visualizer = TerminalRenderer()
+        
+        # Machine-readable output replaces the printed tables and charts
+        if args.output != 'table':
+            self.writer = OutputWriter(args.output)
         
         # Determine which analysis to run
         analysis_flags = [
@@ -201,6 +718,134 @@ Examples:
         
         # Count how many analysis flags are set
         active_analyses = [flag for flag, is_set in analysis_flags if is_set]
+        partitioned = is_partitioned(args.file)
+        if args.all or ((self.writer is not None or args.pdf or args.watch or args.compare or partitioned)
+                        and len(active_analyses) == 0):
+            active_analyses = list(ANALYSIS_TYPES)
+        
+        # --top / --offset page through the author and publisher rankings
+        if args.top is not None or args.offset:
+            if (args.top is not None and args.top < 1) or args.offset < 0:
+                print("Error: --top must be at least 1 and --offset at least 0")
+                sys.exit(1)
+            # The server takes ?top_n= and ?offset= per request instead; the interactive menu
+            # (also used when no analysis is named) runs every analysis with its defaults
+            menu = args.menu or len(active_analyses) == 0
+            if args.serve or args.watch or args.compare or partitioned or args.report or args.pdf or menu:
+                print("Error: --top and --offset apply to named printed or --output analyses, "
+                      "not to --serve, --watch, --compare, partitions, --report, --pdf or the menu")
+                sys.exit(1)
+            params = {'offset': args.offset}
+            if args.top is not None:
+                params['top_n'] = args.top
+            self.analysis_params = {'authors': params, 'publishers': params}
+        
+        # Filters select rows of a fully loaded DataFrame; a sample's estimates are scaled to the whole
+        # file, so they would describe the file rather than the filtered rows
+        filtered = args.years or args.language or args.publisher
+        conflicts = [name for name, used in [
+            ('--serve', args.serve), ('--watch', args.watch), ('--compare', args.compare),
+            ('a partitioned --file', partitioned), ('--sql', args.sql), ('--db', args.db),
+            ('--engine', args.engine != 'pandas'), ('--sample', args.sample is not None),
+            ('--sample-rows', args.sample_rows is not None)] if used]
+        if filtered and conflicts:
+            print("Error: --years, --language and --publisher filter a single CSV loaded in full with the "
+                  f"pandas engine; they cannot be combined with {', '.join(conflicts)}")
+            sys.exit(1)
+        
+        # The server loads (and reloads) the dataset itself
+        if args.serve:
+            server = AnalysisServer(args.file, host=args.host, port=args.port,
+                                    data_loader=self.main_app.data_loader, analyzer=self.main_app.analyzer)
+            if args.use_async:
+                server = AsyncAnalysisServer(server, executor=args.executor, workers=args.workers,
+                                             max_pending=args.max_pending)
+            if not server.serve_forever():
+                sys.exit(1)
+            return
+        
+        # Watch mode reads the file incrementally instead of loading it here
+        if args.watch:
+            if not self.watch_file(args.file, active_analyses, args.interval):
+                sys.exit(1)
+            return
+        
+        if args.compare:
+            if not self.compare_files(args.compare, active_analyses, args.workers):
+                sys.exit(1)
+            return
+        
+        # A directory or glob is aggregated partition by partition, never concatenated in memory
+        if partitioned:
+            if not self.analyze_partitions(args.file, active_analyses, args.workers):
+                sys.exit(1)
+            return
+        
+        # Ad-hoc SQL goes straight to DuckDB over the file
+        if args.sql:
+            if args.db:
+                print("Error: --sql queries --file with DuckDB; drop --db")
+                sys.exit(1)
+            if not self.run_sql(args.file, args.sql):
+                sys.exit(1)
+            return
+        
+        # The SQLite catalog answers every analysis with a query, so no DataFrame is loaded
+        if args.db:
+            if args.engine != 'pandas':
+                print("Error: --db answers from its own SQL engine; drop --engine")
+                sys.exit(1)
+            analyzer = self.open_catalog(args.db, args.file, args.ingest)
+            if analyzer is None:
+                sys.exit(1)
+            self.main_app.analyzer = analyzer
+            if args.search:
+                if not self.search_catalog(analyzer, args.search):
+                    sys.exit(1)
+                return
+            if args.report:
+                print("Error: --report needs the CSV dataset; run it without --db")
+                sys.exit(1)
+            dataset = None
+        elif args.search:
+            print("Error: --search needs a catalog (--db)")
+            sys.exit(1)
+        
+        # Other engines read the file themselves and answer the analyses without a pandas DataFrame
+        elif args.engine != 'pandas':
+            if args.sample is not None or args.sample_rows is not None or args.report:
+                print("Error: --sample, --sample-rows and --report need the pandas engine")
+                sys.exit(1)
+            analyzer = self.open_engine(args.engine, args.file)
+            if analyzer is None:
+                sys.exit(1)
+            self.main_app.analyzer = analyzer
+            dataset = None
+        
+        # Load dataset (or a random sample of it)
+        elif args.sample is not None or args.sample_rows is not None:
+            dataset = self.load_sample(args.file, args.sample, args.sample_rows, args.seed)
+            if dataset is None:
+                sys.exit(1)
+        else:
+            dataset = self.load_dataset(args.file)
+            if dataset is None:
+                sys.exit(1)
+        
+        if filtered:
+            dataset = self.filter_dataset(dataset, args.years, args.language, args.publisher)
+            if dataset is None:
+                sys.exit(1)
+        
+        self.main_app.dataset = dataset
+        
+        if args.report:
+            self.write_report(dataset, args.report, args.file)
+            return
+        
+        if args.pdf:
+            self.write_pdf(dataset, args.pdf, active_analyses)
+            return
         
         if len(active_analyses) == 0 or args.menu:
             # No specific analysis requested or menu explicitly requested
@@ -218,8 +863,11 @@ Examples:
             
             for analysis_type in active_analyses:
                 self.run_analysis(analysis_type, dataset)
-                if len(active_analyses) > 1:  # Add separator between analyses
+                if len(active_analyses) > 1 and self.writer is None:  # Add separator between analyses
                     print("\n" + "-"*60 + "\n")
+        
+        if self.writer is not None:
+            self.writer.flush()
 
 def main():
     """Entry point for CLI"""
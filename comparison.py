@@ -0,0 +1,166 @@
+import hashlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+from dataLoader import DataLoader
+from analyzer import Analyzer, ANALYSIS_METHODS
+
+# Analyses with a side-by-side comparison, in menu order
+COMPARE_TYPES = ['trends', 'authors', 'languages', 'publishers', 'isbn']
+
+# Top lists are fetched deeper than shown so a name that is top-N in one file still has counts in the others
+CANDIDATE_DEPTH = 50
+
+def cache_path(file_path, cache_dir, extension='.pkl'):
+    """Parse-cache file for the current version (mtime and size) of file_path"""
+    stat = os.stat(file_path)
+    digest = hashlib.sha1(os.path.abspath(file_path).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{digest}-{stat.st_mtime_ns}-{stat.st_size}{extension}"), digest
+
+def load_cached(file_path, cache_dir):
+    """Load a CSV through the parse cache shared by all workers; returns (DataFrame, from_cache)"""
+    if cache_dir is None or not os.path.exists(file_path):
+        return DataLoader().load(file_path), False
+    
+    path, digest = cache_path(file_path, cache_dir)
+    if os.path.exists(path):
+        try:
+            return pd.read_pickle(path), True
+        except Exception:
+            pass
+    
+    df = DataLoader().load(file_path)
+    if df is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Drop entries for older versions of this file, then publish the new one atomically
+        for name in os.listdir(cache_dir):
+            if name.startswith(f"{digest}-") and name.endswith('.pkl'):
+                os.remove(os.path.join(cache_dir, name))
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        df.to_pickle(temp_path)
+        os.replace(temp_path, path)
+    return df, False
+
+def analyze_file(file_path, analysis_types, cache_dir):
+    """Worker task: load one file and run the requested analyses on it"""
+    start = time.perf_counter()
+    df, from_cache = load_cached(file_path, cache_dir)
+    loaded = time.perf_counter()
+    if df is None:
+        return {'file': file_path, 'error': f"Failed to load dataset from '{file_path}'"}
+    
+    analyzer = Analyzer()
+    results = {}
+    for analysis_type in analysis_types:
+        method = getattr(analyzer, ANALYSIS_METHODS[analysis_type])
+        if analysis_type in ('authors', 'publishers'):
+            results[analysis_type] = method(df, top_n=CANDIDATE_DEPTH)
+        else:
+            results[analysis_type] = method(df)
+    
+    return {
+        'file': file_path,
+        'rows': len(df),
+        'from_cache': from_cache,
+        'load_seconds': loaded - start,
+        'analysis_seconds': time.perf_counter() - loaded,
+        'results': results
+    }
+
+class DatasetComparison:
+    def __init__(self, cache_dir='.parse_cache', workers=None):
+        """Initialize DatasetComparison; files are loaded and analyzed in worker processes"""
+        self.cache_dir = cache_dir
+        self.workers = workers
+    
+    def labels(self, file_paths):
+        """Short column label per file (base name, or the full path when names clash)"""
+        names = [os.path.basename(path) for path in file_paths]
+        if len(set(names)) == len(names):
+            return names
+        return list(file_paths)
+    
+    def run(self, file_paths, analysis_types=None):
+        """Load and analyze every file concurrently; returns one result dict per file, in order"""
+        analysis_types = [t for t in (analysis_types or COMPARE_TYPES) if t in COMPARE_TYPES]
+        workers = self.workers or min(len(file_paths), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max(workers, 1)) as pool:
+            futures = [pool.submit(analyze_file, path, analysis_types, self.cache_dir) for path in file_paths]
+            return [future.result() for future in futures]
+    
+    def side_by_side(self, series_by_label, base_label, fill_value=None):
+        """One column per file plus the change of each later file against the first"""
+        table = pd.DataFrame(series_by_label)
+        if fill_value is not None:
+            table = table.fillna(fill_value)
+        for label in list(table.columns):
+            if label != base_label:
+                table[f"delta {label}"] = table[label] - table[base_label]
+        return table
+    
+    def value(self, result, analysis_type, key):
+        """One field of a file's analysis_data, or None when the analysis failed"""
+        analysis_data, error = result['results'].get(analysis_type, (None, 'not run'))
+        return None if error else analysis_data[key]
+    
+    def compare(self, results, analysis_type):
+        """Comparison table for one analysis across all loaded files"""
+        loaded = [result for result in results if 'error' not in result]
+        labels = self.labels([result['file'] for result in loaded])
+        if not loaded:
+            return None, "No datasets could be loaded"
+        base = labels[0]
+        
+        if analysis_type == 'trends':
+            series = {label: self.value(result, 'trends', 'year_counts') for label, result in zip(labels, loaded)}
+            if any(value is None for value in series.values()):
+                return None, "Publication years are not available in every file"
+            table = self.side_by_side(series, base, fill_value=0).astype('int64').sort_index()
+            table.index = [int(year) for year in table.index]
+            return table, None
+        
+        if analysis_type in ('authors', 'publishers'):
+            key, shown = ('author_counts', 5) if analysis_type == 'authors' else ('publisher_counts', 20)
+            series = {label: self.value(result, analysis_type, key) for label, result in zip(labels, loaded)}
+            if any(value is None for value in series.values()):
+                return None, f"{analysis_type.capitalize()} are not available in every file"
+            # Union of each file's top names, ranked by the newest file
+            names = list(dict.fromkeys(name for counts in series.values() for name in counts.index[:shown]))
+            table = self.side_by_side({label: counts.reindex(names) for label, counts in series.items()}, base)
+            # Missing means "not among that file's top CANDIDATE_DEPTH", not zero
+            table = table.astype('Int64')
+            return table.sort_values(labels[-1], ascending=False, na_position='last'), None
+        
+        if analysis_type == 'languages':
+            series = {label: self.value(result, 'languages', 'lang_percentages') for label, result in zip(labels, loaded)}
+            if any(value is None for value in series.values()):
+                return None, "Languages are not available in every file"
+            table = self.side_by_side(series, base, fill_value=0.0).round(1)
+            return table.sort_values(labels[-1], ascending=False), None
+        
+        if analysis_type == 'isbn':
+            series = {}
+            for label, result in zip(labels, loaded):
+                isbn_analysis = self.value(result, 'isbn', 'isbn_analysis')
+                if isbn_analysis is None:
+                    return None, "ISBN columns are not available in every file"
+                series[label] = pd.Series({col: 100 - data['missing_percentage'] for col, data in isbn_analysis.items()})
+            table = self.side_by_side(series, base).round(2)
+            table.index = [f"{col} complete %" for col in table.index]
+            return table, None
+        
+        return None, f"Analysis '{analysis_type}' has no comparison view"
+    
+    def print_summary(self, results):
+        """Per-file load and analysis timings"""
+        labels = self.labels([result['file'] for result in results])
+        print(f"{'File':<32} {'Rows':>10} {'Load':>10} {'Analyses':>10}")
+        print("-" * 66)
+        for label, result in zip(labels, results):
+            if 'error' in result:
+                print(f"{label:<32} Error: {result['error']}")
+                continue
+            source = ' (cached)' if result['from_cache'] else ''
+            print(f"{label:<32} {result['rows']:>10,} {result['load_seconds'] * 1000:>8.1f}ms "
+                  f"{result['analysis_seconds'] * 1000:>8.1f}ms{source}")
@@ -0,0 +1,150 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import zstandard
+except ImportError:  # zstd input is optional; the other codecs ship with Python
+    zstandard = None
+
+# Leading bytes of each supported container, longest first
+MAGIC_NUMBERS = [
+    (b'\xfd7zXZ\x00', 'xz'),
+    (b'\x28\xb5\x2f\xfd', 'zstd'),
+    (b'BZh', 'bz2'),
+    (b'\x1f\x8b', 'gzip')
+]
+
+# File name patterns of compressed CSV exports (used when scanning partition directories)
+COMPRESSED_PATTERNS = ['*.csv.gz', '*.csv.bz2', '*.csv.xz', '*.csv.zst']
+
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+ZSTD_SKIPPABLE_MASK = 0xFFFFFFF0
+ZSTD_SKIPPABLE_MAGIC = 0x184D2A50
+
+def detect_compression(file_path):
+    """Compression format from the file's magic bytes, or None for plain text"""
+    with open(file_path, 'rb') as f:
+        head = f.read(6)
+    for magic, name in MAGIC_NUMBERS:
+        if head.startswith(magic):
+            return name
+    return None
+
+def iter_zstd_frames(f):
+    """Yield each compressed zstd frame of a file as bytes, walking frame and block headers"""
+    while True:
+        magic = f.read(4)
+        if not magic:
+            return
+        if len(magic) < 4:
+            raise ValueError("Truncated zstd frame")
+        
+        if int.from_bytes(magic, 'little') & ZSTD_SKIPPABLE_MASK == ZSTD_SKIPPABLE_MAGIC:
+            # Skippable frames carry metadata only
+            f.seek(int.from_bytes(f.read(4), 'little'), os.SEEK_CUR)
+            continue
+        if magic != ZSTD_MAGIC:
+            raise ValueError("Not a zstd frame")
+        
+        parts = [magic]
+        descriptor = f.read(1)
+        parts.append(descriptor)
+        # Header length depends only on the frame header descriptor byte
+        header_size = zstandard.frame_header_size(magic + descriptor + b'\x00' * 13)
+        parts.append(f.read(header_size - 5))
+        
+        last = False
+        while not last:
+            block_header = f.read(3)
+            if len(block_header) < 3:
+                raise ValueError("Truncated zstd block")
+            value = int.from_bytes(block_header, 'little')
+            last = bool(value & 1)
+            block_type = (value >> 1) & 3
+            block_size = value >> 3
+            parts.append(block_header)
+            parts.append(f.read(1 if block_type == 1 else block_size))  # RLE blocks store one byte
+        
+        if descriptor[0] & 0x04:
+            parts.append(f.read(4))  # content checksum
+        yield b''.join(parts)
+
+class ParallelZstdReader(io.RawIOBase):
+    def __init__(self, file_path, threads, batch_frames=None):
+        """Raw stream decoding independent zstd frames on a thread pool, in order (zstandard releases the GIL)"""
+        self.raw = open(file_path, 'rb')
+        self.frames = iter_zstd_frames(self.raw)
+        self.threads = threads
+        self.batch_frames = batch_frames or threads * 2
+        self.pool = ThreadPoolExecutor(max_workers=threads)
+        self.buffer = b''
+        self.offset = 0
+    
+    def readable(self):
+        """Stream is read-only"""
+        return True
+    
+    def decompress(self, frame):
+        """Decode one complete frame (each thread uses its own decompressor)"""
+        return zstandard.ZstdDecompressor().decompressobj().decompress(frame)
+    
+    def fill(self):
+        """Decode the next batch of frames; False at end of file"""
+        batch = [frame for _, frame in zip(range(self.batch_frames), self.frames)]
+        if not batch:
+            return False
+        self.buffer = b''.join(self.pool.map(self.decompress, batch))
+        self.offset = 0
+        return True
+    
+    def readinto(self, target):
+        """Copy decoded bytes into target"""
+        while self.offset >= len(self.buffer):
+            if not self.fill():
+                return 0
+        size = min(len(target), len(self.buffer) - self.offset)
+        target[:size] = self.buffer[self.offset:self.offset + size]
+        self.offset += size
+        return size
+    
+    def close(self):
+        """Close the file and stop the decoder threads"""
+        if not self.closed:
+            self.pool.shutdown(wait=False)
+            self.raw.close()
+        super().close()
+
+def count_zstd_frames(file_path, limit=2):
+    """Number of data frames in a zstd file, counting at most `limit`"""
+    with open(file_path, 'rb') as f:
+        count = 0
+        for _ in iter_zstd_frames(f):
+            count += 1
+            if count >= limit:
+                break
+    return count
+
+def open_decompressed(file_path, threads=None):
+    """Binary stream of the decompressed file contents, or None when the file is not compressed"""
+    compression = detect_compression(file_path)
+    if compression is None:
+        return None
+    if compression == 'gzip':
+        return gzip.open(file_path, 'rb')
+    if compression == 'bz2':
+        return bz2.open(file_path, 'rb')
+    if compression == 'xz':
+        return lzma.open(file_path, 'rb')
+    
+    if zstandard is None:
+        raise ValueError("zstd input requires the 'zstandard' package (pip install zstandard)")
+    threads = threads if threads is not None else os.cpu_count() or 1
+    # Only a multi-frame file (e.g. zstd --block-size / pzstd output) can be decoded in parallel
+    if threads > 1 and count_zstd_frames(file_path) > 1:
+        return io.BufferedReader(ParallelZstdReader(file_path, threads), buffer_size=1 << 20)
+    return zstandard.ZstdDecompressor().stream_reader(open(file_path, 'rb'), read_across_frames=True,
+                                                      closefd=True)
@@ -0,0 +1,305 @@
+import csv
+import io
+import json
+import os
+import time
+from collections import Counter
+import pandas as pd
+from analyzer import (Analyzer, ANALYSIS_METHODS, DATE_COLUMNS, AUTHOR_COLUMNS, LANGUAGE_COLUMNS,
+                      PUBLISHER_COLUMNS, YEAR_LANGUAGE_LIMIT)
+from outputWriter import OutputWriter
+
+class RunningAggregates:
+    def __init__(self, analyzer=None):
+        """Initialize the running counters behind each analysis"""
+        self.analyzer = analyzer or Analyzer()
+        self.reset([])
+    
+    def reset(self, columns):
+        """Start over for a file with the given header"""
+        self.columns = list(columns)
+        self.date_col = self.find_column(DATE_COLUMNS)
+        self.author_col = self.find_column(AUTHOR_COLUMNS)
+        self.lang_col = self.find_column(LANGUAGE_COLUMNS)
+        self.publisher_col = self.find_column(PUBLISHER_COLUMNS)
+        self.isbn_cols = [col for col in self.columns if 'isbn' in col.lower()]
+        
+        self.total_rows = 0
+        self.year_counts = Counter()
+        self.author_counts = Counter()
+        self.lang_counts = Counter()
+        self.publisher_counts = Counter()
+        self.isbn_missing = Counter()
+        # (year, language) of each of the first YEAR_LANGUAGE_LIMIT rows, None where either is invalid
+        self.year_lang_rows = []
+    
+    def find_column(self, candidates):
+        """First accepted column name present in the header"""
+        for col in candidates:
+            if col in self.columns:
+                return col
+        return None
+    
+    def count_values(self, counter, values):
+        """Add value counts to a Counter, keeping first-seen order so ties rank like value_counts()"""
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # Interned columns would be counted in category order, with a zero for every unseen value
+            values = values.astype(values.cat.categories.dtype)
+        for value, count in values.value_counts(sort=False).items():
+            counter[value] += count
+    
+    def update(self, chunk):
+        """Fold newly appended rows into the running counters"""
+        if chunk.empty:
+            return
+        
+        if self.date_col is not None:
+            years = self.analyzer.extract_years(chunk[self.date_col])
+            valid = self.analyzer.valid_year_mask(years)
+            self.count_values(self.year_counts, years[valid].astype(int))
+        
+        # The year-language matrix only covers the first YEAR_LANGUAGE_LIMIT rows of the file
+        remaining = YEAR_LANGUAGE_LIMIT - self.total_rows
+        if remaining > 0:
+            head = min(remaining, len(chunk))
+            if self.date_col is None or self.lang_col is None:
+                self.year_lang_rows.extend([None] * head)
+            else:
+                languages = chunk[self.lang_col].head(head)
+                for year, is_valid, language in zip(years.head(head), valid.head(head), languages):
+                    usable = is_valid and not pd.isna(year) and not pd.isna(language)
+                    self.year_lang_rows.append((int(year), language) if usable else None)
+        
+        if self.author_col is not None:
+            self.count_values(self.author_counts, chunk[self.author_col])
+        if self.lang_col is not None:
+            self.count_values(self.lang_counts, chunk[self.lang_col])
+        if self.publisher_col is not None:
+            self.count_values(self.publisher_counts, chunk[self.publisher_col])
+        for isbn_col in self.isbn_cols:
+            self.isbn_missing[isbn_col] += int(chunk[isbn_col].isnull().sum() + (chunk[isbn_col] == '').sum())
+        
+        self.total_rows += len(chunk)
+    
+    def merge(self, other):
+        """Fold in the aggregates of a later partition, as if its rows followed this one's"""
+        if other.total_rows == 0:
+            return self
+        
+        # Columns are reconciled by field: each side resolved its own aliases
+        for col in other.columns:
+            if col not in self.columns:
+                self.columns.append(col)
+        for field in ('date_col', 'author_col', 'lang_col', 'publisher_col'):
+            if getattr(self, field) is None:
+                setattr(self, field, getattr(other, field))
+        
+        # An ISBN column absent from one side counts as missing for all of that side's rows
+        for isbn_col in other.isbn_cols:
+            if isbn_col not in self.isbn_cols:
+                self.isbn_cols.append(isbn_col)
+                self.isbn_missing[isbn_col] += self.total_rows
+        for isbn_col in self.isbn_cols:
+            if isbn_col in other.isbn_cols:
+                self.isbn_missing[isbn_col] += other.isbn_missing[isbn_col]
+            else:
+                self.isbn_missing[isbn_col] += other.total_rows
+        
+        self.year_counts.update(other.year_counts)
+        self.author_counts.update(other.author_counts)
+        self.lang_counts.update(other.lang_counts)
+        self.publisher_counts.update(other.publisher_counts)
+        self.year_lang_rows.extend(other.year_lang_rows[:max(YEAR_LANGUAGE_LIMIT - len(self.year_lang_rows), 0)])
+        self.total_rows += other.total_rows
+        return self
+    
+    def as_text(self, value):
+        """Spelling of a parsed number in the CSV text (1984.0 from a chunk with gaps -> '1984')"""
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        return str(value)
+    
+    def unify_keys(self, counter, position=None):
+        """Counter with numbers spelled as text when the column also held text"""
+        # Each chunk infers its own dtypes, so '1984' can arrive as an int in one chunk and as a string
+        # in another; read whole, the column is text and both are the same value
+        labels = [key if position is None else key[position] for key in counter]
+        if all(isinstance(label, str) for label in labels) or not any(isinstance(label, str) for label in labels):
+            return counter
+        unified = Counter()
+        for key, count in counter.items():
+            if position is None:
+                key = key if isinstance(key, str) else self.as_text(key)
+            elif not isinstance(key[position], str):
+                key = key[:position] + (self.as_text(key[position]),) + key[position + 1:]
+            unified[key] += count
+        return unified
+    
+    def top(self, counter, n=None):
+        """Counter as a Series in descending count order"""
+        items = self.unify_keys(counter).most_common(n)
+        return pd.Series([count for _, count in items], index=[value for value, _ in items], dtype='int64')
+    
+    def missing_column_error(self, name):
+        """Same message the Analyzer gives for a missing column"""
+        return f"{name} column not found in dataset! Available columns: {self.columns}"
+    
+    def analysis_data(self, analysis_type):
+        """Build the analysis_data dict an Analyzer method would return, from the running counters"""
+        if analysis_type == 'trends':
+            if self.date_col is None:
+                return None, self.missing_column_error("Publication date")
+            if not self.year_counts:
+                return None, "No valid publication years found in the data"
+            year_counts = pd.Series(dict(sorted(self.year_counts.items())), dtype='int64')
+            return {
+                'year_counts': year_counts,
+                'total_years': len(year_counts),
+                'most_productive_year': year_counts.idxmax(),
+                'most_productive_count': year_counts.max(),
+                'least_productive_year': year_counts.idxmin(),
+                'least_productive_count': year_counts.min()
+            }, None
+        
+        if analysis_type == 'authors':
+            if self.author_col is None:
+                return None, self.missing_column_error("Authors")
+            return {'author_counts': self.top(self.author_counts, 5), 'top_n': 5, 'offset': 0}, None
+        
+        if analysis_type == 'languages':
+            if self.lang_col is None:
+                return None, self.missing_column_error("Language")
+            lang_counts = self.top(self.lang_counts)
+            return {
+                'lang_counts': lang_counts,
+                'lang_percentages': (lang_counts / self.total_rows * 100).round(1),
+                'total_books': self.total_rows
+            }, None
+        
+        if analysis_type == 'publishers':
+            if self.publisher_col is None:
+                return None, self.missing_column_error("Publisher")
+            return {
+                'publisher_counts': self.top(self.publisher_counts, 20),
+                'total_publishers': len(self.unify_keys(self.publisher_counts)),
+                'top_n': 20,
+                'offset': 0
+            }, None
+        
+        if analysis_type == 'isbn':
+            if not self.isbn_cols:
+                return None, "No ISBN columns found in dataset!"
+            isbn_analysis = {}
+            for isbn_col in self.isbn_cols:
+                missing_count = self.isbn_missing[isbn_col]
+                isbn_analysis[isbn_col] = {
+                    'total_records': self.total_rows,
+                    'present_count': self.total_rows - missing_count,
+                    'missing_count': missing_count,
+                    'missing_percentage': missing_count / self.total_rows * 100 if self.total_rows else 0.0
+                }
+            return {'isbn_analysis': isbn_analysis, 'total_records': self.total_rows}, None
+        
+        if analysis_type == 'year-language':
+            if self.date_col is None or self.lang_col is None:
+                missing_cols = [name for name, col in (("publication date", self.date_col), ("language", self.lang_col))
+                                if col is None]
+                return None, f"{' and '.join(missing_cols)} column(s) not found in dataset! Available columns: {self.columns}"
+            pairs = self.unify_keys(Counter(pair for pair in self.year_lang_rows if pair is not None), position=1)
+            if not pairs:
+                return None, "No valid year-language data found"
+            year_lang_counts = pd.Series(pairs).unstack(fill_value=0).sort_index()
+            year_lang_counts = year_lang_counts[sorted(year_lang_counts.columns)]
+            return {
+                'year_lang_counts': year_lang_counts,
+                'years': sorted(year_lang_counts.index),
+                'languages': list(year_lang_counts.columns)
+            }, None
+        
+        return None, f"Unknown analysis '{analysis_type}'"
+
+class CsvWatcher:
+    def __init__(self, file_path, analysis_types=None, analyzer=None, poll_interval=2.0):
+        """Initialize CsvWatcher tailing file_path from byte offset 0"""
+        self.file_path = file_path
+        self.analysis_types = analysis_types or list(ANALYSIS_METHODS)
+        self.aggregates = RunningAggregates(analyzer)
+        self.poll_interval = poll_interval
+        self.serializer = OutputWriter('json')
+        self.offset = 0
+        self.columns = None
+        self.fingerprints = {}
+    
+    def record_end(self, data):
+        """Length of data through its last newline outside a quoted field; 0 when no record is complete"""
+        # data starts on a record boundary, so a newline ends a record when an even number of quotes
+        # precede it (an escaped "" counts twice); walking back keeps the count in one pass
+        end = data.rfind(b'\n')
+        quotes = data.count(b'"', 0, max(end, 0))
+        while end >= 0 and quotes % 2:
+            previous = data.rfind(b'\n', 0, end)
+            quotes -= data.count(b'"', max(previous, 0), end)
+            end = previous
+        return end + 1
+    
+    def read_new_rows(self):
+        """Parse rows appended since the last call; a trailing partial record waits for the next poll"""
+        size = os.path.getsize(self.file_path)
+        if size < self.offset:
+            # File was truncated or replaced: start over
+            print(f"Dataset '{self.file_path}' shrank, re-reading from the start...")
+            self.offset = 0
+            self.columns = None
+            self.fingerprints = {}
+        if size == self.offset:
+            return None
+        
+        with open(self.file_path, 'rb') as f:
+            f.seek(self.offset)
+            data = f.read(size - self.offset)
+        
+        complete = self.record_end(data)
+        if complete == 0:
+            return None
+        data = data[:complete]
+        self.offset += complete
+        
+        if self.columns is None:
+            header, _, data = data.partition(b'\n')
+            self.columns = next(csv.reader([header.decode('utf-8-sig').rstrip('\r')]))
+            self.aggregates.reset(self.columns)
+        if not data.strip():
+            return None
+        
+        try:
+            return pd.read_csv(io.BytesIO(data), header=None, names=self.columns)
+        except (pd.errors.ParserError, UnicodeDecodeError) as e:
+            print(f"Error: Skipping unparseable rows in '{self.file_path}': {e}")
+            return None
+    
+    def poll(self):
+        """Read appended rows and return [(analysis_type, analysis_data, error)] for results that changed"""
+        chunk = self.read_new_rows()
+        if chunk is None:
+            return []
+        self.aggregates.update(chunk)
+        
+        changed = []
+        for analysis_type in self.analysis_types:
+            analysis_data, error = self.aggregates.analysis_data(analysis_type)
+            fingerprint = json.dumps([self.serializer.to_serializable(analysis_data), error], sort_keys=True, default=str)
+            if self.fingerprints.get(analysis_type) != fingerprint:
+                self.fingerprints[analysis_type] = fingerprint
+                changed.append((analysis_type, analysis_data, error))
+        return changed
+    
+    def watch(self, render, max_polls=None):
+        """Poll until interrupted, calling render(changed) whenever a result changed"""
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            changed = self.poll()
+            if changed:
+                render(changed)
+            polls += 1
+            if max_polls is None or polls < max_polls:
+                time.sleep(self.poll_interval)
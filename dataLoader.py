@@ -2,13 +2,30 @@
 
 # import necessary libraries
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import numpy as np
 import os
+from contextlib import contextmanager
+from compression import open_decompressed
 
 
 # load the dataset
 class DataLoader:
+    def __init__(self, decompress_threads=None, intern_text=True):
+        """Initialize DataLoader; decompress_threads bounds parallel zstd decoding (default: all CPUs)"""
+        self.decompress_threads = decompress_threads
+        # load() stores repetitive text columns as integer codes into a dictionary of distinct values
+        self.intern_text = intern_text
+    
+    @contextmanager
+    def source(self, file_path):
+        """The path itself for plain CSV, or a decompressing stream for gzip/bz2/xz/zstd (detected by magic bytes)"""
+        stream = open_decompressed(file_path, self.decompress_threads)
+        if stream is None:
+            yield file_path
+            return
+        with stream:
+            yield stream
+    
     def load(self, file_path="Dataset_Books.csv"):
         try:
             # Check if file path is provided and not empty
@@ -19,26 +36,27 @@ class DataLoader:
             # If running from tests directory, adjust path
             if not os.path.exists(file_path) and os.path.exists(f"../{file_path}"):
                 file_path = f"../{file_path}"
-                
+            
             # Check if file exists
             if not os.path.exists(file_path):
                 print(f"Error: File '{file_path}' not found.")
                 return None
             
             # Try to read CSV and validate it has proper structure
-            df = pd.read_csv(file_path)
+            with self.source(file_path) as source:
+                df = pd.read_csv(source)
             
             # Check if DataFrame is empty or has no proper columns
             if df.empty:
                 print(f"Error: File '{file_path}' is empty.")
                 return None
-                
+            
             if len(df.columns) == 0:
                 print(f"Error: Invalid CSV format in '{file_path}' - no columns found.")
                 return None
-                
-            return df
             
+            return self.intern(df) if self.intern_text else df
+        
         except pd.errors.EmptyDataError:
             print(f"Error: File '{file_path}' is empty or has invalid CSV format.")
             return None
@@ -51,3 +69,34 @@ class DataLoader:
         except Exception as e:
             print(f"Error loading file '{file_path}': {e}")
             return None
+    
+    def intern(self, df):
+        """df with each text column that repeats enough stored as categorical codes into its distinct values"""
+        for name in df.columns:
+            values = df[name]
+            if values.dtype.kind in 'biufcmM' or isinstance(values.dtype, pd.CategoricalDtype):
+                continue
+            # Categories keep first-seen order, so code order is file order and ties count the same way
+            codes, uniques = pd.factorize(values)
+            encoded = pd.Series(pd.Categorical.from_codes(codes.astype(np.int32), categories=uniques), index=df.index)
+            # Near-unique columns (titles, identifiers) would only grow by a dictionary as large as themselves
+            if encoded.memory_usage(deep=True, index=False) < values.memory_usage(deep=True, index=False):
+                df[name] = encoded
+        return df
+    
+    def load_chunks(self, file_path, chunk_rows=100000):
+        """Yield the CSV as DataFrames of at most chunk_rows rows (for partitions too large to hold at once)"""
+        if not file_path or not os.path.exists(file_path):
+            print(f"Error: File '{file_path}' not found.")
+            return
+        
+        try:
+            with self.source(file_path) as source:
+                for chunk in pd.read_csv(source, chunksize=chunk_rows):
+                    yield chunk
+        except pd.errors.EmptyDataError:
+            print(f"Error: File '{file_path}' is empty or has invalid CSV format.")
+        except pd.errors.ParserError:
+            print(f"Error: File '{file_path}' has invalid CSV format or structure.")
+        except Exception as e:
+            print(f"Error loading file '{file_path}': {e}")
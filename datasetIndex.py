@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+from analyzer import Analyzer, DATE_COLUMNS, LANGUAGE_COLUMNS, PUBLISHER_COLUMNS
+
+def parse_year_range(text):
+    """(first, last) year from '2010-2020', or from a single year such as '2015'"""
+    first, dash, last = text.strip().partition('-')
+    try:
+        first, last = int(first), int(last if dash else first)
+    except ValueError:
+        raise ValueError(f"invalid year range '{text}' (expected FIRST-LAST, e.g. 2010-2020)")
+    if first > last:
+        raise ValueError(f"invalid year range '{text}' (first year is after the last)")
+    return first, last
+
+def parse_names(text):
+    """Names from a comma-separated list such as 'German,French'"""
+    return [name.strip() for name in text.split(',') if name.strip()]
+
+class DatasetIndex:
+    def __init__(self, df, analyzer=None):
+        """Row indexes over df answering year-range, language and publisher filters without scanning every row"""
+        self.df = df
+        self.analyzer = analyzer or Analyzer()
+        # Built on first use: (row positions ordered by year, their years) and, per text column,
+        # (distinct values, row positions grouped by value, group boundaries)
+        self.years = None
+        self.postings = {}
+    
+    def find_column(self, candidates, name):
+        """First accepted column name present in df; raises ValueError if there is none"""
+        for col in candidates:
+            if col in self.df.columns:
+                return col
+        raise ValueError(f"{name} column not found in dataset! Available columns: {list(self.df.columns)}")
+    
+    def year_index(self):
+        """Row positions sorted by publication year, and the sorted years (missing years last)"""
+        if self.years is None:
+            date_col = self.find_column(DATE_COLUMNS, "Publication date")
+            years = pd.to_numeric(self.analyzer.extract_years(self.df[date_col]), errors='coerce')
+            years = np.asarray(years, dtype=float)
+            # Stable, so rows of one year stay in file order
+            order = np.argsort(years, kind='stable')
+            self.years = (order, years[order])
+        return self.years
+    
+    def value_index(self, column):
+        """(distinct values, row positions grouped by value in file order, boundaries of each group)"""
+        if column not in self.postings:
+            values = self.df[column]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                # Columns DataLoader interned already have their codes
+                codes, categories = values.cat.codes.to_numpy(), values.cat.categories
+            else:
+                codes, categories = pd.factorize(values)
+            # Missing values (code -1) form group 0, value i is group i + 1
+            groups = codes.astype(np.int64) + 1
+            bounds = np.zeros(len(categories) + 2, dtype=np.int64)
+            np.cumsum(np.bincount(groups, minlength=len(categories) + 1), out=bounds[1:])
+            self.postings[column] = (pd.Index(categories), np.argsort(groups, kind='stable'), bounds)
+        return self.postings[column]
+    
+    def year_rows(self, first, last):
+        """Sorted row positions with a publication year in [first, last]"""
+        order, years = self.year_index()
+        start = np.searchsorted(years, first, side='left')
+        stop = np.searchsorted(years, last, side='right')
+        return np.sort(order[start:stop])
+    
+    def value_rows(self, column, names):
+        """Sorted row positions whose column equals one of names"""
+        categories, order, bounds = self.value_index(column)
+        groups = [position + 1 for position in categories.get_indexer(names) if position >= 0]
+        return np.sort(np.concatenate([order[bounds[group]:bounds[group + 1]] for group in groups] +
+                                      [np.array([], dtype=np.int64)]))
+    
+    def rows(self, years=None, languages=None, publishers=None):
+        """Sorted row positions meeting every given filter; None when no filter is given"""
+        selections = []
+        if years is not None:
+            selections.append(self.year_rows(*years))
+        if languages:
+            selections.append(self.value_rows(self.find_column(LANGUAGE_COLUMNS, "Language"), languages))
+        if publishers:
+            selections.append(self.value_rows(self.find_column(PUBLISHER_COLUMNS, "Publisher"), publishers))
+        if not selections:
+            return None
+        # Intersecting from the smallest selection keeps the work proportional to the slice
+        selections.sort(key=len)
+        rows = selections[0]
+        for selection in selections[1:]:
+            rows = np.intersect1d(rows, selection, assume_unique=True)
+        return rows
+    
+    def select(self, years=None, languages=None, publishers=None):
+        """Rows of df meeting every given filter, in file order"""
+        rows = self.rows(years, languages, publishers)
+        return self.df if rows is None else self.df.take(rows)
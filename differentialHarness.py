@@ -0,0 +1,322 @@
+import argparse
+import io
+import json
+import os
+import shutil
+import tempfile
+import warnings
+from contextlib import redirect_stdout
+import numpy as np
+import pandas as pd
+from analyzer import (Analyzer, ANALYSIS_METHODS, DATE_COLUMNS, AUTHOR_COLUMNS, LANGUAGE_COLUMNS,
+                      PUBLISHER_COLUMNS)
+from csvWatcher import RunningAggregates
+from partitions import aggregate_partition
+from catalogStore import CatalogStore, SqlAnalyzer
+from sampler import Sampler, SampledAnalyzer
+from polarsEngine import PolarsAnalyzer, pl
+from duckdbEngine import DuckDbAnalyzer, duckdb
+from outputWriter import OutputWriter
+
+# Alternative engines checked against the reference Analyzer
+ENGINES = ['running', 'partitioned', 'sql', 'sampled']
+if pl is not None:
+    ENGINES.append('polars')
+if duckdb is not None:
+    ENGINES.append('duckdb')
+
+# Small vocabularies so that count ties (and their first-seen order) are common
+AUTHORS = ['Ann Lee', 'Bo Chen', 'Cy Twombly', 'Dee Roy', 'Eve Stone', 'Fay Wu', 'Gus Ortiz', '1984']
+LANGUAGES = ['English', 'French', 'Arabic', 'German', 'eng', 'fre']
+PUBLISHERS = ['Routledge', 'SAGE', 'Penguin', 'Orion House', 'Severn Press', 'Wiley']
+ISBN_COLUMN_NAMES = ['ISBN', 'isbn', 'isbn13', 'ISBN_10']
+
+class DifferentialHarness:
+    def __init__(self, seed=0, max_rows=1500, confidence=0.95, work_dir=None):
+        """Initialize DifferentialHarness; trial t of a seed always generates the same frame"""
+        self.seed = seed
+        self.max_rows = max_rows
+        self.confidence = confidence
+        self.work_dir = work_dir
+        self.writer = OutputWriter('json')
+    
+    def rng(self, trial, stream=0):
+        """Random generator of one trial (stream 0 builds the frame, stream 1 splits it into chunks)"""
+        return np.random.default_rng([self.seed, trial, stream])
+    
+    def pick(self, rng, values, rows, missing=0.0):
+        """`rows` draws from values (object dtype), with a share replaced by None"""
+        cells = np.array(values, dtype=object)[rng.integers(0, len(values), rows)]
+        cells[rng.random(rows) < missing] = None
+        return cells
+    
+    def date_cells(self, rng, rows):
+        """Publication dates of one randomly chosen representation, crowded around the 1800..now+5 edges"""
+        current_year = pd.Timestamp.now().year
+        edges = np.array([1799, 1800, 1801, current_year + 4, current_year + 5, current_year + 6])
+        years = np.where(rng.random(rows) < 0.3, edges[rng.integers(0, len(edges), rows)],
+                         rng.integers(1780, current_year + 10, rows))
+        kind = rng.choice(['int', 'float', 'iso', 'iso-garbage'])
+        if kind == 'int':
+            return years
+        if kind == 'float':
+            # Missing years make the column float64, so year labels arrive as 2019.0
+            cells = years.astype(float)
+            cells[rng.random(rows) < 0.1] = np.nan
+            return cells
+        
+        months = rng.integers(1, 13, rows)
+        days = rng.integers(1, 29, rows)
+        cells = np.array([f"{year:04d}-{month:02d}-{day:02d}" for year, month, day in zip(years, months, days)],
+                         dtype=object)
+        if kind == 'iso-garbage':
+            garbage = rng.random(rows)
+            cells[garbage < 0.08] = 'unknown'
+            cells[(garbage >= 0.08) & (garbage < 0.12)] = None
+        return cells
+    
+    def isbn_cells(self, rng, rows):
+        """ISBN values mixing digits, empty strings and missing values"""
+        cells = rng.integers(100000000, 10000000000, rows).astype(str).astype(object)
+        draw = rng.random(rows)
+        cells[draw < 0.1] = ''
+        cells[(draw >= 0.1) & (draw < 0.2)] = None
+        return cells
+    
+    def frame(self, trial):
+        """Adversarial DataFrame of one trial: random aliases, absent fields, edge years, ties, '' ISBNs"""
+        rng = self.rng(trial)
+        rows = int(rng.integers(1, self.max_rows + 1))
+        columns = {'book': [f"Title {number}" for number in range(rows)]}
+        # Each field uses a random accepted alias, or is absent so the missing-column errors are compared too
+        for candidates, make in ((DATE_COLUMNS, self.date_cells),
+                                 (AUTHOR_COLUMNS, lambda rng, rows: self.pick(rng, AUTHORS, rows, 0.05)),
+                                 (LANGUAGE_COLUMNS, lambda rng, rows: self.pick(rng, LANGUAGES, rows, 0.05)),
+                                 (PUBLISHER_COLUMNS, lambda rng, rows: self.pick(rng, PUBLISHERS, rows, 0.1))):
+            if rng.random() < 0.9:
+                columns[candidates[rng.integers(0, len(candidates))]] = make(rng, rows)
+        for name in rng.choice(ISBN_COLUMN_NAMES, size=rng.integers(0, 3), replace=False):
+            columns[name] = self.isbn_cells(rng, rows)
+        return pd.DataFrame(columns)
+    
+    def split_points(self, rng, rows, pieces):
+        """Sorted cut positions dividing `rows` rows into at most `pieces` non-empty runs"""
+        cuts = rng.choice(np.arange(1, rows), size=min(pieces - 1, rows - 1), replace=False) if rows > 1 else []
+        return [0] + sorted(int(cut) for cut in cuts) + [rows]
+    
+    def canonical(self, result, fields=None):
+        """Order-preserving JSON of (analysis_data, error), optionally restricted to some fields"""
+        analysis_data, error = result
+        if analysis_data is not None and fields is not None:
+            analysis_data = {field: analysis_data[field] for field in fields if field in analysis_data}
+        return json.dumps([self.numbers(self.writer.to_serializable(analysis_data)), error], default=str)
+    
+    def numbers(self, value):
+        """Integral floats as ints: a year is the same answer whether it comes back as 2019 or 2019.0"""
+        if isinstance(value, dict):
+            return {key: self.numbers(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.numbers(item) for item in value]
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        return value
+    
+    def reference(self, df):
+        """Every analysis from the reference Analyzer"""
+        analyzer = Analyzer()
+        return {analysis_type: getattr(analyzer, method_name)(df)
+                for analysis_type, method_name in ANALYSIS_METHODS.items()}
+    
+    def running(self, df, rng):
+        """RunningAggregates fed the frame in random-sized chunks (as CsvWatcher does)"""
+        aggregates = RunningAggregates()
+        aggregates.reset(df.columns)
+        bounds = self.split_points(rng, len(df), int(rng.integers(1, 8)))
+        for start, end in zip(bounds, bounds[1:]):
+            aggregates.update(df.iloc[start:end])
+        return {analysis_type: aggregates.analysis_data(analysis_type) for analysis_type in ANALYSIS_METHODS}
+    
+    def partitioned(self, df, rng, work_dir):
+        """Shard files aggregated by the partition worker and merged in file order"""
+        bounds = self.split_points(rng, len(df), int(rng.integers(1, 6)))
+        merged = None
+        for number, (start, end) in enumerate(zip(bounds, bounds[1:])):
+            path = os.path.join(work_dir, f"part-{number:03d}.csv")
+            df.iloc[start:end].to_csv(path, index=False)
+            aggregates = aggregate_partition(path, int(rng.integers(1, 400)))
+            merged = aggregates if merged is None else merged.merge(aggregates)
+        return {analysis_type: merged.analysis_data(analysis_type) for analysis_type in ANALYSIS_METHODS}
+    
+    def sql(self, file_path, rng, work_dir):
+        """SqlAnalyzer over a catalog ingested from the CSV in small chunks"""
+        store = CatalogStore(os.path.join(work_dir, 'catalog.db'))
+        try:
+            store.ingest(file_path, chunk_rows=int(rng.integers(1, 400)))
+            analyzer = SqlAnalyzer(store)
+            return {analysis_type: getattr(analyzer, method_name)()
+                    for analysis_type, method_name in ANALYSIS_METHODS.items()}
+        finally:
+            store.close()
+    
+    def polars(self, file_path):
+        """PolarsAnalyzer scanning the CSV"""
+        analyzer = PolarsAnalyzer(file_path)
+        return {analysis_type: getattr(analyzer, method_name)()
+                for analysis_type, method_name in ANALYSIS_METHODS.items()}
+    
+    def duckdb(self, file_path, rng, work_dir):
+        """DuckDbAnalyzer querying the CSV directly or through its Parquet cache"""
+        cache_dir = os.path.join(work_dir, 'parquet') if rng.random() < 0.5 else None
+        analyzer = DuckDbAnalyzer(file_path, cache_dir=cache_dir)
+        return {analysis_type: getattr(analyzer, method_name)()
+                for analysis_type, method_name in ANALYSIS_METHODS.items()}
+    
+    def sampled(self, df):
+        """SampledAnalyzer given the whole frame as its sample: scaling must be the identity"""
+        analyzer = SampledAnalyzer(len(df), len(df), self.confidence)
+        return {analysis_type: getattr(analyzer, method_name)(df)
+                for analysis_type, method_name in ANALYSIS_METHODS.items()}
+    
+    def differences(self, expected, actual, engine, trial):
+        """One mismatch record per analysis whose result differs from the reference"""
+        mismatches = []
+        for analysis_type, reference_result in expected.items():
+            # Approximate engines add fields (estimates, sample); only the reference's fields must match
+            fields = list(reference_result[0]) if reference_result[0] is not None and engine == 'sampled' else None
+            want = self.canonical(reference_result)
+            got = self.canonical(actual[analysis_type], fields)
+            if want != got:
+                mismatches.append({'engine': engine, 'trial': trial, 'analysis': analysis_type,
+                                   'expected': want, 'actual': got})
+        return mismatches
+    
+    def run_trial(self, trial, engines=None):
+        """Mismatches of every engine on one trial's frame"""
+        engines = engines or ENGINES
+        df = self.frame(trial)
+        rng = self.rng(trial, stream=1)
+        work_dir = tempfile.mkdtemp(dir=self.work_dir)
+        mismatches = []
+        try:
+            with warnings.catch_warnings(), redirect_stdout(io.StringIO()):
+                # Date-format inference warnings are expected on the garbage-laden columns
+                warnings.simplefilter('ignore')
+                if 'running' in engines:
+                    mismatches += self.differences(self.reference(df), self.running(df, rng), 'running', trial)
+                if 'sampled' in engines:
+                    mismatches += self.differences(self.reference(df), self.sampled(df), 'sampled', trial)
+                
+                # File-backed engines are compared with the reference over the same CSV, since a CSV
+                # round trip itself turns '' into NaN and re-infers column types
+                file_path = os.path.join(work_dir, 'catalog.csv')
+                df.to_csv(file_path, index=False)
+                file_reference = self.reference(pd.read_csv(file_path))
+                if 'partitioned' in engines:
+                    shard_dir = os.path.join(work_dir, 'shards')
+                    os.makedirs(shard_dir)
+                    mismatches += self.differences(file_reference, self.partitioned(df, rng, shard_dir),
+                                                   'partitioned', trial)
+                if 'sql' in engines:
+                    mismatches += self.differences(file_reference, self.sql(file_path, rng, work_dir), 'sql', trial)
+                if 'polars' in engines:
+                    mismatches += self.differences(file_reference, self.polars(file_path), 'polars', trial)
+                if 'duckdb' in engines:
+                    mismatches += self.differences(file_reference, self.duckdb(file_path, rng, work_dir),
+                                                   'duckdb', trial)
+        finally:
+            shutil.rmtree(work_dir)
+        return mismatches
+    
+    def interval_coverage(self, trial, fraction=0.2):
+        """(covered, total) of the sampled language intervals that contain the true count on one trial's frame"""
+        df = self.frame(trial)
+        work_dir = tempfile.mkdtemp(dir=self.work_dir)
+        try:
+            file_path = os.path.join(work_dir, 'catalog.csv')
+            df.to_csv(file_path, index=False)
+            truth, error = Analyzer().analyze_language_distribution(pd.read_csv(file_path))
+            if error:
+                return 0, 0
+            with redirect_stdout(io.StringIO()):
+                sample, total_rows = Sampler(seed=trial).load(file_path, fraction=fraction)
+            if sample is None:
+                return 0, 0
+            estimates = SampledAnalyzer(len(sample), total_rows, self.confidence).analyze_language_distribution(sample)
+            estimates = estimates[0]['estimates'] if estimates[0] is not None else pd.DataFrame()
+        finally:
+            shutil.rmtree(work_dir)
+        
+        covered = total = 0
+        for label, count in truth['lang_counts'].items():
+            # A label missing from the sample has an implied interval starting at zero
+            if label in estimates.index:
+                total += 1
+                covered += int(estimates.at[label, 'count_low'] <= count <= estimates.at[label, 'count_high'])
+        return covered, total
+    
+    def run(self, trials, engines=None):
+        """Run `trials` trials; returns the mismatches and the sampled-interval coverage"""
+        engines = engines or ENGINES
+        mismatches = []
+        covered = total = 0
+        for trial in range(trials):
+            mismatches += self.run_trial(trial, engines)
+            if 'sampled' in engines:
+                trial_covered, trial_total = self.interval_coverage(trial)
+                covered += trial_covered
+                total += trial_total
+        return {
+            'trials': trials,
+            'engines': engines,
+            'mismatches': mismatches,
+            'interval_coverage': covered / total if total else None,
+            'intervals': total
+        }
+    
+    def coverage_ok(self, report, slack=0.05):
+        """True when the sampled intervals held the true count about as often as their confidence claims"""
+        return report['interval_coverage'] is None or report['interval_coverage'] >= self.confidence - slack
+    
+    def print_report(self, report, limit=10):
+        """Summary of mismatches per engine and of the interval coverage"""
+        print(f"Differential run: {report['trials']} trials, seed {self.seed}")
+        for engine in report['engines']:
+            engine_mismatches = [item for item in report['mismatches'] if item['engine'] == engine]
+            status = '✅ identical' if not engine_mismatches else f"❌ {len(engine_mismatches)} mismatch(es)"
+            print(f"  {engine:<12} {status}")
+        for item in report['mismatches'][:limit]:
+            expected, actual = item['expected'], item['actual']
+            # Show the results around the first character where they part
+            at = next((i for i, (a, b) in enumerate(zip(expected, actual)) if a != b), min(len(expected), len(actual)))
+            start = max(at - 80, 0)
+            print(f"\n[{item['engine']}] trial {item['trial']}, {item['analysis']}:")
+            print(f"  expected ...{expected[start:at + 120]}")
+            print(f"  actual   ...{actual[start:at + 120]}")
+        if report['interval_coverage'] is not None:
+            print(f"\nSampled {self.confidence * 100:g}% intervals held the true count in "
+                  f"{report['interval_coverage'] * 100:.1f}% of {report['intervals']} cases")
+
+def main():
+    """Entry point for the differential harness"""
+    parser = argparse.ArgumentParser(description='Check every alternative engine against the reference Analyzer '
+                                                 'on randomized adversarial catalogs')
+    parser.add_argument('--trials', type=int, default=100, help='Number of random catalogs (default: 100)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    parser.add_argument('--engines', nargs='+', choices=ENGINES, default=ENGINES, help='Engines to check')
+    parser.add_argument('--dump', metavar='DIR', help='Write the catalog of each failing trial to DIR as CSV')
+    args = parser.parse_args()
+    
+    harness = DifferentialHarness(seed=args.seed)
+    report = harness.run(args.trials, args.engines)
+    harness.print_report(report)
+    
+    if args.dump and report['mismatches']:
+        os.makedirs(args.dump, exist_ok=True)
+        for trial in sorted({item['trial'] for item in report['mismatches']}):
+            harness.frame(trial).to_csv(os.path.join(args.dump, f"trial-{args.seed}-{trial}.csv"), index=False)
+        print(f"Failing catalogs written to '{args.dump}'")
+    
+    raise SystemExit(0 if not report['mismatches'] and harness.coverage_ok(report) else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+import numpy as np
+import pandas as pd
+
+class Downsampler:
+    def __init__(self, max_points=700, max_ticks=20):
+        """Initialize Downsampler with the point and tick budget for one chart"""
+        self.max_points = max_points
+        self.max_ticks = max_ticks
+    
+    def points_for_width(self, width_inches, dpi=100, pixels_per_point=2):
+        """Number of points a figure of the given width can actually show"""
+        return max(int(width_inches * dpi / pixels_per_point), 3)
+    
+    def lttb(self, x, y, threshold):
+        """Largest-triangle-three-buckets decimation of a series to `threshold` points"""
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        n = len(x)
+        
+        if threshold is None or threshold >= n or threshold < 3:
+            return x, y
+        
+        # First and last points are always kept, the rest is split into buckets
+        bucket_size = (n - 2) / (threshold - 2)
+        selected = np.empty(threshold, dtype=np.int64)
+        selected[0] = 0
+        selected[-1] = n - 1
+        
+        a = 0
+        for i in range(threshold - 2):
+            start = int(np.floor(i * bucket_size)) + 1
+            end = int(np.floor((i + 1) * bucket_size)) + 1
+            
+            # Average of the next bucket is the third vertex of the triangle
+            next_start = end
+            next_end = min(int(np.floor((i + 2) * bucket_size)) + 1, n)
+            avg_x = x[next_start:next_end].mean()
+            avg_y = y[next_start:next_end].mean()
+            
+            # Pick the point in the current bucket forming the largest triangle
+            areas = np.abs(
+                (x[a] - avg_x) * (y[start:end] - y[a]) -
+                (x[a] - x[start:end]) * (avg_y - y[a])
+            )
+            a = start + int(np.argmax(areas))
+            selected[i + 1] = a
+        
+        return x[selected], y[selected]
+    
+    def min_max(self, x, y, threshold):
+        """Min/max decimation keeping the extremes of each bucket, in order"""
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        n = len(x)
+        
+        if threshold is None or threshold >= n or threshold < 2:
+            return x, y
+        
+        n_buckets = max(threshold // 2, 1)
+        edges = np.linspace(0, n, n_buckets + 1).astype(np.int64)
+        selected = []
+        
+        for start, end in zip(edges[:-1], edges[1:]):
+            if end <= start:
+                continue
+            bucket = y[start:end]
+            low = start + int(np.argmin(bucket))
+            high = start + int(np.argmax(bucket))
+            selected.extend(sorted({low, high}))
+        
+        selected = np.asarray(selected, dtype=np.int64)
+        return x[selected], y[selected]
+    
+    def choose_resolution(self, counts, max_points=None):
+        """Pick month, year or decade buckets so the series fits the point budget"""
+        max_points = max_points or self.max_points
+        index = counts.index
+        
+        if isinstance(index, (pd.DatetimeIndex, pd.PeriodIndex)):
+            if len(counts) <= max_points:
+                return 'month'
+            span_years = index.max().year - index.min().year + 1
+            return 'year' if span_years <= max_points else 'decade'
+        
+        if len(counts) <= max_points:
+            return 'year'
+        return 'decade'
+    
+    def bucket(self, counts, resolution):
+        """Aggregate a count series to the given resolution (month, year or decade)"""
+        if counts.empty:
+            return counts
+        
+        index = counts.index
+        is_dated = isinstance(index, (pd.DatetimeIndex, pd.PeriodIndex))
+        
+        if resolution == 'month':
+            if not is_dated:
+                return counts
+            keys = index.to_period('M') if isinstance(index, pd.DatetimeIndex) else index.asfreq('M')
+        else:
+            years = index.year if is_dated else pd.Index(index).astype(int)
+            keys = (years // 10) * 10 if resolution == 'decade' else years
+        
+        return counts.groupby(pd.Index(keys)).sum().sort_index()
+    
+    def thin_ticks(self, ticks, max_ticks=None):
+        """Evenly spaced subset of tick positions, always keeping the last one"""
+        max_ticks = max_ticks or self.max_ticks
+        ticks = list(ticks)
+        
+        if len(ticks) <= max_ticks:
+            return ticks
+        
+        step = int(np.ceil(len(ticks) / max_ticks))
+        thinned = ticks[::step]
+        if thinned[-1] != ticks[-1]:
+            thinned[-1] = ticks[-1]
+        return thinned
+    
+    def prepare(self, counts, method='lttb', resolution='auto', max_points=None):
+        """Bucket and decimate a count series for plotting"""
+        max_points = max_points or self.max_points
+        
+        if resolution == 'auto':
+            resolution = self.choose_resolution(counts, max_points)
+        bucketed = self.bucket(counts, resolution)
+        
+        # Monthly buckets are plotted as fractional years so all resolutions share one axis
+        if isinstance(bucketed.index, pd.PeriodIndex):
+            x = np.asarray(bucketed.index.year + (bucketed.index.month - 1) / 12, dtype=float)
+        else:
+            x = np.asarray(bucketed.index, dtype=float)
+        y = bucketed.values.astype(float)
+        
+        if method == 'minmax':
+            plot_x, plot_y = self.min_max(x, y, max_points)
+        else:
+            plot_x, plot_y = self.lttb(x, y, max_points)
+        
+        return {
+            'x': plot_x,
+            'y': plot_y,
+            'bucket_x': x,
+            'bucket_y': y,
+            'resolution': resolution,
+            'bucketed_counts': bucketed,
+            'original_points': len(counts)
+        }
@@ -0,0 +1,337 @@
+import os
+import tempfile
+import pandas as pd
+from pandas._libs.parsers import STR_NA_VALUES
+from analyzer import (Analyzer, DATE_COLUMNS, AUTHOR_COLUMNS, LANGUAGE_COLUMNS, PUBLISHER_COLUMNS,
+                      YEAR_LANGUAGE_LIMIT)
+from comparison import cache_path
+from compression import detect_compression, open_decompressed
+
+try:
+    import duckdb
+except ImportError:  # the duckdb engine is optional; the pandas Analyzer needs nothing extra
+    duckdb = None
+
+# Hidden column holding each record's position in the file (value_counts() breaks ties by first occurrence)
+ROW_COLUMN = '__row'
+
+# Codecs DuckDB's CSV reader decompresses itself; other compressed files are streamed in through pandas
+NATIVE_COMPRESSION = {None: 'none', 'gzip': 'gzip', 'zstd': 'zstd'}
+
+# Text pandas' parser turns into integers and floats (DuckDB's casts also accept '1.0', '0x1A' and '1_000')
+INTEGER_PATTERN = r'[+-]?\d+'
+FLOAT_PATTERN = r'[+-]?((\d+\.?\d*|\.\d+)([eE][+-]?\d+)?|(?i:inf|infinity))'
+
+# Rows per pandas chunk when streaming a bz2/xz file into DuckDB
+STREAM_CHUNK_ROWS = 100000
+
+def quote(name):
+    """SQL identifier for a column name"""
+    return '"' + name.replace('"', '""') + '"'
+
+class DuckDbAnalyzer(Analyzer):
+    def __init__(self, file_path, cache_dir='.parquet_cache', threads=None, memory_limit=None):
+        """Analyzer answering each analysis with a DuckDB query over file_path; the df argument is ignored"""
+        if duckdb is None:
+            raise ImportError("the duckdb engine needs the 'duckdb' package (pip install duckdb)")
+        super().__init__()
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File '{file_path}' not found.")
+        self.file_path = file_path
+        self.cache_dir = cache_dir
+        self.from_cache = False
+        self.connection = duckdb.connect()
+        # Aggregations larger than memory spill to disk instead of failing; DuckDB uses every core by default
+        self.connection.execute("SET temp_directory = ?", [os.path.join(cache_dir or tempfile.gettempdir(),
+                                                                        'duckdb_spill')])
+        if threads:
+            self.connection.execute(f"SET threads = {int(threads)}")
+        if memory_limit:
+            self.connection.execute("SET memory_limit = ?", [memory_limit])
+        
+        # DuckDB identifiers are case-insensitive, so 'isbn' and 'ISBN' are stored as positional columns
+        self.columns = self.read_header(file_path)
+        self.sql_names = {col: f"c{position}" for position, col in enumerate(self.columns)}
+        self.open_source(file_path)
+        self.total_rows = self.scalar("SELECT COUNT(*) FROM raw_books")
+        if self.total_rows == 0:
+            raise ValueError(f"File '{file_path}' is empty.")
+        self.types = self.infer_types()
+        self.create_views()
+        self.date_col = self.find_column(DATE_COLUMNS)
+        self.author_col = self.find_column(AUTHOR_COLUMNS)
+        self.lang_col = self.find_column(LANGUAGE_COLUMNS)
+        self.publisher_col = self.find_column(PUBLISHER_COLUMNS)
+        self.isbn_cols = [col for col in self.columns if 'isbn' in col.lower()]
+        self.integer_years = False
+        if self.date_col is not None:
+            self.create_year_table()
+    
+    def scalar(self, sql, parameters=None):
+        """First value of a query's first row"""
+        return self.connection.execute(sql, parameters or []).fetchone()[0]
+    
+    def read_header(self, file_path):
+        """Column names as pandas reads them (duplicates renamed 'a.1')"""
+        stream = open_decompressed(file_path)
+        try:
+            if stream is None:
+                return list(pd.read_csv(file_path, nrows=0).columns)
+            with stream:
+                return list(pd.read_csv(stream, nrows=0).columns)
+        except pd.errors.EmptyDataError:
+            raise ValueError(f"File '{file_path}' is empty.")
+    
+    def csv_source(self, file_path):
+        """read_csv call giving every field as text, with pandas' missing-value spellings as NULL"""
+        compression = NATIVE_COMPRESSION[detect_compression(file_path)]
+        return (f"read_csv({self.literal(file_path)}, header=true, all_varchar=true, delim=',', quote='\"', escape='\"', "
+                f"names=[{', '.join(map(self.literal, self.sql_names.values()))}], compression='{compression}', nullstr={self.literal(sorted(STR_NA_VALUES))})")
+    
+    def literal(self, value):
+        """SQL literal for a string or a list of strings"""
+        if isinstance(value, list):
+            return '[' + ', '.join(self.literal(item) for item in value) + ']'
+        return "'" + value.replace("'", "''") + "'"
+    
+    def stream_text(self, file_path):
+        """Load a bz2/xz CSV into a text table through pandas chunks; DuckDB cannot decompress it"""
+        with open_decompressed(file_path) as stream:
+            for number, chunk in enumerate(pd.read_csv(stream, dtype=str, chunksize=STREAM_CHUNK_ROWS)):
+                chunk = chunk.astype(object).where(chunk.notna(), None)
+                chunk.columns = [f"c{position}" for position in range(len(chunk.columns))]
+                self.connection.register('text_chunk', chunk)
+                if number == 0:
+                    self.connection.execute("CREATE TEMP TABLE text_books AS SELECT * FROM text_chunk")
+                else:
+                    self.connection.execute("INSERT INTO text_books SELECT * FROM text_chunk")
+                self.connection.unregister('text_chunk')
+        return "(SELECT rowid AS __row, * FROM text_books)"
+    
+    def open_source(self, file_path):
+        """Create the raw_books view: every field as text plus the record's position in the file"""
+        native = detect_compression(file_path) in NATIVE_COMPRESSION
+        if self.cache_dir is None:
+            source = (f"(SELECT row_number() OVER () - 1 AS __row, * FROM {self.csv_source(file_path)})"
+                      if native else self.stream_text(file_path))
+        else:
+            source = self.parquet_source(file_path, native)
+        self.connection.execute(f"CREATE TEMP VIEW raw_books AS SELECT * FROM {source}")
+    
+    def parquet_source(self, file_path, native):
+        """Columnar copy of the CSV, converted once per version of the file and reused by later runs"""
+        path, digest = cache_path(file_path, self.cache_dir, '.parquet')
+        source = f"(SELECT file_row_number AS __row, * EXCLUDE (file_row_number) " \
+                 f"FROM read_parquet({self.literal(path)}, file_row_number=true))"
+        if os.path.exists(path):
+            self.from_cache = True
+            return source
+        
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Drop entries for older versions of this file, then publish the new one atomically
+        for name in os.listdir(self.cache_dir):
+            if name.startswith(f"{digest}-") and name.endswith('.parquet'):
+                os.remove(os.path.join(self.cache_dir, name))
+        text = f"SELECT * FROM {self.csv_source(file_path)}" if native else \
+               f"SELECT * EXCLUDE (__row) FROM {self.stream_text(file_path)} ORDER BY __row"
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        # Insertion order is preserved, so the Parquet row number is the record's position in the file
+        self.connection.execute(f"COPY ({text}) TO {self.literal(temp_path)} (FORMAT parquet)")
+        os.replace(temp_path, path)
+        return source
+    
+    def infer_types(self):
+        """SQL type pandas would infer for each column (BIGINT, DOUBLE or VARCHAR), from one aggregate scan"""
+        checks = []
+        for name in self.sql_names.values():
+            checks += [f"COUNT({name})",
+                       f"COUNT_IF(regexp_full_match(trim({name}), '{INTEGER_PATTERN}') "
+                       f"AND TRY_CAST(trim({name}) AS BIGINT) IS NOT NULL)",
+                       f"COUNT_IF(regexp_full_match(trim({name}), '{FLOAT_PATTERN}'))"]
+        if not checks:
+            return {}
+        counts = self.connection.execute(f"SELECT {', '.join(checks)} FROM raw_books").fetchone()
+        types = {}
+        for position, col in enumerate(self.columns):
+            present, integers, floats = counts[position * 3:position * 3 + 3]
+            # Like pandas, integers with gaps become floats and an all-missing column is float
+            if integers == present == self.total_rows:
+                types[col] = 'BIGINT'
+            elif floats == present:
+                types[col] = 'DOUBLE'
+            else:
+                types[col] = 'VARCHAR'
+        return types
+    
+    def create_views(self):
+        """typed_books (analyses, positional columns) and books (for --sql, header names): typed like pandas"""
+        typed = {}
+        for col, kind in self.types.items():
+            name = self.sql_names[col]
+            typed[col] = name if kind == 'VARCHAR' else f"CAST(trim({name}) AS {kind})"
+        self.connection.execute(
+            "CREATE TEMP VIEW typed_books AS SELECT " +
+            ', '.join([ROW_COLUMN] + [f"{expression} AS {self.sql_names[col]}" for col, expression in typed.items()]) +
+            " FROM raw_books")
+        
+        # Header names differing only in case get a suffix in the SQL view
+        seen = set()
+        readable = []
+        for col, expression in typed.items():
+            alias = col
+            while alias.lower() in seen:
+                alias = f"{alias}_"
+            seen.add(alias.lower())
+            readable.append(f"{expression} AS {quote(alias)}")
+        self.connection.execute(f"CREATE TEMP VIEW books AS SELECT {', '.join(readable)} FROM raw_books")
+    
+    def create_year_table(self):
+        """year_of: publication year of each distinct date, extracted as Analyzer.extract_years does"""
+        date = self.sql_names[self.date_col]
+        if self.types[self.date_col] != 'VARCHAR':
+            self.integer_years = self.types[self.date_col] == 'BIGINT'
+            self.year_expression = f"CAST({date} AS DOUBLE)"
+            return
+        # Dates repeat heavily, so each distinct string is parsed once by the reference extraction;
+        # keeping file order means pandas guesses the date format from the same first value
+        distinct = [row[0] for row in self.connection.execute(
+            f"SELECT {date} FROM typed_books WHERE {date} IS NOT NULL GROUP BY {date} "
+            f"ORDER BY MIN({ROW_COLUMN})").fetchall()]
+        years = pd.to_numeric(self.extract_years(pd.Series(distinct, dtype=object)))
+        self.connection.register('year_frame', pd.DataFrame({'date': distinct, 'year': years.astype('float64')}))
+        self.connection.execute("CREATE TEMP TABLE year_of AS SELECT * FROM year_frame")
+        self.connection.unregister('year_frame')
+        # Dates that all parse give integer years, as .dt.year does
+        self.integer_years = (not years.isna().any() and
+                              self.scalar(f"SELECT COUNT(*) = COUNT({date}) FROM typed_books"))
+        self.year_expression = f"(SELECT year FROM year_of WHERE year_of.date = typed_books.{date})"
+    
+    def find_column(self, candidates):
+        """First accepted column name present in the header"""
+        for col in candidates:
+            if col in self.columns:
+                return col
+        return None
+    
+    def missing_column_error(self, name):
+        """Same message the Analyzer gives for a missing column"""
+        return f"{name} column not found in dataset! Available columns: {self.columns}"
+    
+    def year_label(self, year):
+        """Year as the Analyzer labels it: int when every date gave a year, float otherwise"""
+        return int(year) if self.integer_years else float(year)
+    
+    def valid_years_sql(self):
+        """SQL version of valid_year_mask"""
+        first, last = self.valid_year_bounds()
+        return f"year BETWEEN {first} AND {last}"
+    
+    def counts(self, column, limit=None, offset=0):
+        """Value counts of a column with a parallel hash aggregate, ties in first-seen order like value_counts()"""
+        col = self.sql_names[column]
+        rows = self.connection.execute(
+            f"SELECT {col}, COUNT(*) FROM typed_books WHERE {col} IS NOT NULL GROUP BY {col} "
+            f"ORDER BY COUNT(*) DESC, MIN({ROW_COLUMN})" + (f" LIMIT {int(limit)}" if limit is not None else "")
+            + f" OFFSET {int(offset)}"
+        ).fetchall()
+        return pd.Series([count for _, count in rows], index=[value for value, _ in rows], dtype='int64')
+    
+    def query(self, sql):
+        """Run a read-only SQL query against the books view; returns a DataFrame"""
+        return self.connection.execute(sql).df()
+    
+    def analyze_publication_trends(self, df=None):
+        """Publication trends from a GROUP BY on the extracted years"""
+        if self.date_col is None:
+            return None, self.missing_column_error("Publication date")
+        rows = self.connection.execute(
+            f"SELECT year, COUNT(*) FROM (SELECT {self.year_expression} AS year FROM typed_books) "
+            f"WHERE {self.valid_years_sql()} GROUP BY year ORDER BY year").fetchall()
+        if not rows:
+            return None, "No valid publication years found in the data"
+        
+        year_counts = pd.Series([count for _, count in rows], index=[self.year_label(year) for year, _ in rows],
+                                dtype='int64')
+        return {
+            'year_counts': year_counts,
+            'total_years': len(year_counts),
+            'most_productive_year': year_counts.idxmax(),
+            'most_productive_count': year_counts.max(),
+            'least_productive_year': year_counts.idxmin(),
+            'least_productive_count': year_counts.min()
+        }, None
+    
+    def analyze_top_authors(self, df=None, top_n=5, offset=0):
+        """Top authors from a GROUP BY ... LIMIT ... OFFSET"""
+        if self.author_col is None:
+            return None, self.missing_column_error("Authors")
+        return {'author_counts': self.counts(self.author_col, top_n, offset), 'top_n': top_n, 'offset': offset}, None
+    
+    def analyze_language_distribution(self, df=None):
+        """Language counts and shares of all records"""
+        if self.lang_col is None:
+            return None, self.missing_column_error("Language")
+        lang_counts = self.counts(self.lang_col)
+        return {
+            'lang_counts': lang_counts,
+            'lang_percentages': (lang_counts / self.total_rows * 100).round(1),
+            'total_books': self.total_rows
+        }, None
+    
+    def analyze_books_by_publisher(self, df=None, top_n=20, offset=0):
+        """Top publishers and the number of distinct publishers"""
+        if self.publisher_col is None:
+            return None, self.missing_column_error("Publisher")
+        return {
+            'publisher_counts': self.counts(self.publisher_col, top_n, offset),
+            'total_publishers': self.scalar(f"SELECT COUNT(DISTINCT {self.sql_names[self.publisher_col]}) FROM typed_books"),
+            'top_n': top_n,
+            'offset': offset
+        }, None
+    
+    def analyze_missing_isbn(self, df=None):
+        """Missing (null or empty) values of every ISBN column, all counted in one scan"""
+        if not self.isbn_cols:
+            return None, "No ISBN columns found in dataset!"
+        missing = []
+        for isbn_col in self.isbn_cols:
+            col = self.sql_names[isbn_col]
+            empty = f" + COUNT_IF({col} = '')" if self.types[isbn_col] == 'VARCHAR' else ""
+            missing.append(f"COUNT(*) - COUNT({col}){empty}")
+        counts = self.connection.execute(f"SELECT {', '.join(missing)} FROM typed_books").fetchone()
+        
+        isbn_analysis = {}
+        for isbn_col, missing_count in zip(self.isbn_cols, counts):
+            isbn_analysis[isbn_col] = {
+                'total_records': self.total_rows,
+                'present_count': self.total_rows - missing_count,
+                'missing_count': missing_count,
+                'missing_percentage': missing_count / self.total_rows * 100
+            }
+        return {'isbn_analysis': isbn_analysis, 'total_records': self.total_rows}, None
+    
+    def analyze_books_per_year_by_language(self, df=None):
+        """Year by language counts over the first YEAR_LANGUAGE_LIMIT records"""
+        if self.date_col is None or self.lang_col is None:
+            missing_cols = [name for name, col in (("publication date", self.date_col), ("language", self.lang_col))
+                            if col is None]
+            return None, f"{' and '.join(missing_cols)} column(s) not found in dataset! Available columns: {self.columns}"
+        
+        lang = self.sql_names[self.lang_col]
+        rows = self.connection.execute(
+            f"SELECT year, language, COUNT(*) FROM (SELECT {self.year_expression} AS year, {lang} AS language "
+            f"FROM typed_books WHERE {ROW_COLUMN} < {YEAR_LANGUAGE_LIMIT}) "
+            f"WHERE {self.valid_years_sql()} AND language IS NOT NULL GROUP BY year, language").fetchall()
+        if not rows:
+            return None, "No valid year-language data found"
+        
+        year_lang_counts = pd.Series([count for _, _, count in rows],
+                                     index=pd.MultiIndex.from_tuples([(self.year_label(year), language)
+                                                                      for year, language, _ in rows]))
+        year_lang_counts = year_lang_counts.unstack(fill_value=0).sort_index()
+        year_lang_counts = year_lang_counts[sorted(year_lang_counts.columns)]
+        return {
+            'year_lang_counts': year_lang_counts,
+            'years': sorted(year_lang_counts.index),
+            'languages': list(year_lang_counts.columns)
+        }, None
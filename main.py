@@ -1,5 +1,4 @@
 from dataLoader import DataLoader
-from visualizer import Visualizer
 from analyzer import Analyzer
 import pandas as pd
 import signal
@@ -9,13 +8,36 @@ class Main:
     def __init__(self):
         """Initialize Main class with DataLoader, Analyzer, and Visualizer instances"""
         self.data_loader = DataLoader()
-        self.visualizer = Visualizer()
+        self._visualizer = None
         self.analyzer = Analyzer()
         self.dataset = None
+        self.profiler = None
         
         # Set up signal handler for Ctrl+C
         signal.signal(signal.SIGINT, self.signal_handler)
     
+    @property
+    def visualizer(self):
+        """Visualizer created on first use so matplotlib is only imported when charts are drawn"""
+        if self._visualizer is None:
+            from visualizer import Visualizer
+            self.visualizer = Visualizer()
+        return self._visualizer
+    
+    @visualizer.setter
+    def visualizer(self, renderer):
+        """Replace the renderer (e.g. with a TerminalRenderer)"""
+        if self.profiler is not None:
+            self.profiler.instrument(renderer, 'visualize')
+        self._visualizer = renderer
+    
+    def enable_profiling(self, profiler):
+        """Time loading, every analysis and every chart with the given Profiler"""
+        self.profiler = profiler
+        profiler.instrument(self.data_loader, 'load')
+        profiler.instrument(self.analyzer, 'analyze')
+        profiler.instrument(self._visualizer, 'visualize')
+    
     def signal_handler(self, sig, frame):
         """Handle Ctrl+C signal gracefully"""
         print("\n\nProcess interrupted by user (Ctrl+C)")
@@ -210,31 +232,32 @@ class Main:
             print("No ISBN data available for analysis.")
             return
         
-        # Print detailed summary (removed duplicate title and extra line)
+        # Build the report and print it in one call (removed duplicate title and extra line)
+        lines = []
         isbn_cols = list(isbn_analysis.keys())
         for isbn_col in isbn_cols:
             data = isbn_analysis[isbn_col]
-            print(f"\n{isbn_col.upper()} Analysis:")
-            print("-" * 40)
-            print(f"   Total records: {data['total_records']:,}")
-            print(f"   Present: {data['present_count']:,}")
-            print(f"   Missing: {data['missing_count']:,}")
-            print(f"   Missing percentage: {data['missing_percentage']:.2f}%")
-            print(f"   Completeness: {100 - data['missing_percentage']:.2f}%")
+            lines.append(f"\n{isbn_col.upper()} Analysis:")
+            lines.append("-" * 40)
+            lines.append(f"   Total records: {data['total_records']:,}")
+            lines.append(f"   Present: {data['present_count']:,}")
+            lines.append(f"   Missing: {data['missing_count']:,}")
+            lines.append(f"   Missing percentage: {data['missing_percentage']:.2f}%")
+            lines.append(f"   Completeness: {100 - data['missing_percentage']:.2f}%")
         
         # Summary table
-        print(f"\nISBN Data Summary Table:")
-        print("=" * 60)
-        print(f"{'ISBN Type':<15} {'Total':<10} {'Present':<10} {'Missing':<10} {'Missing %':<12}")
-        print("-" * 60)
+        lines.append(f"\nISBN Data Summary Table:")
+        lines.append("=" * 60)
+        lines.append(f"{'ISBN Type':<15} {'Total':<10} {'Present':<10} {'Missing':<10} {'Missing %':<12}")
+        lines.append("-" * 60)
         
         for isbn_col in isbn_cols:
             data = isbn_analysis[isbn_col]
-            print(f"{isbn_col.upper():<15} {data['total_records']:<10,} {data['present_count']:<10,} {data['missing_count']:<10,} {data['missing_percentage']:<12.2f}%")
+            lines.append(f"{isbn_col.upper():<15} {data['total_records']:<10,} {data['present_count']:<10,} {data['missing_count']:<10,} {data['missing_percentage']:<12.2f}%")
         
         # Overall assessment
-        print(f"\nData Quality Assessment:")
-        print("-" * 40)
+        lines.append(f"\nData Quality Assessment:")
+        lines.append("-" * 40)
         for isbn_col in isbn_cols:
             data = isbn_analysis[isbn_col]
             completeness = 100 - data['missing_percentage']
@@ -246,7 +269,9 @@ class Main:
                 status = "Fair"
             else:
                 status = "Poor"
-            print(f"   {isbn_col.upper()}: {status} ({completeness:.1f}% complete)")
+            lines.append(f"   {isbn_col.upper()}: {status} ({completeness:.1f}% complete)")
+        
+        print("\n".join(lines))
 
     def analyze_and_visualize_books_per_year_by_language(self):
         """Analyze and visualize books per year by language"""
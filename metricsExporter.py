@@ -0,0 +1,107 @@
+import math
+import os
+import tempfile
+import time
+from analyzer import ANALYSIS_METHODS
+
+# Analysis type for each Analyzer method, used as the "analysis" label
+ANALYSIS_TYPES_BY_METHOD = {method_name: analysis_type for analysis_type, method_name in ANALYSIS_METHODS.items()}
+
+class MetricsExporter:
+    def __init__(self, prefix='bookshop'):
+        """Initialize MetricsExporter collecting metric families for one run"""
+        self.prefix = prefix
+        self.families = {}
+    
+    def add(self, name, metric_type, help_text, value, labels=None, unit=None):
+        """Add one sample; samples with the same name share a family (HELP/TYPE written once)"""
+        family_name = f"{self.prefix}_{name}"
+        family = self.families.get(family_name)
+        if family is None:
+            family = self.families[family_name] = {'type': metric_type, 'help': help_text,
+                                                   'unit': unit, 'samples': []}
+        family['samples'].append((labels or {}, value))
+    
+    def escape(self, value):
+        """Escape a label value per the OpenMetrics text format"""
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    
+    def format_value(self, value):
+        """Numbers as OpenMetrics expects them (integers without a decimal point)"""
+        value = float(value)
+        if math.isnan(value):
+            return 'NaN'
+        if value.is_integer() and abs(value) < 1e15:
+            return str(int(value))
+        return repr(value)
+    
+    def collect_run(self, file_path, profiler=None, dataset=None, report_stats=None, succeeded=True):
+        """Collect the standard metrics of one cli.py run"""
+        labels = {'file': file_path}
+        
+        self.add('run_success', 'gauge', 'Whether the last run finished without error.',
+                 1 if succeeded else 0, labels)
+        self.add('run_timestamp_seconds', 'gauge', 'Unix time the last run finished.',
+                 time.time(), labels, unit='seconds')
+        
+        if file_path and os.path.exists(file_path):
+            self.add('input_bytes', 'gauge', 'Size of the input file read by the run.',
+                     os.path.getsize(file_path), labels, unit='bytes')
+        if dataset is not None:
+            self.add('rows_parsed', 'gauge', 'Rows parsed from the input file.', len(dataset), labels)
+        
+        if profiler is not None:
+            self.add('run_duration_seconds', 'gauge', 'Wall-clock duration of the run.',
+                     profiler.total_seconds, labels, unit='seconds')
+            self.add('memory_peak_bytes', 'gauge', 'Peak traced Python memory during the run (tracemalloc).',
+                     profiler.peak_memory, labels, unit='bytes')
+            
+            for record in profiler.records.values():
+                owner, method_name = record['name'].split('.', 1)
+                if record['stage'] == 'load':
+                    self.add('load_duration_seconds', 'gauge', 'Time spent loading the dataset.',
+                             record['seconds'], labels, unit='seconds')
+                elif record['stage'] == 'analyze':
+                    analysis_labels = dict(labels, analysis=ANALYSIS_TYPES_BY_METHOD.get(method_name, method_name))
+                    self.add('analysis_duration_seconds', 'gauge', 'Time spent in each analysis.',
+                             record['seconds'], analysis_labels, unit='seconds')
+                    self.add('analysis_calls', 'gauge', 'Calls to each analysis during the run.',
+                             record['calls'], analysis_labels)
+                else:
+                    self.add('render_duration_seconds', 'gauge', 'Time spent drawing each chart.',
+                             record['seconds'], dict(labels, renderer=owner, method=method_name), unit='seconds')
+        
+        if report_stats is not None:
+            self.add('report_cache_hits', 'gauge', 'Report sections served from the fragment cache.',
+                     len(report_stats['cached']), labels)
+            self.add('report_cache_misses', 'gauge', 'Report sections rendered because their data changed.',
+                     len(report_stats['rendered']), labels)
+    
+    def render(self):
+        """Metrics in OpenMetrics text format"""
+        lines = []
+        for family_name, family in self.families.items():
+            lines.append(f"# HELP {family_name} {family['help']}")
+            lines.append(f"# TYPE {family_name} {family['type']}")
+            if family['unit']:
+                lines.append(f"# UNIT {family_name} {family['unit']}")
+            for labels, value in family['samples']:
+                label_text = ','.join(f'{key}="{self.escape(item)}"' for key, item in labels.items())
+                sample = f"{family_name}{{{label_text}}}" if label_text else family_name
+                lines.append(f"{sample} {self.format_value(value)}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+    
+    def write(self, path):
+        """Write the metrics atomically so a textfile collector never reads a partial file"""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.metrics-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(self.render())
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
@@ -0,0 +1,142 @@
+import csv
+import io
+import json
+import sys
+import numpy as np
+import pandas as pd
+
+OUTPUT_FORMATS = ['table', 'json', 'csv', 'ndjson']
+ROW_FIELDS = ['analysis', 'field', 'row', 'column', 'value']
+
+class OutputWriter:
+    def __init__(self, output_format='json', stream=None, chunk_rows=10000):
+        """Initialize OutputWriter for one of json, csv or ndjson"""
+        if output_format not in OUTPUT_FORMATS or output_format == 'table':
+            raise ValueError(f"Unsupported output format '{output_format}'. Choose from: json, csv, ndjson")
+        self.output_format = output_format
+        self.stream = stream
+        self.chunk_rows = chunk_rows
+        self.results = {}
+        self.header_written = False
+    
+    def get_stream(self):
+        """Stream results are written to (stdout unless one was given)"""
+        return self.stream or sys.stdout
+    
+    def to_key(self, value):
+        """JSON-friendly index label (2019.0 -> 2019, numpy scalars -> Python)"""
+        value = self.to_value(value)
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        return value
+    
+    def to_value(self, value):
+        """Convert numpy/pandas scalars to plain Python values"""
+        if isinstance(value, np.generic):
+            value = value.item()
+        if value is pd.NA or (isinstance(value, float) and np.isnan(value)):
+            return None
+        if isinstance(value, pd.Timestamp):
+            return value.isoformat()
+        return value
+    
+    def to_serializable(self, value):
+        """Recursively convert analysis_data values (Series, DataFrames, numpy) to JSON types"""
+        if isinstance(value, pd.DataFrame):
+            # Read column by column: a row Series would upcast ints to float in mixed-dtype frames
+            columns = [(str(self.to_key(col)), value.iloc[:, position].values)
+                       for position, col in enumerate(value.columns)]
+            return {
+                str(self.to_key(index)): {name: self.to_value(cells[row]) for name, cells in columns}
+                for row, index in enumerate(value.index)
+            }
+        if isinstance(value, pd.Series):
+            return {str(self.to_key(index)): self.to_value(cell) for index, cell in value.items()}
+        if isinstance(value, dict):
+            return {str(self.to_key(key)): self.to_serializable(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple, np.ndarray, pd.Index)):
+            return [self.to_key(item) for item in value]
+        return self.to_value(value)
+    
+    def iter_rows(self, analysis_type, analysis_data):
+        """Flatten one analysis_data dict into long-format rows (analysis, field, row, column, value)"""
+        for field, value in analysis_data.items():
+            if isinstance(value, pd.DataFrame):
+                # Column-wise iteration avoids building a Series per row
+                for col in value.columns:
+                    column = self.to_key(col)
+                    for index, cell in zip(value.index, value[col].values):
+                        yield [analysis_type, field, self.to_key(index), column, self.to_value(cell)]
+            elif isinstance(value, pd.Series):
+                for index, cell in zip(value.index, value.values):
+                    yield [analysis_type, field, self.to_key(index), '', self.to_value(cell)]
+            elif isinstance(value, dict):
+                for key, item in value.items():
+                    if isinstance(item, dict):
+                        for column, cell in item.items():
+                            yield [analysis_type, field, self.to_key(key), column, self.to_value(cell)]
+                    else:
+                        yield [analysis_type, field, self.to_key(key), '', self.to_value(item)]
+            elif isinstance(value, (list, tuple, np.ndarray, pd.Index)):
+                for position, item in enumerate(value):
+                    yield [analysis_type, field, position, '', self.to_key(item)]
+            else:
+                yield [analysis_type, field, '', '', self.to_value(value)]
+    
+    def write_chunks(self, lines):
+        """Write pre-formatted lines in chunks of chunk_rows, one stream.write per chunk"""
+        stream = self.get_stream()
+        buffer = []
+        for line in lines:
+            buffer.append(line)
+            if len(buffer) >= self.chunk_rows:
+                stream.write(''.join(buffer))
+                buffer = []
+        if buffer:
+            stream.write(''.join(buffer))
+    
+    def iter_csv_lines(self, rows):
+        """Format rows as CSV lines using the csv module's quoting rules"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        if not self.header_written:
+            writer.writerow(ROW_FIELDS)
+            self.header_written = True
+        for row in rows:
+            writer.writerow(row)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue()
+    
+    def iter_ndjson_lines(self, rows):
+        """Format rows as one JSON object per line"""
+        for row in rows:
+            yield json.dumps(dict(zip(ROW_FIELDS, row)), ensure_ascii=False) + '\n'
+    
+    def write(self, analysis_type, analysis_data, error=None):
+        """Write (csv/ndjson) or collect (json) the result of one analysis"""
+        if error:
+            print(f"Error: {error}", file=sys.stderr)
+            if self.output_format == 'json':
+                self.results[analysis_type] = {'error': error}
+            return
+        
+        if self.output_format == 'json':
+            self.results[analysis_type] = self.to_serializable(analysis_data)
+            return
+        
+        rows = self.iter_rows(analysis_type, analysis_data)
+        if self.output_format == 'csv':
+            self.write_chunks(self.iter_csv_lines(rows))
+        else:
+            self.write_chunks(self.iter_ndjson_lines(rows))
+    
+    def flush(self):
+        """Write collected JSON results as a single document"""
+        stream = self.get_stream()
+        if self.output_format == 'json':
+            stream.write(json.dumps(self.results, indent=2, ensure_ascii=False) + '\n')
+            self.results = {}
+        stream.flush()
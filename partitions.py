@@ -0,0 +1,88 @@
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataLoader import DataLoader
+from csvWatcher import RunningAggregates
+from compression import COMPRESSED_PATTERNS
+
+# File name patterns picked up when --file names a directory
+PARTITION_PATTERNS = ['*.csv'] + COMPRESSED_PATTERNS
+
+def is_partitioned(file_path):
+    """True when file_path is a directory or a glob pattern rather than a single file"""
+    return bool(file_path) and (os.path.isdir(file_path) or glob.has_magic(file_path))
+
+def aggregate_partition(file_path, chunk_rows):
+    """Worker task: fold one partition into RunningAggregates chunk by chunk"""
+    aggregates = RunningAggregates()
+    columns = None
+    # Partitions already run one per process, so each decodes zstd single-threaded
+    for chunk in DataLoader(decompress_threads=1).load_chunks(file_path, chunk_rows):
+        if columns is None:
+            # Stray whitespace around header names is the most common shard-to-shard difference
+            columns = [str(col).strip() for col in chunk.columns]
+            aggregates.reset(columns)
+        chunk.columns = columns
+        aggregates.update(chunk)
+    return aggregates if columns is not None else None
+
+class PartitionedDataset:
+    def __init__(self, pattern, workers=None, chunk_rows=100000):
+        """Initialize PartitionedDataset over a directory or glob of CSV shards"""
+        self.pattern = pattern
+        self.workers = workers
+        self.chunk_rows = chunk_rows
+        self.partitions = []
+        self.failed = []
+    
+    def files(self):
+        """Partition files in a stable (sorted) order"""
+        if os.path.isdir(self.pattern):
+            paths = [path for pattern in PARTITION_PATTERNS for path in glob.glob(os.path.join(self.pattern, pattern))]
+        else:
+            paths = glob.glob(self.pattern)
+        return sorted(path for path in set(paths) if os.path.isfile(path))
+    
+    def aggregate(self):
+        """Aggregate every partition in parallel and merge them in file order; None if nothing loaded"""
+        paths = self.files()
+        self.partitions = []
+        self.failed = []
+        if not paths:
+            return None
+        
+        workers = max(1, min(self.workers or os.cpu_count() or 1, len(paths)))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(aggregate_partition, paths, [self.chunk_rows] * len(paths)))
+        
+        merged = None
+        for path, aggregates in zip(paths, results):
+            if aggregates is None:
+                self.failed.append(path)
+                continue
+            self.partitions.append({'file': path, 'rows': aggregates.total_rows, 'columns': list(aggregates.columns)})
+            if merged is None:
+                merged = aggregates
+            else:
+                merged.merge(aggregates)
+        return merged
+    
+    def schema_differences(self):
+        """Columns missing from some partitions: {column: [files without it]}"""
+        all_columns = []
+        for partition in self.partitions:
+            all_columns.extend(col for col in partition['columns'] if col not in all_columns)
+        return {
+            col: [partition['file'] for partition in self.partitions if col not in partition['columns']]
+            for col in all_columns
+            if any(col not in partition['columns'] for partition in self.partitions)
+        }
+    
+    def print_summary(self):
+        """Partition count, rows and schema reconciliation notes"""
+        total = sum(partition['rows'] for partition in self.partitions)
+        print(f"Loaded {len(self.partitions)} partitions from '{self.pattern}' ({total:,} records)")
+        for path in self.failed:
+            print(f"   Skipped '{path}' (could not be loaded)")
+        for col, files in self.schema_differences().items():
+            print(f"   Column '{col}' missing from {len(files)} partition(s); treated as empty there")
@@ -0,0 +1,91 @@
+import queue
+import threading
+import time
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_pdf import PdfPages
+from analyzer import Analyzer, ANALYSIS_METHODS, ANALYSIS_CHARTS
+from visualizer import Visualizer
+
+class PdfReport:
+    def __init__(self, output_path, analyzer=None, visualizer=None):
+        """Initialize PdfReport writing every Visualizer chart to one multi-page PDF"""
+        self.output_path = output_path
+        self.analyzer = analyzer or Analyzer()
+        self.visualizer = visualizer or Visualizer(interactive=False)
+        self.page_times = []
+        self.errors = []
+        # matplotlib is not thread-safe: the worker saves a page only while no figure is being drawn
+        self.drawing = threading.Lock()
+    
+    def render_pages(self, pdf, pages):
+        """Background worker: draw queued figures into the PDF until None arrives"""
+        while True:
+            item = pages.get()
+            if item is None:
+                break
+            
+            analysis_type, figure = item
+            try:
+                with self.drawing:
+                    start = time.perf_counter()
+                    pdf.savefig(figure)
+                    seconds = time.perf_counter() - start
+                self.page_times.append((analysis_type, seconds))
+            except Exception as e:
+                self.errors.append((analysis_type, str(e)))
+    
+    def generate(self, df, analysis_types=None):
+        """Print each analysis summary while its chart is written to the PDF in the background"""
+        analysis_types = analysis_types or list(ANALYSIS_METHODS)
+        self.page_times = []
+        self.errors = []
+        pages = queue.Queue()
+        
+        # Pages are drawn off-screen; the previous backend (possibly interactive) is restored afterwards
+        backend = plt.get_backend()
+        plt.switch_backend('Agg')
+        try:
+            self.write_pages(df, analysis_types, pages)
+        finally:
+            plt.switch_backend(backend)
+        return self.page_times
+    
+    def write_pages(self, df, analysis_types, pages):
+        """Draw each chart on this thread and queue it for the background PDF writer"""
+        with PdfPages(self.output_path) as pdf:
+            worker = threading.Thread(target=self.render_pages, args=(pdf, pages), daemon=True)
+            worker.start()
+            
+            try:
+                for analysis_type in analysis_types:
+                    method_name, title = ANALYSIS_CHARTS[analysis_type]
+                    print("\n" + "="*50)
+                    print(f"   {title.upper()}")
+                    print("="*50)
+                    
+                    analysis_data, error = getattr(self.analyzer, ANALYSIS_METHODS[analysis_type])(df)
+                    if error:
+                        print(f"Error: {error}")
+                        continue
+                    
+                    with self.drawing:
+                        figure = getattr(self.visualizer, method_name)(analysis_data)
+                        if figure is None:
+                            continue
+                        # Detach the figure from pyplot so the worker owns it exclusively
+                        plt.close(figure)
+                    pages.put((analysis_type, figure))
+            finally:
+                pages.put(None)
+                worker.join()
+    
+    def print_timings(self):
+        """Print per-page render time"""
+        print(f"\nPDF written to '{self.output_path}' ({len(self.page_times)} pages)")
+        print(f"{'Page':<6} {'Analysis':<16} {'Render time':>12}")
+        print("-" * 36)
+        for number, (analysis_type, seconds) in enumerate(self.page_times, 1):
+            print(f"{number:<6} {analysis_type:<16} {seconds * 1000:>10.1f}ms")
+        print(f"{'':<6} {'Total':<16} {sum(seconds for _, seconds in self.page_times) * 1000:>10.1f}ms")
+        for analysis_type, error in self.errors:
+            print(f"Error rendering {analysis_type} page: {error}")
@@ -0,0 +1,193 @@
+import os
+import pandas as pd
+from pandas._libs.parsers import STR_NA_VALUES
+from analyzer import (Analyzer, DATE_COLUMNS, AUTHOR_COLUMNS, LANGUAGE_COLUMNS, PUBLISHER_COLUMNS,
+                      YEAR_LANGUAGE_LIMIT)
+from compression import detect_compression, open_decompressed
+
+try:
+    import polars as pl
+except ImportError:  # the polars engine is optional; the pandas Analyzer needs nothing extra
+    pl = None
+
+# Hidden column holding each record's position in the file (value_counts() breaks ties by first occurrence)
+ROW_COLUMN = '__row'
+
+class PolarsAnalyzer(Analyzer):
+    def __init__(self, file_path):
+        """Analyzer backed by a Polars scan of file_path; the df argument of each analysis is ignored"""
+        if pl is None:
+            raise ImportError("the polars engine needs the 'polars' package (pip install polars)")
+        super().__init__()
+        self.file_path = file_path
+        self.columns = []
+        self.total_rows = 0
+        self.frame = self.load(file_path)
+        self.date_col = self.find_column(DATE_COLUMNS)
+        self.author_col = self.find_column(AUTHOR_COLUMNS)
+        self.lang_col = self.find_column(LANGUAGE_COLUMNS)
+        self.publisher_col = self.find_column(PUBLISHER_COLUMNS)
+        self.isbn_cols = [col for col in self.columns if 'isbn' in col.lower()]
+    
+    def load(self, file_path):
+        """Scan the CSV as text (pandas' missing-value spellings as null), keeping only the analyzed columns"""
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File '{file_path}' not found.")
+        options = {'infer_schema': False, 'null_values': sorted(STR_NA_VALUES)}
+        if detect_compression(file_path):
+            with open_decompressed(file_path) as stream:
+                scan = pl.read_csv(stream, **options).lazy()
+        else:
+            scan = pl.scan_csv(file_path, **options)
+        
+        self.columns = scan.collect_schema().names()
+        analyzed = [col for col in self.columns
+                    if col in DATE_COLUMNS + AUTHOR_COLUMNS + LANGUAGE_COLUMNS + PUBLISHER_COLUMNS or 'isbn' in col.lower()]
+        # Projection pushdown: titles and identifiers are never parsed, and the scan runs on all cores
+        frame = scan.select(analyzed).with_row_index(ROW_COLUMN).collect()
+        # With nothing to analyze the projection is empty, so count the records without parsing them
+        self.total_rows = frame.height if analyzed else scan.select(pl.len()).collect().item()
+        if self.total_rows == 0:
+            raise ValueError(f"File '{file_path}' is empty.")
+        return frame.with_columns([self.typed(frame[col]) for col in analyzed])
+    
+    def typed(self, column):
+        """Text column cast to the type pandas would infer for it: integers, floats or text"""
+        present = column.len() - column.null_count()
+        for dtype in (pl.Int64, pl.Float64):
+            cast = column.str.strip_chars().cast(dtype, strict=False)
+            if cast.len() - cast.null_count() == present:
+                # Like pandas, integers with gaps become floats
+                return cast.cast(pl.Float64) if dtype == pl.Int64 and column.null_count() else cast
+        return column
+    
+    def find_column(self, candidates):
+        """First accepted column name present in the header"""
+        for col in candidates:
+            if col in self.columns:
+                return col
+        return None
+    
+    def missing_column_error(self, name):
+        """Same message the Analyzer gives for a missing column"""
+        return f"{name} column not found in dataset! Available columns: {self.columns}"
+    
+    def years(self):
+        """Publication year of each record, extracted as Analyzer.extract_years does"""
+        column = self.frame[self.date_col]
+        if column.dtype != pl.String:
+            return column
+        # Dates repeat heavily, so each distinct string is parsed once by the reference extraction;
+        # keeping file order means pandas guesses the date format from the same first value
+        distinct = column.drop_nulls().unique(maintain_order=True)
+        years = self.extract_years(pd.Series(distinct.to_list(), dtype=object))
+        years = column.replace_strict(distinct, pl.Series(pd.to_numeric(years), dtype=pl.Float64),
+                                      default=None, return_dtype=pl.Float64)
+        # Dates that all parse give integer years, as .dt.year does
+        return years.cast(pl.Int64) if years.null_count() == 0 else years
+    
+    def valid_years(self, years):
+        """Polars expression version of valid_year_mask"""
+        return years.is_between(*self.valid_year_bounds())
+    
+    def counts(self, column, limit=None, offset=0):
+        """Value counts of a column with a multithreaded group-by, ties in first-seen order like value_counts()"""
+        counts = (self.frame.lazy()
+                  .filter(pl.col(column).is_not_null())
+                  .group_by(column)
+                  .agg(pl.len().alias('count'), pl.col(ROW_COLUMN).min().alias('first'))
+                  .sort(['count', 'first'], descending=[True, False]))
+        if limit is not None or offset:
+            counts = counts.slice(offset, limit)
+        counts = counts.collect()
+        return pd.Series(counts['count'].to_list(), index=counts[column].to_list(), dtype='int64')
+    
+    def analyze_publication_trends(self, df=None):
+        """Publication trends from a group-by on the extracted years"""
+        if self.date_col is None:
+            return None, self.missing_column_error("Publication date")
+        years = self.years()
+        valid = years.filter(self.valid_years(years))
+        if valid.len() == 0:
+            return None, "No valid publication years found in the data"
+        
+        counts = valid.value_counts().sort(valid.name)
+        year_counts = pd.Series(counts['count'].to_list(), index=counts[valid.name].to_list(), dtype='int64')
+        return {
+            'year_counts': year_counts,
+            'total_years': len(year_counts),
+            'most_productive_year': year_counts.idxmax(),
+            'most_productive_count': year_counts.max(),
+            'least_productive_year': year_counts.idxmin(),
+            'least_productive_count': year_counts.min()
+        }, None
+    
+    def analyze_top_authors(self, df=None, top_n=5, offset=0):
+        """Top authors from a group-by"""
+        if self.author_col is None:
+            return None, self.missing_column_error("Authors")
+        return {'author_counts': self.counts(self.author_col, top_n, offset), 'top_n': top_n, 'offset': offset}, None
+    
+    def analyze_language_distribution(self, df=None):
+        """Language counts and shares of all records"""
+        if self.lang_col is None:
+            return None, self.missing_column_error("Language")
+        lang_counts = self.counts(self.lang_col)
+        return {
+            'lang_counts': lang_counts,
+            'lang_percentages': (lang_counts / self.total_rows * 100).round(1),
+            'total_books': self.total_rows
+        }, None
+    
+    def analyze_books_by_publisher(self, df=None, top_n=20, offset=0):
+        """Top publishers and the number of distinct publishers"""
+        if self.publisher_col is None:
+            return None, self.missing_column_error("Publisher")
+        return {
+            'publisher_counts': self.counts(self.publisher_col, top_n, offset),
+            'total_publishers': self.frame[self.publisher_col].drop_nulls().n_unique(),
+            'top_n': top_n,
+            'offset': offset
+        }, None
+    
+    def analyze_missing_isbn(self, df=None):
+        """Missing (null or empty) values of every ISBN column"""
+        if not self.isbn_cols:
+            return None, "No ISBN columns found in dataset!"
+        isbn_analysis = {}
+        for isbn_col in self.isbn_cols:
+            column = self.frame[isbn_col]
+            missing_count = column.null_count()
+            if column.dtype == pl.String:
+                missing_count += int((column == '').sum())
+            isbn_analysis[isbn_col] = {
+                'total_records': self.total_rows,
+                'present_count': self.total_rows - missing_count,
+                'missing_count': missing_count,
+                'missing_percentage': missing_count / self.total_rows * 100
+            }
+        return {'isbn_analysis': isbn_analysis, 'total_records': self.total_rows}, None
+    
+    def analyze_books_per_year_by_language(self, df=None):
+        """Year by language counts over the first YEAR_LANGUAGE_LIMIT records"""
+        if self.date_col is None or self.lang_col is None:
+            missing_cols = [name for name, col in (("publication date", self.date_col), ("language", self.lang_col))
+                            if col is None]
+            return None, f"{' and '.join(missing_cols)} column(s) not found in dataset! Available columns: {self.columns}"
+        
+        head = pl.DataFrame({'year': self.years().head(YEAR_LANGUAGE_LIMIT),
+                             'language': self.frame[self.lang_col].head(YEAR_LANGUAGE_LIMIT)})
+        pairs = (head.filter(self.valid_years(pl.col('year')) & pl.col('language').is_not_null())
+                 .group_by(['year', 'language']).len())
+        if pairs.height == 0:
+            return None, "No valid year-language data found"
+        
+        year_lang_counts = pd.Series(pairs['len'].to_list(),
+                                     index=pd.MultiIndex.from_arrays([pairs['year'].to_list(), pairs['language'].to_list()]))
+        year_lang_counts = year_lang_counts.unstack(fill_value=0).sort_index()
+        year_lang_counts = year_lang_counts[sorted(year_lang_counts.columns)]
+        return {
+            'year_lang_counts': year_lang_counts,
+            'years': sorted(year_lang_counts.index),
+            'languages': list(year_lang_counts.columns)
+        }, None
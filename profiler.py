@@ -0,0 +1,142 @@
+import cProfile
+import functools
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# Method-name prefix wrapped on each instrumented object, by stage
+STAGE_PREFIXES = {
+    'load': 'load',
+    'analyze': 'analyze_',
+    'visualize': 'visualize_'
+}
+
+class Profiler:
+    def __init__(self, trace_memory=True, cprofile_path=None):
+        """Initialize Profiler; cprofile_path also records a cProfile dump for pstats"""
+        self.trace_memory = trace_memory
+        self.cprofile_path = cprofile_path
+        self.records = {}
+        self.peak_memory = 0
+        self.started_at = None
+        self.total_seconds = 0.0
+        self.cprofile = None
+        self.started_tracemalloc = False
+    
+    def start(self):
+        """Start the wall clock, tracemalloc and (optionally) cProfile"""
+        self.started_at = time.perf_counter()
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracemalloc = True
+        if self.cprofile_path:
+            self.cprofile = cProfile.Profile()
+            self.cprofile.enable()
+        return self
+    
+    def stop(self):
+        """Stop measuring and write the cProfile dump if one was requested"""
+        if self.started_at is None:
+            return self
+        self.total_seconds = time.perf_counter() - self.started_at
+        self.started_at = None
+        
+        if self.cprofile is not None:
+            self.cprofile.disable()
+            self.cprofile.dump_stats(self.cprofile_path)
+            self.cprofile = None
+        if tracemalloc.is_tracing():
+            self.peak_memory = max(self.peak_memory, tracemalloc.get_traced_memory()[1])
+            if self.started_tracemalloc:
+                tracemalloc.stop()
+                self.started_tracemalloc = False
+        return self
+    
+    def __enter__(self):
+        """Profile a with-block"""
+        return self.start()
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stop profiling when the with-block ends"""
+        self.stop()
+        return False
+    
+    @contextmanager
+    def measure(self, stage, name):
+        """Time one call and record the memory peak reached during it"""
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            # Keep the run-wide peak before resetting it for this call
+            self.peak_memory = max(self.peak_memory, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] if tracing else 0
+            self.peak_memory = max(self.peak_memory, peak)
+            
+            record = self.records.get(name)
+            if record is None:
+                record = self.records[name] = {'stage': stage, 'name': name, 'calls': 0,
+                                               'seconds': 0.0, 'peak_memory': 0}
+            record['calls'] += 1
+            record['seconds'] += seconds
+            record['peak_memory'] = max(record['peak_memory'], peak)
+    
+    def wrap(self, stage, name, method):
+        """Timed version of a bound method"""
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            with self.measure(stage, name):
+                return method(*args, **kwargs)
+        return timed
+    
+    def instrument(self, obj, stage):
+        """Replace obj's methods for a stage (load / analyze_* / visualize_*) with timed wrappers"""
+        if obj is None:
+            return obj
+        prefix = STAGE_PREFIXES[stage]
+        for attr in dir(type(obj)):
+            if not attr.startswith(prefix):
+                continue
+            method = getattr(obj, attr)
+            if not callable(method) or hasattr(method, '__wrapped__'):
+                continue
+            setattr(obj, attr, self.wrap(stage, f"{type(obj).__name__}.{attr}", method))
+        return obj
+    
+    def stage_totals(self):
+        """Seconds spent in each stage"""
+        totals = {stage: 0.0 for stage in STAGE_PREFIXES}
+        for record in self.records.values():
+            totals[record['stage']] += record['seconds']
+        return totals
+    
+    def summary(self):
+        """Profiling results as plain data (for benchmarks and exporters)"""
+        return {
+            'total_seconds': self.total_seconds,
+            'peak_memory': self.peak_memory,
+            'stages': self.stage_totals(),
+            'calls': [dict(record) for record in self.records.values()]
+        }
+    
+    def print_report(self, stream=None):
+        """Print the per-stage breakdown (to stderr when stdout carries machine-readable output)"""
+        total = self.total_seconds or sum(record['seconds'] for record in self.records.values()) or 1
+        lines = ["", "="*78, "   PROFILE", "="*78,
+                 f"{'Call':<54} {'Calls':>5} {'Time':>9} {'Share':>6}", "-" * 78]
+        for record in self.records.values():
+            lines.append(f"{record['name']:<54} {record['calls']:>5} {record['seconds'] * 1000:>7.1f}ms "
+                         f"{record['seconds'] / total * 100:>5.1f}%")
+        lines.append("-" * 78)
+        for stage, seconds in self.stage_totals().items():
+            lines.append(f"{'Stage: ' + stage:<54} {'':>5} {seconds * 1000:>7.1f}ms {seconds / total * 100:>5.1f}%")
+        lines.append(f"{'Total run':<54} {'':>5} {self.total_seconds * 1000:>7.1f}ms")
+        if self.trace_memory:
+            lines.append(f"Peak traced memory: {self.peak_memory / 1024 / 1024:.1f} MiB")
+        if self.cprofile_path:
+            lines.append(f"cProfile stats written to '{self.cprofile_path}' (python -m pstats {self.cprofile_path})")
+        print("\n".join(lines), file=stream)
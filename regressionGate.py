@@ -0,0 +1,155 @@
+import json
+import os
+import statistics
+from benchmarkSuite import BenchmarkSuite
+
+# Fixed synthetic datasets timed by the test runners' benchmark mode (rows)
+GATE_TIERS = [20000, 200000]
+
+# Default baseline location, next to the test runners
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tests', 'perf_baseline.json')
+
+class RegressionGate:
+    def __init__(self, baseline_path=DEFAULT_BASELINE, threshold=0.25, noise_sigmas=3.0, min_delta=0.002,
+                 tiers=None, repeat=5, data_dir=None):
+        """Initialize RegressionGate; a stage regresses only when it is slower by more than the noise allows"""
+        self.baseline_path = baseline_path
+        self.threshold = threshold
+        self.noise_sigmas = noise_sigmas
+        self.min_delta = min_delta
+        self.tiers = tiers or GATE_TIERS
+        self.repeat = repeat
+        self.data_dir = data_dir or os.path.join(os.path.dirname(os.path.abspath(__file__)), '.bench_data')
+    
+    def spread(self, samples):
+        """Robust standard deviation of timing samples (scaled median absolute deviation)"""
+        if len(samples) < 2:
+            return 0.0
+        median = statistics.median(samples)
+        return 1.4826 * statistics.median(abs(sample - median) for sample in samples)
+    
+    def allowed_delta(self, base_stage, current_stage):
+        """Slow-down tolerated for one stage: relative threshold, measured noise or an absolute floor"""
+        noise = max(self.spread(base_stage['samples']), self.spread(current_stage['samples']))
+        return max(base_stage['min_seconds'] * self.threshold, self.noise_sigmas * noise, self.min_delta)
+    
+    def compare(self, baseline, results):
+        """One row per stage found in both runs: tier, stage, baseline and current best times, allowed delta, verdict"""
+        rows = []
+        for tier, tier_results in results['tiers'].items():
+            base_stages = baseline.get('tiers', {}).get(tier, {}).get('stages', {})
+            for name, stage in tier_results['stages'].items():
+                base_stage = base_stages.get(name)
+                if base_stage is None:
+                    continue
+                # Best-of-N is the least disturbed by other load on the machine; the spread covers the rest
+                delta = stage['min_seconds'] - base_stage['min_seconds']
+                allowed = self.allowed_delta(base_stage, stage)
+                rows.append({
+                    'tier': tier,
+                    'stage': name,
+                    'baseline_seconds': base_stage['min_seconds'],
+                    'current_seconds': stage['min_seconds'],
+                    'allowed_seconds': allowed,
+                    'regressed': delta > allowed
+                })
+        return rows
+    
+    def environment_warnings(self, baseline, results):
+        """Differences in the measuring environment that make the comparison less meaningful"""
+        warnings = []
+        for key in ('platform', 'cpu_count', 'python', 'pandas', 'numpy', 'generator_version'):
+            before = baseline.get('environment', {}).get(key)
+            after = results['environment'].get(key)
+            if before != after:
+                warnings.append(f"{key} changed since the baseline: {before} -> {after}")
+        return warnings
+    
+    def load_baseline(self):
+        """Stored baseline results, or None when there is none yet"""
+        if not os.path.exists(self.baseline_path):
+            return None
+        with open(self.baseline_path) as f:
+            return json.load(f)
+    
+    def save_baseline(self, results):
+        """Store results as the new baseline"""
+        with open(self.baseline_path, 'w') as f:
+            json.dump(results, f, indent=2)
+    
+    def measure(self):
+        """Benchmark loading, every analysis and a headless render of every chart on the gate datasets"""
+        suite = BenchmarkSuite(tiers=self.tiers, repeat=self.repeat, data_dir=self.data_dir,
+                               trace_memory=False, render=True)
+        return suite.run()
+    
+    def print_report(self, rows, warnings):
+        """Per-stage comparison table"""
+        print(f"{'Tier':>8} {'Stage':<24} {'Baseline':>10} {'Current':>10} {'Change':>8} {'Allowed':>9}  Result")
+        print("-" * 84)
+        for row in rows:
+            change = (row['current_seconds'] / row['baseline_seconds'] - 1) * 100 if row['baseline_seconds'] else 0.0
+            print(f"{int(row['tier']):>8} {row['stage']:<24} {row['baseline_seconds'] * 1000:>8.1f}ms "
+                  f"{row['current_seconds'] * 1000:>8.1f}ms {change:>+7.1f}% {row['allowed_seconds'] * 1000:>7.1f}ms  "
+                  f"{'REGRESSED' if row['regressed'] else 'ok'}")
+        for warning in warnings:
+            print(f"Warning: {warning}")
+    
+    def run(self, update_baseline=False):
+        """Measure, compare with the baseline and report; False when any stage regressed or there is no baseline"""
+        print("\n" + "="*70)
+        print("                     PERFORMANCE REGRESSION GATE")
+        print("="*70)
+        # A missing baseline fails rather than quietly becoming one, so a fresh clone or CI job
+        # cannot pass the gate without comparing anything
+        baseline = None if update_baseline else self.load_baseline()
+        if baseline is None and not update_baseline:
+            print(f"\n❌ No baseline at '{self.baseline_path}'; record one on this machine with --update-baseline.")
+            return False
+        results = self.measure()
+        
+        if update_baseline:
+            self.save_baseline(results)
+            print(f"Baseline written to '{self.baseline_path}' ({len(results['tiers'])} tiers); "
+                  f"later benchmark runs are compared against it.")
+            return True
+        
+        rows = self.compare(baseline, results)
+        self.print_report(rows, self.environment_warnings(baseline, results))
+        regressed = [row for row in rows if row['regressed']]
+        if regressed:
+            print(f"\n❌ {len(regressed)} stage(s) slower than the baseline beyond the noise threshold.")
+            return False
+        print(f"\n✅ No performance regressions ({len(rows)} stages compared).")
+        return True
+
+def add_benchmark_arguments(parser):
+    """Benchmark-mode options shared by the test runners"""
+    parser.add_argument(
+        '--benchmark', '-b',
+        action='store_true',
+        help='Also run the performance regression gate (load, analyses and headless charts on synthetic data)'
+    )
+    parser.add_argument(
+        '--baseline',
+        type=str,
+        default=DEFAULT_BASELINE,
+        metavar='JSON_FILE',
+        help='Baseline results for --benchmark (recorded with --update-baseline; default: tests/perf_baseline.json)'
+    )
+    parser.add_argument(
+        '--update-baseline',
+        action='store_true',
+        help='With --benchmark, record this run as the baseline instead of comparing (required when there is none)'
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.25,
+        help='Relative slow-down tolerated per stage before it counts as a regression (default: 0.25)'
+    )
+
+def run_benchmark_gate(args):
+    """Run the gate configured by add_benchmark_arguments; True when it passes"""
+    gate = RegressionGate(baseline_path=args.baseline, threshold=args.threshold)
+    return gate.run(update_baseline=args.update_baseline)
@@ -0,0 +1,229 @@
+import hashlib
+import html
+import json
+import os
+from datetime import datetime
+from analyzer import Analyzer, ANALYSIS_METHODS, ANALYSIS_CHARTS
+from outputWriter import OutputWriter
+
+# Bumped whenever fragment markup changes so old cache entries are not reused
+FRAGMENT_VERSION = 1
+
+PAGE_STYLE = """
+body { font-family: Helvetica, Arial, sans-serif; margin: 2em auto; max-width: 960px; color: #222; }
+h1 { border-bottom: 2px solid #333; padding-bottom: .3em; }
+section { margin-bottom: 2.5em; }
+table { border-collapse: collapse; margin-top: 1em; font-size: 13px; }
+th, td { border: 1px solid #ccc; padding: 3px 8px; text-align: right; }
+th:first-child, td:first-child { text-align: left; }
+svg text { font-size: 11px; font-family: Helvetica, Arial, sans-serif; }
+"""
+
+class ReportGenerator:
+    def __init__(self, cache_dir='.report_cache', analyzer=None):
+        """Initialize ReportGenerator with the directory holding cached chart fragments"""
+        self.cache_dir = cache_dir
+        self.analyzer = analyzer or Analyzer()
+        self.serializer = OutputWriter('json')
+        self.stats = {'rendered': [], 'cached': []}
+    
+    def fingerprint(self, analysis_type, analysis_data):
+        """Stable hash of an analysis result, used as the fragment cache key"""
+        payload = json.dumps(
+            [FRAGMENT_VERSION, analysis_type, self.serializer.to_serializable(analysis_data)],
+            sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+    
+    def fragment_path(self, analysis_type, digest):
+        """Cache file for one section at one data fingerprint"""
+        return os.path.join(self.cache_dir, f"{analysis_type}-{digest}.html")
+    
+    def get_fragment(self, analysis_type, analysis_data):
+        """Return a section's HTML, re-rendering only when its analysis_data changed"""
+        digest = self.fingerprint(analysis_type, analysis_data)
+        path = self.fragment_path(analysis_type, digest)
+        
+        if os.path.exists(path):
+            self.stats['cached'].append(analysis_type)
+            with open(path, encoding='utf-8') as f:
+                return f.read()
+        
+        fragment = self.render_section(analysis_type, analysis_data)
+        self.stats['rendered'].append(analysis_type)
+        
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Drop fragments of older data for this section before storing the new one
+        for name in os.listdir(self.cache_dir):
+            if name.startswith(f"{analysis_type}-") and name.endswith('.html'):
+                os.remove(os.path.join(self.cache_dir, name))
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(fragment)
+        return fragment
+    
+    def generate(self, df, output_path, source_name=''):
+        """Run all analyses and write one self-contained HTML report"""
+        self.stats = {'rendered': [], 'cached': []}
+        sections = []
+        
+        for analysis_type, method_name in ANALYSIS_METHODS.items():
+            analysis_data, error = getattr(self.analyzer, method_name)(df)
+            title = html.escape(ANALYSIS_CHARTS[analysis_type][1])
+            if error:
+                sections.append(f"<section><h2>{title}</h2><p>Error: {html.escape(error)}</p></section>")
+            else:
+                sections.append(self.get_fragment(analysis_type, analysis_data))
+        
+        generated = datetime.now().strftime('%Y-%m-%d %H:%M')
+        page = (
+            "<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\">"
+            "<title>Dream Book Shop Catalog Report</title>"
+            f"<style>{PAGE_STYLE}</style></head><body>\n"
+            "<h1>Dream Book Shop Catalog Report</h1>\n"
+            f"<p>Source: {html.escape(str(source_name))} &middot; {len(df):,} records &middot; generated {generated}</p>\n"
+            + "\n".join(sections) +
+            "\n</body></html>\n"
+        )
+        
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(page)
+        return self.stats
+    
+    def render_section(self, analysis_type, analysis_data):
+        """Render one section (heading, inline SVG chart and table)"""
+        title = html.escape(ANALYSIS_CHARTS[analysis_type][1])
+        
+        if analysis_type == 'trends':
+            counts = analysis_data['year_counts']
+            body = (self.svg_line_chart([int(year) for year in counts.index], list(counts.values)) +
+                    self.html_table(['Year', 'Books'], [(int(year), count) for year, count in counts.items()]))
+        elif analysis_type == 'authors':
+            counts = analysis_data['author_counts']
+            body = (self.svg_bar_chart(list(counts.index), list(counts.values)) +
+                    self.html_table(['Author', 'Books'], list(counts.items())))
+        elif analysis_type == 'languages':
+            counts = analysis_data['lang_counts']
+            percentages = analysis_data['lang_percentages']
+            body = (self.svg_bar_chart(list(counts.index), list(counts.values)) +
+                    self.html_table(['Language', 'Books', '%'],
+                                    [(lang, count, percentages[lang]) for lang, count in counts.items()]))
+        elif analysis_type == 'publishers':
+            counts = analysis_data['publisher_counts']
+            body = (f"<p>{analysis_data['total_publishers']:,} publishers in total.</p>" +
+                    self.svg_bar_chart(list(counts.index), list(counts.values)) +
+                    self.html_table(['Publisher', 'Books'], list(counts.items())))
+        elif analysis_type == 'isbn':
+            isbn_analysis = analysis_data['isbn_analysis']
+            labels = [col.upper() for col in isbn_analysis]
+            body = (self.svg_bar_chart(labels, [100 - data['missing_percentage'] for data in isbn_analysis.values()],
+                                       value_format='{:.1f}%') +
+                    self.html_table(['ISBN Type', 'Total', 'Present', 'Missing', 'Missing %'],
+                                    [(col.upper(), data['total_records'], data['present_count'],
+                                      data['missing_count'], f"{data['missing_percentage']:.2f}")
+                                     for col, data in isbn_analysis.items()]))
+        else:
+            matrix = analysis_data['year_lang_counts']
+            years = [int(year) for year in matrix.index]
+            languages = [str(lang) for lang in matrix.columns]
+            rows = [[int(value) for value in matrix[lang].values] for lang in matrix.columns]
+            body = (self.svg_heatmap(languages, years, rows) +
+                    self.html_table(['Year'] + languages,
+                                    [[year] + [int(v) for v in matrix.loc[index].values]
+                                     for year, index in zip(years, matrix.index)]))
+        
+        return f"<section id=\"{analysis_type}\"><h2>{title}</h2>\n{body}\n</section>"
+    
+    def html_table(self, headers, rows):
+        """Plain HTML table with escaped cells"""
+        head = ''.join(f"<th>{html.escape(str(header))}</th>" for header in headers)
+        body = ''.join(
+            "<tr>" + ''.join(f"<td>{html.escape(self.format_cell(cell))}</td>" for cell in row) + "</tr>"
+            for row in rows
+        )
+        return f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+    
+    def format_cell(self, value):
+        """Thousands separators for integers, plain text otherwise"""
+        value = self.serializer.to_value(value)
+        if isinstance(value, int):
+            return f"{value:,}"
+        return str(value)
+    
+    def svg_bar_chart(self, labels, values, width=760, bar_height=18, value_format='{:,}'):
+        """Horizontal SVG bar chart"""
+        label_width = 220
+        chart_width = width - label_width - 60
+        values = [self.serializer.to_value(value) for value in values]
+        peak = max(values) if values and max(values) > 0 else 1
+        height = len(values) * (bar_height + 4) + 10
+        
+        parts = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}">']
+        for i, (label, value) in enumerate(zip(labels, values)):
+            y = 5 + i * (bar_height + 4)
+            bar = value / peak * chart_width
+            text = str(label) if len(str(label)) <= 34 else str(label)[:33] + '…'
+            parts.append(
+                f'<text x="{label_width - 6}" y="{y + bar_height - 5}" text-anchor="end">{html.escape(text)}</text>'
+                f'<rect x="{label_width}" y="{y}" width="{bar:.1f}" height="{bar_height}" fill="#f0a04b"/>'
+                f'<text x="{label_width + bar + 4:.1f}" y="{y + bar_height - 5}">{value_format.format(value)}</text>'
+            )
+        parts.append('</svg>')
+        return ''.join(parts)
+    
+    def svg_line_chart(self, xs, ys, width=760, height=260):
+        """SVG line chart with a least-squares trend line"""
+        pad = 40
+        ys = [self.serializer.to_value(y) for y in ys]
+        x_low, x_high = min(xs), max(xs)
+        y_high = max(ys) or 1
+        x_span = (x_high - x_low) or 1
+        
+        def point(x, y):
+            return (pad + (x - x_low) / x_span * (width - 2 * pad),
+                    height - pad - y / y_high * (height - 2 * pad))
+        
+        coords = ' '.join(f"{px:.1f},{py:.1f}" for px, py in (point(x, y) for x, y in zip(xs, ys)))
+        parts = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}">',
+            f'<line x1="{pad}" y1="{height - pad}" x2="{width - pad}" y2="{height - pad}" stroke="#999"/>',
+            f'<polyline points="{coords}" fill="none" stroke="darkblue" stroke-width="2"/>'
+        ]
+        
+        if len(xs) > 1:
+            n = len(xs)
+            mean_x, mean_y = sum(xs) / n, sum(ys) / n
+            denominator = sum((x - mean_x) ** 2 for x in xs) or 1
+            slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / denominator
+            (x1, y1), (x2, y2) = point(x_low, mean_y + slope * (x_low - mean_x)), point(x_high, mean_y + slope * (x_high - mean_x))
+            parts.append(f'<line x1="{x1:.1f}" y1="{y1:.1f}" x2="{x2:.1f}" y2="{y2:.1f}" '
+                         f'stroke="red" stroke-dasharray="6,4"/>')
+        
+        parts.append(f'<text x="{pad}" y="{height - pad + 16}">{x_low}</text>')
+        parts.append(f'<text x="{width - pad}" y="{height - pad + 16}" text-anchor="end">{x_high}</text>')
+        parts.append(f'<text x="{pad - 4}" y="{pad}" text-anchor="end">{y_high:,}</text>')
+        parts.append('</svg>')
+        return ''.join(parts)
+    
+    def svg_heatmap(self, row_labels, column_labels, rows, cell=22):
+        """SVG heatmap with one row per language and one column per year"""
+        label_width = 90
+        width = label_width + cell * len(column_labels) + 10
+        height = cell * len(row_labels) + 40
+        peak = max((max(row) for row in rows if row), default=0) or 1
+        
+        parts = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}">']
+        for r, (label, row) in enumerate(zip(row_labels, rows)):
+            y = r * cell
+            parts.append(f'<text x="{label_width - 6}" y="{y + cell - 7}" text-anchor="end">{html.escape(label)}</text>')
+            for c, value in enumerate(row):
+                # White for zero, deepening red as the count approaches the peak
+                shade = int(255 - value / peak * 200)
+                fill = '#ffffff' if value == 0 else f'#ff{shade:02x}{max(shade - 60, 0):02x}'
+                parts.append(f'<rect x="{label_width + c * cell}" y="{y}" width="{cell - 1}" height="{cell - 1}" '
+                             f'fill="{fill}"><title>{html.escape(label)} {column_labels[c]}: {value}</title></rect>')
+        for c, year in enumerate(column_labels):
+            x = label_width + c * cell + cell / 2
+            y = len(row_labels) * cell + 12
+            parts.append(f'<text x="{x:.1f}" y="{y}" text-anchor="end" transform="rotate(-60 {x:.1f} {y})">{year}</text>')
+        parts.append('</svg>')
+        return ''.join(parts)
@@ -0,0 +1,226 @@
+import math
+import os
+from statistics import NormalDist
+import numpy as np
+import pandas as pd
+from analyzer import Analyzer
+from dataLoader import DataLoader
+
+class Sampler:
+    def __init__(self, seed=None, chunk_rows=100000):
+        """Initialize Sampler; the same seed always draws the same sample"""
+        self.seed = seed
+        self.chunk_rows = chunk_rows
+    
+    def load(self, file_path, fraction=None, rows=None):
+        """Sample rows while reading the CSV; returns (sample DataFrame, total rows in the file)"""
+        if not file_path:
+            print("Error: No file path provided.")
+            return None, 0
+        if not os.path.exists(file_path) and os.path.exists(f"../{file_path}"):
+            file_path = f"../{file_path}"
+        if not os.path.exists(file_path):
+            print(f"Error: File '{file_path}' not found.")
+            return None, 0
+        
+        try:
+            with DataLoader().source(file_path) as source:
+                if rows is not None:
+                    sample, total_rows = self.reservoir(source, rows)
+                else:
+                    sample, total_rows = self.bernoulli(source, fraction)
+        except (pd.errors.EmptyDataError, pd.errors.ParserError) as e:
+            print(f"Error: File '{file_path}' has invalid CSV format or structure: {e}")
+            return None, 0
+        
+        if total_rows == 0 or sample.empty:
+            print(f"Error: Sample of '{file_path}' is empty.")
+            return None, 0
+        return sample, total_rows
+    
+    def bernoulli(self, file_path, fraction):
+        """Keep each row with probability `fraction`; skipped rows are never converted to values"""
+        if not 0 < fraction <= 1:
+            raise ValueError("Sample fraction must be in (0, 1]")
+        rng = np.random.default_rng(self.seed)
+        seen = [0]
+        
+        def skip(line_number):
+            if line_number == 0:
+                return False
+            seen[0] += 1
+            return rng.random() >= fraction
+        
+        sample = pd.read_csv(file_path, skiprows=skip)
+        return sample, seen[0]
+    
+    def reservoir(self, file_path, rows):
+        """Uniform sample of exactly `rows` rows (Algorithm R) in one chunked pass"""
+        if rows < 1:
+            raise ValueError("Sample size must be at least 1")
+        rng = np.random.default_rng(self.seed)
+        slots = np.empty(0, dtype=np.int64)  # file position of the row held by each slot
+        kept = []
+        total_rows = 0
+        
+        for chunk in pd.read_csv(file_path, chunksize=self.chunk_rows):
+            chunk.index = np.arange(total_rows, total_rows + len(chunk))
+            fill = min(max(rows - len(slots), 0), len(chunk))
+            slots = np.concatenate([slots, chunk.index[:fill]])
+            
+            # Row i (0-based over the file) takes a random slot with probability rows / (i + 1);
+            # when several rows draw the same slot, the assignment keeps the last one
+            candidates = chunk.index[fill:].to_numpy()
+            drawn = (rng.random(len(candidates)) * (candidates + 1)).astype(np.int64)
+            hit = drawn < rows
+            slots[drawn[hit]] = candidates[hit]
+            
+            total_rows += len(chunk)
+            kept.append(chunk)
+            kept = [piece[piece.index.isin(slots)] for piece in kept]
+        
+        if not kept:
+            return pd.DataFrame(), 0
+        return pd.concat(kept).reset_index(drop=True), total_rows
+
+class SampledAnalyzer(Analyzer):
+    def __init__(self, sample_rows, total_rows, confidence=0.95):
+        """Analyzer whose counts are scaled from a sample back up to the full file"""
+        super().__init__()
+        self.sample_rows = sample_rows
+        self.total_rows = total_rows
+        self.confidence = confidence
+        self.z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    
+    def scale(self, count):
+        """Estimated population count for a count seen in the sample"""
+        return int(round(count * self.total_rows / self.sample_rows))
+    
+    def interval(self, successes):
+        """Wilson score interval for a proportion, with finite population correction"""
+        n, N = self.sample_rows, self.total_rows
+        p = successes / n
+        if n >= N:
+            return p, p, p
+        # The correction shrinks the variance as the sample approaches the whole file
+        n_eff = n * (N - 1) / (N - n)
+        z2 = self.z ** 2
+        denominator = 1 + z2 / n_eff
+        center = (p + z2 / (2 * n_eff)) / denominator
+        half = self.z * math.sqrt(p * (1 - p) / n_eff + z2 / (4 * n_eff ** 2)) / denominator
+        return p, max(center - half, 0.0), min(center + half, 1.0)
+    
+    def estimate_table(self, sample_counts):
+        """Estimated count and percentage with confidence bounds for each label"""
+        rows = {}
+        for label, count in sample_counts.items():
+            p, low, high = self.interval(count)
+            rows[label] = {
+                'count': self.scale(count),
+                'count_low': int(math.floor(low * self.total_rows)),
+                'count_high': int(math.ceil(high * self.total_rows)),
+                'percent': round(p * 100, 2),
+                'percent_low': round(low * 100, 2),
+                'percent_high': round(high * 100, 2)
+            }
+        return pd.DataFrame.from_dict(rows, orient='index')
+    
+    def sample_info(self):
+        """Sample size, population size and confidence level"""
+        return {
+            'sample_rows': self.sample_rows,
+            'total_rows': self.total_rows,
+            'fraction': self.sample_rows / self.total_rows,
+            'confidence': self.confidence
+        }
+    
+    def analyze_publication_trends(self, df):
+        """Publication trends with per-year counts scaled to the full file"""
+        analysis_data, error = super().analyze_publication_trends(df)
+        if error:
+            return analysis_data, error
+        
+        sample_counts = analysis_data['year_counts']
+        year_counts = sample_counts.apply(self.scale)
+        analysis_data.update({
+            'year_counts': year_counts,
+            'most_productive_year': year_counts.idxmax(),
+            'most_productive_count': year_counts.max(),
+            'least_productive_year': year_counts.idxmin(),
+            'least_productive_count': year_counts.min(),
+            'estimates': self.estimate_table(sample_counts),
+            'sample': self.sample_info()
+        })
+        return analysis_data, None
+    
+    def analyze_top_authors(self, df, top_n=5, offset=0):
+        """Top authors with counts scaled to the full file"""
+        analysis_data, error = super().analyze_top_authors(df, top_n, offset)
+        if error:
+            return analysis_data, error
+        analysis_data['author_counts'] = analysis_data['author_counts'].apply(self.scale)
+        analysis_data['sample'] = self.sample_info()
+        return analysis_data, None
+    
+    def analyze_language_distribution(self, df):
+        """Language shares with confidence intervals; counts scaled to the full file"""
+        analysis_data, error = super().analyze_language_distribution(df)
+        if error:
+            return analysis_data, error
+        
+        sample_counts = analysis_data['lang_counts']
+        analysis_data.update({
+            'lang_counts': sample_counts.apply(self.scale),
+            'total_books': self.total_rows,
+            'estimates': self.estimate_table(sample_counts),
+            'sample': self.sample_info()
+        })
+        return analysis_data, None
+    
+    def analyze_books_by_publisher(self, df, top_n=20, offset=0):
+        """Top publishers with counts scaled to the full file (total_publishers is the number seen in the sample)"""
+        analysis_data, error = super().analyze_books_by_publisher(df, top_n, offset)
+        if error:
+            return analysis_data, error
+        analysis_data['publisher_counts'] = analysis_data['publisher_counts'].apply(self.scale)
+        analysis_data['sample'] = self.sample_info()
+        return analysis_data, None
+    
+    def analyze_missing_isbn(self, df):
+        """Missing ISBN counts scaled to the full file, with confidence intervals on the missing share"""
+        analysis_data, error = super().analyze_missing_isbn(df)
+        if error:
+            return analysis_data, error
+        
+        missing = {}
+        for isbn_col, data in analysis_data['isbn_analysis'].items():
+            missing[isbn_col] = int(data['missing_count'])
+            missing_count = self.scale(data['missing_count'])
+            data.update({
+                'total_records': self.total_rows,
+                'present_count': self.total_rows - missing_count,
+                'missing_count': missing_count
+            })
+        analysis_data.update({
+            'total_records': self.total_rows,
+            'estimates': self.estimate_table(missing),
+            'sample': self.sample_info()
+        })
+        return analysis_data, None
+    
+    def describe_estimates(self, analysis_data, limit=15):
+        """Text lines summarising the confidence intervals of a sampled analysis"""
+        sample = analysis_data.get('sample')
+        estimates = analysis_data.get('estimates')
+        if sample is None or estimates is None:
+            return []
+        
+        lines = [f"Estimated from {sample['sample_rows']:,} of {sample['total_rows']:,} rows "
+                 f"({sample['fraction'] * 100:.1f}%), {sample['confidence'] * 100:g}% confidence intervals:"]
+        ordered = estimates.sort_values('count', ascending=False)
+        for row in ordered.head(limit).itertuples():
+            lines.append(f"  {str(row.Index):<24} {row.count:>10,} [{row.count_low:,} - {row.count_high:,}]  "
+                         f"{row.percent:>6.2f}% [{row.percent_low:.2f}% - {row.percent_high:.2f}%]")
+        if len(ordered) > limit:
+            lines.append(f"  ... {len(ordered) - limit} more")
+        return lines
@@ -0,0 +1,211 @@
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+from analyzer import Analyzer, ANALYSIS_METHODS
+from csvWatcher import RunningAggregates
+
+try:
+    import pyarrow as pa
+    from pandas.arrays import ArrowStringArray
+except ImportError:  # without pyarrow, pandas stores text as Python strings and dictionaries are decoded
+    pa = None
+
+# Byte alignment of each array inside the shared block
+ALIGNMENT = 64
+
+# Datasets attached by this (worker) process: block name -> SharedDataset
+_attached = {}
+
+def encode_column(values):
+    """(int32 codes, distinct values in first-seen order) of a text column, or (values, None) if numeric"""
+    # Code -1 marks a missing value
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Columns DataLoader already interned are shared as they are
+        return values.cat.codes.to_numpy().astype(np.int32), np.asarray(values.cat.categories, dtype=object)
+    if values.dtype.kind in 'biuf':
+        return values.to_numpy(), None
+    codes, uniques = pd.factorize(values)
+    return codes.astype(np.int32), np.asarray(uniques, dtype=object)
+
+class SharedDataset:
+    def __init__(self, handle, memory, owner):
+        """Initialize SharedDataset over an open shared-memory block; use publish() or attach()"""
+        self.handle = handle
+        self.memory = memory
+        self.owner = owner
+        self.specs = {spec['name']: spec for spec in handle['columns']}
+        self.dictionaries = {}
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def array(self, section):
+        """Read-only NumPy view of one (offset, dtype, length) section of the block, without copying"""
+        offset, dtype, length = section
+        dtype = np.dtype(dtype)
+        # Viewing a slice of the block's memoryview holds an export on the mapping, so close() cannot
+        # unmap it while a frame, categorical or Arrow array still reads from it
+        view = np.frombuffer(self.memory.buf[offset:offset + dtype.itemsize * length], dtype=dtype)
+        view.flags.writeable = False
+        return view
+    
+    def dictionary(self, name):
+        """Distinct values of a text column as an Index, built once per process"""
+        if name not in self.dictionaries:
+            spec = self.specs[name]
+            kind, *sections = spec['dictionary']
+            dtype = pd.api.types.pandas_dtype(spec['dtype'])
+            if kind == 'utf8' and isinstance(dtype, pd.StringDtype) and dtype.storage == 'pyarrow':
+                # Arrow strings over the block's offsets and bytes: a label is only decoded
+                # when a result takes it
+                offsets, data = self.array(sections[0]), self.array(sections[1])
+                strings = pa.LargeStringArray.from_buffers(len(offsets) - 1, pa.py_buffer(offsets), pa.py_buffer(data))
+                values = ArrowStringArray(strings, dtype=dtype)
+            elif kind == 'utf8':
+                offsets, data = self.array(sections[0]), self.array(sections[1]).tobytes()
+                values = [data[start:end].decode('utf-8') for start, end in zip(offsets[:-1], offsets[1:])]
+            else:
+                values = pickle.loads(self.array(sections[0]).tobytes())
+            self.dictionaries[name] = pd.Index(values, dtype=dtype)
+        return self.dictionaries[name]
+    
+    def column(self, name, start=0, stop=None):
+        """Values of one column for rows start:stop: numbers as published, text as categorical codes"""
+        spec = self.specs[name]
+        if spec['values'] is not None:
+            return self.array(spec['values'])[start:stop]
+        # Text stays interned (as DataLoader interns it) instead of being expanded to one object per row
+        codes = self.array(spec['codes'])[start:stop]
+        # Dictionaries are distinct by construction; checking that again would hash every label
+        dtype = pd.CategoricalDtype._from_fastpath(self.dictionary(name), ordered=False)
+        return pd.Categorical.from_codes(codes, dtype=dtype)
+    
+    def index(self, start=0, stop=None):
+        """Row labels for rows start:stop"""
+        kind, *layout = self.handle['index']
+        if kind == 'range':
+            first, step = layout
+            return pd.RangeIndex(first, first + step * self.handle['rows'], step)[start:stop]
+        return pickle.loads(self.array(layout[0]).tobytes())[start:stop]
+    
+    def frame(self, columns=None, start=0, stop=None):
+        """DataFrame of rows start:stop; only the requested columns are built"""
+        columns = [spec['name'] for spec in self.handle['columns']] if columns is None else columns
+        return pd.DataFrame({name: self.column(name, start, stop) for name in columns},
+                            index=self.index(start, stop), columns=columns)
+    
+    def close(self):
+        """Detach; the publishing process also frees the block"""
+        self.dictionaries = {}
+        if self.owner:
+            self.memory.unlink()
+        try:
+            self.memory.close()
+        except BufferError:
+            # Frames still viewing the block keep the mapping alive and unmap it when they are collected;
+            # forgetting it here stops SharedMemory.__del__ from trying (and failing) to close it again
+            self.memory._mmap = None
+
+def publish(df):
+    """Copy df into one shared-memory block as codes, dictionaries and numeric arrays; returns the owner"""
+    sections = []
+    size = 0
+    
+    def add(data):
+        """Reserve an aligned section for a NumPy array; returns its (offset, dtype, length)"""
+        nonlocal size
+        offset = -(-size // ALIGNMENT) * ALIGNMENT
+        sections.append((offset, data))
+        size = offset + data.nbytes
+        return offset, data.dtype.str, len(data)
+    
+    specs = []
+    for name in df.columns:
+        values, dictionary = encode_column(df[name])
+        categorical = isinstance(df[name].dtype, pd.CategoricalDtype)
+        # An interned column records the dtype of its distinct values
+        dtype = df[name].cat.categories.dtype if categorical else df[name].dtype
+        spec = {'name': name, 'dtype': str(dtype), 'categorical': categorical,
+                'values': None, 'codes': None, 'dictionary': None}
+        if dictionary is None:
+            spec['values'] = add(np.ascontiguousarray(values))
+        else:
+            spec['codes'] = add(values)
+            if all(isinstance(value, str) for value in dictionary):
+                encoded = [value.encode('utf-8') for value in dictionary]
+                offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+                np.cumsum([len(value) for value in encoded], out=offsets[1:])
+                spec['dictionary'] = ('utf8', add(offsets), add(np.frombuffer(b''.join(encoded), dtype=np.uint8)))
+            else:
+                # Mixed dictionaries (text and numbers in one column) keep their Python types
+                spec['dictionary'] = ('pickle', add(np.frombuffer(pickle.dumps(list(dictionary)), dtype=np.uint8)))
+        specs.append(spec)
+    
+    if isinstance(df.index, pd.RangeIndex):
+        index = ('range', df.index.start, df.index.step)
+    else:
+        index = ('pickle', add(np.frombuffer(pickle.dumps(df.index), dtype=np.uint8)))
+    
+    memory = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    for offset, data in sections:
+        memory.buf[offset:offset + data.nbytes] = data.view(np.uint8).reshape(-1) if data.nbytes else b''
+    handle = {'name': memory.name, 'rows': len(df), 'index': index, 'columns': specs}
+    return SharedDataset(handle, memory, owner=True)
+
+def attach(handle):
+    """Map a published dataset into this process without copying it"""
+    # Pool workers share the publisher's resource tracker, so the block is freed once, by the publisher
+    memory = shared_memory.SharedMemory(name=handle['name'])
+    return SharedDataset(handle, memory, owner=False)
+
+def attached(handle):
+    """The dataset of handle, attached once per worker process"""
+    dataset = _attached.get(handle['name'])
+    if dataset is None:
+        # A new version of the dataset replaces the one attached before
+        for previous in _attached.values():
+            previous.close()
+        _attached.clear()
+        dataset = _attached[handle['name']] = attach(handle)
+    return dataset
+
+def run_shared_analysis(handle, analysis_type, params=None):
+    """Worker task: one analysis over the shared dataset"""
+    method = getattr(Analyzer(), ANALYSIS_METHODS[analysis_type])
+    return method(attached(handle).frame(), **(params or {}))
+
+def aggregate_shared_rows(handle, start, stop):
+    """Worker task: fold rows start:stop of the shared dataset into RunningAggregates"""
+    frame = attached(handle).frame(start=start, stop=stop)
+    aggregates = RunningAggregates()
+    aggregates.reset(list(frame.columns))
+    aggregates.update(frame)
+    return aggregates
+
+def analyze_in_parallel(df, analysis_types, workers=None):
+    """{analysis_type: (analysis_data, error)}, one analysis per worker process"""
+    # Workers read df from shared memory instead of each receiving a pickled copy
+    with publish(df) as shared:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+            futures = {analysis_type: pool.submit(run_shared_analysis, shared.handle, analysis_type)
+                       for analysis_type in analysis_types}
+            return {analysis_type: future.result() for analysis_type, future in futures.items()}
+
+def aggregate_in_parallel(df, workers=None, partitions=None):
+    """RunningAggregates of df built from row ranges in worker processes and merged in row order"""
+    workers = workers or os.cpu_count() or 1
+    bounds = np.linspace(0, len(df), (partitions or workers) + 1).astype(int)
+    with publish(df) as shared:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(aggregate_shared_rows, [shared.handle] * (len(bounds) - 1),
+                                    bounds[:-1], bounds[1:]))
+    merged = results[0]
+    for aggregates in results[1:]:
+        merged.merge(aggregates)
+    return merged
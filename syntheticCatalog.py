@@ -0,0 +1,174 @@
+import argparse
+import os
+import numpy as np
+import pandas as pd
+
+# Header of Dataset_Books.csv
+COLUMNS = ['book', 'author', 'publication date', 'language', 'book publisher', 'ISBN', 'BNB id']
+
+# Language shares observed in Dataset_Books.csv; the remainder is spread over OTHER_LANGUAGES
+LANGUAGE_SHARES = {
+    'English': 0.619, 'Arabic': 0.077, 'Russian': 0.053, 'German': 0.042, 'French': 0.034,
+    'Italian': 0.032, 'Spanish': 0.029, 'Chinese': 0.024, 'Turkish': 0.018, 'Swedish': 0.018
+}
+OTHER_LANGUAGES = ['Japanese', 'Polish', 'Dutch', 'Portuguese', 'Korean', 'Welsh', 'Persian', 'Hebrew',
+                   'Greek', 'Hindi', 'Czech', 'Danish', 'Norwegian', 'Finnish', 'Hungarian', 'Irish']
+
+# Publication years 2011..2023 weighted like the real catalog (peak in 2019)
+YEAR_WEIGHTS = {2011: 150, 2012: 240, 2013: 135, 2014: 140, 2015: 330, 2016: 210, 2017: 350, 2018: 260,
+                2019: 530, 2020: 470, 2021: 420, 2022: 330, 2023: 310}
+
+FIRST_NAMES = ['Alison', 'James', 'Maria', 'Ahmed', 'Olga', 'Hans', 'Claire', 'Luca', 'Sofia', 'Wei', 'Emre',
+               'Ingrid', 'David', 'Fatima', 'Ivan', 'Anna', 'Peter', 'Yuki', 'Carlos', 'Zuri', 'Barrie', 'Helen',
+               'Muhammad', 'Valerie', 'Jeffrey', 'Terry', 'Joachim', 'Sarah', 'Thomas', 'Leila']
+LAST_NAMES = ['Roberts', 'Day', 'Gunter', 'Jackson', 'Haynes', 'Miller', 'Cross', 'Schwermer', 'Smith', 'Khan',
+              'Ivanova', 'Schmidt', 'Dubois', 'Rossi', 'Garcia', 'Wang', 'Yilmaz', 'Lindqvist', 'Brown', 'Hassan',
+              'Petrov', 'Weber', 'Martin', 'Bianchi', 'Lopez', 'Chen', 'Demir', 'Berg', 'Taylor', 'Karimi']
+PUBLISHER_WORDS = ['Routledge', 'SAGE', 'Severn', 'Cambridge', 'Oxford', 'Penguin', 'Harlequin', 'Springer',
+                   'Bloomsbury', 'Dafina', 'Atlantic', 'Sunono', 'Wiley', 'Palgrave', 'Hachette', 'Orion']
+PUBLISHER_SUFFIXES = ['Press', 'Books', 'House', 'Publishing Ltd', 'University Press', 'Kids', 'Editions']
+TITLE_WORDS = ['world', 'politics', 'music', 'journey', 'reflections', 'theory', 'garden', 'love', 'history',
+               'light', 'winter', 'city', 'river', 'secret', 'guide', 'life', 'war', 'night', 'house', 'story',
+               'science', 'art', 'children', 'sea', 'heart', 'road', 'time', 'power', 'family', 'game']
+SUBTITLES = ['a global journey', 'a novel', 'an introduction', 'essays', 'a history', 'selected poems',
+             'a practical guide', 'the untold story']
+
+# Characters of the BNB id suffix (GB + B/C + six of these)
+BNB_CHARACTERS = np.array(list('0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'), dtype=object)
+
+class CatalogGenerator:
+    def __init__(self, seed=0, author_skew=0.9, publisher_skew=1.1, missing_publisher=0.019, missing_isbn=0.01):
+        """Initialize CatalogGenerator; the same seed and size always produce the same catalog"""
+        self.seed = seed
+        self.author_skew = author_skew
+        self.publisher_skew = publisher_skew
+        self.missing_publisher = missing_publisher
+        self.missing_isbn = missing_isbn
+    
+    def zipf_weights(self, size, skew):
+        """Probabilities proportional to 1 / rank^skew"""
+        weights = 1.0 / np.arange(1, size + 1) ** skew
+        return weights / weights.sum()
+    
+    def cumulative(self, weights):
+        """Cumulative weights ending at exactly 1, computed once per vocabulary"""
+        cdf = np.cumsum(weights)
+        return cdf / cdf[-1]
+    
+    def draw(self, rng, cdf, size):
+        """size indices drawn with the probabilities behind cdf (the same draws as rng.choice(p=...))"""
+        # rng.choice rebuilds the cumulative sum of p on every call, which costs O(vocabulary) per chunk
+        return cdf.searchsorted(rng.random(size), side='right')
+    
+    def formatted(self, formatter, index):
+        """formatter(index), formatting each distinct position once"""
+        # Skewed draws repeat the popular names, so this formats far fewer strings than rows
+        distinct, inverse = np.unique(index, return_inverse=True)
+        return formatter(distinct)[inverse]
+    
+    def names(self, index):
+        """Author names of vocabulary positions (a numeric suffix once first x last combinations run out)"""
+        first = np.array(FIRST_NAMES, dtype=object)
+        last = np.array(LAST_NAMES, dtype=object)
+        # Shift the surname with the first name so the most frequent authors do not share one surname
+        names = first[index % len(first)] + ' ' + last[(index // len(first) + index) % len(last)]
+        generation = index // (len(first) * len(last))
+        return np.where(generation > 0, names + ' ' + generation.astype(str).astype(object), names)
+    
+    def publishers(self, index):
+        """Publisher names of vocabulary positions"""
+        words = np.array(PUBLISHER_WORDS, dtype=object)
+        suffixes = np.array(PUBLISHER_SUFFIXES, dtype=object)
+        names = words[index % len(words)] + ' ' + suffixes[(index // len(words)) % len(suffixes)]
+        generation = index // (len(words) * len(suffixes))
+        return np.where(generation > 0, names + ' ' + generation.astype(str).astype(object), names)
+    
+    def languages(self):
+        """Language labels and their probabilities"""
+        other_share = (1 - sum(LANGUAGE_SHARES.values())) / len(OTHER_LANGUAGES)
+        labels = list(LANGUAGE_SHARES) + OTHER_LANGUAGES
+        weights = np.array(list(LANGUAGE_SHARES.values()) + [other_share] * len(OTHER_LANGUAGES))
+        return np.array(labels, dtype=object), weights / weights.sum()
+    
+    def isbn_cells(self, rng, rows):
+        """ISBN cells: mostly one 10-digit ISBN, some 9-digit (leading zero lost), some '/'-joined lists"""
+        def numbers():
+            return rng.integers(100000000, 10000000000, size=rows).astype(str).astype(object)
+        
+        cells = numbers()
+        # 10% of cells list a second ISBN (other formats), 3% a third
+        second = rng.random(rows) < 0.10
+        cells[second] = cells[second] + '/' + numbers()[second]
+        third = second & (rng.random(rows) < 0.3)
+        cells[third] = cells[third] + '/' + numbers()[third]
+        cells[rng.random(rows) < self.missing_isbn] = None
+        return cells
+    
+    def titles(self, rng, rows):
+        """Titles of two to five words, some with a subtitle"""
+        words = np.array(TITLE_WORDS, dtype=object)
+        capitalized = np.array([word.capitalize() for word in TITLE_WORDS], dtype=object)
+        word_weights = self.zipf_weights(len(words), 0.8)
+        titles = capitalized[rng.choice(len(words), size=rows, p=word_weights)]
+        for position in range(1, 5):
+            extend = rng.random(rows) < (0.9 if position == 1 else 0.4)
+            titles[extend] = titles[extend] + ' ' + words[rng.choice(len(words), size=int(extend.sum()), p=word_weights)]
+        subtitled = rng.random(rows) < 0.25
+        titles[subtitled] = (titles[subtitled] + ' : ' +
+                             np.array(SUBTITLES, dtype=object)[rng.integers(0, len(SUBTITLES), int(subtitled.sum()))])
+        return titles
+    
+    def generate(self, rows, chunk_rows=100000):
+        """Yield the catalog as DataFrames of at most chunk_rows rows"""
+        rng = np.random.default_rng(self.seed)
+        # Vocabulary sizes follow the real catalog's distinct-value ratios; names are only formatted
+        # for the positions drawn, so memory per chunk does not grow with the vocabulary
+        author_cdf = self.cumulative(self.zipf_weights(max(int(rows * 0.75), 1), self.author_skew))
+        publisher_cdf = self.cumulative(self.zipf_weights(max(int(rows * 0.3), 1), self.publisher_skew))
+        languages, language_weights = self.languages()
+        years = np.array(list(YEAR_WEIGHTS))
+        year_weights = np.array(list(YEAR_WEIGHTS.values()), dtype=float)
+        year_weights /= year_weights.sum()
+        
+        produced = 0
+        while produced < rows:
+            size = min(chunk_rows, rows - produced)
+            publisher_cells = self.formatted(self.publishers, self.draw(rng, publisher_cdf, size))
+            publisher_cells[rng.random(size) < self.missing_publisher] = None
+            bnb_ids = 'GB' + np.array(list('BC'), dtype=object)[rng.integers(0, 2, size)]
+            for _ in range(6):
+                bnb_ids = bnb_ids + BNB_CHARACTERS[rng.integers(0, len(BNB_CHARACTERS), size)]
+            yield pd.DataFrame({
+                'book': self.titles(rng, size),
+                'author': self.formatted(self.names, self.draw(rng, author_cdf, size)),
+                'publication date': rng.choice(years, size=size, p=year_weights),
+                'language': languages[rng.choice(len(languages), size=size, p=language_weights)],
+                'book publisher': publisher_cells,
+                'ISBN': self.isbn_cells(rng, size),
+                'BNB id': bnb_ids
+            }, columns=COLUMNS)
+            produced += size
+    
+    def write(self, file_path, rows, chunk_rows=100000):
+        """Write a catalog of `rows` rows to a CSV file (compressed when the name ends in .gz/.bz2/.xz/.zst)"""
+        temp_path = f"{file_path}.{os.getpid()}.tmp"
+        compression = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'xz', '.zst': 'zstd'}.get(os.path.splitext(file_path)[1])
+        with pd.io.common.get_handle(temp_path, 'w', compression=compression) as handle:
+            for number, chunk in enumerate(self.generate(rows, chunk_rows)):
+                chunk.to_csv(handle.handle, index=False, header=number == 0)
+        os.replace(temp_path, file_path)
+        return file_path
+
+def main():
+    """Entry point for writing a synthetic catalog"""
+    parser = argparse.ArgumentParser(description='Write a seeded synthetic book catalog with the Dataset_Books.csv schema')
+    parser.add_argument('output', help='CSV file to write (.gz/.bz2/.xz/.zst to compress)')
+    parser.add_argument('--rows', type=int, default=1000000, help='Number of rows (default: 1000000)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    args = parser.parse_args()
+    
+    CatalogGenerator(seed=args.seed).write(args.output, args.rows)
+    print(f"Wrote {args.rows:,} rows to '{args.output}'")
+
+if __name__ == "__main__":
+    main()
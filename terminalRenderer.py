@@ -0,0 +1,227 @@
+import shutil
+import sys
+
+# Partial block characters, from one eighth to a full cell
+BAR_BLOCKS = ['', '▏', '▎', '▍', '▌', '▋', '▊', '▉']
+SPARK_BLOCKS = '▁▂▃▄▅▆▇█'
+HEAT_SHADES = ' ░▒▓█'
+
+class TerminalRenderer:
+    def __init__(self, width=None, stream=None):
+        """Initialize TerminalRenderer; width defaults to the current terminal width"""
+        self.width = width or shutil.get_terminal_size((80, 24)).columns
+        self.stream = stream
+    
+    def emit(self, lines):
+        """Write all lines of one chart in a single call"""
+        stream = self.stream or sys.stdout
+        stream.write("\n".join(lines) + "\n")
+        stream.flush()
+    
+    def bar(self, value, max_value, width):
+        """Unicode block bar for value scaled to width cells"""
+        if max_value <= 0 or width <= 0:
+            return ''
+        eighths = int(round(value / max_value * width * 8))
+        return '█' * (eighths // 8) + BAR_BLOCKS[eighths % 8]
+    
+    def bar_chart(self, labels, values, label_width=None):
+        """Horizontal block bar chart, one row per label"""
+        labels = [str(label) for label in labels]
+        values = [float(value) for value in values]
+        if not values:
+            return []
+        
+        label_width = label_width or min(max(len(label) for label in labels), self.width // 3)
+        value_width = max(len(f"{value:g}") for value in values)
+        bar_width = max(self.width - label_width - value_width - 4, 10)
+        max_value = max(values)
+        
+        lines = []
+        for label, value in zip(labels, values):
+            if len(label) > label_width:
+                label = label[:label_width - 1] + '…'
+            lines.append(f"{label:<{label_width}} │{self.bar(value, max_value, bar_width)} {value:g}")
+        return lines
+    
+    def sparkline(self, values, width=None):
+        """One-line sparkline; series wider than width are reduced to per-cell maxima"""
+        values = [float(value) for value in values]
+        width = width or self.width
+        if not values:
+            return ''
+        
+        if len(values) > width:
+            size = len(values) / width
+            values = [max(values[int(i * size):max(int((i + 1) * size), int(i * size) + 1)])
+                      for i in range(width)]
+        
+        low, high = min(values), max(values)
+        span = high - low
+        if span == 0:
+            return SPARK_BLOCKS[0] * len(values)
+        return ''.join(SPARK_BLOCKS[int((value - low) / span * (len(SPARK_BLOCKS) - 1))]
+                       for value in values)
+    
+    def heatmap(self, row_labels, column_labels, rows):
+        """Character heatmap; columns are merged when they do not fit the width"""
+        row_labels = [str(label) for label in row_labels]
+        label_width = min(max(len(label) for label in row_labels), 12)
+        cells = max(self.width - label_width - 3, 1)
+        n_columns = len(column_labels)
+        
+        # Merge adjacent columns (e.g. years) by summing so the grid fits
+        group = max(-(-n_columns // cells), 1)
+        merged = [[sum(row[i:i + group]) for i in range(0, n_columns, group)] for row in rows]
+        peak = max((max(row) for row in merged if row), default=0)
+        
+        lines = []
+        if column_labels:
+            header = f"{column_labels[0]}"
+            footer = f"{column_labels[-1]}"
+            span = len(merged[0]) if merged else 0
+            lines.append(f"{'':<{label_width}} │{header}{footer:>{max(span - len(header), len(footer))}}")
+        for label, row in zip(row_labels, merged):
+            shades = ''.join(
+                HEAT_SHADES[0] if value == 0 else
+                HEAT_SHADES[1 + min(int(value / peak * (len(HEAT_SHADES) - 1)), len(HEAT_SHADES) - 2)]
+                for value in row
+            )
+            lines.append(f"{label[:label_width]:<{label_width}} │{shades}")
+        if group > 1:
+            lines.append(f"(each column = {group} years)")
+        lines.append(f"Scale: '{HEAT_SHADES[1]}' low  →  '{HEAT_SHADES[-1]}' {peak} books")
+        return lines
+    
+    def visualize_publication_trends(self, analysis_data):
+        """Render publication trends as a sparkline with summary"""
+        if analysis_data is None:
+            return
+        
+        year_counts = analysis_data['year_counts']
+        
+        if year_counts.empty:
+            print("No publication data available for visualization.")
+            return
+        
+        years = list(year_counts.index)
+        counts = list(year_counts.values)
+        spark_width = max(self.width - 2, 10)
+        first, last = str(int(years[0])), str(int(years[-1]))
+        
+        lines = [
+            self.sparkline(counts, spark_width),
+            f"{first}{last:>{max(min(len(counts), spark_width) - len(first), len(last))}}",
+            "",
+            "Publication Trends Summary:",
+            f"   Total years with publications: {analysis_data['total_years']}",
+            f"   Most productive year: {analysis_data['most_productive_year']} ({analysis_data['most_productive_count']} books)",
+            f"   Least productive year: {analysis_data['least_productive_year']} ({analysis_data['least_productive_count']} books)",
+            f"   Average books per year: {year_counts.mean():.1f}",
+            f"   Total books analyzed: {year_counts.sum()}",
+        ]
+        if len(counts) > 1:
+            overall_trend = "increasing" if counts[-1] > counts[0] else "decreasing" if counts[-1] < counts[0] else "stable"
+            lines.append(f"   Overall trend: {overall_trend}")
+        self.emit(lines)
+    
+    def visualize_top_authors(self, analysis_data):
+        """Render top authors as a block bar chart"""
+        if analysis_data is None:
+            return
+        
+        author_counts = analysis_data['author_counts']
+        
+        if author_counts.empty:
+            print("No author data available for visualization.")
+            return
+        
+        offset = analysis_data.get('offset', 0)
+        if offset:
+            title = f"Most Prolific Authors, ranks {offset + 1}-{offset + len(author_counts)}:"
+        else:
+            title = f"Top {analysis_data['top_n']} Most Prolific Authors:"
+        lines = [title, ""]
+        lines += self.bar_chart(author_counts.index, author_counts.values)
+        self.emit(lines)
+    
+    def visualize_language_distribution(self, analysis_data):
+        """Render language distribution as a block bar chart with percentages"""
+        if analysis_data is None:
+            return
+        
+        lang_counts = analysis_data['lang_counts']
+        lang_percentages = analysis_data['lang_percentages']
+        
+        if lang_counts.empty:
+            print("No language data available for visualization.")
+            return
+        
+        labels = [f"{lang} ({lang_percentages[lang]}%)" for lang in lang_counts.index]
+        lines = [f"Language Distribution ({analysis_data['total_books']} total books):", ""]
+        lines += self.bar_chart(labels, lang_counts.values)
+        self.emit(lines)
+    
+    def visualize_books_by_publisher(self, analysis_data):
+        """Render top publishers as a block bar chart"""
+        if analysis_data is None:
+            return
+        
+        publisher_counts = analysis_data['publisher_counts']
+        
+        if publisher_counts.empty:
+            print("No publisher data available for visualization.")
+            return
+        
+        offset = analysis_data.get('offset', 0)
+        if offset:
+            title = (f"Publishers ranked {offset + 1}-{offset + len(publisher_counts)} "
+                     f"of {analysis_data['total_publishers']}:")
+        else:
+            title = f"Top {analysis_data['top_n']} of {analysis_data['total_publishers']} Publishers:"
+        lines = [title, ""]
+        lines += self.bar_chart(publisher_counts.index, publisher_counts.values)
+        self.emit(lines)
+    
+    def visualize_missing_isbn(self, analysis_data, show_graph=True):
+        """Render ISBN completeness as present/missing percentage bars"""
+        if analysis_data is None:
+            return
+        
+        isbn_analysis = analysis_data['isbn_analysis']
+        
+        if not isbn_analysis:
+            print("No ISBN data available for visualization.")
+            return
+        
+        lines = []
+        for isbn_col, data in isbn_analysis.items():
+            lines.append(f"{isbn_col.upper()}: {data['present_count']:,} present, "
+                         f"{data['missing_count']:,} missing of {data['total_records']:,}")
+            if show_graph:
+                present_percentage = 100 - data['missing_percentage']
+                lines += self.bar_chart(
+                    ['Present %', 'Missing %'],
+                    [round(present_percentage, 2), round(data['missing_percentage'], 2)]
+                )
+            lines.append("")
+        self.emit(lines)
+    
+    def visualize_books_per_year_by_language(self, analysis_data):
+        """Render the year×language matrix as a character heatmap"""
+        if analysis_data is None:
+            return
+        
+        year_lang_counts = analysis_data['year_lang_counts']
+        
+        if year_lang_counts.empty:
+            print("No year-language data available for visualization.")
+            return
+        
+        languages = list(year_lang_counts.columns)
+        years = [int(year) for year in year_lang_counts.index]
+        rows = [[int(value) for value in year_lang_counts[lang].values] for lang in languages]
+        
+        lines = ["Books by Year and Language - First 1000 Records (Heatmap):", ""]
+        lines += self.heatmap(languages, years, rows)
+        self.emit(lines)
@@ -1,4 +1,5 @@
 import unittest
+import argparse
 import sys
 import os
 
@@ -12,6 +13,31 @@ from test_visualizer import TestVisualizer
 from test_main import TestMain
 from test_cli import TestCLI
 from test_comprehensive_analysis import TestComprehensiveAnalysis
+from test_downsampler import TestDownsampler
+from test_terminalrenderer import TestTerminalRenderer
+from test_outputwriter import TestOutputWriter
+from test_reportgenerator import TestReportGenerator
+from test_pdfreport import TestPdfReport
+from test_analysisserver import TestAnalysisServer
+from test_asyncserver import TestAsyncAnalysisServer
+from test_csvwatcher import TestCsvWatcher
+from test_profiler import TestProfiler
+from test_metricsexporter import TestMetricsExporter
+from test_sampler import TestSampler
+from test_comparison import TestDatasetComparison
+from test_partitions import TestPartitionedDataset
+from test_compression import TestCompression
+from test_catalogstore import TestCatalogStore
+from test_syntheticcatalog import TestCatalogGenerator
+from test_benchmarksuite import TestBenchmarkSuite
+from test_regressiongate import TestRegressionGate
+from test_differentialharness import TestDifferentialHarness
+from test_polarsengine import TestPolarsAnalyzer
+from test_duckdbengine import TestDuckDbAnalyzer
+from test_catalogquery import TestCatalogQuery
+from test_shareddataset import TestSharedDataset
+from test_datasetindex import TestDatasetIndex
+from regressionGate import add_benchmark_arguments, run_benchmark_gate
 
 def create_test_suite():
     """Create a comprehensive test suite for all components"""
@@ -24,7 +50,31 @@ def create_test_suite():
         TestVisualizer,
         TestMain,
         TestCLI,
-        TestComprehensiveAnalysis  # Added comprehensive analysis tests
+        TestComprehensiveAnalysis,  # Added comprehensive analysis tests
+        TestDownsampler,
+        TestTerminalRenderer,
+        TestOutputWriter,
+        TestReportGenerator,
+        TestPdfReport,
+        TestAnalysisServer,
+        TestAsyncAnalysisServer,
+        TestCsvWatcher,
+        TestProfiler,
+        TestMetricsExporter,
+        TestSampler,
+        TestDatasetComparison,
+        TestPartitionedDataset,
+        TestCompression,
+        TestCatalogStore,
+        TestCatalogGenerator,
+        TestBenchmarkSuite,
+        TestRegressionGate,
+        TestDifferentialHarness,
+        TestPolarsAnalyzer,
+        TestDuckDbAnalyzer,
+        TestCatalogQuery,
+        TestSharedDataset,
+        TestDatasetIndex
     ]
     
     for test_class in test_classes:
@@ -79,5 +129,12 @@ def run_all_tests():
     return result.wasSuccessful()
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run the Dream Book Shop test suite')
+    add_benchmark_arguments(parser)
+    args = parser.parse_args()
+    
     success = run_all_tests()
+    if args.benchmark:
+        # The gate runs even after test failures so both verdicts are reported
+        success = run_benchmark_gate(args) and success
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -13,6 +13,7 @@ Usage:
     python run_comprehensive_tests.py --test T001              # Run specific test (T001-T006)
     python run_comprehensive_tests.py --test publication       # Run test by keyword
     python run_comprehensive_tests.py --interactive            # Interactive test selection
+    python run_comprehensive_tests.py --benchmark              # Tests plus the performance regression gate
 """
 
 import unittest
@@ -26,6 +27,7 @@ sys.path.append('..')
 # Import test configuration
 from test_config import ALL_TEST_CASES
 from test_comprehensive_analysis import TestComprehensiveAnalysis
+from regressionGate import add_benchmark_arguments, run_benchmark_gate
 
 def list_test_cases():
     """Display all available test cases"""
@@ -260,6 +262,8 @@ Examples:
   python run_comprehensive_tests.py --test author      # Run test containing 'author'
   python run_comprehensive_tests.py --interactive      # Interactive test selection
   python run_comprehensive_tests.py --test T003 -v     # Run T003 with verbose output
+  python run_comprehensive_tests.py --benchmark        # Also fail on performance regressions
+  python run_comprehensive_tests.py -b --update-baseline  # Accept current timings as the baseline
 
 Test Identifiers:
   T001, T002, T003, T004, T005, T006                   # Test by ID
@@ -292,6 +296,8 @@ Test Identifiers:
         help='Interactive test selection menu'
     )
     
+    add_benchmark_arguments(parser)
+    
     args = parser.parse_args()
     
     # Load test configuration
@@ -327,10 +333,14 @@ Test Identifiers:
             sys.exit(1)
         
         success = run_single_test(test_index, test_case, verbose=args.verbose)
+        if args.benchmark:
+            success = run_benchmark_gate(args) and success
         sys.exit(0 if success else 1)
     
     # Default: run all tests
     success = run_comprehensive_tests(verbose=args.verbose)
+    if args.benchmark:
+        success = run_benchmark_gate(args) and success
     sys.exit(0 if success else 1)
 
 if __name__ == '__main__':
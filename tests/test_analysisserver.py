@@ -0,0 +1,183 @@
+import unittest
+import json
+import os
+import tempfile
+import threading
+import urllib.request
+import urllib.error
+from unittest.mock import patch
+import pandas as pd
+import sys
+sys.path.append('..')
+from analysisServer import AnalysisServer, RESULT_CACHE_SIZE
+
+class TestAnalysisServer(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False)
+        self.temp_file.close()
+        self.write_csv(['Author A', 'Author B', 'Author A'])
+        
+        self.server = AnalysisServer(self.temp_file.name, port=0, reload_interval=0.05)
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        self.server.shutdown()
+        if os.path.exists(self.temp_file.name):
+            os.unlink(self.temp_file.name)
+    
+    def write_csv(self, authors, mtime_offset=0):
+        """Write a small catalog with the given authors"""
+        pd.DataFrame({
+            'authors': authors,
+            'publication_date': [2020] * len(authors),
+            'language_code': ['en'] * len(authors),
+            'publisher': ['Publisher X'] * len(authors),
+            'isbn': ['123'] * len(authors)
+        }).to_csv(self.temp_file.name, index=False)
+        if mtime_offset:
+            stat = os.stat(self.temp_file.name)
+            os.utime(self.temp_file.name, (stat.st_atime, stat.st_mtime + mtime_offset))
+    
+    def get(self, path):
+        """GET a path from the running server, returning (status, JSON body)"""
+        url = f"http://127.0.0.1:{self.server.port}{path}"
+        try:
+            with urllib.request.urlopen(url, timeout=10) as response:
+                return response.status, json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read())
+    
+    def test_run_query_with_top_n(self):
+        """Test analyses accept their own parameters"""
+        self.server.load()
+        status, payload = self.server.run_query('authors', {'top_n': ['1']})
+        self.assertEqual(status, 200)
+        self.assertEqual(payload['data']['author_counts'], {'Author A': 2})
+        
+        status, payload = self.server.run_query('authors', {'top_n': ['1'], 'offset': ['1']})
+        self.assertEqual(payload['data']['author_counts'], {'Author B': 1})
+        self.assertEqual(self.server.run_query('authors', {'offset': ['0']})[0], 200)
+        self.assertEqual(self.server.run_query('authors', {'offset': ['-1']})[0], 400)
+    
+    def test_run_query_rejects_bad_parameters(self):
+        """Test unknown and non-integer parameters return 400"""
+        self.server.load()
+        self.assertEqual(self.server.run_query('authors', {'top_n': ['many']})[0], 400)
+        self.assertEqual(self.server.run_query('languages', {'top_n': ['3']})[0], 400)
+        self.assertEqual(self.server.run_query('unknown')[0], 404)
+    
+    def test_result_cache_is_bounded(self):
+        """Test distinct parameters evict the least recently used results instead of growing the cache"""
+        self.server.load()
+        self.server.run_query('authors')
+        for top_n in range(1, RESULT_CACHE_SIZE + 20):
+            self.server.run_query('authors', {'top_n': [str(top_n)]})
+            # Keep the default query recently used
+            self.server.run_query('authors')
+        self.assertEqual(len(self.server.results), RESULT_CACHE_SIZE)
+        self.assertEqual(next(reversed(self.server.results))[:2], ('authors', ()))
+        self.assertNotIn(('authors', (('top_n', 1),), self.server.version), self.server.results)
+    
+    def test_run_query_analysis_error(self):
+        """Test analysis errors are returned as 422"""
+        self.server.load()
+        self.server.dataset = self.server.dataset.drop(columns=['isbn'])
+        self.server.results.clear()
+        status, payload = self.server.run_query('isbn')
+        self.assertEqual(status, 422)
+        self.assertIn('No ISBN columns found', payload['error'])
+    
+    def test_http_endpoints_concurrent(self):
+        """Test the HTTP server answers concurrent requests"""
+        self.assertTrue(self.server.start())
+        results = []
+        
+        def fetch():
+            results.append(self.get('/analyze/authors?top_n=2'))
+        
+        threads = [threading.Thread(target=fetch) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(len(results), 10)
+        for status, payload in results:
+            self.assertEqual(status, 200)
+            self.assertEqual(payload['data']['author_counts']['Author A'], 2)
+        self.assertEqual(self.get('/health')[1]['rows'], 3)
+        self.assertEqual(self.get('/nowhere')[0], 404)
+    
+    def test_hot_reload(self):
+        """Test the dataset is reloaded when the CSV changes"""
+        self.server.load()
+        self.assertEqual(self.server.version, 1)
+        self.server.run_query('authors')
+        
+        self.write_csv(['Author C'] * 4, mtime_offset=10)
+        with patch('builtins.print'):
+            self.assertTrue(self.server.check_reload())
+        self.assertEqual(self.server.version, 2)
+        
+        status, payload = self.server.run_query('authors')
+        self.assertEqual(payload['data']['author_counts'], {'Author C': 4})
+        
+        # A version that fails to load is tried once, and again only after the next change
+        with open(self.temp_file.name, 'w'):
+            pass
+        stat = os.stat(self.temp_file.name)
+        os.utime(self.temp_file.name, (stat.st_atime, stat.st_mtime + 20))
+        with patch('builtins.print'), patch.object(self.server.data_loader, 'load',
+                                                   wraps=self.server.data_loader.load) as mock_load:
+            for _ in range(3):
+                self.server.check_reload()
+            self.assertEqual(mock_load.call_count, 1)
+            self.write_csv(['Author D'], mtime_offset=30)
+            self.assertTrue(self.server.check_reload())
+        self.assertEqual(self.server.version, 3)
+
+def run_single_test():
+    """Run this test file individually with detailed output"""
+    print("=" * 70)
+    print("                  TESTING ANALYSIS SERVER CLASS")
+    print("=" * 70)
+    
+    # Create test suite
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestAnalysisServer)
+    
+    # Run tests with detailed output
+    runner = unittest.TextTestRunner(
+        verbosity=2,
+        stream=sys.stdout,
+        buffer=True
+    )
+    
+    result = runner.run(suite)
+    
+    # Print summary
+    print("\n" + "=" * 50)
+    print("              TEST SUMMARY")
+    print("=" * 50)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    
+    if result.wasSuccessful():
+        print("✅ ALL TESTS PASSED!")
+    else:
+        print("❌ SOME TESTS FAILED!")
+        if result.failures:
+            print(f"\nFailures ({len(result.failures)}):")
+            for test, traceback in result.failures:
+                print(f"  - {test}")
+        if result.errors:
+            print(f"\nErrors ({len(result.errors)}):")
+            for test, traceback in result.errors:
+                print(f"  - {test}")
+    
+    print("=" * 50)
+    return result.wasSuccessful()
+
+if __name__ == '__main__':
+    run_single_test()
@@ -65,6 +65,19 @@ class TestAnalyzer(unittest.TestCase):
         # Author A should be top with 3 books
         self.assertEqual(analysis_data['author_counts'].iloc[0], 3)
     
+    def test_analyze_top_authors_offset(self):
+        """Test offset pages past the most prolific authors, ties kept in first-seen order"""
+        analysis_data, error = self.analyzer.analyze_top_authors(self.test_df, top_n=1, offset=1)
+        
+        self.assertIsNone(error)
+        self.assertEqual(analysis_data['author_counts'].to_dict(), {'Author B': 1})
+        self.assertEqual(analysis_data['offset'], 1)
+        
+        # Paging past the last author gives an empty page
+        analysis_data, error = self.analyzer.analyze_books_by_publisher(self.test_df, top_n=5, offset=10)
+        self.assertTrue(analysis_data['publisher_counts'].empty)
+        self.assertEqual(analysis_data['total_publishers'], 3)
+    
     def test_analyze_top_authors_missing_column(self):
         """Test top authors with missing authors column"""
         df_no_authors = self.test_df.drop(['authors'], axis=1)
@@ -0,0 +1,268 @@
+import unittest
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+import pandas as pd
+from unittest.mock import patch
+import sys
+sys.path.append('..')
+from analysisServer import AnalysisServer
+from asyncServer import AsyncAnalysisServer, MAX_LATENCY_ROUTES
+from sharedDataset import publish
+
+class TestAsyncAnalysisServer(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False)
+        self.temp_file.close()
+        pd.DataFrame({
+            'authors': ['Author A', 'Author B', 'Author A'],
+            'publication_date': [2020, 2021, 2021],
+            'language_code': ['en', 'fr', 'en'],
+            'publisher': ['Publisher X'] * 3,
+            'isbn': ['123', None, '456']
+        }).to_csv(self.temp_file.name, index=False)
+        
+        self.server = AnalysisServer(self.temp_file.name, port=0)
+        self.server.load()
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        if os.path.exists(self.temp_file.name):
+            os.unlink(self.temp_file.name)
+    
+    def run_with_executor(self, front, coroutine):
+        """Run a coroutine with the front end's executor started and shut down around it"""
+        async def runner():
+            front.executor = front.create_executor()
+            try:
+                return await coroutine
+            finally:
+                await front.stop()
+        return asyncio.run(runner())
+    
+    def slow_query(self, delay):
+        """Wrap run_query so concurrent requests overlap while it runs"""
+        run_query = self.server.run_query
+        calls = []
+        
+        def slow(analysis_type, query=None):
+            calls.append(threading.current_thread().name)
+            time.sleep(delay)
+            return run_query(analysis_type, query)
+        
+        self.server.run_query = slow
+        return calls
+    
+    def test_identical_requests_are_coalesced(self):
+        """Test a burst of identical requests computes the analysis once"""
+        calls = self.slow_query(0.2)
+        front = AsyncAnalysisServer(self.server, workers=2)
+        
+        async def burst():
+            return await asyncio.gather(*[front.submit('authors', {'top_n': ['1']}) for _ in range(50)])
+        
+        results = self.run_with_executor(front, burst())
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(front.counters['computed'], 1)
+        self.assertEqual(front.counters['coalesced'], 49)
+        for status, payload in results:
+            self.assertEqual(status, 200)
+            self.assertEqual(payload['data']['author_counts'], {'Author A': 2})
+        self.assertEqual(front.in_flight, {})
+    
+    def test_distinct_requests_run_separately(self):
+        """Test different parameters are not coalesced"""
+        calls = self.slow_query(0.05)
+        front = AsyncAnalysisServer(self.server, workers=2)
+        
+        async def pair():
+            return await asyncio.gather(front.submit('authors', {'top_n': ['1']}),
+                                        front.submit('authors', {'top_n': ['2']}))
+        
+        first, second = self.run_with_executor(front, pair())
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(len(first[1]['data']['author_counts']), 1)
+        self.assertEqual(len(second[1]['data']['author_counts']), 2)
+    
+    def test_process_workers_attach_shared_dataset(self):
+        """Test process workers answer from the shared dataset, which is published again after a reload"""
+        front = AsyncAnalysisServer(self.server, executor='process', workers=1)
+        publish_threads = []
+        
+        def tracked_publish(dataset):
+            publish_threads.append(threading.current_thread())
+            return publish(dataset)
+        
+        async def query():
+            return await front.submit('authors', {'top_n': ['1']})
+        
+        async def both():
+            first = await query()
+            first_block = front.shared[0].handle['name']
+            pd.DataFrame({'authors': ['Author C'] * 2}).to_csv(self.temp_file.name, index=False)
+            self.server.load()
+            second = await query()
+            return first, second, [first_block, front.shared[0].handle['name'], front.retired[0].handle['name']]
+        
+        with patch('asyncServer.publish', tracked_publish):
+            first, second, blocks = self.run_with_executor(front, both())
+        self.assertEqual(first, (200, {'analysis': 'authors', 'version': 1, 'data': {'author_counts': {'Author A': 2},
+                                                                                      'top_n': 1, 'offset': 0}}))
+        self.assertEqual(second[1]['data']['author_counts'], {'Author C': 2})
+        self.assertEqual(second[1]['version'], 2)
+        # The previous version stays shared until the next reload
+        self.assertNotEqual(blocks[1], blocks[0])
+        self.assertEqual(blocks[2], blocks[0])
+        self.assertIsNone(front.shared)  # stop() frees the shared copies
+        # Both versions were copied off the event loop thread
+        self.assertEqual(len(publish_threads), 2)
+        self.assertNotIn(threading.main_thread(), publish_threads)
+    
+    def test_max_pending_rejects_with_503(self):
+        """Test requests beyond max_pending distinct computations are shed"""
+        self.slow_query(0.2)
+        front = AsyncAnalysisServer(self.server, workers=1, max_pending=1)
+        
+        async def overload():
+            return await asyncio.gather(front.submit('authors'), front.submit('languages'))
+        
+        first, second = self.run_with_executor(front, overload())
+        self.assertEqual(first[0], 200)
+        self.assertEqual(second[0], 503)
+        self.assertEqual(front.counters['rejected'], 1)
+    
+    def test_percentiles(self):
+        """Test nearest-rank percentiles are reported in milliseconds"""
+        front = AsyncAnalysisServer(self.server)
+        for ms in range(1, 101):
+            front.record_latency('/analyze/authors', ms / 1000)
+        
+        status, payload = front.metrics()
+        latency = payload['latency_ms']['/analyze/authors']
+        self.assertEqual(status, 200)
+        self.assertEqual(latency['count'], 100)
+        self.assertEqual(latency['p50'], 51.0)
+        self.assertEqual(latency['p99'], 100.0)
+        self.assertEqual(front.percentiles([]), {})
+    
+    def test_latency_windows_are_keyed_by_route(self):
+        """Test made-up paths share one latency window and the number of windows is capped"""
+        front = AsyncAnalysisServer(self.server)
+        self.assertEqual(front.route_name('/analyze/authors?top_n=3'), '/analyze/authors')
+        self.assertEqual(front.route_name('/health'), '/health')
+        self.assertEqual(front.route_name('/analyze/foo1'), 'other')
+        self.assertEqual(front.route_name('/no/such/path'), 'other')
+        
+        for number in range(MAX_LATENCY_ROUTES + 10):
+            front.record_latency(f"route-{number}", 0.001)
+        self.assertEqual(len(front.latencies), MAX_LATENCY_ROUTES + 1)
+        self.assertEqual(len(front.latencies['other']), 10)
+    
+    def test_http_end_to_end(self):
+        """Test the asyncio HTTP listener serves analyses, metrics and fallback routes"""
+        front = AsyncAnalysisServer(self.server, workers=2)
+        
+        async def fetch(path):
+            reader, writer = await asyncio.open_connection(self.server.host, self.server.port)
+            writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode('latin-1'))
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+            head, body = response.split(b'\r\n\r\n', 1)
+            return int(head.split()[1]), json.loads(body)
+        
+        async def scenario():
+            self.assertTrue(await front.start())
+            try:
+                results = await asyncio.gather(*[fetch('/analyze/languages') for _ in range(10)])
+                health = await fetch('/health')
+                missing = await fetch('/analyze/unknown')
+                await fetch('/analyze/unknown2')
+                metrics = await fetch('/metrics')
+            finally:
+                await front.stop()
+            return results, health, missing, metrics
+        
+        results, health, missing, metrics = asyncio.run(scenario())
+        for status, payload in results:
+            self.assertEqual(status, 200)
+            self.assertEqual(payload['data']['lang_counts'], {'en': 2, 'fr': 1})
+        self.assertEqual(health[1]['rows'], 3)
+        self.assertEqual(missing[0], 404)
+        self.assertEqual(metrics[1]['counters']['requests'], 12)
+        self.assertEqual(metrics[1]['latency_ms']['/analyze/languages']['count'], 10)
+        self.assertEqual(metrics[1]['latency_ms']['other']['count'], 2)
+    
+    def test_failed_analysis_answers_500(self):
+        """Test an exception while computing a response is answered with a 500 JSON body"""
+        front = AsyncAnalysisServer(self.server, workers=1)
+        
+        def broken(analysis_type, query=None):
+            raise RuntimeError('worker lost its dataset')
+        self.server.run_query = broken
+        
+        async def scenario():
+            self.assertTrue(await front.start())
+            try:
+                reader, writer = await asyncio.open_connection(self.server.host, self.server.port)
+                writer.write(b"GET /analyze/authors HTTP/1.1\r\nHost: localhost\r\n\r\n")
+                await writer.drain()
+                response = await reader.read()
+                writer.close()
+            finally:
+                await front.stop()
+            return response
+        
+        head, body = asyncio.run(scenario()).split(b'\r\n\r\n', 1)
+        self.assertEqual(int(head.split()[1]), 500)
+        self.assertIn('worker lost its dataset', json.loads(body)['error'])
+        self.assertEqual(front.counters['errors'], 1)
+
+def run_single_test():
+    """Run this test file individually with detailed output"""
+    print("=" * 70)
+    print("               TESTING ASYNC ANALYSIS SERVER CLASS")
+    print("=" * 70)
+    
+    # Create test suite
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestAsyncAnalysisServer)
+    
+    # Run tests with detailed output
+    runner = unittest.TextTestRunner(
+        verbosity=2,
+        stream=sys.stdout,
+        buffer=True
+    )
+    
+    result = runner.run(suite)
+    
+    # Print summary
+    print("\n" + "=" * 50)
+    print("              TEST SUMMARY")
+    print("=" * 50)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    
+    if result.wasSuccessful():
+        print("✅ ALL TESTS PASSED!")
+    else:
+        print("❌ SOME TESTS FAILED!")
+        if result.failures:
+            print(f"\nFailures ({len(result.failures)}):")
+            for test, traceback in result.failures:
+                print(f"  - {test}")
+        if result.errors:
+            print(f"\nErrors ({len(result.errors)}):")
+            for test, traceback in result.errors:
+                print(f"  - {test}")
+    
+    print("=" * 50)
+    return result.wasSuccessful()
+
+if __name__ == '__main__':
+    run_single_test()
@@ -0,0 +1,127 @@
+import unittest
+import json
+import shutil
+import tempfile
+import sys
+sys.path.append('..')
+from unittest.mock import patch
+from benchmarkSuite import BenchmarkSuite
+from analyzer import ANALYSIS_METHODS
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.suite = BenchmarkSuite(tiers=[500, 1000], repeat=2, data_dir=self.temp_dir)
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        shutil.rmtree(self.temp_dir)
+    
+    def test_results_per_tier_and_stage(self):
+        """Test every tier reports time samples and peak memory for load and each analysis"""
+        with patch('sys.stderr'):
+            results = self.suite.run()
+        self.assertEqual(list(results['tiers']), ['500', '1000'])
+        self.assertEqual(results['environment']['seed'], 0)
+        
+        stages = results['tiers']['1000']['stages']
+        self.assertEqual(list(stages), ['load'] + [f"analyze:{analysis_type}" for analysis_type in ANALYSIS_METHODS])
+        for stage in stages.values():
+            self.assertEqual(len(stage['samples']), 2)
+            self.assertLessEqual(stage['min_seconds'], stage['median_seconds'])
+            self.assertGreater(stage['peak_memory'], 0)
+        json.dumps(results)
+    
+    def test_datasets_are_cached(self):
+        """Test a tier's catalog is generated once and reused"""
+        with patch('sys.stderr') as mock_stderr:
+            path = self.suite.dataset_path(500)
+            self.assertEqual(self.suite.dataset_path(500), path)
+        self.assertEqual(sum(1 for call in mock_stderr.write.call_args_list if 'Generating' in call.args[0]), 1)
+    
+    def test_print_against_baseline(self):
+        """Test the table shows the change of each median against a baseline"""
+        suite = BenchmarkSuite(tiers=[500], repeat=1, data_dir=self.temp_dir, trace_memory=False)
+        with patch('sys.stderr'):
+            results = suite.run()
+        baseline = json.loads(json.dumps(results))
+        for stage in baseline['tiers']['500']['stages'].values():
+            stage['median_seconds'] = stage['median_seconds'] / 2
+        
+        with patch('builtins.print') as mock_print:
+            suite.print_results(results, baseline)
+        printed = '\n'.join(str(call.args[0]) for call in mock_print.call_args_list)
+        self.assertIn('+100.0%', printed)
+
+    def test_render_stages(self):
+        """Test render mode adds a headless chart stage per analysis"""
+        suite = BenchmarkSuite(tiers=[500], repeat=1, data_dir=self.temp_dir, trace_memory=False, render=True)
+        with patch('sys.stderr'):
+            results = suite.run()
+        stages = results['tiers']['500']['stages']
+        for analysis_type in ANALYSIS_METHODS:
+            self.assertIn(f"render:{analysis_type}", stages)
+        self.assertTrue(results['environment']['render'])
+
+    def test_engines_side_by_side(self):
+        """Test each extra engine gets its own prefixed load and analysis stages and a totals line"""
+        suite = BenchmarkSuite(tiers=[500], repeat=1, data_dir=self.temp_dir, engines=['pandas', 'polars'])
+        with patch('sys.stderr'):
+            results = suite.run()
+        stages = results['tiers']['500']['stages']
+        self.assertIn('polars/load', stages)
+        for analysis_type in ANALYSIS_METHODS:
+            self.assertIn(f"analyze:{analysis_type}", stages)
+            self.assertIn(f"polars/analyze:{analysis_type}", stages)
+        self.assertEqual(results['environment']['engines'], ['pandas', 'polars'])
+        
+        with patch('builtins.print') as mock_print:
+            suite.print_results(results)
+        printed = '\n'.join(str(call.args[0]) for call in mock_print.call_args_list)
+        self.assertIn('Load + analyses: pandas', printed)
+
+def run_single_test():
+    """Run this test file individually with detailed output"""
+    print("=" * 70)
+    print("                  TESTING BENCHMARK SUITE CLASS")
+    print("=" * 70)
+    
+    # Create test suite
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestBenchmarkSuite)
+    
+    # Run tests with detailed output
+    runner = unittest.TextTestRunner(
+        verbosity=2,
+        stream=sys.stdout,
+        buffer=True
+    )
+    
+    result = runner.run(suite)
+    
+    # Print summary
+    print("\n" + "=" * 50)
+    print("              TEST SUMMARY")
+    print("=" * 50)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    
+    if result.wasSuccessful():
+        print("✅ ALL TESTS PASSED!")
+    else:
+        print("❌ SOME TESTS FAILED!")
+        if result.failures:
+            print(f"\nFailures ({len(result.failures)}):")
+            for test, traceback in result.failures:
+                print(f"  - {test}")
+        if result.errors:
+            print(f"\nErrors ({len(result.errors)}):")
+            for test, traceback in result.errors:
+                print(f"  - {test}")
+    
+    print("=" * 50)
+    return result.wasSuccessful()
+
+if __name__ == '__main__':
+    run_single_test()
@@ -0,0 +1,174 @@
+import unittest
+import gzip
+import os
+import shutil
+import tempfile
+import pandas as pd
+import sys
+sys.path.append('..')
+from unittest.mock import patch
+import catalogQuery
+from catalogQuery import Catalog, col
+from dataLoader import DataLoader
+from analyzer import Analyzer
+
+class TestCatalogQuery(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.temp_dir, 'books.csv')
+        self.df = pd.DataFrame({
+            'title': ['Garden Paths', 'The Quiet Garden', 'Winter Light', 'Paths of Glory', 'Summer Light'] * 40,
+            'authors': ['Author B', 'Author A', '1984', None, 'Author B'] * 40,
+            'publication_date': ['2016-01-01', '2018-05-05', '2012-01-01', 'unknown', '2020-01-01'] * 40,
+            'language_code': ['German', 'French', 'German', None, 'English'] * 40,
+            'publisher': ['Pub X', 'Pub Y', 'Pub X', 'Pub Z', None] * 40
+        })
+        self.df.to_csv(self.csv_path, index=False)
+        self.catalog = Catalog()
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        shutil.rmtree(self.temp_dir)
+    
+    def german_publishers(self, query):
+        """Publishers of German books from 2015 to 2020"""
+        return (query.with_years('publication_date', Analyzer().extract_years, name='year')
+                .filter(col('year').between(2015, 2020))
+                .filter(col('language_code') == 'German')
+                .group_by('publisher').count().top(20))
+    
+    def test_plan_pushes_projection_and_fuses_filters(self):
+        """Test the optimized plan reads only the referenced columns and pushes leading filters into the scan"""
+        query = (self.catalog.scan(self.csv_path)
+                 .filter(col('language_code').isin(['German', 'French']))
+                 .filter(col('authors').not_null())
+                 .group_by('publisher').count())
+        self.assertEqual(query.explain().splitlines()[0],
+                         "Scan books.csv columns=['language_code', 'authors', 'publisher'] "
+                         "filter=(language_code isin ['German', 'French'] & authors not_null)")
+        self.assertEqual(query.collect().to_dict(), {'Pub X': 80, 'Pub Y': 40})
+        
+        # A filter on a derived column stays after the year extraction it needs
+        plan = self.german_publishers(self.catalog.scan(self.csv_path)).explain().splitlines()
+        self.assertEqual(plan[0], "Scan books.csv columns=['publication_date', 'language_code', 'publisher']")
+        self.assertIn("filter year between (2015, 2020) & language_code == 'German'", plan[2])
+    
+    def test_scan_and_frame_agree(self):
+        """Test a plan gives the same result over the CSV (plain or gzip) and over the loaded DataFrame"""
+        gz_path = os.path.join(self.temp_dir, 'books.csv.gz')
+        with open(self.csv_path, 'rb') as source, gzip.open(gz_path, 'wb') as target:
+            target.write(source.read())
+        expected = self.german_publishers(self.catalog.frame(pd.read_csv(self.csv_path))).collect()
+        self.assertEqual(expected.to_dict(), {'Pub X': 40})
+        for path in (self.csv_path, gz_path):
+            pd.testing.assert_series_equal(self.german_publishers(self.catalog.scan(path)).collect(), expected)
+        
+        self.assertEqual(self.catalog.scan(self.csv_path).count().collect(), 200)
+        self.assertEqual(self.catalog.scan(self.csv_path).head(7).count().collect(), 7)
+        rows = self.catalog.scan(self.csv_path).filter(col('publisher').is_missing()).collect()
+        self.assertEqual(list(rows.columns), list(self.df.columns))
+        self.assertEqual(len(rows), 40)
+    
+    def test_chunked_filter_keeps_pandas_types(self):
+        """Test values typed differently by separate chunks are unified as a single read would type them"""
+        csv_path = os.path.join(self.temp_dir, 'numbers.csv')
+        pd.DataFrame({'authors': ['1984', None, 'Author B', '1984', 'Author A'],
+                      'language_code': ['German'] * 5}).to_csv(csv_path, index=False)
+        with patch.object(catalogQuery, 'SCAN_CHUNK_ROWS', 2):
+            # The first chunk holds only '1984' and a gap, so alone it parses as the number 1984.0
+            counts = (self.catalog.scan(csv_path)
+                      .filter(col('language_code') == 'German')
+                      .group_by('authors').count().collect())
+        self.assertEqual(counts.to_dict(), {'1984': 2, 'Author B': 1, 'Author A': 1})
+    
+    def test_errors_and_immutability(self):
+        """Test unknown columns and files raise, and extending a query leaves it unchanged"""
+        base = self.catalog.scan(self.csv_path)
+        grouped = base.group_by('isbn').count()
+        self.assertEqual(base.steps, [])
+        with self.assertRaises(ValueError) as context:
+            grouped.collect()
+        self.assertIn("['isbn'] not found", str(context.exception))
+        with self.assertRaises(FileNotFoundError):
+            self.catalog.scan(os.path.join(self.temp_dir, 'missing.csv')).count().collect()
+    
+    def test_interned_counts_match_value_counts(self):
+        """Test counts over interned columns come from the codes, ordered exactly as value_counts() orders them"""
+        interned = DataLoader().intern(pd.read_csv(self.csv_path))
+        self.assertIsInstance(interned['language_code'].dtype, pd.CategoricalDtype)
+        plain = pd.read_csv(self.csv_path)
+        
+        for name in ['authors', 'language_code', 'publisher']:
+            pd.testing.assert_series_equal(self.catalog.frame(interned).group_by(name).count().collect(),
+                                           plain[name].value_counts())
+        # After a filter, ties go to the value seen first among the kept rows, not in the whole column
+        rows = [2, 1, 4, 0]
+        pd.testing.assert_series_equal(self.catalog.frame(interned.iloc[rows]).group_by('authors').count().collect(),
+                                       plain['authors'].iloc[rows].value_counts())
+        pd.testing.assert_series_equal(self.german_publishers(self.catalog.frame(interned)).collect(),
+                                       self.german_publishers(self.catalog.frame(plain)).collect())
+        
+        # Range filters compare the distinct values of an unordered categorical, not its codes
+        dates = col('publication_date').between('2015', '2019')
+        self.assertEqual(self.catalog.frame(interned).filter(dates).count().collect(),
+                         self.catalog.frame(plain).filter(dates).count().collect())
+        self.assertEqual(self.catalog.frame(interned).filter(dates).count().collect(), 80)
+    
+    def test_top_selects_pages_by_partial_sort(self):
+        """Test top(n, offset) after a single-key count ranks only the page, giving value_counts() slices"""
+        frame = pd.DataFrame({'publisher': [f'Pub {i % 37}' for i in range(500)] + [f'Pub {i}' for i in range(100)]})
+        expected = frame['publisher'].value_counts()
+        plan = self.catalog.frame(frame).group_by('publisher').count().top(10, 30)
+        self.assertIn('top_count 10 30', plan.explain())
+        
+        for df in [frame, DataLoader().intern(frame.copy())]:
+            for n, offset in [(5, 0), (10, 30), (100, 0), (3, 136), (1, 200)]:
+                pd.testing.assert_series_equal(self.catalog.frame(df).group_by('publisher').count().top(n, offset).collect(),
+                                               expected.iloc[offset:offset + n], obj=f"{n}, {offset}")
+            self.assertEqual(self.catalog.frame(df).group_by('publisher').distinct().collect(), len(expected))
+
+def run_single_test():
+    """Run this test file individually with detailed output"""
+    print("=" * 70)
+    print("                   TESTING CATALOG QUERY CLASS")
+    print("=" * 70)
+    
+    # Create test suite
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestCatalogQuery)
+    
+    # Run tests with detailed output
+    runner = unittest.TextTestRunner(
+        verbosity=2,
+        stream=sys.stdout,
+        buffer=True
+    )
+    
+    result = runner.run(suite)
+    
+    # Print summary
+    print("\n" + "=" * 50)
+    print("              TEST SUMMARY")
+    print("=" * 50)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    
+    if result.wasSuccessful():
+        print("✅ ALL TESTS PASSED!")
+    else:
+        print("❌ SOME TESTS FAILED!")
+        if result.failures:
+            print(f"\nFailures ({len(result.failures)}):")
+            for test, traceback in result.failures:
+                print(f"  - {test}")
+        if result.errors:
+            print(f"\nErrors ({len(result.errors)}):")
+            for test, traceback in result.errors:
+                print(f"  - {test}")
+    
+    print("=" * 50)
+    return result.wasSuccessful()
+
+if __name__ == '__main__':
+    run_single_test()
@@ -0,0 +1,144 @@
+import unittest
+from unittest.mock import patch
+import json
+import os
+import shutil
+import tempfile
+import pandas as pd
+import sys
+sys.path.append('..')
+from analyzer import Analyzer, ANALYSIS_METHODS
+from outputWriter import OutputWriter
+from catalogStore import CatalogStore, SqlAnalyzer
+
+class TestCatalogStore(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.temp_dir, 'books.csv')
+        self.df = pd.DataFrame({
+            'title': ['Garden Paths', 'The Quiet Garden', 'Winter Light', 'Paths of Glory', 'Summer Light'] * 300,
+            'authors': ['Author A', 'Author B', 'Author A', None, 'Author C'] * 300,
+            'publication_date': ['2019-01-01', '2020-05-05', '0001-01-01', '2021-03-03', '2020-01-01'] * 300,
+            'language_code': ['en', 'fr', 'en', None, 'de'] * 300,
+            'publisher': ['Pub X', 'Pub Y', 'Pub X', 'Pub Z', None] * 300,
+            'isbn': ['9780000000001', None, '9780000000003', '', '9780000000005'] * 300,
+            'isbn13': [None, None, '1', '2', '3'] * 300
+        })
+        self.df.to_csv(self.csv_path, index=False)
+        self.store = CatalogStore(os.path.join(self.temp_dir, 'catalog.sqlite'))
+        self.serializer = OutputWriter('json')
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        self.store.close()
+        shutil.rmtree(self.temp_dir)
+    
+    def serialized(self, analysis_data):
+        """analysis_data as the JSON the output writer would emit"""
+        return json.dumps(self.serializer.to_serializable(analysis_data), sort_keys=True, default=str)
+    
+    def test_queries_match_analyzer(self):
+        """Test every SQL analysis returns what the pandas Analyzer returns"""
+        self.assertEqual(self.store.ingest(self.csv_path, chunk_rows=400), 1500)
+        sql_analyzer = SqlAnalyzer(self.store)
+        expected_df = pd.read_csv(self.csv_path)
+        
+        for analysis_type, method_name in ANALYSIS_METHODS.items():
+            expected, expected_error = getattr(Analyzer(), method_name)(expected_df)
+            actual, error = getattr(sql_analyzer, method_name)(None)
+            self.assertEqual(error, expected_error, analysis_type)
+            self.assertEqual(self.serialized(actual), self.serialized(expected), analysis_type)
+    
+    def test_missing_columns(self):
+        """Test missing fields give the Analyzer's error messages"""
+        self.df[['title', 'isbn']].to_csv(self.csv_path, index=False)
+        self.store.ingest(self.csv_path)
+        sql_analyzer = SqlAnalyzer(self.store)
+        
+        _, error = sql_analyzer.analyze_top_authors()
+        self.assertEqual(error, "Authors column not found in dataset! Available columns: ['title', 'isbn']")
+        _, error = sql_analyzer.analyze_books_per_year_by_language()
+        self.assertIn("publication date and language column(s) not found", error)
+        data, error = sql_analyzer.analyze_missing_isbn()
+        self.assertIsNone(error)
+        self.assertEqual(data['isbn_analysis']['isbn']['missing_count'], 600)
+    
+    def test_indexes_and_full_text_search(self):
+        """Test the indexed columns are used and titles are searchable with FTS5"""
+        self.store.ingest(self.csv_path)
+        indexes = {row[0] for row in self.store.query("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertTrue({'idx_books_year', 'idx_books_language', 'idx_books_publisher', 'idx_books_author'} <= indexes)
+        plan = ' '.join(row[-1] for row in self.store.query(
+            "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM books WHERE language = 'fr'"))
+        self.assertIn('idx_books_language', plan)
+        
+        matches = self.store.search('garden', limit=1000)
+        self.assertEqual(len(matches), 600)
+        self.assertEqual(set(matches['title']), {'Garden Paths', 'The Quiet Garden'})
+        self.assertEqual(set(self.store.search('paths NOT garden', limit=1000)['title']), {'Paths of Glory'})
+    
+    def test_stale_source_and_failed_ingest(self):
+        """Test a changed source is detected and a failed ingest keeps the previous catalog"""
+        self.store.ingest(self.csv_path)
+        self.assertTrue(self.store.is_current(self.csv_path))
+        self.assertFalse(self.store.is_stale(self.csv_path))
+        self.assertIsNone(self.store.other_source(self.csv_path))
+        self.assertEqual(self.store.other_source(os.path.join(self.temp_dir, 'other.csv')),
+                         os.path.abspath(self.csv_path))
+        
+        self.df.head(10).to_csv(self.csv_path, index=False)
+        self.assertTrue(self.store.is_stale(self.csv_path))
+        self.assertEqual(self.store.ingest(self.csv_path), 10)
+        
+        empty_path = os.path.join(self.temp_dir, 'empty.csv')
+        open(empty_path, 'w').close()
+        with patch('builtins.print'):
+            self.assertIsNone(self.store.ingest(empty_path))
+        self.assertEqual(self.store.meta()['rows'], 10)
+        self.assertEqual(self.store.query("SELECT COUNT(*) FROM books")[0][0], 10)
+
+def run_single_test():
+    """Run this test file individually with detailed output"""
+    print("=" * 70)
+    print("                   TESTING CATALOG STORE CLASS")
+    print("=" * 70)
+    
+    # Create test suite
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestCatalogStore)
+    
+    # Run tests with detailed output
+    runner = unittest.TextTestRunner(
+        verbosity=2,
+        stream=sys.stdout,
+        buffer=True
+    )
+    
+    result = runner.run(suite)
+    
+    # Print summary
+    print("\n" + "=" * 50)
+    print("              TEST SUMMARY")
+    print("=" * 50)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    
+    if result.wasSuccessful():
+        print("✅ ALL TESTS PASSED!")
+    else:
+        print("❌ SOME TESTS FAILED!")
+        if result.failures:
+            print(f"\nFailures ({len(result.failures)}):")
+            for test, traceback in result.failures:
+                print(f"  - {test}")
+        if result.errors:
+            print(f"\nErrors ({len(result.errors)}):")
+            for test, traceback in result.errors:
+                print(f"  - {test}")
+    
+    print("=" * 50)
+    return result.wasSuccessful()
+
+if __name__ == '__main__':
+    run_single_test()
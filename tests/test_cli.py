@@ -1,8 +1,15 @@
 import unittest
+import gzip
+import json
+import os
+import shutil
 import sys
+import tempfile
 from unittest.mock import patch, MagicMock
+import pandas as pd
 sys.path.append('..')
 from cli import CLI
+from terminalRenderer import TerminalRenderer
 
 class TestCLI(unittest.TestCase):
     def setUp(self):
@@ -123,6 +130,408 @@ class TestCLI(unittest.TestCase):
                 self.cli.run_analysis('trends', mock_dataset)
                 
                 mock_print.assert_any_call("\n\nAnalysis interrupted by user (Ctrl+C)")
+    
+    @patch('cli.CLI.run_analysis')
+    @patch('cli.CLI.load_dataset')
+    @patch('sys.argv', ['cli.py', '--all'])
+    def test_run_all_analyses(self, mock_load, mock_run_analysis):
+        """Test --all runs every analysis in menu order"""
+        mock_dataset = MagicMock()
+        mock_load.return_value = mock_dataset
+        
+        with patch('builtins.print'):
+            self.cli.run()
+        called = [call.args[0] for call in mock_run_analysis.call_args_list]
+        self.assertEqual(called, ['trends', 'authors', 'languages', 'publishers', 'isbn', 'year-language'])
+    
+    @patch('cli.CLI.run_analysis')
+    @patch('cli.CLI.load_dataset')
+    @patch('sys.argv', ['cli.py', '--trends', '--terminal'])
+    def test_run_terminal_renderer(self, mock_load, mock_run_analysis):
+        """Test --terminal swaps in the TerminalRenderer"""
+        mock_load.return_value = MagicMock()
+        
+        self.cli.run()
+        self.assertIsInstance(self.cli.main_app.visualizer, TerminalRenderer)
+    
+    @patch('cli.CLI.load_dataset')
+    @patch('sys.argv', ['cli.py', '--authors', '--output', 'json'])
+    def test_run_json_output(self, mock_load):
+        """Test --output json writes one JSON document and no tables"""
+        import io
+        import json
+        import pandas as pd
+        mock_load.return_value = pd.DataFrame({'authors': ['A', 'B', 'A']})
+        
+        with patch('sys.stdout', new_callable=io.StringIO) as mock_stdout:
+            self.cli.run()
+        result = json.loads(mock_stdout.getvalue())
+        self.assertEqual(result['authors']['author_counts'], {'A': 2, 'B': 1})
+    
+    @patch('cli.ReportGenerator.generate', return_value={'rendered': ['trends'], 'cached': []})
+    @patch('cli.CLI.load_dataset')
+    @patch('sys.argv', ['cli.py', '--report', 'weekly.html'])
+    def test_run_report(self, mock_load, mock_generate):
+        """Test --report writes the HTML report instead of running the menu"""
+        mock_dataset = MagicMock()
+        mock_load.return_value = mock_dataset
+        
+        with patch('builtins.print') as mock_print:
+            with patch.object(self.cli.main_app, 'show_menu') as mock_menu:
+                self.cli.run()
+                mock_menu.assert_not_called()
+        mock_generate.assert_called_once()
+        mock_print.assert_any_call("Report written to 'weekly.html'")
+    
+    @patch('cli.CLI.write_pdf')
+    @patch('cli.CLI.load_dataset')
+    @patch('sys.argv', ['cli.py', '--pdf', 'report.pdf'])
+    def test_run_pdf(self, mock_load, mock_write_pdf):
+        """Test --pdf renders all analyses when none are selected"""
+        mock_dataset = MagicMock()
+        mock_load.return_value = mock_dataset
+        
+        self.cli.run()
+        mock_write_pdf.assert_called_once_with(mock_dataset, 'report.pdf',
+                                               ['trends', 'authors', 'languages', 'publishers', 'isbn', 'year-language'])
+    
+    @patch('cli.AnalysisServer')
+    @patch('cli.CLI.load_dataset')
+    @patch('sys.argv', ['cli.py', '--serve', '--port', '9000'])
+    def test_run_serve(self, mock_load, mock_server):
+        """Test --serve starts the analysis server instead of loading the dataset here"""
+        mock_server.return_value.serve_forever.return_value = True
+        
+        self.cli.run()
+        mock_load.assert_not_called()
+        self.assertEqual(mock_server.call_args.kwargs['port'], 9000)
+        mock_server.return_value.serve_forever.assert_called_once()
+    
+    @patch('cli.AsyncAnalysisServer')
+    @patch('cli.AnalysisServer')
+    @patch('cli.CLI.load_dataset')
+    @patch('sys.argv', ['cli.py', '--serve', '--async', '--executor', 'process', '--workers', '2', '--max-pending', '8'])
+    def test_run_serve_async(self, mock_load, mock_server, mock_async):
+        """Test --serve --async wraps the analysis server in the asyncio front end"""
+        mock_async.return_value.serve_forever.return_value = True
+        
+        self.cli.run()
+        mock_load.assert_not_called()
+        mock_async.assert_called_once_with(mock_server.return_value, executor='process', workers=2, max_pending=8)
+        mock_async.return_value.serve_forever.assert_called_once()
+        mock_server.return_value.serve_forever.assert_not_called()
+    
+    @patch('cli.CLI.watch_file')
+    @patch('cli.CLI.load_dataset')
+    @patch('sys.argv', ['cli.py', '--watch', '--interval', '0.5', '--authors'])
+    def test_run_watch(self, mock_load, mock_watch):
+        """Test --watch follows the file instead of loading it once"""
+        mock_watch.return_value = True
+        
+        self.cli.run()
+        mock_load.assert_not_called()
+        mock_watch.assert_called_once_with('Dataset_Books.csv', ['authors'], 0.5)
+    
+    def test_watch_file_renders_changes(self):
+        """Test watch_file renders the initial results of a file"""
+        with patch('cli.TerminalRenderer') as mock_renderer, patch('builtins.print'):
+            dataset_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Dataset_Books.csv')
+            self.assertTrue(self.cli.watch_file(dataset_path, ['authors'], 0, max_polls=2))
+        mock_renderer.return_value.visualize_top_authors.assert_called_once()
+        
+        with patch('builtins.print'):
+            self.assertFalse(self.cli.watch_file('missing.csv', ['authors'], 0))
+        
+        # Byte offsets are meaningless in a compressed file
+        with tempfile.NamedTemporaryFile(suffix='.csv.gz', delete=False) as f:
+            f.write(gzip.compress(b'authors\nAuthor A\n'))
+        try:
+            with patch('builtins.print'):
+                self.assertFalse(self.cli.watch_file(f.name, ['authors'], 0))
+        finally:
+            os.unlink(f.name)
+    
+    @patch('cli.CLI.load_dataset')
+    @patch('sys.argv', ['cli.py', '--authors', '--terminal', '--profile'])
+    def test_run_profile(self, mock_load):
+        """Test --profile times the analysis and chart and prints the breakdown"""
+        mock_load.return_value = pd.DataFrame({'authors': ['Author A', 'Author B', 'Author A']})
+        
+        with patch('builtins.print') as mock_print, patch('sys.stdout'):
+            self.cli.run()
+        self.assertEqual(list(self.cli.profiler.records),
+                         ['Analyzer.analyze_top_authors', 'TerminalRenderer.visualize_top_authors'])
+        printed = ' '.join(str(call.args[0]) for call in mock_print.call_args_list if call.args)
+        self.assertIn('Stage: analyze', printed)
+    
+    @patch('cli.CLI.load_dataset')
+    def test_run_metrics_file(self, mock_load):
+        """Test --metrics-file writes OpenMetrics without printing the profile"""
+        mock_load.return_value = pd.DataFrame({'authors': ['Author A', 'Author B', 'Author A']})
+        temp_dir = tempfile.mkdtemp()
+        metrics_path = os.path.join(temp_dir, 'run.prom')
+        
+        try:
+            with patch('sys.argv', ['cli.py', '--authors', '--output', 'json', '--metrics-file', metrics_path]), \
+                 patch('sys.stdout'), patch('sys.stderr') as mock_stderr:
+                self.cli.run()
+            with open(metrics_path) as f:
+                metrics = f.read()
+        finally:
+            if os.path.exists(metrics_path):
+                os.unlink(metrics_path)
+            os.rmdir(temp_dir)
+        
+        mock_stderr.write.assert_not_called()
+        self.assertIn('bookshop_analysis_duration_seconds{file="Dataset_Books.csv",analysis="authors"}', metrics)
+        self.assertIn('bookshop_rows_parsed{file="Dataset_Books.csv"} 3', metrics)
+        self.assertTrue(metrics.endswith('# EOF\n'))
+    
+    @patch('cli.Sampler')
+    @patch('cli.CLI.load_dataset')
+    @patch('sys.argv', ['cli.py', '--languages', '--output', 'json', '--sample-rows', '2', '--seed', '3'])
+    def test_run_sample(self, mock_load, mock_sampler):
+        """Test --sample-rows loads a sample and scales results with the sampled analyzer"""
+        sample = pd.DataFrame({'language_code': ['en', 'fr']})
+        mock_sampler.return_value.load.return_value = (sample, 10)
+        
+        with patch('sys.stdout') as mock_stdout:
+            self.cli.run()
+        mock_load.assert_not_called()
+        mock_sampler.assert_called_once_with(seed=3)
+        mock_sampler.return_value.load.assert_called_once_with('Dataset_Books.csv', fraction=None, rows=2)
+        output = ''.join(call.args[0] for call in mock_stdout.write.call_args_list)
+        result = json.loads(output)['languages']
+        self.assertEqual(result['lang_counts'], {'en': 5, 'fr': 5})
+        self.assertEqual(result['sample']['total_rows'], 10)
+    
+    @patch('cli.CLI.compare_files')
+    @patch('cli.CLI.load_dataset')
+    @patch('sys.argv', ['cli.py', '--compare', 'a.csv', 'b.csv', '--workers', '2'])
+    def test_run_compare(self, mock_load, mock_compare):
+        """Test --compare analyzes the listed files instead of loading --file"""
+        mock_compare.return_value = True
+        
+        self.cli.run()
+        mock_load.assert_not_called()
+        mock_compare.assert_called_once_with(['a.csv', 'b.csv'], ['trends', 'authors', 'languages', 'publishers',
+                                                                   'isbn', 'year-language'], 2)
+    
+    def test_compare_files_needs_two(self):
+        """Test --compare with a single file is rejected"""
+        with patch('builtins.print'):
+            self.assertFalse(self.cli.compare_files(['a.csv'], ['authors'], 2))
+    
+    @patch('cli.CLI.analyze_partitions')
+    @patch('cli.CLI.load_dataset')
+    @patch('sys.argv', ['cli.py', '--file', 'exports/*.csv', '--languages', '--workers', '3'])
+    def test_run_partitioned_file(self, mock_load, mock_partitions):
+        """Test a glob --file is aggregated per partition instead of loaded as one file"""
+        mock_partitions.return_value = True
+        
+        self.cli.run()
+        mock_load.assert_not_called()
+        mock_partitions.assert_called_once_with('exports/*.csv', ['languages'], 3)
+    
+    @patch('cli.CLI.load_dataset')
+    def test_run_db(self, mock_load):
+        """Test --db ingests once, then answers from SQL without loading the CSV, and refuses another CSV"""
+        temp_dir = tempfile.mkdtemp()
+        db_path = os.path.join(temp_dir, 'catalog.sqlite')
+        csv_path = os.path.join(temp_dir, 'books.csv')
+        pd.DataFrame({'title': ['Garden Paths', 'Winter Light', 'Garden Walls'],
+                      'authors': ['Author A', 'Author B', 'Author A']}).to_csv(csv_path, index=False)
+        
+        try:
+            with patch('sys.argv', ['cli.py', '--db', db_path, '--file', csv_path, '--authors', '-o', 'json']), \
+                 patch('sys.stdout') as mock_stdout:
+                self.cli.run()
+            output = ''.join(call.args[0] for call in mock_stdout.write.call_args_list)
+            self.assertEqual(json.loads(output)['authors']['author_counts'], {'Author A': 2, 'Author B': 1})
+            
+            cli = CLI()
+            with patch('sys.argv', ['cli.py', '--db', db_path, '--file', csv_path, '--search', 'garden']), \
+                 patch('builtins.print') as mock_print:
+                cli.run()
+            self.assertIn('Garden Walls', mock_print.call_args.args[0])
+            mock_load.assert_not_called()
+            
+            # A catalog of another CSV is refused until --ingest replaces it
+            other_path = os.path.join(temp_dir, 'other.csv')
+            pd.DataFrame({'title': ['Summer Roads'], 'authors': ['Author C']}).to_csv(other_path, index=False)
+            with patch('sys.argv', ['cli.py', '--db', db_path, '--file', other_path, '--authors']), \
+                 patch('builtins.print') as mock_print, self.assertRaises(SystemExit):
+                CLI().run()
+            self.assertIn('--ingest', mock_print.call_args.args[0])
+            with patch('sys.argv', ['cli.py', '--db', db_path, '--file', other_path, '--ingest',
+                                    '--authors', '-o', 'json']), \
+                 patch('sys.stdout') as mock_stdout:
+                CLI().run()
+            output = ''.join(call.args[0] for call in mock_stdout.write.call_args_list)
+            self.assertEqual(json.loads(output)['authors']['author_counts'], {'Author C': 1})
+        finally:
+            shutil.rmtree(temp_dir)
+    
+    @patch('cli.CLI.load_dataset')
+    def test_run_polars_engine(self, mock_load):
+        """Test --engine polars answers without the pandas loader, with the same results"""
+        temp_dir = tempfile.mkdtemp()
+        csv_path = os.path.join(temp_dir, 'books.csv')
+        pd.DataFrame({'authors': ['Author A', 'Author B', 'Author A'],
+                      'language_code': ['eng', 'fre', None]}).to_csv(csv_path, index=False)
+        
+        try:
+            with patch('sys.argv', ['cli.py', '--file', csv_path, '--engine', 'polars', '--all', '-o', 'json']), \
+                 patch('sys.stdout') as mock_stdout:
+                self.cli.run()
+            output = json.loads(''.join(call.args[0] for call in mock_stdout.write.call_args_list))
+            mock_load.assert_not_called()
+            self.assertEqual(output['authors']['author_counts'], {'Author A': 2, 'Author B': 1})
+            self.assertEqual(output['languages']['lang_counts'], {'eng': 1, 'fre': 1})
+            self.assertIn('Publication date column not found', output['trends']['error'])
+            
+            with patch('sys.argv', ['cli.py', '--file', csv_path, '--engine', 'polars', '--sample', '0.5']), \
+                 patch('builtins.print'):
+                with self.assertRaises(SystemExit):
+                    CLI().run()
+        finally:
+            shutil.rmtree(temp_dir)
+    
+    def test_sql_query(self):
+        """Test --sql prints or writes the query result, and rejects invalid SQL"""
+        temp_dir = tempfile.mkdtemp()
+        csv_path = os.path.join(temp_dir, 'books.csv')
+        pd.DataFrame({'authors': ['Author A', 'Author B', 'Author A'],
+                      'language_code': ['eng', 'fre', None]}).to_csv(csv_path, index=False)
+        query = 'SELECT authors, COUNT(*) AS books FROM books GROUP BY 1 ORDER BY 2 DESC'
+        
+        cwd = os.getcwd()
+        os.chdir(temp_dir)  # the Parquet cache goes to the working directory
+        try:
+            with patch('sys.argv', ['cli.py', '--file', csv_path, '--sql', query, '-o', 'json']), \
+                 patch('sys.stdout') as mock_stdout:
+                self.cli.run()
+            output = json.loads(''.join(call.args[0] for call in mock_stdout.write.call_args_list))
+            self.assertEqual(output['sql']['rows'], {'0': {'authors': 'Author A', 'books': 2},
+                                                     '1': {'authors': 'Author B', 'books': 1}})
+            
+            with patch('sys.argv', ['cli.py', '--file', csv_path, '--sql', query]), \
+                 patch('builtins.print') as mock_print:
+                CLI().run()
+            self.assertIn('Author A', mock_print.call_args.args[0])
+            
+            with patch('sys.argv', ['cli.py', '--file', csv_path, '--sql', 'SELEC 1']), \
+                 patch('builtins.print') as mock_print:
+                with self.assertRaises(SystemExit):
+                    CLI().run()
+            self.assertIn('Invalid SQL query', mock_print.call_args.args[0])
+        finally:
+            os.chdir(cwd)
+            shutil.rmtree(temp_dir)
+    
+    def test_filters_apply_to_every_analysis(self):
+        """Test --years, --language and --publisher narrow the rows every analysis sees"""
+        temp_dir = tempfile.mkdtemp()
+        csv_path = os.path.join(temp_dir, 'books.csv')
+        pd.DataFrame({'authors': ['Author A', 'Author B', 'Author A', 'Author C'] * 5,
+                      'publication_date': [2009, 2012, 2015, 2021] * 5,
+                      'language_code': ['German', 'French', 'German', 'English'] * 5,
+                      'publisher': ['Pub X', 'Pub Y', 'Pub Y', 'Pub X'] * 5}).to_csv(csv_path, index=False)
+        try:
+            with patch('sys.argv', ['cli.py', '--file', csv_path, '--all', '-o', 'json', '--years', '2010-2020',
+                                    '--language', 'German,French', '--publisher', 'Pub Y']), \
+                 patch('sys.stdout') as mock_stdout:
+                self.cli.run()
+            output = json.loads(''.join(call.args[0] for call in mock_stdout.write.call_args_list))
+            self.assertEqual(output['trends']['year_counts'], {'2012': 5, '2015': 5})
+            self.assertEqual(output['authors']['author_counts'], {'Author B': 5, 'Author A': 5})
+            self.assertEqual(output['languages']['total_books'], 10)
+            self.assertEqual(output['publishers']['total_publishers'], 1)
+            
+            with patch('sys.argv', ['cli.py', '--file', csv_path, '--trends', '--years', '2020-2010']), \
+                 patch('builtins.print') as mock_print:
+                with self.assertRaises(SystemExit):
+                    CLI().run()
+            self.assertIn('invalid year range', mock_print.call_args.args[0])
+            
+            with patch('sys.argv', ['cli.py', '--file', csv_path, '--trends', '--years', '2010-2020',
+                                    '--engine', 'polars']), \
+                 patch('builtins.print') as mock_print:
+                with self.assertRaises(SystemExit):
+                    CLI().run()
+            self.assertIn('cannot be combined with --engine', mock_print.call_args.args[0])
+            
+            with patch('sys.argv', ['cli.py', '--file', csv_path, '--trends', '--years', '2010-2020',
+                                    '--db', os.path.join(temp_dir, 'catalog.db')]), \
+                 patch('builtins.print') as mock_print:
+                with self.assertRaises(SystemExit):
+                    CLI().run()
+            self.assertIn('cannot be combined with --db', mock_print.call_args.args[0])
+            
+            # Sampled estimates are scaled to the whole file, so they cannot describe a filtered slice
+            with patch('sys.argv', ['cli.py', '--file', csv_path, '--isbn', '-o', 'json', '--sample', '0.5',
+                                    '--years', '2020-2020']), \
+                 patch('builtins.print') as mock_print:
+                with self.assertRaises(SystemExit):
+                    CLI().run()
+            self.assertIn('cannot be combined with --sample', mock_print.call_args.args[0])
+            
+            # The server answers every request from the whole file, so it cannot apply a filter
+            with patch('sys.argv', ['cli.py', '--file', csv_path, '--serve', '--years', '2000-2010']), \
+                 patch('cli.AnalysisServer') as mock_server, patch('builtins.print') as mock_print:
+                with self.assertRaises(SystemExit):
+                    CLI().run()
+            mock_server.assert_not_called()
+            self.assertIn('cannot be combined with --serve', mock_print.call_args.args[0])
+        finally:
+            shutil.rmtree(temp_dir)
+    
+    def test_top_and_offset_page_through_rankings(self):
+        """Test --top and --offset choose which authors and publishers are listed"""
+        temp_dir = tempfile.mkdtemp()
+        csv_path = os.path.join(temp_dir, 'books.csv')
+        pd.DataFrame({'authors': [f'Author {i}' for i in range(6) for _ in range(6 - i)],
+                      'publisher': [f'Pub {i % 4}' for i in range(21)]}).to_csv(csv_path, index=False)
+        try:
+            with patch('sys.argv', ['cli.py', '--file', csv_path, '--authors', '--publishers', '-o', 'json',
+                                    '--top', '2', '--offset', '1']), \
+                 patch('sys.stdout') as mock_stdout:
+                self.cli.run()
+            output = json.loads(''.join(call.args[0] for call in mock_stdout.write.call_args_list))
+            self.assertEqual(output['authors']['author_counts'], {'Author 1': 5, 'Author 2': 4})
+            self.assertEqual(output['publishers']['publisher_counts'], {'Pub 1': 5, 'Pub 2': 5})
+            self.assertEqual(output['publishers']['offset'], 1)
+            
+            with patch('sys.argv', ['cli.py', '--file', csv_path, '--authors', '-T', '--top', '2', '--offset', '2']), \
+                 patch('builtins.print') as mock_print:
+                CLI().run()
+            printed = '\n'.join(str(call.args[0]) for call in mock_print.call_args_list if call.args)
+            self.assertIn('MOST PROLIFIC AUTHORS, RANKS 3-4', printed)
+            
+            with patch('sys.argv', ['cli.py', '--file', csv_path, '--authors', '--top', '0']), \
+                 patch('builtins.print') as mock_print:
+                with self.assertRaises(SystemExit):
+                    CLI().run()
+            self.assertIn('--top must be at least 1', mock_print.call_args.args[0])
+            
+            with patch('sys.argv', ['cli.py', '--file', csv_path, '--serve', '--top', '3']), \
+                 patch('cli.AnalysisServer') as mock_server, patch('builtins.print') as mock_print:
+                with self.assertRaises(SystemExit):
+                    CLI().run()
+            mock_server.assert_not_called()
+            self.assertIn('not to --serve', mock_print.call_args.args[0])
+            
+            # The menu, also reached when no analysis is named, would ignore them
+            for flags in (['--menu', '--authors'], []):
+                cli = CLI()
+                with patch('sys.argv', ['cli.py', '--file', csv_path, '--top', '3'] + flags), \
+                     patch.object(cli.main_app, 'show_menu') as mock_menu, patch('builtins.print') as mock_print:
+                    with self.assertRaises(SystemExit):
+                        cli.run()
+                mock_menu.assert_not_called()
+                self.assertIn('or the menu', mock_print.call_args.args[0])
+        finally:
+            shutil.rmtree(temp_dir)
 
 def run_single_test():
     """Run this test file individually with detailed output"""
@@ -0,0 +1,144 @@
+import unittest
+import os
+import shutil
+import tempfile
+import pandas as pd
+import sys
+sys.path.append('..')
+from comparison import DatasetComparison, load_cached, analyze_file
+
+class TestDatasetComparison(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, 'cache')
+        self.old_path = os.path.join(self.temp_dir, 'old.csv')
+        self.new_path = os.path.join(self.temp_dir, 'new.csv')
+        pd.DataFrame({
+            'authors': ['Author A', 'Author A', 'Author B', 'Author C'],
+            'publication_date': [2019, 2020, 2020, 2020],
+            'language_code': ['en', 'en', 'fr', 'en'],
+            'publisher': ['Pub X', 'Pub X', 'Pub Y', 'Pub Y'],
+            'isbn': ['1', None, '3', '4']
+        }).to_csv(self.old_path, index=False)
+        pd.DataFrame({
+            'authors': ['Author A', 'Author B', 'Author B', 'Author B', 'Author D'],
+            'publication_date': [2020, 2020, 2021, 2021, 2021],
+            'language_code': ['en', 'fr', 'fr', 'de', 'en'],
+            'publisher': ['Pub X', 'Pub Y', 'Pub Y', 'Pub Z', 'Pub Z'],
+            'isbn': ['1', '2', '3', '4', '5']
+        }).to_csv(self.new_path, index=False)
+        self.comparison = DatasetComparison(cache_dir=self.cache_dir, workers=2)
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        shutil.rmtree(self.temp_dir)
+    
+    def test_parse_cache(self):
+        """Test a parsed file is reused until the file changes"""
+        df, from_cache = load_cached(self.old_path, self.cache_dir)
+        self.assertFalse(from_cache)
+        cached, from_cache = load_cached(self.old_path, self.cache_dir)
+        self.assertTrue(from_cache)
+        pd.testing.assert_frame_equal(df, cached)
+        
+        with open(self.old_path, 'a') as f:
+            f.write('Author E,2021,en,Pub X,9\n')
+        df, from_cache = load_cached(self.old_path, self.cache_dir)
+        self.assertFalse(from_cache)
+        self.assertEqual(len(df), 5)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+    
+    def test_run_in_processes(self):
+        """Test every file is analyzed and results come back in input order"""
+        results = self.comparison.run([self.old_path, self.new_path])
+        self.assertEqual([result['file'] for result in results], [self.old_path, self.new_path])
+        self.assertEqual([result['rows'] for result in results], [4, 5])
+        self.assertEqual(set(results[0]['results']), {'trends', 'authors', 'languages', 'publishers', 'isbn'})
+        
+        # Second run is served from the shared parse cache
+        self.assertTrue(all(result['from_cache'] for result in self.comparison.run([self.old_path, self.new_path])))
+    
+    def test_trend_and_language_deltas(self):
+        """Test year counts and language shares are compared with deltas against the first file"""
+        results = [analyze_file(path, ['trends', 'languages'], None) for path in (self.old_path, self.new_path)]
+        
+        trends, error = self.comparison.compare(results, 'trends')
+        self.assertIsNone(error)
+        self.assertEqual(list(trends.columns), ['old.csv', 'new.csv', 'delta new.csv'])
+        self.assertEqual(trends.loc[2019].tolist(), [1, 0, -1])
+        self.assertEqual(trends.loc[2021].tolist(), [0, 3, 3])
+        
+        languages, _ = self.comparison.compare(results, 'languages')
+        self.assertEqual(languages.loc['de'].tolist(), [0.0, 20.0, 20.0])
+        self.assertEqual(languages.loc['en', 'delta new.csv'], -35.0)
+    
+    def test_top_lists_and_isbn(self):
+        """Test top authors union and ISBN completeness deltas"""
+        results = [analyze_file(path, ['authors', 'isbn'], None) for path in (self.old_path, self.new_path)]
+        
+        authors, _ = self.comparison.compare(results, 'authors')
+        self.assertEqual(authors.index[0], 'Author B')
+        self.assertEqual(authors.loc['Author B'].tolist(), [1, 3, 2])
+        self.assertTrue(pd.isna(authors.loc['Author C', 'new.csv']))
+        
+        isbn, _ = self.comparison.compare(results, 'isbn')
+        self.assertEqual(isbn.loc['isbn complete %'].tolist(), [75.0, 100.0, 25.0])
+    
+    def test_missing_file_and_unsupported_analysis(self):
+        """Test load failures are reported per file and year-language has no comparison"""
+        results = self.comparison.run([self.old_path, os.path.join(self.temp_dir, 'missing.csv')], ['authors'])
+        self.assertIn('error', results[1])
+        table, error = self.comparison.compare(results, 'authors')
+        self.assertEqual(list(table.columns), ['old.csv'])
+        self.assertIsNotNone(self.comparison.compare(results, 'year-language')[1])
+    
+    def test_labels_disambiguate_same_names(self):
+        """Test files with the same base name are labelled by full path"""
+        self.assertEqual(self.comparison.labels(['a/x.csv', 'b/x.csv']), ['a/x.csv', 'b/x.csv'])
+        self.assertEqual(self.comparison.labels(['a/x.csv', 'b/y.csv']), ['x.csv', 'y.csv'])
+
+def run_single_test():
+    """Run this test file individually with detailed output"""
+    print("=" * 70)
+    print("                 TESTING DATASET COMPARISON CLASS")
+    print("=" * 70)
+    
+    # Create test suite
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestDatasetComparison)
+    
+    # Run tests with detailed output
+    runner = unittest.TextTestRunner(
+        verbosity=2,
+        stream=sys.stdout,
+        buffer=True
+    )
+    
+    result = runner.run(suite)
+    
+    # Print summary
+    print("\n" + "=" * 50)
+    print("              TEST SUMMARY")
+    print("=" * 50)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    
+    if result.wasSuccessful():
+        print("✅ ALL TESTS PASSED!")
+    else:
+        print("❌ SOME TESTS FAILED!")
+        if result.failures:
+            print(f"\nFailures ({len(result.failures)}):")
+            for test, traceback in result.failures:
+                print(f"  - {test}")
+        if result.errors:
+            print(f"\nErrors ({len(result.errors)}):")
+            for test, traceback in result.errors:
+                print(f"  - {test}")
+    
+    print("=" * 50)
+    return result.wasSuccessful()
+
+if __name__ == '__main__':
+    run_single_test()
@@ -0,0 +1,151 @@
+import unittest
+from unittest.mock import patch
+import bz2
+import gzip
+import lzma
+import os
+import shutil
+import tempfile
+import pandas as pd
+import sys
+sys.path.append('..')
+from compression import detect_compression, open_decompressed, iter_zstd_frames, zstandard
+from dataLoader import DataLoader
+from partitions import PartitionedDataset
+
+class TestCompression(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.df = pd.DataFrame({
+            'authors': [f'Author {i % 13}' for i in range(3000)],
+            'publication_date': [2000 + i % 20 for i in range(3000)],
+            'language_code': ['en', 'fr', 'de'] * 1000,
+            'isbn': [str(i) if i % 4 else None for i in range(3000)]
+        })
+        self.plain_path = os.path.join(self.temp_dir, 'books.csv')
+        self.df.to_csv(self.plain_path, index=False)
+        with open(self.plain_path, 'rb') as f:
+            self.data = f.read()
+        self.expected = pd.read_csv(self.plain_path)
+        # load() interns repetitive text columns; load_chunks() leaves chunks as parsed
+        self.interned = DataLoader().intern(pd.read_csv(self.plain_path))
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        shutil.rmtree(self.temp_dir)
+    
+    def write(self, name, payload):
+        """Write bytes to a file in the temporary directory"""
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'wb') as f:
+            f.write(payload)
+        return path
+    
+    def compressed_files(self):
+        """The test data in every supported format, under misleading names so only magic bytes can tell"""
+        files = {
+            'gzip': self.write('gzip.csv', gzip.compress(self.data)),
+            'bz2': self.write('bz2.csv', bz2.compress(self.data)),
+            'xz': self.write('xz.csv', lzma.compress(self.data))
+        }
+        if zstandard is not None:
+            files['zstd'] = self.write('zstd.csv', zstandard.ZstdCompressor().compress(self.data))
+        return files
+    
+    def test_detect_by_magic_bytes(self):
+        """Test compression is detected from content, not file extension"""
+        self.assertIsNone(detect_compression(self.plain_path))
+        self.assertIsNone(open_decompressed(self.plain_path))
+        for name, path in self.compressed_files().items():
+            self.assertEqual(detect_compression(path), name)
+    
+    def test_load_compressed(self):
+        """Test DataLoader.load and load_chunks stream every format into the parser"""
+        loader = DataLoader()
+        for name, path in self.compressed_files().items():
+            pd.testing.assert_frame_equal(loader.load(path), self.interned, obj=name)
+            chunks = list(loader.load_chunks(path, chunk_rows=700))
+            self.assertEqual([len(chunk) for chunk in chunks], [700, 700, 700, 700, 200])
+            pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), self.expected, obj=name)
+    
+    def test_corrupt_compressed_file(self):
+        """Test a truncated archive is reported instead of raising"""
+        path = self.write('broken.csv.gz', gzip.compress(self.data)[:200])
+        with patch('builtins.print') as mock_print:
+            self.assertIsNone(DataLoader().load(path))
+            self.assertEqual(list(DataLoader().load_chunks(path)), [])
+        self.assertTrue(all('Error' in call.args[0] for call in mock_print.call_args_list))
+    
+    @unittest.skipIf(zstandard is None, "zstandard is not installed")
+    def test_parallel_zstd_frames(self):
+        """Test multi-frame zstd files are split into frames and decoded in parallel, in order"""
+        compressor = zstandard.ZstdCompressor(write_checksum=True)
+        frames = [compressor.compress(self.data[start:start + 10000]) for start in range(0, len(self.data), 10000)]
+        # A skippable metadata frame between data frames must be ignored
+        skippable = (0x184D2A50).to_bytes(4, 'little') + (3).to_bytes(4, 'little') + b'abc'
+        path = self.write('frames.csv.zst', b''.join(frames[:2]) + skippable + b''.join(frames[2:]))
+        
+        with open(path, 'rb') as f:
+            self.assertEqual(list(iter_zstd_frames(f)), frames)
+        with open_decompressed(path, threads=4) as stream:
+            self.assertEqual(stream.read(), self.data)
+        pd.testing.assert_frame_equal(DataLoader(decompress_threads=4).load(path), self.interned)
+        pd.testing.assert_frame_equal(DataLoader(decompress_threads=1).load(path), self.interned)
+    
+    def test_compressed_partitions(self):
+        """Test directories of compressed shards are picked up by the partitioned loader"""
+        shard_dir = os.path.join(self.temp_dir, 'shards')
+        os.makedirs(shard_dir)
+        half = len(self.df) // 2
+        self.df.iloc[:half].to_csv(os.path.join(shard_dir, 'part-0.csv.gz'), index=False, compression='gzip')
+        self.df.iloc[half:].to_csv(os.path.join(shard_dir, 'part-1.csv.xz'), index=False, compression='xz')
+        
+        aggregates = PartitionedDataset(shard_dir, workers=2).aggregate()
+        self.assertEqual(aggregates.total_rows, len(self.df))
+        self.assertEqual(aggregates.lang_counts['fr'], 1000)
+
+def run_single_test():
+    """Run this test file individually with detailed output"""
+    print("=" * 70)
+    print("                     TESTING COMPRESSED INPUT")
+    print("=" * 70)
+    
+    # Create test suite
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestCompression)
+    
+    # Run tests with detailed output
+    runner = unittest.TextTestRunner(
+        verbosity=2,
+        stream=sys.stdout,
+        buffer=True
+    )
+    
+    result = runner.run(suite)
+    
+    # Print summary
+    print("\n" + "=" * 50)
+    print("              TEST SUMMARY")
+    print("=" * 50)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    
+    if result.wasSuccessful():
+        print("✅ ALL TESTS PASSED!")
+    else:
+        print("❌ SOME TESTS FAILED!")
+        if result.failures:
+            print(f"\nFailures ({len(result.failures)}):")
+            for test, traceback in result.failures:
+                print(f"  - {test}")
+        if result.errors:
+            print(f"\nErrors ({len(result.errors)}):")
+            for test, traceback in result.errors:
+                print(f"  - {test}")
+    
+    print("=" * 50)
+    return result.wasSuccessful()
+
+if __name__ == '__main__':
+    run_single_test()
@@ -0,0 +1,200 @@
+import unittest
+import json
+import os
+import tempfile
+from unittest.mock import patch
+import pandas as pd
+import sys
+sys.path.append('..')
+from analyzer import Analyzer, ANALYSIS_METHODS
+from csvWatcher import CsvWatcher, RunningAggregates
+from outputWriter import OutputWriter
+
+class TestCsvWatcher(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False)
+        self.temp_file.close()
+        self.rows = pd.DataFrame({
+            'authors': ['Author A', 'Author B', 'Author A', 'Author C', 'Author B', 'Author A'],
+            'publication_date': [2019, 2020, 2020, 1700, 2021, 2021],
+            'language_code': ['en', 'fr', 'en', 'de', None, 'en'],
+            'publisher': ['Pub X', 'Pub Y', 'Pub X', 'Pub Z', 'Pub Y', None],
+            'isbn': ['111', None, '333', None, '555', '666']
+        })
+        self.serializer = OutputWriter('json')
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        if os.path.exists(self.temp_file.name):
+            os.unlink(self.temp_file.name)
+    
+    def write_rows(self, rows, header=True, mode='w'):
+        """Write (or append) rows to the temporary CSV"""
+        rows.to_csv(self.temp_file.name, index=False, header=header, mode=mode)
+    
+    def serialized(self, analysis_data):
+        """Comparable JSON form of analysis_data"""
+        return json.dumps(self.serializer.to_serializable(analysis_data), sort_keys=True, default=str)
+    
+    def assert_matches_analyzer(self, watcher):
+        """Every incremental result equals the Analyzer run on the whole file"""
+        df = pd.read_csv(self.temp_file.name)
+        analyzer = Analyzer()
+        for analysis_type, method_name in ANALYSIS_METHODS.items():
+            expected, expected_error = getattr(analyzer, method_name)(df)
+            actual, error = watcher.aggregates.analysis_data(analysis_type)
+            self.assertEqual(error, expected_error, analysis_type)
+            self.assertEqual(self.serialized(actual), self.serialized(expected), analysis_type)
+    
+    def test_incremental_results_match_full_analysis(self):
+        """Test appended rows update every analysis to the full-file result"""
+        self.write_rows(self.rows.head(3))
+        watcher = CsvWatcher(self.temp_file.name)
+        self.assertEqual(len(watcher.poll()), len(ANALYSIS_METHODS))
+        self.assert_matches_analyzer(watcher)
+        
+        self.write_rows(self.rows.tail(3), header=False, mode='a')
+        watcher.poll()
+        self.assertEqual(watcher.aggregates.total_rows, 6)
+        self.assert_matches_analyzer(watcher)
+    
+    def test_only_changed_results_are_returned(self):
+        """Test a poll reports only analyses whose results changed"""
+        self.write_rows(self.rows.head(3))
+        watcher = CsvWatcher(self.temp_file.name, analysis_types=['trends', 'authors'])
+        watcher.poll()
+        self.assertEqual(watcher.poll(), [])
+        
+        # Row 4 has an out-of-range year, so only the author counts change
+        self.write_rows(self.rows.iloc[[3]], header=False, mode='a')
+        changed = watcher.poll()
+        self.assertEqual([analysis_type for analysis_type, _, _ in changed], ['authors'])
+        self.assertEqual(changed[0][1]['author_counts']['Author C'], 1)
+    
+    def test_partial_line_waits_for_newline(self):
+        """Test a row without its trailing newline is not parsed until completed"""
+        self.write_rows(self.rows.head(2))
+        watcher = CsvWatcher(self.temp_file.name)
+        watcher.poll()
+        
+        with open(self.temp_file.name, 'a') as f:
+            f.write('Author D,2022,en,Pub W,')
+        self.assertEqual(watcher.poll(), [])
+        self.assertEqual(watcher.aggregates.total_rows, 2)
+        
+        with open(self.temp_file.name, 'a') as f:
+            f.write('999\n')
+        watcher.poll()
+        self.assertEqual(watcher.aggregates.total_rows, 3)
+        self.assertEqual(watcher.aggregates.author_counts['Author D'], 1)
+    
+    def test_quoted_newline_split_across_polls(self):
+        """Test a quoted field containing a newline is not cut at a read boundary"""
+        self.write_rows(self.rows.head(2))
+        watcher = CsvWatcher(self.temp_file.name)
+        watcher.poll()
+        
+        with open(self.temp_file.name, 'a') as f:
+            f.write('"Author D ""the elder""\nand Author E",2022,en,"Pub W\n')
+        self.assertEqual(watcher.poll(), [])
+        self.assertEqual(watcher.aggregates.total_rows, 2)
+        
+        with open(self.temp_file.name, 'a') as f:
+            f.write('Press",999\nAuthor F,2023,fr,Pub V,888\n')
+        watcher.poll()
+        self.assertEqual(watcher.aggregates.total_rows, 4)
+        self.assertEqual(watcher.aggregates.author_counts['Author D "the elder"\nand Author E'], 1)
+        self.assertEqual(watcher.aggregates.author_counts['Author F'], 1)
+        self.assertEqual(watcher.record_end(b'a,"b\nc"\nd,"e\n'), 8)
+        self.assertEqual(watcher.record_end(b'"x\ny'), 0)
+    
+    def test_truncated_file_is_reread(self):
+        """Test a file that shrinks is read again from the start"""
+        self.write_rows(self.rows)
+        watcher = CsvWatcher(self.temp_file.name)
+        watcher.poll()
+        
+        self.write_rows(self.rows.head(2))
+        with patch('builtins.print'):
+            watcher.poll()
+        self.assertEqual(watcher.aggregates.total_rows, 2)
+        self.assert_matches_analyzer(watcher)
+    
+    def test_year_language_limited_to_first_rows(self):
+        """Test the year-language matrix stops growing after the first 1000 rows"""
+        aggregates = RunningAggregates()
+        aggregates.reset(list(self.rows.columns))
+        block = pd.concat([self.rows] * 200, ignore_index=True)
+        aggregates.update(block)
+        aggregates.update(block)
+        
+        expected, _ = Analyzer().analyze_books_per_year_by_language(pd.concat([block, block], ignore_index=True))
+        actual, _ = aggregates.analysis_data('year-language')
+        self.assertEqual(self.serialized(actual), self.serialized(expected))
+        self.assertEqual(aggregates.total_rows, 2400)
+    
+    def test_numbers_in_text_columns_across_chunks(self):
+        """Test a value parsed as a number in one chunk and as text in another is counted once"""
+        aggregates = RunningAggregates()
+        aggregates.reset(['authors', 'publisher'])
+        aggregates.update(pd.DataFrame({'authors': [1984, 1984], 'publisher': [7.0, None]}))
+        aggregates.update(pd.DataFrame({'authors': ['Orwell', '1984'], 'publisher': ['7', 'Penguin']}))
+        
+        authors, _ = aggregates.analysis_data('authors')
+        self.assertEqual(authors['author_counts'].to_dict(), {'1984': 3, 'Orwell': 1})
+        publishers, _ = aggregates.analysis_data('publishers')
+        self.assertEqual(publishers['publisher_counts'].to_dict(), {'7': 2, 'Penguin': 1})
+        self.assertEqual(publishers['total_publishers'], 2)
+    
+    def test_missing_columns(self):
+        """Test missing columns give the Analyzer's errors"""
+        self.write_rows(self.rows[['authors']])
+        watcher = CsvWatcher(self.temp_file.name)
+        watcher.poll()
+        self.assert_matches_analyzer(watcher)
+
+def run_single_test():
+    """Run this test file individually with detailed output"""
+    print("=" * 70)
+    print("                    TESTING CSV WATCHER CLASS")
+    print("=" * 70)
+    
+    # Create test suite
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestCsvWatcher)
+    
+    # Run tests with detailed output
+    runner = unittest.TextTestRunner(
+        verbosity=2,
+        stream=sys.stdout,
+        buffer=True
+    )
+    
+    result = runner.run(suite)
+    
+    # Print summary
+    print("\n" + "=" * 50)
+    print("              TEST SUMMARY")
+    print("=" * 50)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    
+    if result.wasSuccessful():
+        print("✅ ALL TESTS PASSED!")
+    else:
+        print("❌ SOME TESTS FAILED!")
+        if result.failures:
+            print(f"\nFailures ({len(result.failures)}):")
+            for test, traceback in result.failures:
+                print(f"  - {test}")
+        if result.errors:
+            print(f"\nErrors ({len(result.errors)}):")
+            for test, traceback in result.errors:
+                print(f"  - {test}")
+    
+    print("=" * 50)
+    return result.wasSuccessful()
+
+if __name__ == '__main__':
+    run_single_test()
@@ -40,6 +40,28 @@ class TestDataLoader(unittest.TestCase):
         self.assertIn('title', result.columns)
         self.assertIn('authors', result.columns)
     
+    def test_load_interns_repetitive_text(self):
+        """Test repetitive text columns load as int32 codes into first-seen distinct values"""
+        path = self.temp_file.name
+        pd.DataFrame({
+            'title': [f'Book {i}' for i in range(300)],
+            'language_code': ['fr', 'en', None] * 100,
+            'publication_date': range(300)
+        }).to_csv(path, index=False)
+        
+        result = self.data_loader.load(path)
+        languages = result['language_code']
+        self.assertIsInstance(languages.dtype, pd.CategoricalDtype)
+        self.assertEqual(list(languages.cat.categories), ['fr', 'en'])
+        self.assertEqual(list(languages.cat.codes[:3]), [0, 1, -1])
+        # Unique titles gain nothing from a dictionary, and numbers are left alone
+        self.assertNotIsInstance(result['title'].dtype, pd.CategoricalDtype)
+        self.assertEqual(result['publication_date'].dtype, 'int64')
+        
+        plain = DataLoader(intern_text=False).load(path)
+        pd.testing.assert_frame_equal(result.astype({'language_code': plain['language_code'].dtype}), plain)
+        self.assertLess(result.memory_usage(deep=True).sum(), plain.memory_usage(deep=True).sum())
+    
     def test_load_nonexistent_file(self):
         """Test loading a non-existent file"""
         result = self.data_loader.load('nonexistent_file.csv')
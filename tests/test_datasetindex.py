@@ -0,0 +1,112 @@
+import unittest
+import numpy as np
+import pandas as pd
+import sys
+sys.path.append('..')
+from analyzer import Analyzer
+from dataLoader import DataLoader
+from datasetIndex import DatasetIndex, parse_year_range, parse_names
+
+class TestDatasetIndex(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.df = pd.DataFrame({
+            'title': [f'Book {i}' for i in range(200)],
+            'publication_date': ['2016-01-01', '2011-05-05', 'unknown', '2020-12-31', '2009-01-01'] * 40,
+            'language_code': ['German', 'French', 'German', None, 'English'] * 40,
+            'publisher': ['Pub X', 'Pub Y', 'Pub X', 'Pub Z', None] * 40
+        })
+    
+    def expected(self, df, years=None, languages=None, publishers=None):
+        """The same filter as full-frame boolean masks"""
+        mask = pd.Series(True, index=df.index)
+        if years is not None:
+            mask &= pd.to_numeric(Analyzer().extract_years(df['publication_date'])).between(*years)
+        if languages:
+            mask &= df['language_code'].isin(languages)
+        if publishers:
+            mask &= df['publisher'].isin(publishers)
+        return df[mask]
+    
+    def test_parse_filters(self):
+        """Test year ranges and name lists are parsed, and bad ranges rejected"""
+        self.assertEqual(parse_year_range('2010-2020'), (2010, 2020))
+        self.assertEqual(parse_year_range('2015'), (2015, 2015))
+        for text in ['2020-2010', 'recent', '2010-']:
+            with self.assertRaises(ValueError):
+                parse_year_range(text)
+        self.assertEqual(parse_names('German, French,'), ['German', 'French'])
+    
+    def test_select_matches_boolean_masks(self):
+        """Test indexed filters give the rows, in file order, that masks over the whole frame give"""
+        cases = [
+            {'years': (2010, 2020)},
+            {'years': (2016, 2016), 'languages': ['German']},
+            {'languages': ['German', 'French', 'Klingon'], 'publishers': ['Pub Y']},
+            {'years': (2000, 2100), 'publishers': ['Pub X', 'Pub Z']},
+            {'years': (1900, 1950)}
+        ]
+        for df in [self.df, DataLoader().intern(self.df.copy())]:
+            index = DatasetIndex(df)
+            for case in cases:
+                pd.testing.assert_frame_equal(index.select(**case), self.expected(df, **case), obj=str(case))
+            self.assertIs(index.select(), df)
+        
+        # Indexes are built once per column and reused by later filters
+        index = DatasetIndex(self.df)
+        index.select(languages=['German'])
+        positions = index.postings['language_code'][1]
+        index.select(languages=['French'])
+        self.assertIs(index.postings['language_code'][1], positions)
+        self.assertTrue(np.all(np.diff(index.year_index()[1][:120]) >= 0))
+    
+    def test_missing_filter_column(self):
+        """Test filtering on a column the dataset lacks raises ValueError"""
+        with self.assertRaises(ValueError) as context:
+            DatasetIndex(self.df.drop(columns=['publisher'])).select(publishers=['Pub X'])
+        self.assertIn('Publisher column not found', str(context.exception))
+
+def run_single_test():
+    """Run this test file individually with detailed output"""
+    print("=" * 70)
+    print("                   TESTING DATASET INDEX CLASS")
+    print("=" * 70)
+    
+    # Create test suite
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestDatasetIndex)
+    
+    # Run tests with detailed output
+    runner = unittest.TextTestRunner(
+        verbosity=2,
+        stream=sys.stdout,
+        buffer=True
+    )
+    
+    result = runner.run(suite)
+    
+    # Print summary
+    print("\n" + "=" * 50)
+    print("              TEST SUMMARY")
+    print("=" * 50)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    
+    if result.wasSuccessful():
+        print("✅ ALL TESTS PASSED!")
+    else:
+        print("❌ SOME TESTS FAILED!")
+        if result.failures:
+            print(f"\nFailures ({len(result.failures)}):")
+            for test, traceback in result.failures:
+                print(f"  - {test}")
+        if result.errors:
+            print(f"\nErrors ({len(result.errors)}):")
+            for test, traceback in result.errors:
+                print(f"  - {test}")
+    
+    print("=" * 50)
+    return result.wasSuccessful()
+
+if __name__ == '__main__':
+    run_single_test()
@@ -0,0 +1,88 @@
+import unittest
+from unittest.mock import patch
+import pandas as pd
+import sys
+sys.path.append('..')
+from differentialHarness import DifferentialHarness, ENGINES
+from catalogStore import SqlAnalyzer
+from analyzer import DATE_COLUMNS
+
+class TestDifferentialHarness(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.harness = DifferentialHarness(seed=7, max_rows=1200)
+    
+    def test_engines_match_reference(self):
+        """Test every engine agrees with the reference Analyzer on random catalogs"""
+        report = self.harness.run(12)
+        self.assertEqual(report['engines'], ENGINES)
+        self.assertEqual(report['mismatches'], [])
+        self.assertGreater(report['intervals'], 0)
+        self.assertTrue(self.harness.coverage_ok(report))
+    
+    def test_frames_are_repeatable_and_adversarial(self):
+        """Test a trial always builds the same frame, and frames hit the edge cases"""
+        pd.testing.assert_frame_equal(self.harness.frame(3), self.harness.frame(3))
+        
+        frames = [self.harness.frame(trial) for trial in range(30)]
+        current_year = pd.Timestamp.now().year
+        self.assertTrue(any((frame[col] == '').any() for frame in frames for col in frame.columns if 'isbn' in col.lower()))
+        self.assertTrue(any('authors' not in frame and 'author' not in frame and 'writer' not in frame
+                            and 'book_author' not in frame for frame in frames))
+        years = pd.concat([frame[col] for frame in frames for col in DATE_COLUMNS if col in frame
+                           and pd.api.types.is_numeric_dtype(frame[col])])
+        self.assertTrue({1799, 1800, current_year + 5, current_year + 6} <= set(years.dropna().astype(int)))
+    
+    def test_detects_divergent_engine(self):
+        """Test an engine with an off-by-one year window is reported"""
+        with patch.object(SqlAnalyzer, 'valid_year_bounds', lambda self: (1800, pd.Timestamp.now().year + 6)):
+            report = self.harness.run(4, ['sql'])
+        self.assertTrue(report['mismatches'])
+        self.assertEqual({item['engine'] for item in report['mismatches']}, {'sql'})
+        self.assertIn('trends', {item['analysis'] for item in report['mismatches']})
+        self.assertIsNone(report['interval_coverage'])
+
+def run_single_test():
+    """Run this test file individually with detailed output"""
+    print("=" * 70)
+    print("                TESTING DIFFERENTIAL HARNESS CLASS")
+    print("=" * 70)
+    
+    # Create test suite
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestDifferentialHarness)
+    
+    # Run tests with detailed output
+    runner = unittest.TextTestRunner(
+        verbosity=2,
+        stream=sys.stdout,
+        buffer=True
+    )
+    
+    result = runner.run(suite)
+    
+    # Print summary
+    print("\n" + "=" * 50)
+    print("              TEST SUMMARY")
+    print("=" * 50)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    
+    if result.wasSuccessful():
+        print("✅ ALL TESTS PASSED!")
+    else:
+        print("❌ SOME TESTS FAILED!")
+        if result.failures:
+            print(f"\nFailures ({len(result.failures)}):")
+            for test, traceback in result.failures:
+                print(f"  - {test}")
+        if result.errors:
+            print(f"\nErrors ({len(result.errors)}):")
+            for test, traceback in result.errors:
+                print(f"  - {test}")
+    
+    print("=" * 50)
+    return result.wasSuccessful()
+
+if __name__ == '__main__':
+    run_single_test()
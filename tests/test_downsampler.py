@@ -0,0 +1,119 @@
+import unittest
+import numpy as np
+import pandas as pd
+import sys
+sys.path.append('..')
+from downsampler import Downsampler
+
+class TestDownsampler(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.downsampler = Downsampler(max_points=100, max_ticks=10)
+        
+        # Two thousand years of counts with a single spike
+        self.years = np.arange(1, 2001)
+        self.counts = np.ones(2000)
+        self.counts[1234] = 500
+    
+    def test_lttb_reduces_to_threshold(self):
+        """Test LTTB returns exactly the requested number of points"""
+        x, y = self.downsampler.lttb(self.years, self.counts, 100)
+        self.assertEqual(len(x), 100)
+        self.assertEqual(x[0], 1)
+        self.assertEqual(x[-1], 2000)
+    
+    def test_lttb_keeps_spike(self):
+        """Test LTTB keeps the visually dominant point"""
+        x, y = self.downsampler.lttb(self.years, self.counts, 50)
+        self.assertIn(500, y)
+    
+    def test_lttb_short_series_untouched(self):
+        """Test LTTB leaves series shorter than the threshold alone"""
+        x, y = self.downsampler.lttb([1, 2, 3], [4, 5, 6], 100)
+        self.assertEqual(list(y), [4, 5, 6])
+    
+    def test_min_max_keeps_extremes(self):
+        """Test min/max decimation keeps the global maximum and minimum"""
+        x, y = self.downsampler.min_max(self.years, self.counts, 40)
+        self.assertLessEqual(len(x), 40)
+        self.assertIn(500, y)
+        self.assertTrue(np.all(np.diff(x) > 0))
+    
+    def test_bucket_decade(self):
+        """Test bucketing yearly counts into decades"""
+        counts = pd.Series({2001: 1, 2005: 2, 2010: 3, 2019: 4})
+        result = self.downsampler.bucket(counts, 'decade')
+        self.assertEqual(result[2000], 3)
+        self.assertEqual(result[2010], 7)
+    
+    def test_bucket_month(self):
+        """Test bucketing dated counts into months"""
+        index = pd.to_datetime(['2020-01-03', '2020-01-20', '2020-02-01'])
+        result = self.downsampler.bucket(pd.Series([1, 2, 3], index=index), 'month')
+        self.assertEqual(list(result.values), [3, 3])
+    
+    def test_choose_resolution(self):
+        """Test automatic resolution selection"""
+        short = pd.Series(1, index=range(2000, 2050))
+        long = pd.Series(1, index=self.years)
+        self.assertEqual(self.downsampler.choose_resolution(short), 'year')
+        self.assertEqual(self.downsampler.choose_resolution(long), 'decade')
+    
+    def test_thin_ticks(self):
+        """Test tick thinning keeps first and last tick"""
+        ticks = self.downsampler.thin_ticks(range(1000))
+        self.assertLessEqual(len(ticks), 10)
+        self.assertEqual(ticks[0], 0)
+        self.assertEqual(ticks[-1], 999)
+    
+    def test_prepare_bounded_by_budget(self):
+        """Test prepare never returns more points than the budget"""
+        counts = pd.Series(self.counts, index=self.years)
+        prepared = self.downsampler.prepare(counts, max_points=60)
+        self.assertLessEqual(len(prepared['x']), 60)
+        self.assertEqual(prepared['original_points'], 2000)
+
+def run_single_test():
+    """Run this test file individually with detailed output"""
+    print("=" * 70)
+    print("               TESTING DOWNSAMPLER CLASS")
+    print("=" * 70)
+    
+    # Create test suite
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestDownsampler)
+    
+    # Run tests with detailed output
+    runner = unittest.TextTestRunner(
+        verbosity=2,
+        stream=sys.stdout,
+        buffer=True
+    )
+    
+    result = runner.run(suite)
+    
+    # Print summary
+    print("\n" + "=" * 50)
+    print("              TEST SUMMARY")
+    print("=" * 50)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    
+    if result.wasSuccessful():
+        print("✅ ALL TESTS PASSED!")
+    else:
+        print("❌ SOME TESTS FAILED!")
+        if result.failures:
+            print(f"\nFailures ({len(result.failures)}):")
+            for test, traceback in result.failures:
+                print(f"  - {test}")
+        if result.errors:
+            print(f"\nErrors ({len(result.errors)}):")
+            for test, traceback in result.errors:
+                print(f"  - {test}")
+    
+    print("=" * 50)
+    return result.wasSuccessful()
+
+if __name__ == '__main__':
+    run_single_test()
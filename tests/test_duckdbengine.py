@@ -0,0 +1,136 @@
+import unittest
+import bz2
+import json
+import os
+import shutil
+import tempfile
+import pandas as pd
+import sys
+sys.path.append('..')
+from analyzer import Analyzer, ANALYSIS_METHODS
+from outputWriter import OutputWriter
+from duckdbEngine import DuckDbAnalyzer
+
+class TestDuckDbAnalyzer(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, 'parquet')
+        self.csv_path = os.path.join(self.temp_dir, 'books.csv')
+        self.df = pd.DataFrame({
+            'title': ['Garden Paths', 'The Quiet Garden', 'Winter Light', 'Paths of Glory', 'Summer Light'] * 300,
+            'authors': ['Author B', 'Author A', 'Author A', None, 'Author B'] * 300,
+            'publication_date': ['2019-01-01', '2020-05-05', '0001-01-01', 'unknown', '2020-01-01'] * 300,
+            'language_code': ['en', 'fr', 'en', None, 'de'] * 300,
+            'publisher': ['Pub X', 'Pub Y', 'Pub X', 'NA', None] * 300,
+            'isbn': ['9780000000001', None, '9780000000003', '', '9780000000005'] * 300,
+            'ISBN': [None, None, '1', '2', '3'] * 300
+        })
+        self.df.to_csv(self.csv_path, index=False)
+        self.serializer = OutputWriter('json')
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        shutil.rmtree(self.temp_dir)
+    
+    def assert_matches_analyzer(self, analyzer, csv_path):
+        """Every analysis equals the pandas Analyzer's, including the order of tied counts"""
+        expected_df = pd.read_csv(csv_path)
+        for analysis_type, method_name in ANALYSIS_METHODS.items():
+            expected, expected_error = getattr(Analyzer(), method_name)(expected_df)
+            actual, error = getattr(analyzer, method_name)()
+            self.assertEqual(error, expected_error, analysis_type)
+            self.assertEqual(json.dumps(self.serializer.to_serializable(actual), default=str),
+                             json.dumps(self.serializer.to_serializable(expected), default=str), analysis_type)
+    
+    def test_analyses_match_analyzer_through_parquet_cache(self):
+        """Test every query returns what the pandas Analyzer returns, before and after the Parquet cache exists"""
+        first = DuckDbAnalyzer(self.csv_path, cache_dir=self.cache_dir)
+        self.assertFalse(first.from_cache)
+        self.assert_matches_analyzer(first, self.csv_path)
+        self.assertEqual(len([name for name in os.listdir(self.cache_dir) if name.endswith('.parquet')]), 1)
+        
+        second = DuckDbAnalyzer(self.csv_path, cache_dir=self.cache_dir)
+        self.assertTrue(second.from_cache)
+        self.assert_matches_analyzer(second, self.csv_path)
+        self.assertEqual(list(second.analyze_top_authors()[0]['author_counts'].index), ['Author B', 'Author A'])
+        # 'isbn' and 'ISBN' are distinct columns even though SQL names are case-insensitive
+        self.assertEqual(list(second.analyze_missing_isbn()[0]['isbn_analysis']), ['isbn', 'ISBN'])
+    
+    def test_types_follow_pandas_inference(self):
+        """Test numeric years and numeric-looking values are typed the way pandas reads them"""
+        csv_path = os.path.join(self.temp_dir, 'numeric.csv')
+        with open(csv_path, 'w') as f:
+            f.write("year,author,lang,code\n2019,1984,en,0x1A\n,1984,en,1_000\n1799,7,fr,1.0\n2020,,fr,2\n")
+        analyzer = DuckDbAnalyzer(csv_path, cache_dir=None)
+        self.assert_matches_analyzer(analyzer, csv_path)
+        self.assertEqual(analyzer.analyze_top_authors()[0]['author_counts'].to_dict(), {1984: 2, 7: 1})
+        self.assertEqual(analyzer.types, {'year': 'DOUBLE', 'author': 'DOUBLE', 'lang': 'VARCHAR', 'code': 'VARCHAR'})
+    
+    def test_sql_query_compressed_input_and_errors(self):
+        """Test ad-hoc SQL over a bz2 file, missing columns and unreadable files"""
+        bz2_path = os.path.join(self.temp_dir, 'books.csv.bz2')
+        with open(self.csv_path, 'rb') as source, bz2.open(bz2_path, 'wb') as target:
+            target.write(source.read())
+        analyzer = DuckDbAnalyzer(bz2_path, cache_dir=self.cache_dir)
+        self.assert_matches_analyzer(analyzer, self.csv_path)
+        rows = analyzer.query("SELECT language_code, COUNT(*) AS books FROM books WHERE language_code IS NOT NULL "
+                              "GROUP BY 1 ORDER BY 2 DESC, 1")
+        self.assertEqual(rows.values.tolist(), [['en', 600], ['de', 300], ['fr', 300]])
+        self.assertIn('ISBN_', list(analyzer.query("SELECT * FROM books LIMIT 1").columns))
+        
+        csv_path = os.path.join(self.temp_dir, 'titles.csv')
+        self.df[['title']].to_csv(csv_path, index=False)
+        self.assert_matches_analyzer(DuckDbAnalyzer(csv_path, cache_dir=None), csv_path)
+        
+        with self.assertRaises(FileNotFoundError):
+            DuckDbAnalyzer(os.path.join(self.temp_dir, 'missing.csv'))
+        empty_path = os.path.join(self.temp_dir, 'empty.csv')
+        open(empty_path, 'w').close()
+        with self.assertRaises(ValueError):
+            DuckDbAnalyzer(empty_path, cache_dir=None)
+
+def run_single_test():
+    """Run this test file individually with detailed output"""
+    print("=" * 70)
+    print("                  TESTING DUCKDB ANALYZER CLASS")
+    print("=" * 70)
+    
+    # Create test suite
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestDuckDbAnalyzer)
+    
+    # Run tests with detailed output
+    runner = unittest.TextTestRunner(
+        verbosity=2,
+        stream=sys.stdout,
+        buffer=True
+    )
+    
+    result = runner.run(suite)
+    
+    # Print summary
+    print("\n" + "=" * 50)
+    print("              TEST SUMMARY")
+    print("=" * 50)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    
+    if result.wasSuccessful():
+        print("✅ ALL TESTS PASSED!")
+    else:
+        print("❌ SOME TESTS FAILED!")
+        if result.failures:
+            print(f"\nFailures ({len(result.failures)}):")
+            for test, traceback in result.failures:
+                print(f"  - {test}")
+        if result.errors:
+            print(f"\nErrors ({len(result.errors)}):")
+            for test, traceback in result.errors:
+                print(f"  - {test}")
+    
+    print("=" * 50)
+    return result.wasSuccessful()
+
+if __name__ == '__main__':
+    run_single_test()
@@ -0,0 +1,137 @@
+import unittest
+import os
+import re
+import tempfile
+import pandas as pd
+import sys
+sys.path.append('..')
+from metricsExporter import MetricsExporter
+from profiler import Profiler
+from analyzer import Analyzer
+
+SAMPLE_LINE = re.compile(r'^[a-zA-Z_:][a-zA-Z0-9_:]*(\{[^}]*\})? (?:[-+0-9.eE]+|NaN)$')
+
+class TestMetricsExporter(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.temp_dir, 'catalog.csv')
+        self.df = pd.DataFrame({
+            'authors': ['Author A', 'Author B', 'Author A'],
+            'language_code': ['en', 'fr', 'en']
+        })
+        self.df.to_csv(self.csv_path, index=False)
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        for name in os.listdir(self.temp_dir):
+            os.unlink(os.path.join(self.temp_dir, name))
+        os.rmdir(self.temp_dir)
+    
+    def samples(self, text):
+        """Map of sample (name plus labels) to value"""
+        return dict(line.rsplit(' ', 1) for line in text.splitlines() if not line.startswith('#'))
+    
+    def test_collect_run(self):
+        """Test load, rows, bytes, per-analysis latency, memory and cache metrics are exported"""
+        profiler = Profiler(trace_memory=False)
+        analyzer = profiler.instrument(Analyzer(), 'analyze')
+        with profiler:
+            analyzer.analyze_top_authors(self.df)
+            analyzer.analyze_language_distribution(self.df)
+        
+        exporter = MetricsExporter()
+        exporter.collect_run(self.csv_path, profiler=profiler, dataset=self.df,
+                             report_stats={'rendered': ['authors'], 'cached': ['trends', 'isbn']})
+        samples = self.samples(exporter.render())
+        labels = f'file="{self.csv_path}"'
+        
+        self.assertEqual(samples[f'bookshop_rows_parsed{{{labels}}}'], '3')
+        self.assertEqual(samples[f'bookshop_input_bytes{{{labels}}}'], str(os.path.getsize(self.csv_path)))
+        self.assertEqual(samples[f'bookshop_run_success{{{labels}}}'], '1')
+        self.assertEqual(samples[f'bookshop_report_cache_hits{{{labels}}}'], '2')
+        self.assertEqual(samples[f'bookshop_report_cache_misses{{{labels}}}'], '1')
+        self.assertIn(f'bookshop_analysis_duration_seconds{{{labels},analysis="authors"}}', samples)
+        self.assertIn(f'bookshop_analysis_duration_seconds{{{labels},analysis="languages"}}', samples)
+        self.assertIn(f'bookshop_memory_peak_bytes{{{labels}}}', samples)
+    
+    def test_render_format(self):
+        """Test HELP/TYPE/UNIT appear once per family and the exposition ends with # EOF"""
+        exporter = MetricsExporter(prefix='test')
+        exporter.add('duration_seconds', 'gauge', 'Duration.', 0.5, {'analysis': 'a'}, unit='seconds')
+        exporter.add('duration_seconds', 'gauge', 'Duration.', 2, {'analysis': 'b'}, unit='seconds')
+        exporter.add('plain', 'gauge', 'No labels.', float('nan'))
+        text = exporter.render()
+        lines = text.splitlines()
+        
+        self.assertEqual(lines.count('# TYPE test_duration_seconds gauge'), 1)
+        self.assertIn('# UNIT test_duration_seconds seconds', lines)
+        self.assertIn('test_duration_seconds{analysis="b"} 2', lines)
+        self.assertIn('test_plain NaN', lines)
+        self.assertEqual(lines[-1], '# EOF')
+        for line in lines:
+            if not line.startswith('#'):
+                self.assertRegex(line, SAMPLE_LINE)
+    
+    def test_label_escaping(self):
+        """Test quotes, backslashes and newlines in label values are escaped"""
+        exporter = MetricsExporter(prefix='test')
+        exporter.add('rows', 'gauge', 'Rows.', 1, {'file': 'C:\\data\\"new"\nfile.csv'})
+        self.assertIn('test_rows{file="C:\\\\data\\\\\\"new\\"\\nfile.csv"} 1', exporter.render())
+    
+    def test_write_is_atomic(self):
+        """Test the file is replaced in one step and no temporary files are left behind"""
+        path = os.path.join(self.temp_dir, 'bookshop.prom')
+        exporter = MetricsExporter()
+        exporter.collect_run(self.csv_path, dataset=self.df, succeeded=False)
+        exporter.write(path)
+        exporter.write(path)
+        
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ['bookshop.prom', 'catalog.csv'])
+        with open(path) as f:
+            self.assertIn(f'bookshop_run_success{{file="{self.csv_path}"}} 0', f.read())
+
+def run_single_test():
+    """Run this test file individually with detailed output"""
+    print("=" * 70)
+    print("                  TESTING METRICS EXPORTER CLASS")
+    print("=" * 70)
+    
+    # Create test suite
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestMetricsExporter)
+    
+    # Run tests with detailed output
+    runner = unittest.TextTestRunner(
+        verbosity=2,
+        stream=sys.stdout,
+        buffer=True
+    )
+    
+    result = runner.run(suite)
+    
+    # Print summary
+    print("\n" + "=" * 50)
+    print("              TEST SUMMARY")
+    print("=" * 50)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    
+    if result.wasSuccessful():
+        print("✅ ALL TESTS PASSED!")
+    else:
+        print("❌ SOME TESTS FAILED!")
+        if result.failures:
+            print(f"\nFailures ({len(result.failures)}):")
+            for test, traceback in result.failures:
+                print(f"  - {test}")
+        if result.errors:
+            print(f"\nErrors ({len(result.errors)}):")
+            for test, traceback in result.errors:
+                print(f"  - {test}")
+    
+    print("=" * 50)
+    return result.wasSuccessful()
+
+if __name__ == '__main__':
+    run_single_test()
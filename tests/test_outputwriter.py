@@ -0,0 +1,169 @@
+import unittest
+import io
+import csv
+import json
+import numpy as np
+import pandas as pd
+import sys
+from unittest.mock import patch
+sys.path.append('..')
+from outputWriter import OutputWriter
+
+class RecordingStream:
+    """Stream recording every write call"""
+    def __init__(self):
+        self.writes = []
+    
+    def write(self, text):
+        self.writes.append(text)
+    
+    def flush(self):
+        pass
+
+class TestOutputWriter(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.output = io.StringIO()
+        
+        self.publication_data = {
+            'year_counts': pd.Series({2020.0: np.int64(100), 2021.0: np.int64(150)}),
+            'total_years': 2,
+            'most_productive_year': np.float64(2021.0),
+            'most_productive_count': np.int64(150)
+        }
+        
+        self.isbn_data = {
+            'isbn_analysis': {
+                'isbn': {
+                    'total_records': 10,
+                    'present_count': np.int64(8),
+                    'missing_count': np.int64(2),
+                    'missing_percentage': np.float64(20.0)
+                }
+            },
+            'total_records': 10
+        }
+        
+        self.year_lang_data = {
+            'year_lang_counts': pd.DataFrame({'en': [3, 1], 'es': [0, 2]}, index=[2020.0, 2021.0]),
+            'years': [2020.0, 2021.0],
+            'languages': ['en', 'es']
+        }
+    
+    def test_invalid_format(self):
+        """Test unsupported formats are rejected"""
+        with self.assertRaises(ValueError):
+            OutputWriter('xml')
+    
+    def test_json_single_document(self):
+        """Test JSON results are collected and written once as valid JSON"""
+        writer = OutputWriter('json', stream=self.output)
+        writer.write('trends', self.publication_data)
+        writer.write('isbn', self.isbn_data)
+        self.assertEqual(self.output.getvalue(), '')
+        
+        writer.flush()
+        result = json.loads(self.output.getvalue())
+        self.assertEqual(result['trends']['year_counts'], {'2020': 100, '2021': 150})
+        self.assertEqual(result['trends']['most_productive_year'], 2021)
+        self.assertEqual(result['isbn']['isbn_analysis']['isbn']['missing_count'], 2)
+    
+    def test_json_dataframe(self):
+        """Test DataFrames serialize as nested row/column objects"""
+        writer = OutputWriter('json', stream=self.output)
+        writer.write('year-language', self.year_lang_data)
+        writer.flush()
+        result = json.loads(self.output.getvalue())
+        self.assertEqual(result['year-language']['year_lang_counts']['2021']['es'], 2)
+        self.assertEqual(result['year-language']['years'], [2020, 2021])
+    
+    def test_mixed_dtype_dataframe_keeps_ints(self):
+        """Test integer columns of a frame that also has float columns serialize as ints in every format"""
+        estimates = pd.DataFrame({'count': [169, 12], 'share': [4.36, 0.31], 'count_low': [150, 8]},
+                                 index=['German', 'Welsh'])
+        serialized = OutputWriter('json').to_serializable(estimates)
+        self.assertEqual(serialized['German'], {'count': 169, 'share': 4.36, 'count_low': 150})
+        self.assertIsInstance(serialized['Welsh']['count'], int)
+        
+        for output_format in ['json', 'csv', 'ndjson']:
+            output = io.StringIO()
+            writer = OutputWriter(output_format, stream=output)
+            writer.write('languages', {'estimates': estimates})
+            writer.flush()
+            self.assertIn('169', output.getvalue(), output_format)
+            self.assertNotIn('169.0', output.getvalue(), output_format)
+    
+    def test_json_records_error(self):
+        """Test analysis errors are kept in the JSON document"""
+        writer = OutputWriter('json', stream=self.output)
+        with patch('sys.stderr', new_callable=io.StringIO):
+            writer.write('authors', None, "Authors column not found")
+        writer.flush()
+        self.assertEqual(json.loads(self.output.getvalue())['authors']['error'], "Authors column not found")
+    
+    def test_csv_long_format(self):
+        """Test CSV output has one header and long-format rows"""
+        writer = OutputWriter('csv', stream=self.output)
+        writer.write('trends', self.publication_data)
+        writer.write('year-language', self.year_lang_data)
+        rows = list(csv.reader(io.StringIO(self.output.getvalue())))
+        self.assertEqual(rows[0], ['analysis', 'field', 'row', 'column', 'value'])
+        self.assertEqual(rows.count(['analysis', 'field', 'row', 'column', 'value']), 1)
+        self.assertIn(['trends', 'year_counts', '2020', '', '100'], rows)
+        self.assertIn(['year-language', 'year_lang_counts', '2021', 'es', '2'], rows)
+    
+    def test_ndjson_streams_in_chunks(self):
+        """Test NDJSON rows are written in chunks of chunk_rows"""
+        stream = RecordingStream()
+        writer = OutputWriter('ndjson', stream=stream, chunk_rows=2)
+        writer.write('year-language', self.year_lang_data)
+        lines = ''.join(stream.writes).splitlines()
+        self.assertEqual(json.loads(lines[0])['column'], 'en')
+        self.assertGreater(len(stream.writes), 1)
+        for chunk in stream.writes:
+            self.assertLessEqual(chunk.count('\n'), 2)
+
+def run_single_test():
+    """Run this test file individually with detailed output"""
+    print("=" * 70)
+    print("                   TESTING OUTPUT WRITER CLASS")
+    print("=" * 70)
+    
+    # Create test suite
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestOutputWriter)
+    
+    # Run tests with detailed output
+    runner = unittest.TextTestRunner(
+        verbosity=2,
+        stream=sys.stdout,
+        buffer=True
+    )
+    
+    result = runner.run(suite)
+    
+    # Print summary
+    print("\n" + "=" * 50)
+    print("              TEST SUMMARY")
+    print("=" * 50)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    
+    if result.wasSuccessful():
+        print("✅ ALL TESTS PASSED!")
+    else:
+        print("❌ SOME TESTS FAILED!")
+        if result.failures:
+            print(f"\nFailures ({len(result.failures)}):")
+            for test, traceback in result.failures:
+                print(f"  - {test}")
+        if result.errors:
+            print(f"\nErrors ({len(result.errors)}):")
+            for test, traceback in result.errors:
+                print(f"  - {test}")
+    
+    print("=" * 50)
+    return result.wasSuccessful()
+
+if __name__ == '__main__':
+    run_single_test()
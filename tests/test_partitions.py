@@ -0,0 +1,142 @@
+import unittest
+import json
+import os
+import shutil
+import tempfile
+import pandas as pd
+import sys
+sys.path.append('..')
+from analyzer import Analyzer, ANALYSIS_METHODS
+from outputWriter import OutputWriter
+from partitions import PartitionedDataset, aggregate_partition, is_partitioned
+
+class TestPartitionedDataset(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.frames = [
+            pd.DataFrame({
+                'authors': ['Author A', 'Author B', 'Author A'] * 200,
+                'publication_date': ['2019-01-01', '2020-05-05', '0001-01-01'] * 200,
+                'language_code': ['en', 'fr', 'en'] * 200,
+                'publisher': ['Pub X', 'Pub Y', 'Pub X'] * 200,
+                'isbn': ['1', None, '3'] * 200
+            }),
+            pd.DataFrame({
+                'authors': ['Author B', 'Author C'] * 300,
+                'publication_date': ['2021-03-03', '2020-01-01'] * 300,
+                'language_code': ['de', 'en'] * 300,
+                'publisher': ['Pub Z', 'Pub X'] * 300,
+                'isbn': ['7', None] * 300
+            })
+        ]
+        self.paths = []
+        for number, frame in enumerate(self.frames):
+            path = os.path.join(self.temp_dir, f'part-{number}.csv')
+            frame.to_csv(path, index=False)
+            self.paths.append(path)
+        self.serializer = OutputWriter('json')
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        shutil.rmtree(self.temp_dir)
+    
+    def serialized(self, analysis_data):
+        """analysis_data as the JSON the output writer would emit"""
+        return json.dumps(self.serializer.to_serializable(analysis_data), sort_keys=True, default=str)
+    
+    def test_resolve_directory_and_glob(self):
+        """Test directories and glob patterns resolve to sorted partition files"""
+        open(os.path.join(self.temp_dir, 'notes.txt'), 'w').close()
+        self.assertTrue(is_partitioned(self.temp_dir))
+        self.assertTrue(is_partitioned(os.path.join(self.temp_dir, '*.csv')))
+        self.assertFalse(is_partitioned(self.paths[0]))
+        
+        self.assertEqual(PartitionedDataset(self.temp_dir).files(), self.paths)
+        self.assertEqual(PartitionedDataset(os.path.join(self.temp_dir, 'part-1*')).files(), self.paths[1:])
+        self.assertIsNone(PartitionedDataset(os.path.join(self.temp_dir, 'missing-*.csv')).aggregate())
+    
+    def test_merged_results_match_analyzer(self):
+        """Test merged partition aggregates equal the Analyzer on the concatenated data"""
+        aggregates = PartitionedDataset(self.temp_dir, workers=2).aggregate()
+        combined = pd.concat(self.frames, ignore_index=True)
+        analyzer = Analyzer()
+        
+        self.assertEqual(aggregates.total_rows, 1200)
+        for analysis_type, method_name in ANALYSIS_METHODS.items():
+            expected, expected_error = getattr(analyzer, method_name)(combined)
+            actual, error = aggregates.analysis_data(analysis_type)
+            self.assertEqual(error, expected_error, analysis_type)
+            self.assertEqual(self.serialized(actual), self.serialized(expected), analysis_type)
+    
+    def test_schema_reconciliation(self):
+        """Test column aliases are merged and a missing ISBN column counts as missing"""
+        renamed = self.frames[1].rename(columns={'authors': 'author'}).drop(columns=['isbn'])
+        renamed.to_csv(self.paths[1], index=False)
+        partitioned = PartitionedDataset(self.temp_dir, workers=2)
+        aggregates = partitioned.aggregate()
+        
+        authors, error = aggregates.analysis_data('authors')
+        self.assertIsNone(error)
+        self.assertEqual(authors['author_counts']['Author B'], 500)
+        
+        isbn, _ = aggregates.analysis_data('isbn')
+        self.assertEqual(isbn['isbn_analysis']['isbn']['missing_count'], 200 + 600)
+        self.assertEqual(partitioned.schema_differences(), {'authors': [self.paths[1]], 'isbn': [self.paths[1]],
+                                                            'author': [self.paths[0]]})
+    
+    def test_unloadable_partition_is_skipped(self):
+        """Test an empty partition is reported instead of aborting the merge"""
+        empty_path = os.path.join(self.temp_dir, 'part-2.csv')
+        open(empty_path, 'w').close()
+        self.assertIsNone(aggregate_partition(empty_path, 100))
+        
+        partitioned = PartitionedDataset(self.temp_dir, workers=2)
+        aggregates = partitioned.aggregate()
+        self.assertEqual(partitioned.failed, [empty_path])
+        self.assertEqual(aggregates.total_rows, 1200)
+
+def run_single_test():
+    """Run this test file individually with detailed output"""
+    print("=" * 70)
+    print("                TESTING PARTITIONED DATASET CLASS")
+    print("=" * 70)
+    
+    # Create test suite
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestPartitionedDataset)
+    
+    # Run tests with detailed output
+    runner = unittest.TextTestRunner(
+        verbosity=2,
+        stream=sys.stdout,
+        buffer=True
+    )
+    
+    result = runner.run(suite)
+    
+    # Print summary
+    print("\n" + "=" * 50)
+    print("              TEST SUMMARY")
+    print("=" * 50)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    
+    if result.wasSuccessful():
+        print("✅ ALL TESTS PASSED!")
+    else:
+        print("❌ SOME TESTS FAILED!")
+        if result.failures:
+            print(f"\nFailures ({len(result.failures)}):")
+            for test, traceback in result.failures:
+                print(f"  - {test}")
+        if result.errors:
+            print(f"\nErrors ({len(result.errors)}):")
+            for test, traceback in result.errors:
+                print(f"  - {test}")
+    
+    print("=" * 50)
+    return result.wasSuccessful()
+
+if __name__ == '__main__':
+    run_single_test()
@@ -0,0 +1,159 @@
+import unittest
+import importlib
+import os
+import tempfile
+import threading
+import time
+import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Use non-interactive backend for testing
+import sys
+from unittest.mock import patch
+sys.path.append('..')
+import matplotlib.pyplot as plt
+import pdfReport
+from pdfReport import PdfReport
+
+class TestPdfReport(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        temp_file = tempfile.NamedTemporaryFile(suffix='.pdf', delete=False)
+        temp_file.close()
+        self.pdf_path = temp_file.name
+        self.report = PdfReport(self.pdf_path)
+        
+        self.test_df = pd.DataFrame({
+            'authors': ['Author A', 'Author B', 'Author A', 'Author C'],
+            'publication_date': [2020, 2021, 2021, 2022],
+            'language_code': ['en', 'es', 'en', 'fr'],
+            'publisher': ['Publisher X', 'Publisher Y', 'Publisher X', 'Publisher Z'],
+            'isbn': ['123', None, '456', '']
+        })
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        if os.path.exists(self.pdf_path):
+            os.unlink(self.pdf_path)
+    
+    @patch('matplotlib.pyplot.show')
+    def test_generate_one_page_per_analysis(self, mock_show):
+        """Test every analysis becomes one PDF page without showing windows"""
+        with patch('builtins.print'):
+            page_times = self.report.generate(self.test_df)
+        
+        self.assertEqual([analysis for analysis, _ in page_times],
+                         ['trends', 'authors', 'languages', 'publishers', 'isbn', 'year-language'])
+        self.assertTrue(all(seconds >= 0 for _, seconds in page_times))
+        mock_show.assert_not_called()
+        with open(self.pdf_path, 'rb') as f:
+            self.assertEqual(f.read(4), b'%PDF')
+    
+    def test_backend_is_selected_only_while_generating(self):
+        """Test importing the module keeps the process backend, and generating restores it"""
+        plt.switch_backend('svg')
+        try:
+            importlib.reload(pdfReport)
+            self.assertEqual(plt.get_backend(), 'svg')
+            
+            backends = []
+            report = pdfReport.PdfReport(self.pdf_path)
+            draw = report.visualizer.visualize_top_authors
+            def recording_draw(analysis_data):
+                backends.append(plt.get_backend().lower())
+                return draw(analysis_data)
+            report.visualizer.visualize_top_authors = recording_draw
+            with patch('builtins.print'):
+                report.generate(self.test_df, ['authors'])
+            self.assertEqual(backends, ['agg'])
+            self.assertEqual(plt.get_backend(), 'svg')
+        finally:
+            plt.switch_backend('Agg')
+    
+    def test_drawing_and_saving_never_overlap(self):
+        """Test the writer thread saves a page only while the main thread is not drawing"""
+        active = []
+        overlaps = []
+        
+        def exclusive(function):
+            def wrapper(*args, **kwargs):
+                if active:
+                    overlaps.append(threading.current_thread().name)
+                active.append(1)
+                try:
+                    time.sleep(0.01)
+                    return function(*args, **kwargs)
+                finally:
+                    active.pop()
+            return wrapper
+        
+        for method_name in ('visualize_publication_trends', 'visualize_top_authors', 'visualize_language_distribution'):
+            setattr(self.report.visualizer, method_name, exclusive(getattr(self.report.visualizer, method_name)))
+        with patch('pdfReport.PdfPages.savefig', exclusive(pdfReport.PdfPages.savefig)), patch('builtins.print'):
+            page_times = self.report.generate(self.test_df, ['trends', 'authors', 'languages'])
+        self.assertEqual(len(page_times), 3)
+        self.assertEqual(overlaps, [])
+    
+    def test_generate_selected_analyses(self):
+        """Test only the requested analyses are rendered"""
+        with patch('builtins.print'):
+            page_times = self.report.generate(self.test_df, ['authors'])
+        self.assertEqual(len(page_times), 1)
+    
+    def test_analysis_error_skips_page(self):
+        """Test analyses that fail print an error and add no page"""
+        with patch('builtins.print') as mock_print:
+            page_times = self.report.generate(self.test_df.drop(columns=['authors']), ['authors', 'languages'])
+        self.assertEqual([analysis for analysis, _ in page_times], ['languages'])
+        self.assertTrue(any('Authors column not found' in str(call) for call in mock_print.call_args_list))
+    
+    def test_print_timings(self):
+        """Test per-page timings are printed"""
+        self.report.page_times = [('trends', 0.25)]
+        with patch('builtins.print') as mock_print:
+            self.report.print_timings()
+        mock_print.assert_any_call(f"{1:<6} {'trends':<16} {250.0:>10.1f}ms")
+
+def run_single_test():
+    """Run this test file individually with detailed output"""
+    print("=" * 70)
+    print("                     TESTING PDF REPORT CLASS")
+    print("=" * 70)
+    
+    # Create test suite
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestPdfReport)
+    
+    # Run tests with detailed output
+    runner = unittest.TextTestRunner(
+        verbosity=2,
+        stream=sys.stdout,
+        buffer=True
+    )
+    
+    result = runner.run(suite)
+    
+    # Print summary
+    print("\n" + "=" * 50)
+    print("              TEST SUMMARY")
+    print("=" * 50)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    
+    if result.wasSuccessful():
+        print("✅ ALL TESTS PASSED!")
+    else:
+        print("❌ SOME TESTS FAILED!")
+        if result.failures:
+            print(f"\nFailures ({len(result.failures)}):")
+            for test, traceback in result.failures:
+                print(f"  - {test}")
+        if result.errors:
+            print(f"\nErrors ({len(result.errors)}):")
+            for test, traceback in result.errors:
+                print(f"  - {test}")
+    
+    print("=" * 50)
+    return result.wasSuccessful()
+
+if __name__ == '__main__':
+    run_single_test()
@@ -0,0 +1,119 @@
+import unittest
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import pandas as pd
+import sys
+sys.path.append('..')
+from analyzer import Analyzer, ANALYSIS_METHODS, create_engine
+from outputWriter import OutputWriter
+from polarsEngine import PolarsAnalyzer
+
+class TestPolarsAnalyzer(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.temp_dir, 'books.csv')
+        self.df = pd.DataFrame({
+            'title': ['Garden Paths', 'The Quiet Garden', 'Winter Light', 'Paths of Glory', 'Summer Light'] * 300,
+            'authors': ['Author B', 'Author A', 'Author A', None, 'Author B'] * 300,
+            'publication_date': ['2019-01-01', '2020-05-05', '0001-01-01', 'unknown', '2020-01-01'] * 300,
+            'language_code': ['en', 'fr', 'en', None, 'de'] * 300,
+            'publisher': ['Pub X', 'Pub Y', 'Pub X', 'NA', None] * 300,
+            'isbn': ['9780000000001', None, '9780000000003', '', '9780000000005'] * 300,
+            'isbn13': [None, None, '1', '2', '3'] * 300
+        })
+        self.df.to_csv(self.csv_path, index=False)
+        self.serializer = OutputWriter('json')
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        shutil.rmtree(self.temp_dir)
+    
+    def assert_matches_analyzer(self, analyzer, csv_path):
+        """Every analysis equals the pandas Analyzer's, including the order of tied counts"""
+        expected_df = pd.read_csv(csv_path)
+        for analysis_type, method_name in ANALYSIS_METHODS.items():
+            expected, expected_error = getattr(Analyzer(), method_name)(expected_df)
+            actual, error = getattr(analyzer, method_name)()
+            self.assertEqual(error, expected_error, analysis_type)
+            self.assertEqual(json.dumps(self.serializer.to_serializable(actual), default=str),
+                             json.dumps(self.serializer.to_serializable(expected), default=str), analysis_type)
+    
+    def test_analyses_match_analyzer(self):
+        """Test every Polars analysis returns what the pandas Analyzer returns"""
+        analyzer = create_engine('polars', self.csv_path)
+        self.assertIsInstance(analyzer, PolarsAnalyzer)
+        self.assertEqual(analyzer.total_rows, 1500)
+        self.assert_matches_analyzer(analyzer, self.csv_path)
+        self.assertEqual(list(analyzer.analyze_top_authors()[0]['author_counts'].index), ['Author B', 'Author A'])
+    
+    def test_types_follow_pandas_inference(self):
+        """Test numeric years and numeric-looking values are typed the way pandas reads them"""
+        csv_path = os.path.join(self.temp_dir, 'numeric.csv')
+        pd.DataFrame({'year': [2019, None, 1799, 2020], 'author': ['1984', '1984', '7', None],
+                      'lang': ['en', 'en', 'fr', 'fr']}).to_csv(csv_path, index=False)
+        analyzer = PolarsAnalyzer(csv_path)
+        self.assert_matches_analyzer(analyzer, csv_path)
+        self.assertEqual(analyzer.analyze_top_authors()[0]['author_counts'].to_dict(), {1984: 2, 7: 1})
+    
+    def test_missing_columns_and_compressed_input(self):
+        """Test missing columns give the Analyzer's errors and gzip input is read"""
+        gz_path = os.path.join(self.temp_dir, 'books.csv.gz')
+        with open(self.csv_path, 'rb') as source, gzip.open(gz_path, 'wb') as target:
+            target.write(source.read())
+        self.assert_matches_analyzer(PolarsAnalyzer(gz_path), self.csv_path)
+        
+        csv_path = os.path.join(self.temp_dir, 'titles.csv')
+        self.df[['title']].to_csv(csv_path, index=False)
+        self.assert_matches_analyzer(PolarsAnalyzer(csv_path), csv_path)
+        
+        with self.assertRaises(FileNotFoundError):
+            PolarsAnalyzer(os.path.join(self.temp_dir, 'missing.csv'))
+
+def run_single_test():
+    """Run this test file individually with detailed output"""
+    print("=" * 70)
+    print("                  TESTING POLARS ANALYZER CLASS")
+    print("=" * 70)
+    
+    # Create test suite
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestPolarsAnalyzer)
+    
+    # Run tests with detailed output
+    runner = unittest.TextTestRunner(
+        verbosity=2,
+        stream=sys.stdout,
+        buffer=True
+    )
+    
+    result = runner.run(suite)
+    
+    # Print summary
+    print("\n" + "=" * 50)
+    print("              TEST SUMMARY")
+    print("=" * 50)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    
+    if result.wasSuccessful():
+        print("✅ ALL TESTS PASSED!")
+    else:
+        print("❌ SOME TESTS FAILED!")
+        if result.failures:
+            print(f"\nFailures ({len(result.failures)}):")
+            for test, traceback in result.failures:
+                print(f"  - {test}")
+        if result.errors:
+            print(f"\nErrors ({len(result.errors)}):")
+            for test, traceback in result.errors:
+                print(f"  - {test}")
+    
+    print("=" * 50)
+    return result.wasSuccessful()
+
+if __name__ == '__main__':
+    run_single_test()
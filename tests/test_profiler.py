@@ -0,0 +1,155 @@
+import unittest
+import io
+import os
+import pstats
+import tempfile
+import tracemalloc
+import pandas as pd
+import sys
+sys.path.append('..')
+from profiler import Profiler
+from analyzer import Analyzer
+from dataLoader import DataLoader
+from terminalRenderer import TerminalRenderer
+from main import Main
+
+class TestProfiler(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.df = pd.DataFrame({
+            'authors': ['Author A', 'Author B', 'Author A'],
+            'publication_date': [2019, 2020, 2020],
+            'language_code': ['en', 'fr', 'en'],
+            'publisher': ['Pub X', 'Pub Y', 'Pub X'],
+            'isbn': ['111', None, '333']
+        })
+    
+    def test_instrument_records_calls(self):
+        """Test instrumented analyze_* methods are timed and still return their results"""
+        profiler = Profiler(trace_memory=False)
+        analyzer = profiler.instrument(Analyzer(), 'analyze')
+        
+        analysis_data, error = analyzer.analyze_top_authors(self.df, top_n=1)
+        analyzer.analyze_top_authors(self.df)
+        analyzer.analyze_language_distribution(self.df)
+        
+        self.assertIsNone(error)
+        self.assertEqual(analysis_data['author_counts'].to_dict(), {'Author A': 2})
+        record = profiler.records['Analyzer.analyze_top_authors']
+        self.assertEqual(record['stage'], 'analyze')
+        self.assertEqual(record['calls'], 2)
+        self.assertGreater(record['seconds'], 0)
+        self.assertIn('Analyzer.analyze_language_distribution', profiler.records)
+        self.assertNotIn('Analyzer.limit_dataset', profiler.records)
+    
+    def test_instrument_is_idempotent(self):
+        """Test instrumenting an object twice does not double-count calls"""
+        profiler = Profiler(trace_memory=False)
+        analyzer = Analyzer()
+        profiler.instrument(analyzer, 'analyze')
+        profiler.instrument(analyzer, 'analyze')
+        analyzer.analyze_missing_isbn(self.df)
+        self.assertEqual(profiler.records['Analyzer.analyze_missing_isbn']['calls'], 1)
+    
+    def test_summary_and_peak_memory(self):
+        """Test the programmatic summary groups time by stage and reports peak memory"""
+        temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False)
+        temp_file.close()
+        self.df.to_csv(temp_file.name, index=False)
+        try:
+            with Profiler() as profiler:
+                loader = profiler.instrument(DataLoader(), 'load')
+                renderer = profiler.instrument(TerminalRenderer(stream=io.StringIO()), 'visualize')
+                analyzer = profiler.instrument(Analyzer(), 'analyze')
+                df = loader.load(temp_file.name)
+                renderer.visualize_top_authors(analyzer.analyze_top_authors(df)[0])
+        finally:
+            os.unlink(temp_file.name)
+        
+        summary = profiler.summary()
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertEqual(set(summary['stages']), {'load', 'analyze', 'visualize'})
+        self.assertGreater(summary['stages']['load'], 0)
+        self.assertGreater(summary['peak_memory'], 0)
+        self.assertGreaterEqual(summary['total_seconds'], sum(summary['stages'].values()))
+        self.assertEqual([call['name'] for call in summary['calls']],
+                         ['DataLoader.load', 'Analyzer.analyze_top_authors', 'TerminalRenderer.visualize_top_authors'])
+    
+    def test_cprofile_dump(self):
+        """Test a cProfile dump readable by pstats is written"""
+        temp_file = tempfile.NamedTemporaryFile(suffix='.prof', delete=False)
+        temp_file.close()
+        try:
+            profiler = Profiler(trace_memory=False, cprofile_path=temp_file.name)
+            profiler.start()
+            Analyzer().analyze_top_authors(self.df)
+            profiler.stop()
+            stats = pstats.Stats(temp_file.name)
+            self.assertTrue(any(name == 'analyze_top_authors' for _, _, name in stats.stats))
+        finally:
+            os.unlink(temp_file.name)
+    
+    def test_print_report(self):
+        """Test the report lists calls, stage totals and peak memory"""
+        profiler = Profiler(trace_memory=False)
+        profiler.instrument(Analyzer(), 'analyze').analyze_missing_isbn(self.df)
+        stream = io.StringIO()
+        profiler.print_report(stream)
+        output = stream.getvalue()
+        self.assertIn('Analyzer.analyze_missing_isbn', output)
+        self.assertIn('Stage: analyze', output)
+    
+    def test_main_instruments_renderer_set_later(self):
+        """Test renderers swapped in after enable_profiling are also timed"""
+        main_app = Main()
+        profiler = Profiler(trace_memory=False)
+        main_app.enable_profiling(profiler)
+        main_app.visualizer = TerminalRenderer(stream=io.StringIO())
+        main_app.visualizer.visualize_top_authors(main_app.analyzer.analyze_top_authors(self.df)[0])
+        self.assertEqual(list(profiler.records),
+                         ['Analyzer.analyze_top_authors', 'TerminalRenderer.visualize_top_authors'])
+
+def run_single_test():
+    """Run this test file individually with detailed output"""
+    print("=" * 70)
+    print("                      TESTING PROFILER CLASS")
+    print("=" * 70)
+    
+    # Create test suite
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestProfiler)
+    
+    # Run tests with detailed output
+    runner = unittest.TextTestRunner(
+        verbosity=2,
+        stream=sys.stdout,
+        buffer=True
+    )
+    
+    result = runner.run(suite)
+    
+    # Print summary
+    print("\n" + "=" * 50)
+    print("              TEST SUMMARY")
+    print("=" * 50)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    
+    if result.wasSuccessful():
+        print("✅ ALL TESTS PASSED!")
+    else:
+        print("❌ SOME TESTS FAILED!")
+        if result.failures:
+            print(f"\nFailures ({len(result.failures)}):")
+            for test, traceback in result.failures:
+                print(f"  - {test}")
+        if result.errors:
+            print(f"\nErrors ({len(result.errors)}):")
+            for test, traceback in result.errors:
+                print(f"  - {test}")
+    
+    print("=" * 50)
+    return result.wasSuccessful()
+
+if __name__ == '__main__':
+    run_single_test()
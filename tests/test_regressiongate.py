@@ -0,0 +1,140 @@
+import unittest
+import json
+import os
+import shutil
+import tempfile
+import sys
+sys.path.append('..')
+from unittest.mock import patch
+from regressionGate import RegressionGate
+
+def stage(samples):
+    """Benchmark stage record built from timing samples"""
+    samples = sorted(samples)
+    return {'min_seconds': samples[0], 'median_seconds': samples[len(samples) // 2], 'samples': samples,
+            'peak_memory': None}
+
+def results(stages, cpu_count=4):
+    """Benchmark results with one tier"""
+    return {
+        'environment': {'platform': 'test', 'cpu_count': cpu_count, 'python': '3', 'pandas': '2', 'numpy': '1',
+                        'generator_version': 1},
+        'tiers': {'1000': {'rows': 1000, 'file_bytes': 0, 'stages': stages}}
+    }
+
+class TestRegressionGate(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.baseline_path = os.path.join(self.temp_dir, 'baseline.json')
+        self.gate = RegressionGate(baseline_path=self.baseline_path, threshold=0.25)
+        self.baseline = results({
+            'load': stage([0.100, 0.101, 0.102]),
+            'analyze:trends': stage([0.0010, 0.0011, 0.0012]),
+            'render:trends': stage([0.200, 0.260, 0.320])
+        })
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        shutil.rmtree(self.temp_dir)
+    
+    def verdicts(self, current):
+        """Regressed flag of each stage"""
+        return {row['stage']: row['regressed'] for row in self.gate.compare(self.baseline, current)}
+    
+    def test_slow_down_beyond_threshold_regresses(self):
+        """Test a stage slower than the relative threshold is flagged and the others are not"""
+        current = results({
+            'load': stage([0.140, 0.141, 0.142]),
+            'analyze:trends': stage([0.0010, 0.0011, 0.0012]),
+            'render:trends': stage([0.200, 0.260, 0.320])
+        })
+        self.assertEqual(self.verdicts(current), {'load': True, 'analyze:trends': False, 'render:trends': False})
+    
+    def test_noise_and_floor_prevent_false_positives(self):
+        """Test jitter within the measured spread or under the absolute floor is not a regression"""
+        current = results({
+            'load': stage([0.120, 0.121, 0.122]),
+            # +100% of a millisecond stays under the 2ms floor
+            'analyze:trends': stage([0.0020, 0.0021, 0.0022]),
+            # +40% but within three robust deviations of these noisy samples
+            'render:trends': stage([0.280, 0.300, 0.400])
+        })
+        self.assertEqual(self.verdicts(current), {'load': False, 'analyze:trends': False, 'render:trends': False})
+        self.assertAlmostEqual(self.gate.spread([1.0, 2.0, 3.0]), 1.4826)
+        self.assertEqual(self.gate.spread([1.0]), 0.0)
+    
+    def test_missing_baseline_fails_until_recorded(self):
+        """Test a run without a baseline fails without measuring, and --update-baseline records one"""
+        with patch.object(self.gate, 'measure', return_value=self.baseline) as mock_measure, \
+             patch('builtins.print') as mock_print:
+            self.assertFalse(self.gate.run())
+            mock_measure.assert_not_called()
+            self.assertIn('--update-baseline', mock_print.call_args.args[0])
+            self.assertFalse(os.path.exists(self.baseline_path))
+            self.assertTrue(self.gate.run(update_baseline=True))
+        with open(self.baseline_path) as f:
+            self.assertEqual(json.load(f), self.baseline)
+    
+    def test_run_fails_on_regression_until_baseline_updated(self):
+        """Test a regression fails the gate, and --update-baseline accepts the new timings"""
+        self.gate.save_baseline(self.baseline)
+        slower = json.loads(json.dumps(self.baseline))
+        slower['tiers']['1000']['stages']['load'] = stage([0.200, 0.201, 0.202])
+        
+        with patch.object(self.gate, 'measure', return_value=slower), patch('builtins.print') as mock_print:
+            self.assertFalse(self.gate.run())
+            printed = '\n'.join(str(call.args[0]) for call in mock_print.call_args_list if call.args)
+            self.assertIn('REGRESSED', printed)
+            self.assertTrue(self.gate.run(update_baseline=True))
+            self.assertTrue(self.gate.run())
+    
+    def test_environment_warnings(self):
+        """Test a changed machine or library version is reported"""
+        warnings = self.gate.environment_warnings(self.baseline, results({}, cpu_count=8))
+        self.assertEqual(warnings, ['cpu_count changed since the baseline: 4 -> 8'])
+
+def run_single_test():
+    """Run this test file individually with detailed output"""
+    print("=" * 70)
+    print("                  TESTING REGRESSION GATE CLASS")
+    print("=" * 70)
+    
+    # Create test suite
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestRegressionGate)
+    
+    # Run tests with detailed output
+    runner = unittest.TextTestRunner(
+        verbosity=2,
+        stream=sys.stdout,
+        buffer=True
+    )
+    
+    result = runner.run(suite)
+    
+    # Print summary
+    print("\n" + "=" * 50)
+    print("              TEST SUMMARY")
+    print("=" * 50)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    
+    if result.wasSuccessful():
+        print("✅ ALL TESTS PASSED!")
+    else:
+        print("❌ SOME TESTS FAILED!")
+        if result.failures:
+            print(f"\nFailures ({len(result.failures)}):")
+            for test, traceback in result.failures:
+                print(f"  - {test}")
+        if result.errors:
+            print(f"\nErrors ({len(result.errors)}):")
+            for test, traceback in result.errors:
+                print(f"  - {test}")
+    
+    print("=" * 50)
+    return result.wasSuccessful()
+
+if __name__ == '__main__':
+    run_single_test()
@@ -0,0 +1,110 @@
+import unittest
+import os
+import shutil
+import tempfile
+import pandas as pd
+import sys
+sys.path.append('..')
+from reportGenerator import ReportGenerator
+
+class TestReportGenerator(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, 'cache')
+        self.report_path = os.path.join(self.temp_dir, 'report.html')
+        self.generator = ReportGenerator(cache_dir=self.cache_dir)
+        
+        self.test_df = pd.DataFrame({
+            'authors': ['Author A', 'Author B', 'Author A', 'Author <C>'],
+            'publication_date': [2020, 2021, 2021, 2022],
+            'language_code': ['en', 'es', 'en', 'fr'],
+            'publisher': ['Publisher X', 'Publisher Y', 'Publisher X', 'Publisher Z'],
+            'isbn': ['123', None, '456', '']
+        })
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        shutil.rmtree(self.temp_dir)
+    
+    def test_generate_self_contained_html(self):
+        """Test the report has every section with inline SVG and escaped labels"""
+        self.generator.generate(self.test_df, self.report_path, source_name='test.csv')
+        with open(self.report_path, encoding='utf-8') as f:
+            page = f.read()
+        
+        for section in ['trends', 'authors', 'languages', 'publishers', 'isbn', 'year-language']:
+            self.assertIn(f'<section id="{section}">', page)
+        self.assertGreaterEqual(page.count('<svg'), 6)
+        self.assertIn('Author &lt;C&gt;', page)
+        self.assertNotIn('<script', page)
+    
+    def test_second_run_uses_cache(self):
+        """Test unchanged data is served entirely from cached fragments"""
+        first = self.generator.generate(self.test_df, self.report_path)
+        self.assertEqual(len(first['rendered']), 6)
+        
+        second = ReportGenerator(cache_dir=self.cache_dir).generate(self.test_df, self.report_path)
+        self.assertEqual(second['rendered'], [])
+        self.assertEqual(len(second['cached']), 6)
+    
+    def test_only_changed_sections_rerender(self):
+        """Test a change to one column only re-renders sections depending on it"""
+        self.generator.generate(self.test_df, self.report_path)
+        
+        changed = self.test_df.copy()
+        changed.loc[3, 'publisher'] = 'Publisher X'
+        stats = self.generator.generate(changed, self.report_path)
+        self.assertEqual(stats['rendered'], ['publishers'])
+        self.assertEqual(len([name for name in os.listdir(self.cache_dir) if name.startswith('publishers-')]), 1)
+    
+    def test_error_section(self):
+        """Test analyses that fail are reported instead of aborting the report"""
+        self.generator.generate(self.test_df.drop(columns=['isbn']), self.report_path)
+        with open(self.report_path, encoding='utf-8') as f:
+            self.assertIn('No ISBN columns found', f.read())
+
+def run_single_test():
+    """Run this test file individually with detailed output"""
+    print("=" * 70)
+    print("                  TESTING REPORT GENERATOR CLASS")
+    print("=" * 70)
+    
+    # Create test suite
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestReportGenerator)
+    
+    # Run tests with detailed output
+    runner = unittest.TextTestRunner(
+        verbosity=2,
+        stream=sys.stdout,
+        buffer=True
+    )
+    
+    result = runner.run(suite)
+    
+    # Print summary
+    print("\n" + "=" * 50)
+    print("              TEST SUMMARY")
+    print("=" * 50)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    
+    if result.wasSuccessful():
+        print("✅ ALL TESTS PASSED!")
+    else:
+        print("❌ SOME TESTS FAILED!")
+        if result.failures:
+            print(f"\nFailures ({len(result.failures)}):")
+            for test, traceback in result.failures:
+                print(f"  - {test}")
+        if result.errors:
+            print(f"\nErrors ({len(result.errors)}):")
+            for test, traceback in result.errors:
+                print(f"  - {test}")
+    
+    print("=" * 50)
+    return result.wasSuccessful()
+
+if __name__ == '__main__':
+    run_single_test()
@@ -0,0 +1,158 @@
+import unittest
+import os
+import tempfile
+from unittest.mock import patch
+import numpy as np
+import pandas as pd
+import sys
+sys.path.append('..')
+from sampler import Sampler, SampledAnalyzer
+from analyzer import Analyzer
+
+class TestSampler(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False)
+        self.temp_file.close()
+        rows = 2000
+        self.df = pd.DataFrame({
+            'row_id': range(rows),
+            'authors': [f"Author {i % 7}" for i in range(rows)],
+            'publication_date': [2000 + i % 10 for i in range(rows)],
+            'language_code': ['en' if i % 4 else 'fr' for i in range(rows)],
+            'publisher': [f"Pub {i % 3}" for i in range(rows)],
+            'isbn': [None if i % 20 == 0 else str(i) for i in range(rows)]
+        })
+        self.df.to_csv(self.temp_file.name, index=False)
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        if os.path.exists(self.temp_file.name):
+            os.unlink(self.temp_file.name)
+    
+    def test_bernoulli_sample(self):
+        """Test a fractional sample keeps roughly that share of rows and counts the whole file"""
+        sample, total_rows = Sampler(seed=1).load(self.temp_file.name, fraction=0.1)
+        self.assertEqual(total_rows, 2000)
+        self.assertTrue(150 < len(sample) < 250)
+        self.assertEqual(list(sample.columns), list(self.df.columns))
+        self.assertTrue(sample['row_id'].is_unique)
+    
+    def test_same_seed_same_sample(self):
+        """Test samples are repeatable for a seed"""
+        first, _ = Sampler(seed=5).load(self.temp_file.name, fraction=0.05)
+        second, _ = Sampler(seed=5).load(self.temp_file.name, fraction=0.05)
+        pd.testing.assert_frame_equal(first, second)
+    
+    def test_reservoir_sample_across_chunks(self):
+        """Test the reservoir holds exactly N distinct rows drawn from the whole file"""
+        sample, total_rows = Sampler(seed=2, chunk_rows=150).load(self.temp_file.name, rows=100)
+        self.assertEqual(total_rows, 2000)
+        self.assertEqual(len(sample), 100)
+        self.assertTrue(sample['row_id'].is_unique)
+        self.assertGreater(sample['row_id'].max(), 1500)
+        
+        # Averaged over many seeds, positions are spread uniformly over the file
+        means = [Sampler(seed=seed, chunk_rows=300).load(self.temp_file.name, rows=20)[0]['row_id'].mean()
+                 for seed in range(60)]
+        self.assertAlmostEqual(np.mean(means), 999.5, delta=60)
+    
+    def test_reservoir_larger_than_file(self):
+        """Test asking for more rows than exist returns the whole file"""
+        sample, total_rows = Sampler(seed=1, chunk_rows=500).load(self.temp_file.name, rows=5000)
+        self.assertEqual(len(sample), total_rows)
+        self.assertEqual(sorted(sample['row_id']), list(range(2000)))
+    
+    def test_load_errors(self):
+        """Test missing files and invalid fractions are reported"""
+        with patch('builtins.print'):
+            self.assertEqual(Sampler().load('missing.csv', fraction=0.5), (None, 0))
+        with self.assertRaises(ValueError):
+            Sampler().load(self.temp_file.name, fraction=1.5)
+    
+    def test_language_estimates_cover_truth(self):
+        """Test scaled language counts and intervals bracket the exact values"""
+        sample, total_rows = Sampler(seed=3).load(self.temp_file.name, fraction=0.2)
+        analyzer = SampledAnalyzer(len(sample), total_rows)
+        analysis_data, error = analyzer.analyze_language_distribution(sample)
+        
+        self.assertIsNone(error)
+        self.assertEqual(analysis_data['total_books'], 2000)
+        estimates = analysis_data['estimates']
+        self.assertLessEqual(estimates.loc['fr', 'count_low'], 500)
+        self.assertGreaterEqual(estimates.loc['fr', 'count_high'], 500)
+        self.assertLessEqual(estimates.loc['en', 'percent_low'], 75)
+        self.assertGreaterEqual(estimates.loc['en', 'percent_high'], 75)
+        self.assertEqual(analysis_data['lang_counts'].sum(), estimates['count'].sum())
+    
+    def test_isbn_and_trend_estimates(self):
+        """Test missing ISBN and yearly counts are scaled to the file size"""
+        sample, total_rows = Sampler(seed=4, chunk_rows=400).load(self.temp_file.name, rows=400)
+        analyzer = SampledAnalyzer(len(sample), total_rows)
+        
+        isbn_data, _ = analyzer.analyze_missing_isbn(sample)
+        isbn = isbn_data['isbn_analysis']['isbn']
+        self.assertEqual(isbn['total_records'], 2000)
+        self.assertEqual(isbn['present_count'] + isbn['missing_count'], 2000)
+        self.assertLessEqual(isbn_data['estimates'].loc['isbn', 'count_low'], 100)
+        self.assertGreaterEqual(isbn_data['estimates'].loc['isbn', 'count_high'], 100)
+        
+        trend_data, _ = analyzer.analyze_publication_trends(sample)
+        self.assertAlmostEqual(trend_data['year_counts'].sum(), 2000, delta=10)
+        self.assertEqual(trend_data['sample']['sample_rows'], 400)
+        self.assertTrue(analyzer.describe_estimates(trend_data)[0].startswith('Estimated from 400 of 2,000 rows'))
+    
+    def test_full_sample_is_exact(self):
+        """Test a sample of the whole file gives the exact results with zero-width intervals"""
+        analyzer = SampledAnalyzer(len(self.df), len(self.df))
+        analysis_data, _ = analyzer.analyze_language_distribution(self.df)
+        expected, _ = Analyzer().analyze_language_distribution(self.df)
+        self.assertEqual(analysis_data['lang_counts'].to_dict(), expected['lang_counts'].to_dict())
+        estimates = analysis_data['estimates']
+        self.assertTrue((estimates['count_low'] == estimates['count']).all())
+        self.assertTrue((estimates['count_high'] == estimates['count']).all())
+
+def run_single_test():
+    """Run this test file individually with detailed output"""
+    print("=" * 70)
+    print("                      TESTING SAMPLER CLASS")
+    print("=" * 70)
+    
+    # Create test suite
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestSampler)
+    
+    # Run tests with detailed output
+    runner = unittest.TextTestRunner(
+        verbosity=2,
+        stream=sys.stdout,
+        buffer=True
+    )
+    
+    result = runner.run(suite)
+    
+    # Print summary
+    print("\n" + "=" * 50)
+    print("              TEST SUMMARY")
+    print("=" * 50)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    
+    if result.wasSuccessful():
+        print("✅ ALL TESTS PASSED!")
+    else:
+        print("❌ SOME TESTS FAILED!")
+        if result.failures:
+            print(f"\nFailures ({len(result.failures)}):")
+            for test, traceback in result.failures:
+                print(f"  - {test}")
+        if result.errors:
+            print(f"\nErrors ({len(result.errors)}):")
+            for test, traceback in result.errors:
+                print(f"  - {test}")
+    
+    print("=" * 50)
+    return result.wasSuccessful()
+
+if __name__ == '__main__':
+    run_single_test()
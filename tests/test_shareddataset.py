@@ -0,0 +1,134 @@
+import unittest
+import json
+import numpy as np
+import pandas as pd
+import sys
+sys.path.append('..')
+from analyzer import Analyzer, ANALYSIS_METHODS
+from dataLoader import DataLoader
+from outputWriter import OutputWriter
+from sharedDataset import publish, attach, analyze_in_parallel, aggregate_in_parallel
+
+def numbers(value):
+    """JSON value with integral floats as ints (running aggregates type years from each chunk)"""
+    if isinstance(value, dict):
+        return {key: numbers(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [numbers(item) for item in value]
+    return int(value) if isinstance(value, float) and value.is_integer() else value
+
+class TestSharedDataset(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.df = pd.DataFrame({
+            'authors': ['Author B', 'Author A', 'Ana Ñúñez', None, 'Author B'] * 40,
+            'publication_date': ['2019-01-01', '2020-05-05', '0001-01-01', 'unknown', '2020-01-01'] * 40,
+            'language_code': ['en', 'fr', 'en', None, 'de'] * 40,
+            'publisher': ['Pub X', 1984, 'Pub X', 'Pub Z', np.nan] * 40,
+            'isbn': [9780000000001.0, np.nan, 9780000000003.0, 1.0, 2.0] * 40
+        })
+        self.serializer = OutputWriter('json')
+    
+    def assert_same_results(self, results):
+        """Every (analysis_data, error) equals the in-process Analyzer's"""
+        analyzer = Analyzer()
+        for analysis_type, method_name in ANALYSIS_METHODS.items():
+            expected = getattr(analyzer, method_name)(self.df)
+            self.assertEqual(numbers(self.serializer.to_serializable(results[analysis_type][0])),
+                             numbers(self.serializer.to_serializable(expected[0])), analysis_type)
+            self.assertEqual(results[analysis_type][1], expected[1])
+    
+    def test_round_trip_through_shared_memory(self):
+        """Test an attached copy holds the published frame, with text as codes and numbers as raw arrays"""
+        with publish(self.df) as shared:
+            specs = {spec['name']: spec for spec in shared.handle['columns']}
+            self.assertEqual(specs['authors']['dictionary'][0], 'utf8')
+            self.assertEqual(specs['publisher']['dictionary'][0], 'pickle')
+            self.assertIsNotNone(specs['isbn']['values'])
+            # Workers receive only the small handle
+            self.assertLess(len(json.dumps(shared.handle)), 2000)
+            
+            worker_view = attach(shared.handle)
+            codes = worker_view.array(specs['authors']['codes'])
+            self.assertEqual(codes.dtype, np.int32)
+            self.assertEqual(list(codes[:5]), [0, 1, 2, -1, 0])
+            self.assertFalse(codes.flags.writeable)
+            # Text stays codes into the shared dictionary; cast back it is the published frame
+            frame = worker_view.frame()
+            self.assertIsInstance(frame['authors'].dtype, pd.CategoricalDtype)
+            self.assertIsInstance(worker_view.dictionary('authors').array, pd.arrays.ArrowStringArray)
+            pd.testing.assert_frame_equal(frame.astype(self.df.dtypes.to_dict()), self.df)
+            pd.testing.assert_frame_equal(worker_view.frame(['language_code'], start=7, stop=12).astype(str),
+                                          self.df[['language_code']].iloc[7:12])
+            worker_view.close()
+        
+        # Columns DataLoader interned keep their codes and category order
+        interned = DataLoader().intern(self.df.copy())
+        with publish(interned) as shared:
+            self.assertTrue(shared.handle['columns'][0]['categorical'])
+            with attach(shared.handle) as worker_view:
+                pd.testing.assert_frame_equal(worker_view.frame(), interned)
+        
+        shifted = self.df.set_index(pd.Index(range(1000, 1200)).astype(str))
+        with publish(shifted) as shared:
+            with attach(shared.handle) as worker_view:
+                pd.testing.assert_frame_equal(worker_view.frame(start=3, stop=9).astype(shifted.dtypes.to_dict()),
+                                              shifted.iloc[3:9])
+    
+    def test_parallel_analyses_and_row_partitions_match_analyzer(self):
+        """Test per-analysis and per-partition process pools over the shared dataset give the Analyzer's results"""
+        self.assert_same_results(analyze_in_parallel(self.df, list(ANALYSIS_METHODS), workers=2))
+        
+        aggregates = aggregate_in_parallel(self.df, workers=2, partitions=3)
+        self.assertEqual(aggregates.total_rows, 200)
+        self.assert_same_results({analysis_type: aggregates.analysis_data(analysis_type)
+                                  for analysis_type in ANALYSIS_METHODS})
+        
+        interned = aggregate_in_parallel(DataLoader().intern(self.df.copy()), workers=2, partitions=3)
+        self.assert_same_results({analysis_type: interned.analysis_data(analysis_type)
+                                  for analysis_type in ANALYSIS_METHODS})
+
+def run_single_test():
+    """Run this test file individually with detailed output"""
+    print("=" * 70)
+    print("                   TESTING SHARED DATASET CLASS")
+    print("=" * 70)
+    
+    # Create test suite
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestSharedDataset)
+    
+    # Run tests with detailed output
+    runner = unittest.TextTestRunner(
+        verbosity=2,
+        stream=sys.stdout,
+        buffer=True
+    )
+    
+    result = runner.run(suite)
+    
+    # Print summary
+    print("\n" + "=" * 50)
+    print("              TEST SUMMARY")
+    print("=" * 50)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    
+    if result.wasSuccessful():
+        print("✅ ALL TESTS PASSED!")
+    else:
+        print("❌ SOME TESTS FAILED!")
+        if result.failures:
+            print(f"\nFailures ({len(result.failures)}):")
+            for test, traceback in result.failures:
+                print(f"  - {test}")
+        if result.errors:
+            print(f"\nErrors ({len(result.errors)}):")
+            for test, traceback in result.errors:
+                print(f"  - {test}")
+    
+    print("=" * 50)
+    return result.wasSuccessful()
+
+if __name__ == '__main__':
+    run_single_test()
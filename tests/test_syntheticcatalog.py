@@ -0,0 +1,114 @@
+import unittest
+import os
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+import sys
+sys.path.append('..')
+from syntheticCatalog import CatalogGenerator, COLUMNS
+from analyzer import Analyzer
+
+class TestCatalogGenerator(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.generator = CatalogGenerator(seed=42)
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        shutil.rmtree(self.temp_dir)
+    
+    def test_same_seed_same_catalog(self):
+        """Test generation is reproducible and chunking does not change the data"""
+        whole = pd.concat(self.generator.generate(5000, chunk_rows=5000), ignore_index=True)
+        again = pd.concat(CatalogGenerator(seed=42).generate(5000, chunk_rows=5000), ignore_index=True)
+        pd.testing.assert_frame_equal(whole, again)
+        
+        other = pd.concat(CatalogGenerator(seed=43).generate(5000), ignore_index=True)
+        self.assertFalse(whole['author'].equals(other['author']))
+        
+        chunks = list(self.generator.generate(5000, chunk_rows=1200))
+        self.assertEqual([len(chunk) for chunk in chunks], [1200, 1200, 1200, 1200, 200])
+    
+    def test_schema_and_skew(self):
+        """Test the real header, Zipfian authors, English-dominated languages, multi-ISBN cells and gaps"""
+        path = self.generator.write(os.path.join(self.temp_dir, 'catalog.csv'), 20000)
+        df = pd.read_csv(path)
+        self.assertEqual(list(df.columns), COLUMNS)
+        self.assertEqual(len(df), 20000)
+        
+        author_counts = df['author'].value_counts()
+        self.assertGreater(author_counts.iloc[0], 10 * author_counts.iloc[100])
+        self.assertAlmostEqual(df['language'].value_counts(normalize=True)['English'], 0.62, delta=0.02)
+        self.assertGreater(df['ISBN'].str.contains('/', na=False).mean(), 0.05)
+        self.assertGreater(df['ISBN'].isna().sum(), 0)
+        self.assertGreater(df['book publisher'].isna().sum(), 0)
+        self.assertTrue(df['BNB id'].str.match(r'^GB[BC][0-9A-Z]{6}$').all())
+        
+        # Every analysis runs on the synthetic catalog
+        data, error = Analyzer().analyze_publication_trends(df)
+        self.assertIsNone(error)
+        self.assertEqual(data['most_productive_year'], 2019)
+    
+    def test_draws_without_materializing_vocabulary(self):
+        """Test precomputed cumulative weights draw what rng.choice(p=...) draws, with names formatted on demand"""
+        weights = self.generator.zipf_weights(50000, 0.9)
+        cdf = self.generator.cumulative(weights)
+        drawn = self.generator.draw(np.random.default_rng(3), cdf, 2000)
+        np.testing.assert_array_equal(drawn, np.random.default_rng(3).choice(len(weights), size=2000, p=weights))
+        
+        np.testing.assert_array_equal(self.generator.formatted(self.generator.names, drawn),
+                                      self.generator.names(np.arange(50000))[drawn])
+    
+    def test_compressed_output(self):
+        """Test the file name picks the compression"""
+        path = self.generator.write(os.path.join(self.temp_dir, 'catalog.csv.gz'), 300)
+        with open(path, 'rb') as f:
+            self.assertEqual(f.read(2), b'\x1f\x8b')
+        self.assertEqual(len(pd.read_csv(path)), 300)
+
+def run_single_test():
+    """Run this test file individually with detailed output"""
+    print("=" * 70)
+    print("                 TESTING CATALOG GENERATOR CLASS")
+    print("=" * 70)
+    
+    # Create test suite
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestCatalogGenerator)
+    
+    # Run tests with detailed output
+    runner = unittest.TextTestRunner(
+        verbosity=2,
+        stream=sys.stdout,
+        buffer=True
+    )
+    
+    result = runner.run(suite)
+    
+    # Print summary
+    print("\n" + "=" * 50)
+    print("              TEST SUMMARY")
+    print("=" * 50)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    
+    if result.wasSuccessful():
+        print("✅ ALL TESTS PASSED!")
+    else:
+        print("❌ SOME TESTS FAILED!")
+        if result.failures:
+            print(f"\nFailures ({len(result.failures)}):")
+            for test, traceback in result.failures:
+                print(f"  - {test}")
+        if result.errors:
+            print(f"\nErrors ({len(result.errors)}):")
+            for test, traceback in result.errors:
+                print(f"  - {test}")
+    
+    print("=" * 50)
+    return result.wasSuccessful()
+
+if __name__ == '__main__':
+    run_single_test()
@@ -0,0 +1,125 @@
+import unittest
+import io
+import os
+import subprocess
+import pandas as pd
+import sys
+sys.path.append('..')
+from terminalRenderer import TerminalRenderer
+
+class TestTerminalRenderer(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.output = io.StringIO()
+        self.renderer = TerminalRenderer(width=60, stream=self.output)
+        
+        self.publication_data = {
+            'year_counts': pd.Series({2020: 100, 2021: 150, 2022: 120}),
+            'total_years': 3,
+            'most_productive_year': 2021,
+            'most_productive_count': 150,
+            'least_productive_year': 2020,
+            'least_productive_count': 100
+        }
+        
+        self.year_lang_data = {
+            'year_lang_counts': pd.DataFrame({
+                'en': [100, 120, 110],
+                'es': [0, 60, 55]
+            }, index=[2020, 2021, 2022]),
+            'years': [2020, 2021, 2022],
+            'languages': ['en', 'es']
+        }
+    
+    def test_bar_scales_to_width(self):
+        """Test the largest value fills the full bar width"""
+        self.assertEqual(self.renderer.bar(10, 10, 5), '█████')
+        self.assertEqual(self.renderer.bar(0, 10, 5), '')
+    
+    def test_bar_chart_fits_width(self):
+        """Test bar chart lines never exceed the terminal width"""
+        lines = self.renderer.bar_chart(['A very long publisher name indeed', 'B'], [300, 20])
+        for line in lines:
+            self.assertLessEqual(len(line), 60)
+    
+    def test_sparkline_levels(self):
+        """Test sparkline maps min and max to lowest and highest blocks"""
+        self.assertEqual(self.renderer.sparkline([1, 5, 9]), '▁▄█')
+    
+    def test_sparkline_long_series_fits(self):
+        """Test long series are reduced to the requested width"""
+        line = self.renderer.sparkline(range(5000), width=40)
+        self.assertEqual(len(line), 40)
+    
+    def test_heatmap_zero_cells_blank(self):
+        """Test zero counts are drawn as blank cells"""
+        lines = self.renderer.heatmap(['es'], [2020, 2021], [[0, 60]])
+        self.assertIn('│ █', lines[1])
+    
+    def test_visualize_publication_trends(self):
+        """Test trends are rendered in one write with a sparkline"""
+        self.renderer.visualize_publication_trends(self.publication_data)
+        text = self.output.getvalue()
+        self.assertIn('▁█', text)
+        self.assertIn('Most productive year: 2021', text)
+    
+    def test_visualize_books_per_year_by_language(self):
+        """Test year-language heatmap lists every language"""
+        self.renderer.visualize_books_per_year_by_language(self.year_lang_data)
+        text = self.output.getvalue()
+        self.assertIn('en', text)
+        self.assertIn('es', text)
+    
+    def test_cli_terminal_mode_does_not_import_matplotlib(self):
+        """Test a full terminal report never imports matplotlib"""
+        root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+        code = ("import sys; sys.argv = ['cli.py', '--all', '--terminal']; "
+                "import cli; cli.main(); print('matplotlib' in sys.modules)")
+        result = subprocess.run([sys.executable, '-c', code], cwd=root,
+                                capture_output=True, text=True, timeout=120)
+        self.assertEqual(result.stdout.strip().splitlines()[-1], 'False')
+
+def run_single_test():
+    """Run this test file individually with detailed output"""
+    print("=" * 70)
+    print("                 TESTING TERMINAL RENDERER CLASS")
+    print("=" * 70)
+    
+    # Create test suite
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestTerminalRenderer)
+    
+    # Run tests with detailed output
+    runner = unittest.TextTestRunner(
+        verbosity=2,
+        stream=sys.stdout,
+        buffer=True
+    )
+    
+    result = runner.run(suite)
+    
+    # Print summary
+    print("\n" + "=" * 50)
+    print("              TEST SUMMARY")
+    print("=" * 50)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    
+    if result.wasSuccessful():
+        print("✅ ALL TESTS PASSED!")
+    else:
+        print("❌ SOME TESTS FAILED!")
+        if result.failures:
+            print(f"\nFailures ({len(result.failures)}):")
+            for test, traceback in result.failures:
+                print(f"  - {test}")
+        if result.errors:
+            print(f"\nErrors ({len(result.errors)}):")
+            for test, traceback in result.errors:
+                print(f"  - {test}")
+    
+    print("=" * 50)
+    return result.wasSuccessful()
+
+if __name__ == '__main__':
+    run_single_test()
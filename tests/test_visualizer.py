@@ -177,6 +177,33 @@ class TestVisualizer(unittest.TestCase):
             mock_print.assert_called()
             mock_show.assert_called()
 
+    @patch('matplotlib.pyplot.show')
+    @patch('matplotlib.pyplot.pause')
+    def test_visualize_publication_trends_long_series(self, mock_pause, mock_show):
+        """Test long publication series are decimated instead of annotated"""
+        long_data = {
+            'year_counts': pd.Series(range(1, 1501), index=range(500, 2000)),
+            'total_years': 1500,
+            'most_productive_year': 1999,
+            'most_productive_count': 1500,
+            'least_productive_year': 500,
+            'least_productive_count': 1
+        }
+        with patch('builtins.print'), \
+             patch.object(self.visualizer, 'plot_long_publication_trends') as mock_long:
+            self.visualizer.visualize_publication_trends(long_data)
+            mock_long.assert_called_once()
+            mock_show.assert_called()
+
+    @patch('matplotlib.pyplot.show')
+    def test_non_interactive_returns_figure(self, mock_show):
+        """Test non-interactive visualizers return the figure instead of showing it"""
+        visualizer = Visualizer(interactive=False)
+        with patch('builtins.print'):
+            figure = visualizer.visualize_top_authors(self.author_data)
+        self.assertIsNotNone(figure)
+        mock_show.assert_not_called()
+
 def run_single_test():
     """Run this test file individually with detailed output"""
     print("=" * 70)
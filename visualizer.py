@@ -2,15 +2,38 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
+from downsampler import Downsampler
 
 class Visualizer:
-    def __init__(self):
+    def __init__(self, annotate_limit=60, downsample_method='lttb', interactive=True):
         """Initialize Visualizer class"""
         # Set up plotting style
         plt.style.use('default')
         sns.set_palette("husl")
-        # Configure matplotlib to be non-blocking
-        plt.ion()  # Turn on interactive mode
+        
+        # Non-interactive visualizers hand figures back (e.g. for PDF export) instead of showing them
+        self.interactive = interactive
+        if interactive:
+            # Configure matplotlib to be non-blocking
+            plt.ion()  # Turn on interactive mode
+        
+        # Series longer than annotate_limit are drawn in time-series mode
+        self.annotate_limit = annotate_limit
+        self.downsample_method = downsample_method
+        self.downsampler = Downsampler()
+    
+    def display_figure(self):
+        """Show the current figure, or return it when the visualizer is not interactive"""
+        if not self.interactive:
+            return plt.gcf()
+        
+        # Show plot non-blocking and automatically close after displaying
+        plt.show(block=False)
+        plt.pause(0.1)  # Small pause to ensure plot is displayed
+        
+        # Close the plot automatically after a short time
+        # User can still see it but doesn't need to manually close it
+        print("\nGraph displayed! (Graph will close automatically)")
     
     def display_first_records(self, df, n=30):
         if df is None:
@@ -92,6 +115,16 @@ class Visualizer:
             overall_trend = "increasing" if counts[-1] > counts[0] else "decreasing" if counts[-1] < counts[0] else "stable"
             print(f"   Overall trend: {overall_trend}")
         
+        # Long series are bucketed and decimated instead of drawn point by point
+        if len(years) > self.annotate_limit:
+            self.plot_long_publication_trends(year_counts)
+        else:
+            self.plot_publication_trends(years, counts)
+        
+        return self.display_figure()
+    
+    def plot_publication_trends(self, years, counts):
+        """Draw every year with markers and value labels (short series)"""
         # Create trend line chart visualization
         plt.figure(figsize=(14, 8))
         
@@ -127,14 +160,44 @@ class Visualizer:
         
         plt.tight_layout()
         plt.legend(fontsize=10)
+    
+    def plot_long_publication_trends(self, year_counts):
+        """Draw a bucketed, LTTB/min-max decimated series bounded by the figure width"""
+        width = 14
+        max_points = self.downsampler.points_for_width(width)
+        prepared = self.downsampler.prepare(year_counts, method=self.downsample_method,
+                                            max_points=max_points)
+        x, y = prepared['x'], prepared['y']
+        
+        plt.figure(figsize=(width, 8))
+        plt.plot(x, y, linewidth=1.5, color='darkblue', label='Publication Trend')
+        
+        # Trend line is fitted on the full bucketed series but drawn from its two ends
+        bucket_x, bucket_y = prepared['bucket_x'], prepared['bucket_y']
+        if len(bucket_x) > 1:
+            z = np.polyfit(bucket_x, bucket_y, 1)
+            p = np.poly1d(z)
+            ends = np.array([bucket_x[0], bucket_x[-1]])
+            plt.plot(ends, p(ends), "--", alpha=0.8, color='red', linewidth=2, label='Trend Line')
+        
+        # Highlight highest and lowest buckets
+        max_idx = int(np.argmax(bucket_y))
+        min_idx = int(np.argmin(bucket_y))
+        plt.scatter(bucket_x[max_idx], bucket_y[max_idx], color='green', s=80, alpha=0.7, label='Peak')
+        plt.scatter(bucket_x[min_idx], bucket_y[min_idx], color='red', s=80, alpha=0.7, label='Lowest')
+        
+        resolution = prepared['resolution']
+        plt.title(f'Publication Trends Over Time (per {resolution}, '
+                  f'{len(x)} of {prepared["original_points"]} points)',
+                  fontsize=18, fontweight='bold', pad=20)
+        plt.xlabel('Year', fontsize=14, fontweight='bold')
+        plt.ylabel('Number of Books Published', fontsize=14, fontweight='bold')
+        plt.grid(True, alpha=0.3, linestyle='--')
+        ticks = self.downsampler.thin_ticks(np.unique(np.floor(x)).astype(int))
+        plt.xticks(ticks, rotation=45)
         
-        # Show plot non-blocking and automatically close after displaying
-        plt.show(block=False)
-        plt.pause(0.1)  # Small pause to ensure plot is displayed
-        
-        # Close the plot automatically after a short time
-        # User can still see it but doesn't need to manually close it
-        print("\nGraph displayed! (Graph will close automatically)")
+        plt.tight_layout()
+        plt.legend(fontsize=10)
     
     def visualize_top_authors(self, analysis_data):
         """Create visualization for top prolific authors"""
@@ -147,9 +210,10 @@ class Visualizer:
             print("No author data available for visualization.")
             return
         
-        # Print summary first (removed redundant title)
+        # Print summary first (removed redundant title); ranks continue from the skipped authors
+        offset = analysis_data.get('offset', 0)
         print(f"\nTop Authors Summary:")
-        for i, (author, count) in enumerate(author_counts.items(), 1):
+        for i, (author, count) in enumerate(author_counts.items(), offset + 1):
             print(f"   {i}. {author}: {count} books")
         
         plt.figure(figsize=(12, 8))
@@ -159,7 +223,11 @@ class Visualizer:
         bars = plt.barh(range(len(author_counts)), author_counts.values, color='lightcoral')
         plt.yticks(range(len(author_counts)), author_counts.index)
         plt.xlabel('Number of Books', fontsize=12)
-        plt.title(f'Top {analysis_data["top_n"]} Most Prolific Authors', fontsize=14, fontweight='bold')
+        if offset:
+            title = f'Most Prolific Authors, Ranks {offset + 1}-{offset + len(author_counts)}'
+        else:
+            title = f'Top {analysis_data["top_n"]} Most Prolific Authors'
+        plt.title(title, fontsize=14, fontweight='bold')
         plt.gca().invert_yaxis()
         
         # Add value labels on bars
@@ -173,9 +241,7 @@ class Visualizer:
         plt.title('Distribution of Books Among Top Authors', fontsize=14, fontweight='bold')
         
         plt.tight_layout()
-        plt.show(block=False)
-        plt.pause(0.1)
-        print("\nGraph displayed! (Graph will close automatically)")
+        return self.display_figure()
     
     def visualize_language_distribution(self, analysis_data):
         """Create visualization for language distribution"""
@@ -226,9 +292,7 @@ class Visualizer:
         plt.title('Language Distribution (Pie Chart)', fontsize=14, fontweight='bold')
         
         plt.tight_layout()
-        plt.show(block=False)
-        plt.pause(0.1)
-        print("\nGraph displayed! (Graph will close automatically)")
+        return self.display_figure()
     
     def visualize_books_by_publisher(self, analysis_data):
         """Create visualization for books by publisher"""
@@ -244,8 +308,12 @@ class Visualizer:
         # Print summary first (removed redundant title)
         print(f"\nPublisher Summary:")
         print(f"   Total publishers: {analysis_data['total_publishers']}")
-        print(f"   Top {analysis_data['top_n']} publishers:")
-        for i, (publisher, count) in enumerate(publisher_counts.items(), 1):
+        offset = analysis_data.get('offset', 0)
+        if offset:
+            print(f"   Publishers ranked {offset + 1}-{offset + len(publisher_counts)}:")
+        else:
+            print(f"   Top {analysis_data['top_n']} publishers:")
+        for i, (publisher, count) in enumerate(publisher_counts.items(), offset + 1):
             print(f"   {i}. {publisher}: {count} books")
         
         plt.figure(figsize=(14, 10))
@@ -254,7 +322,11 @@ class Visualizer:
         bars = plt.barh(range(len(publisher_counts)), publisher_counts.values, color='orange', alpha=0.7)
         plt.yticks(range(len(publisher_counts)), publisher_counts.index)
         plt.xlabel('Number of Books', fontsize=12)
-        plt.title(f'Top {analysis_data["top_n"]} Publishers by Number of Books', fontsize=14, fontweight='bold')
+        if offset:
+            title = f'Publishers Ranked {offset + 1}-{offset + len(publisher_counts)} by Number of Books'
+        else:
+            title = f'Top {analysis_data["top_n"]} Publishers by Number of Books'
+        plt.title(title, fontsize=14, fontweight='bold')
         
         # Invert y-axis BEFORE setting ylabel
         plt.gca().invert_yaxis()
@@ -268,9 +340,7 @@ class Visualizer:
                     str(publisher_counts.values[i]), va='center', fontsize=10)
         
         plt.tight_layout()
-        plt.show(block=False)
-        plt.pause(0.1)
-        print("\nGraph displayed! (Graph will close automatically)")
+        return self.display_figure()
     
     def visualize_missing_isbn(self, analysis_data, show_graph=True):
         """Create visualization for missing ISBN analysis"""
@@ -296,7 +366,7 @@ class Visualizer:
         # Only show graph if requested
         if not show_graph:
             return
-            
+        
         # Prepare data for visualization
         missing_counts = [isbn_analysis[col]['missing_count'] for col in isbn_cols]
         present_counts = [isbn_analysis[col]['present_count'] for col in isbn_cols]
@@ -336,9 +406,7 @@ class Visualizer:
             plt.title(f'{isbn_col.upper()} Distribution', fontsize=10, fontweight='bold')
         
         plt.tight_layout()
-        plt.show(block=False)
-        plt.pause(0.1)
-        print("\nGraph displayed! (Graph will close automatically)")
+        return self.display_figure()
     
     def visualize_books_per_year_by_language(self, analysis_data):
         """Create visualization for books per year by language"""
@@ -390,6 +458,4 @@ class Visualizer:
         plt.ylabel('Language', fontsize=12)
         
         plt.tight_layout()
-        plt.show(block=False)
-        plt.pause(0.1)
-        print("\nGraph displayed! (Graph will close automatically)")
+        return self.display_figure()